@@ -9,7 +9,7 @@ import {StorageAccess} from "./StorageAccess.sol";
 import {TransientAccess} from "./TransientAccess.sol";
 import {IUnlockCallback} from "./callback/IUnlockCallback.sol";
 import {Tag, TagLibrary, native} from "./utilities/Tag.sol";
-import {zeroIndex} from "./utilities/Index.sol";
+import {Index, zeroIndex, oneIndex, twoIndex, min} from "./utilities/Index.sol";
 import {zeroX127} from "./utilities/X127.sol";
 import {X59} from "./utilities/X59.sol";
 import {
@@ -28,7 +28,11 @@ import {
   getIntegralLimit,
   getIntegralLimitInterval,
   setBackGrowthMultiplier,
-  setNextGrowthMultiplier
+  setNextGrowthMultiplier,
+  getNextGrowthMultiplier,
+  getCurveLength,
+  getKernel,
+  getKernelLength
 } from "./utilities/Memory.sol";
 import {isGrowthPortion} from "./utilities/GrowthPortion.sol";
 import {
@@ -41,11 +45,13 @@ import {
   updateAllowance,
   writeProtocol,
   readAccruedParams,
-  readPoolData,
+  readPoolDataExceptKernel,
+  readKernel,
   writeDynamicParams,
   writeAccruedParams,
   writeCurve,
   readGrowthMultiplier,
+  writeGrowthMultiplier,
   writeDoubleBalance,
   readDoubleBalance,
   incrementBalance,
@@ -598,8 +604,12 @@ contract Nofeeswap is INofeeswap, StorageAccess, TransientAccess {
     uint256 poolLockSlot = getPoolLockSlot();
     lockPool(poolLockSlot);
     
-    // Dynamic parameters, static parameters, kernel, and curve are read next.
-    readPoolData();
+    // Dynamic parameters, static parameters, and curve are read next. Kernel
+    // breakpoints are only needed by 'swapWithin' and hooks. Hence, they are
+    // loaded once either of the two is invoked for the first time. Until
+    // then, the memory space for the kernel is reserved but not populated.
+    address kernelStorageAddress = readPoolDataExceptKernel();
+    bool kernelLoaded;
 
     // If there is a nonzero growth portion, then accrued parameters should be
     // read from storage as well.
@@ -608,8 +618,13 @@ contract Nofeeswap is INofeeswap, StorageAccess, TransientAccess {
     // Swap parameters are calculated and set in memory.
     setSwapParams();
 
-    // Mid swap hook is invoked next.
-    if (isMidSwap()) invokeMidSwap();
+    // Mid swap hook is invoked next. The memory snapshot given to the hook
+    // contract should include kernel breakpoints.
+    if (isMidSwap()) {
+      readKernel(getKernel(), kernelStorageAddress, getKernelLength());
+      kernelLoaded = true;
+      invokeMidSwap();
+    }
 
     // In this case, we can return without swapping.
     if (
@@ -621,13 +636,41 @@ contract Nofeeswap is INofeeswap, StorageAccess, TransientAccess {
       return (0, 0);
     }
 
+    // The lowest index among the members of the curve sequence which are
+    // modified throughout the swap. Initially, the last member is marked
+    // because 'readCurve' only loads the members up to 'qCurrent'.
+    //
+    // Each call to 'transition', 'swapWithin', or 'cross' ends with
+    // 'newCurve' or 'amend' which set the curve length as one plus the
+    // index of the last modified member. 'swapWithin' may amend the curve
+    // twice, in which case the first amended member may appear right before
+    // the last one. Hence, 'getCurveLength() - twoIndex' is a lower bound for
+    // the indices that are modified by each call. The subtraction is safe
+    // because the curve has at least two members.
+    Index curveIndex = getCurveLength() - oneIndex;
+
+    // The storage slot for the growth multiplier of 'qNext' and whether a
+    // default value for it is yet to be written on storage. Default values
+    // which are computed by 'transition' for boundaries that are crossed
+    // later in the same swap are overwritten by the subsequent transition.
+    // Hence, only the default value for the last 'qNext' is written once the
+    // loop comes to an end. Boundary reads are neither prefetched nor
+    // batched, and boundaries with no positions are still written, because
+    // later positions at those boundaries rely on the chained values.
+    uint256 growthMultiplierSlot;
+    bool growthMultiplierPending;
+
     bool transitioned;
     while (true) {
       // Once we reach the end of the current interval, we transition.
       if (getLogPriceCurrent() == _next_.log()) {
         // If there is pending kernel, then the kernel should be updated along
-        // with other static parameters.
-        if (getPendingKernelLength() != zeroIndex) updateKernel();
+        // with other static parameters. 'updateKernel' loads the breakpoints
+        // of the new kernel in memory.
+        if (getPendingKernelLength() != zeroIndex) {
+          updateKernel();
+          kernelLoaded = true;
+        }
 
         // If not yet transitioned, we need to read the two growth ratios for
         // the first time.
@@ -635,14 +678,20 @@ contract Nofeeswap is INofeeswap, StorageAccess, TransientAccess {
           setBackGrowthMultiplier(readGrowthMultiplier(
             getGrowthMultiplierSlot(getPoolId(), _back_.log())
           ));
-          setNextGrowthMultiplier(readGrowthMultiplier(
-            getGrowthMultiplierSlot(getPoolId(), _next_.log())
-          ));
+          growthMultiplierSlot = getGrowthMultiplierSlot(
+            getPoolId(),
+            _next_.log()
+          );
+          setNextGrowthMultiplier(readGrowthMultiplier(growthMultiplierSlot));
         }
 
         // Transition and modify the 'transitioned' flag accordingly.
-        transition();
+        (
+          growthMultiplierSlot,
+          growthMultiplierPending
+        ) = transition(growthMultiplierSlot);
         transitioned = true;
+        curveIndex = min(curveIndex, getCurveLength() - twoIndex);
       }
 
       // If the swap is large enough and we are at the beginning of an interval,
@@ -654,9 +703,17 @@ contract Nofeeswap is INofeeswap, StorageAccess, TransientAccess {
           ||
         (getZeroForOne() != (getLogPriceLimitOffsetted() <= _next_.log()))
       ) {
-        if (swapWithin()) break;
+        if (!kernelLoaded) {
+          readKernel(getKernel(), kernelStorageAddress, getKernelLength());
+          kernelLoaded = true;
+        }
+        bool halt = swapWithin();
+        curveIndex = min(curveIndex, getCurveLength() - twoIndex);
+        if (halt) break;
       } else {
-        if (cross()) break;
+        bool halt = cross();
+        curveIndex = min(curveIndex, getCurveLength() - twoIndex);
+        if (halt) break;
       }
 
       // Once either of the following limits are met, the loop is broken.
@@ -664,11 +721,17 @@ contract Nofeeswap is INofeeswap, StorageAccess, TransientAccess {
       if (getAmountSpecified() == zeroX127) break;
     }
 
+    // The default growth multiplier for 'qNext' is written on storage if
+    // 'transition' has not done so.
+    if (growthMultiplierPending) {
+      writeGrowthMultiplier(growthMultiplierSlot, getNextGrowthMultiplier());
+    }
+
     // Dynamic parameters, accrued growth portions and the curve are written on
     // storage.
     writeDynamicParams();
     if (isGrowthPortion()) writeAccruedParams();
-    writeCurve();
+    writeCurve(curveIndex);
 
     // The two amounts are cast as integers.
     amount0 = getAmount0().toIntegerRoundUp();
@@ -684,8 +747,14 @@ contract Nofeeswap is INofeeswap, StorageAccess, TransientAccess {
     // An event is emitted.
     emitSwapEvent();
 
-    // Post swap hook is invoked next.
-    if (isPostSwap()) invokePostSwap();
+    // Post swap hook is invoked next. The memory snapshot given to the hook
+    // contract should include kernel breakpoints.
+    if (isPostSwap()) {
+      if (!kernelLoaded) {
+        readKernel(getKernel(), kernelStorageAddress, getKernelLength());
+      }
+      invokePostSwap();
+    }
   }
 
   /// @notice See ERC1155TokenReceiver specifications.
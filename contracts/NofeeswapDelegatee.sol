@@ -10,7 +10,8 @@ import {
   readCollectInput,
   readModifyKernelInput,
   readModifyPoolGrowthPortionInput,
-  readUpdateGrowthPortionsInput
+  readUpdateGrowthPortionsInput,
+  readModifyExpTableInput
 } from "./utilities/Calldata.sol";
 import {
   _endOfStaticParams_,
@@ -38,6 +39,7 @@ import {
   getProtocolGrowthPortion,
   getLogPriceMin,
   getLogPriceMax,
+  getFreeMemoryPointer,
   setPoolGrowthPortion,
   setMaxPoolGrowthPortion,
   setProtocolGrowthPortion,
@@ -50,7 +52,6 @@ import {
   setSharesTotal,
   setPoolId,
   setGrowth,
-  setKernel,
   setKernelLength,
   setLogPriceCurrent,
   setCurveLength,
@@ -71,6 +72,11 @@ import {
   writeGrowthMultipliers,
   writeCurve,
   writeStaticParams,
+  writeKernel,
+  readExpTable,
+  calculateExpTable,
+  redeployStaticParams,
+  maxExpTableEntries,
   writeDynamicParams,
   writeStorage,
   getPoolOwnerSlot,
@@ -92,7 +98,7 @@ import {
   writePoolOwner,
   incrementBalance,
   getKernelLength,
-  readStaticParamsAndKernel,
+  readKernelStorage,
   getStaticParamsStorageAddress,
   updateTotalSupply
 } from "./utilities/Storage.sol";
@@ -153,7 +159,8 @@ import {
   emitPoolCollectionEvent,
   emitModifyKernelEvent,
   emitModifyPoolGrowthPortionEvent,
-  emitUpdateGrowthPortionsEvent
+  emitUpdateGrowthPortionsEvent,
+  emitModifyExpTableEvent
 } from "./utilities/Events.sol";
 import {
   invokeAuthorizeInitialization,
@@ -170,7 +177,6 @@ import {X59, thirtyTwoX59} from "./utilities/X59.sol";
 import {oneX111} from "./utilities/X111.sol";
 import {X127} from "./utilities/X127.sol";
 import {KernelCompact} from "./utilities/KernelCompact.sol";
-import {Kernel} from "./utilities/Kernel.sol";
 import {
   AdminCannotBeAddressZero,
   OnlyByProtocol,
@@ -179,6 +185,7 @@ import {
   LogPriceMinIsNotSpaced,
   LogPriceMaxIsNotSpaced,
   LogPricesOutOfOrder,
+  ExpTableTooLarge,
   LogPriceMaxIsInBlankArea,
   LogPriceMinIsInBlankArea,
   DonateIsNotAllowed,
@@ -647,9 +654,17 @@ contract NofeeswapDelegatee is INofeeswapDelegatee {
       );
       setStaticParamsStoragePointerExtension(nextPointer);
 
-      // The new kernel is deployed.
+      // The new kernel is deployed. The exp table of the current static
+      // parameters, if any, is carried over.
       setPendingKernelLength(zeroIndex);
-      writeStaticParams(nextPointer + 1);
+      address kernelStorageAddress = writeKernel();
+      uint256 expTable = getFreeMemoryPointer();
+      writeStaticParams(
+        nextPointer + 1,
+        kernelStorageAddress,
+        expTable,
+        readExpTable(getStaticParamsStorageAddress(pointer), expTable)
+      );
     }
 
     // Dynamic parameters are updated to include the new pointer.
@@ -819,6 +834,106 @@ contract NofeeswapDelegatee is INofeeswapDelegatee {
     emitModifyPoolGrowthPortionEvent();
   }
 
+  /// @inheritdoc INofeeswapDelegatee
+  function modifyExpTable(
+    uint256 poolId,
+    X59 logPriceMin,
+    X59 logPriceMax
+  ) external override sentry {
+    // Reads input parameters from calldata and sets them in appropriate memory
+    // locations.
+    readModifyExpTableInput();
+
+    // Safeguard against reentrancy.
+    uint256 poolLockSlot = getPoolLockSlot();
+    lockPool(poolLockSlot);
+
+    // Checks the pool owner.
+    {
+      address owner = readPoolOwner(getPoolOwnerSlot(getPoolId()));
+      require(msg.sender == owner, OnlyByPoolOwner(msg.sender, owner));
+    }
+
+    // Read dynamic parameters from which we determine whether the pool exists.
+    readDynamicParams();
+
+    // Static parameters are read (excluding the current kernel).
+    uint256 pointer = getStaticParamsStoragePointerExtension();
+    readStaticParams(getStaticParamsStorageAddress(pointer));
+
+    // Boundaries of the current active interval are read using which 'qMin'
+    // and 'qMax' are validated.
+    X59 qMin = getLogPriceMinOffsetted();
+    X59 qMax = getLogPriceMaxOffsetted();
+    {
+      (X59 qLower, X59 qUpper) = readBoundaries();
+      X59 qSpacing = qUpper - qLower;
+      require(
+        qMin % qSpacing == qUpper % qSpacing,
+        LogPriceMinIsNotSpaced(qMin)
+      );
+      require(
+        qMax % qSpacing == qUpper % qSpacing,
+        LogPriceMaxIsNotSpaced(qMax)
+      );
+      require(qMin <= qMax, LogPricesOutOfOrder(qMin, qMax));
+      require(qMax < thirtyTwoX59 - qSpacing, LogPriceMaxIsInBlankArea(qMax));
+      require(qMin > qSpacing, LogPriceMinIsInBlankArea(qMin));
+
+      // The number of entries is checked up front so that the table is not
+      // calculated only for the deployment to fail on the EIP-170 limit.
+      require(
+        uint256(X59.unwrap(qMax - qMin) / X59.unwrap(qSpacing)) <
+          maxExpTableEntries,
+        ExpTableTooLarge(qMin, qMax)
+      );
+    }
+
+    // The exp table is calculated in free memory.
+    uint256 expTable = getFreeMemoryPointer();
+    uint256 expTableByteCount = calculateExpTable(expTable, qMin, qMax);
+
+    // If there is no pending kernel,
+    // - The current static parameters will be deployed to 'pointer + 1' along
+    //   with the new exp table.
+    // If there is a pending kernel, then 'pointer + 1' is occupied. Hence:
+    // - The current static parameters will be deployed to 'pointer + 2' along
+    //   with the new exp table.
+    // - The pending static parameters which are at 'pointer + 1' will be
+    //   deployed to 'pointer + 3' along with the new exp table.
+    uint256 nextPointer;
+    unchecked {
+      nextPointer = pointer + 1;
+      if (getPendingKernelLength() > zeroIndex) {
+        redeployStaticParams(
+          nextPointer,
+          pointer + 3,
+          qMin,
+          expTable,
+          expTableByteCount
+        );
+        ++nextPointer;
+      }
+    }
+    redeployStaticParams(
+      pointer,
+      nextPointer,
+      qMin,
+      expTable,
+      expTableByteCount
+    );
+    setStaticParamsStoragePointerExtension(nextPointer);
+
+    // Dynamic parameters are updated to include the new pointer.
+    writeDynamicParams();
+
+    // The lock is cleared to open the pool for other actions.
+    unlockPool(poolLockSlot);
+
+    // An event is emitted next.
+    emitModifyExpTableEvent();
+  }
+
   /// @inheritdoc INofeeswapDelegatee
   function updateGrowthPortions(
     uint256 poolId
@@ -1013,17 +1128,29 @@ contract NofeeswapDelegatee is INofeeswapDelegatee {
       X47 protocolGrowthPortion,
       Index pendingKernelLength
     ) = readRedeployStaticParamsAndKernel();
-    Kernel kernel;
-    assembly {
-      kernel := _endOfStaticParams_
-    }
-    setKernel(kernel);
     setPoolId(poolId);
-    readStaticParamsAndKernel(getStaticParamsStorageAddress(sourcePointer));
+    address storageAddress = getStaticParamsStorageAddress(sourcePointer);
+    readStaticParams(storageAddress);
     setPoolGrowthPortion(poolGrowthPortion);
     setMaxPoolGrowthPortion(maxPoolGrowthPortion);
     setProtocolGrowthPortion(protocolGrowthPortion);
     setPendingKernelLength(pendingKernelLength);
-    writeStaticParams(targetPointer);
+
+    // The kernel breakpoints are not copied. The new storage contract refers
+    // to the same kernel storage contract instead.
+    (
+      address kernelStorageAddress,
+      Index kernelLength
+    ) = readKernelStorage(storageAddress);
+    setKernelLength(kernelLength);
+
+    // The exp table, if any, is carried over. Nothing else is placed in memory
+    // after static parameters.
+    writeStaticParams(
+      targetPointer,
+      kernelStorageAddress,
+      _endOfStaticParams_,
+      readExpTable(storageAddress, _endOfStaticParams_)
+    );
   }
 }
\ No newline at end of file
@@ -29,7 +29,7 @@ import {
 import {
   readStaticParams,
   getStaticParamsStorageAddress,
-  readKernelLength,
+  readKernelStorage,
   readKernel,
   getDynamicParamsSlot,
   getCurveSlot,
@@ -354,21 +354,17 @@ contract Access {
   ) external view returns (
     uint256[] memory 
   ) {
-    address storageAddress = getStaticParamsStorageAddress(
-      nofeeswap,
-      poolId,
-      pointer
+    (
+      address kernelStorageAddress,
+      Index length
+    ) = readKernelStorage(
+      getStaticParamsStorageAddress(nofeeswap, poolId, pointer)
     );
-    Index length = readKernelLength(storageAddress);
     Kernel kernel;
     assembly {
       kernel := 0x40
     }
-    readKernel(
-      kernel,
-      getStaticParamsStorageAddress(nofeeswap, poolId, pointer),
-      length
-    );
+    readKernel(kernel, kernelStorageAddress, length);
     assembly {
       mstore(0x00, 0x20)
       mstore(0x20, shl(1, sub(length, 1)))
@@ -50,6 +50,14 @@ contract FullMathWrapper {
     return FullMathLibrary.cheapMulDiv(a, b, denominator);
   }
 
+  function sqrt(
+    uint256 value
+  ) public returns (
+    uint256 root
+  ) {
+    return FullMathLibrary.sqrt(value);
+  }
+
   function modularInverse(
     uint256 value
   ) public returns (
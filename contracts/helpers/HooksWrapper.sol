@@ -34,6 +34,27 @@ contract HooksWrapper {
     invokeHook(selector);
   }
 
+  function _invokeHookGas(
+    uint256 poolId,
+    bytes4 selector,
+    bytes calldata content
+  ) public returns (
+    uint256 gasUsed
+  ) {
+    assembly {
+      let hookInputStart := add(4, calldataload(68))
+      calldatacopy(
+        _hookInputByteCount_,
+        hookInputStart,
+        add(32, calldataload(hookInputStart))
+      )
+    }
+    setPoolId(poolId);
+    gasUsed = gasleft();
+    invokeHook(selector);
+    gasUsed = gasUsed - gasleft();
+  }
+
   function _validateFlags(
     uint256 poolId
   ) public {
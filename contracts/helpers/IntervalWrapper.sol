@@ -38,6 +38,14 @@ contract IntervalWrapper {
   using IntegralLibrary for uint16;
   using IntegralLibrary for X216;
 
+  // Emitted once per Halley iteration of the target searches with the current
+  // value of 'x', the resulting 'step' and the gas spent to calculate it.
+  event HalleyIteration(X59 x, X59 step, uint256 gasUsed);
+
+  // Emitted at the end of '_traceOutgoingTarget' and '_traceIncomingTarget'
+  // with the number of Halley iterations and the gas spent by the search.
+  event TargetSearch(uint256 iterations, uint256 gasUsed);
+
   function _initiateInterval(
     Curve curve,
     Index curveLength,
@@ -560,6 +568,598 @@ contract IntervalWrapper {
     }
   }
 
+  // The functions below implement a candidate initial guess for the target
+  // searches which is only deployed with this wrapper. They reproduce
+  // 'searchOutgoingTarget' and 'searchIncomingTarget' of 'Interval.sol' with
+  // the coefficients and the Halley step split into separate functions and
+  // with the linear guess refined by 'refineTargetGuess'. The safety of every
+  // operation that is shared with 'Interval.sol' is argued there.
+  // 'IntervalSearchTargetGas_test.py' measures them against the deployed
+  // searches.
+
+  // Let 'w(y)' denote the integrand of either search at distance 'y' from
+  // 'qBegin' up to a constant factor. Both searches start from
+  //
+  //           integralLimit
+  //  'x := --------------------- * xLimit'
+  //        integral(0, xLimit)
+  //
+  // which is exact if 'w' is constant. Instead, we approximate 'w' linearly
+  // between 'w0 := w(0)' and 'w1 := w(xLimit)', in which case the equation
+  //
+  //  'integral(0, y) == (x / xLimit) * integral(0, xLimit)'
+  //
+  // becomes:
+  //
+  //    w1 - w0
+  //  '--------- * y ** 2 + 2 * w0 * y - x * (w0 + w1) == 0'.
+  //     xLimit
+  //
+  // The non-negative root of the above quadratic equation is:
+  //
+  //                            x * (w0 + w1)
+  //  'y := ------------------------------------------------------------'
+  //         w0 + sqrt(w0 ** 2 + ((w1 - w0) * x / xLimit) * (w0 + w1))
+  //
+  // which is returned after being capped by 'epsilonX59' and 'xLimit'.
+  //
+  // The integrand of either search is equal to the height of the kernel
+  // segment times an exponential factor. Hence, we take
+  //
+  //  'w0 := gBegin',
+  //
+  //           gTarget * sqrtTarget
+  //  'w1 := ----------------------'
+  //               sqrtBegin
+  //
+  // where 'gBegin' and 'gTarget' are the heights at 'qBegin' and 'qTarget'
+  // (both scaled by the same factor) and 'sqrtTarget / sqrtBegin' is the ratio
+  // of the exponential factors at 'qTarget' and 'qBegin'.
+  //
+  // We should have 'epsilonX59 <= x <= xLimit < 2 ** 64'. 'gBegin' and
+  // 'gTarget' should be non-negative and less than '2 ** 82'. 'sqrtBegin' and
+  // 'sqrtTarget' should be the outputs of 'exp' for 'qBegin' and 'qTarget'.
+  function refineTargetGuess(
+    X59 x,
+    X59 xLimit,
+    X74 gBegin,
+    X74 gTarget,
+    X216 sqrtBegin,
+    X216 sqrtTarget
+  ) private pure returns (
+    X59 guess
+  ) {
+    // Both 'sqrtBegin' and 'sqrtTarget' are greater than
+    // '(2 ** 216) * exp(-16) > 2 ** 192' and not greater than '2 ** 216'.
+    // Hence,
+    //
+    //  'gTarget * sqrtTarget < (2 ** 82) * (2 ** 216) <
+    //   (2 ** 192) * (2 ** 192 - 1) < sqrtBegin * (sqrtBegin - 1)'
+    //
+    // and the requirement of 'cheapMulDiv' is met. The castings are safe
+    // because all three values are non-negative. The output 'w1' does not
+    // exceed '82 + 216 - 192 == 106' bits.
+    uint256 w1 = FullMathLibrary.cheapMulDiv(
+      uint256(X74.unwrap(gTarget)),
+      uint256(X216.unwrap(sqrtTarget)),
+      uint256(X216.unwrap(sqrtBegin))
+    );
+
+    // 'w0 + w1' does not exceed '107' bits.
+    uint256 sum;
+    uint256 radicand;
+    assembly {
+      sum := add(gBegin, w1)
+
+      // '(w1 - w0) * x' does not overflow because '|w1 - w0| < 2 ** 106' and
+      // 'x < 2 ** 64'. The signed division rounds '(w1 - w0) * x / xLimit'
+      // towards zero and the outcome is not greater than '|w1 - w0|' in
+      // absolute value because 'x <= xLimit'. Hence, its product with
+      // 'w0 + w1' does not exceed '213' bits in absolute value.
+      //
+      // Let 'm := w0 + (w1 - w0) * x / xLimit' which is a convex combination
+      // of 'w0' and 'w1' and therefore non-negative. Then,
+      //
+      //  'w0 ** 2 + ((w1 - w0) * x / xLimit) * (w0 + w1) ==
+      //   m ** 2 + (x / xLimit) * (1 - x / xLimit) * ((w1 - w0) ** 2) >= 0'.
+      //
+      // Rounding towards zero does not make the radicand negative because if
+      // 'w1 < w0', the product with 'w0 + w1' is rounded up.
+      radicand := add(
+        mul(gBegin, gBegin),
+        mul(sdiv(mul(sub(w1, gBegin), x), xLimit), sum)
+      )
+    }
+
+    // The addition is safe because both values do not exceed '107' bits.
+    uint256 denominator = 
+      uint256(X74.unwrap(gBegin)) + FullMathLibrary.sqrt(radicand);
+
+    // If 'denominator == 0', we keep the initial guess. Otherwise,
+    // 'x * (w0 + w1)' does not exceed '64 + 107' bits.
+    guess = x;
+    if (denominator != 0) {
+      assembly {
+        guess := div(mul(x, sum), denominator)
+      }
+    }
+
+    // Signed comparisons are valid because 'guess' is non-negative.
+    guess = min(max(epsilonX59, guess), xLimit);
+  }
+
+  // Calculates the coefficients of the Halley search in 'searchOutgoingTarget'
+  // together with the refined initial guess for 'x'. We should have
+  // 'outgoingLimit < outgoing'.
+  function prepareOutgoingSearch(
+    X216 outgoingLimit,
+    X216 outgoing
+  ) private pure returns (
+    X59 x,
+    X59 xLimit,
+    X15 dc,
+    X74 q2,
+    X74 q1,
+    X216 q0
+  ) {
+    bool left = getZeroForOne();
+
+    X59 db = left ? 
+      _total0_.log() - _total1_.log() : 
+      _total1_.log() - _total0_.log();
+    dc = _total1_.height() - _total0_.height();
+    q2 = twoX59.times(dc);
+    q1 = q2 + db.times(_total0_.height());
+    q1 = left ? 
+      q1 + (_total0_.log() - _begin_.log()).times(dc) : 
+      q1 + (_begin_.log() - _total0_.log()).times(dc);
+    q0 = 
+      q1.toX216() - db.mulDivByExpInv16(_begin_.sqrt(!left), outgoingLimit);
+    q0 = q0 + q0;
+
+    xLimit = 
+      left ? _begin_.log() - _target_.log() : _target_.log() - _begin_.log();
+    x = max(epsilonX59, xLimit.cheapMulDiv(outgoingLimit, outgoing));
+
+    // For every '0 <= x <= xLimit', the integrand at 'qBegin + x' (or
+    // 'qBegin - x' if 'left == true') is proportional to
+    //
+    //  '(x.times(dc) + q1 - q2) * exp(- x / 2)'
+    //
+    // where the first factor is '|qTotal1 - qTotal0|' times the height of the
+    // kernel segment at 'x'. Hence, at 'x == 0' and 'x == xLimit', the first
+    // factor is equal to 'q1 - q2' and 'xLimit.times(dc) + q1 - q2',
+    // respectively. Both are non-negative and do not exceed '82' bits.
+    //
+    // Additionally, 'exp(- xLimit / 2)' is equal to
+    //
+    //  '_target_.sqrt(left) / _begin_.sqrt(left)'.
+    x = refineTargetGuess(
+      x,
+      xLimit,
+      q1 - q2,
+      xLimit.times(dc) + q1 - q2,
+      _begin_.sqrt(left),
+      _target_.sqrt(left)
+    );
+  }
+
+  // Calculates a single Halley step of 'searchOutgoingTarget' for the given
+  // 'x' and the coefficients which are calculated by 'prepareOutgoingSearch'.
+  // The search is concluded once 'step == zeroX59'.
+  function outgoingHalleyStep(
+    X59 x,
+    X15 dc,
+    X74 q2,
+    X74 q1,
+    X216 q0
+  ) private pure returns (
+    X59 step
+  ) {
+    X74 g = x.times(dc) + q1;
+    X216 h = g.toX216() - q0.cheapMulDiv(1 << 255, x.expInverse());
+    g = g - q2;
+
+    uint256 denominator;
+    assembly {
+      let h_over_g_X142 := sdiv(h, g) // h(x) / g(x)
+      denominator := sub(
+        shl(83, 1), // oneX83
+        sub(
+          sar(60, h_over_g_X142), // (h(x) / g(x)) / 2
+          sdiv(mul(h_over_g_X142, dc), g) // (h(x) / g(x)) * (dc / g(x))
+        )
+      ) // 1 - (h(x) / g(x)) / 2 + (h(x) / g(x)) * (dc / g(x))
+      step := sdiv(
+        add(h_over_g_X142, h_over_g_X142), // 2 * (h(x) / g(x))
+        denominator
+      )
+    }
+
+    if (step == zeroX59) {
+      require(denominator != 0, SearchingForOutgoingTargetFailed());
+    }
+  }
+
+  // 'searchOutgoingTarget' starting from the refined guess.
+  function searchOutgoingTargetRefined() private pure returns (
+    bool exactAmount,
+    X216 outgoing
+  ) {
+    X216 outgoingLimit = getIntegralLimit() - _currentToTarget_.integral();
+    outgoing = _total0_.outgoing(_begin_, _target_);
+    if (outgoing <= outgoingLimit) return (false, outgoing);
+
+    (
+      X59 x,
+      X59 xLimit,
+      X15 dc,
+      X74 q2,
+      X74 q1,
+      X216 q0
+    ) = prepareOutgoingSearch(outgoingLimit, outgoing);
+    while (true) {
+      X59 step = outgoingHalleyStep(x, dc, q2, q1, q0);
+      if (step == zeroX59) break;
+      x = min(max(epsilonX59, x + step), xLimit);
+    }
+
+    bool left = getZeroForOne();
+    x = left ? _begin_.log() - x : _begin_.log() + x;
+    _overshoot_.storePrice(x);
+    outgoing = _total0_.outgoing(_begin_, _overshoot_);
+    while (outgoing < outgoingLimit) {
+      x = left ? x - epsilonX59 : x + epsilonX59;
+      moveOvershootByEpsilon(left);
+      outgoing = _total0_.outgoing(_begin_, _overshoot_);
+    }
+    _target_.copyPrice(_overshoot_);
+
+    return (true, outgoing);
+  }
+
+  // Calculates the coefficients of the Halley search in 'searchIncomingTarget'
+  // together with the refined initial guess for 'x'. We should have
+  // 'incomingLimit < incoming'.
+  function prepareIncomingSearch(
+    X216 incomingLimit,
+    X216 incoming
+  ) private pure returns (
+    X59 x,
+    X59 xLimit,
+    X15 dc,
+    X74 q2,
+    X74 q1,
+    X216 q0
+  ) {
+    bool left = getZeroForOne();
+
+    X59 db = left ? 
+      _total0_.log() - _total1_.log() : 
+      _total1_.log() - _total0_.log();
+    dc = _total1_.height() - _total0_.height();
+    q2 = twoX59.times(dc);
+    q1 = q2 - db.times(_total1_.height());
+    q1 = left ? 
+      q1 + (_begin_.log() - _total1_.log()).times(dc) : 
+      q1 + (_total1_.log() - _begin_.log()).times(dc);
+    q0 = 
+      q1.toX216() - db.mulDivByExpInv16(_begin_.sqrt(left), incomingLimit);
+
+    xLimit = 
+      left ? _begin_.log() - _target_.log() : _target_.log() - _begin_.log();
+    x = xLimit;
+    if (X59.unwrap(xLimit) <= X216.unwrap(incoming)) {
+      x = max(epsilonX59, xLimit.cheapMulDiv(incomingLimit, incoming));
+
+      // Same as 'prepareOutgoingSearch' where the first factor of the
+      // integrand is 'x.times(dc) + q2 - q1' and the exponential factor is
+      // 'exp(+ x / 2)'.
+      x = refineTargetGuess(
+        x,
+        xLimit,
+        q2 - q1,
+        xLimit.times(dc) + q2 - q1,
+        _begin_.sqrt(!left),
+        _target_.sqrt(!left)
+      );
+    }
+  }
+
+  // Calculates a single Halley step of 'searchIncomingTarget' for the given
+  // 'x' and the coefficients which are calculated by 'prepareIncomingSearch'.
+  // The search is concluded once 'step == zeroX59'.
+  function incomingHalleyStep(
+    X59 x,
+    X15 dc,
+    X74 q2,
+    X74 q1,
+    X216 q0
+  ) private pure returns (
+    X59 step
+  ) {
+    X74 g = x.times(dc) - q1;
+    X216 h = g.toX216() + q0 * X216.wrap(int256(x.expInverse() >> 40));
+    g = g + q2;
+
+    uint256 denominator;
+    assembly {
+      let h_over_g_X142 := sdiv(h, g) // h(x) / g(x)
+      denominator := sub(
+        shl(83, 1), // oneX83
+        add(
+          sar(60, h_over_g_X142), // (h(x) / g(x)) / 2
+          sdiv(mul(h_over_g_X142, dc), g) // (h(x) / g(x)) * (dc / g(x))
+        )
+      ) // 1 - (h(x) / g(x)) / 2 - (h(x) / g(x)) * (dc / g(x))
+      step := sdiv(
+        add(h_over_g_X142, h_over_g_X142), // 2 * (h(x) / g(x))
+        denominator
+      )
+    }
+
+    if (step == zeroX59) {
+      require(denominator != 0, SearchingForIncomingTargetFailed());
+    }
+  }
+
+  // 'searchIncomingTarget' starting from the refined guess.
+  function searchIncomingTargetRefined() private pure returns (
+    bool exactAmount,
+    X216 incoming
+  ) {
+    X216 incomingLimit = 
+      getIntegralLimit() - _incomingCurrentToTarget_.integral();
+    incoming = _total0_.incoming(_begin_, _target_);
+    if (incoming <= incomingLimit) return (false, incoming);
+
+    (
+      X59 x,
+      X59 xLimit,
+      X15 dc,
+      X74 q2,
+      X74 q1,
+      X216 q0
+    ) = prepareIncomingSearch(incomingLimit, incoming);
+    while (true) {
+      X59 step = incomingHalleyStep(x, dc, q2, q1, q0);
+      if (step == zeroX59) break;
+      x = min(max(epsilonX59, x - step), xLimit);
+    }
+
+    bool left = getZeroForOne();
+    x = min(x + epsilonX59, xLimit);
+    x = left ? _begin_.log() - x : _begin_.log() + x;
+    _overshoot_.storePrice(x);
+    incoming = _total0_.incoming(_begin_, _overshoot_);
+    while (incoming > incomingLimit) {
+      x = left ? x + epsilonX59 : x - epsilonX59;
+      moveOvershootByEpsilon(!left);
+      incoming = _total0_.incoming(_begin_, _overshoot_);
+    }
+    _target_.copyPrice(_overshoot_);
+
+    return (true, incoming);
+  }
+
+  function _refineTargetGuess(
+    X59 x,
+    X59 xLimit,
+    X74 gBegin,
+    X74 gTarget,
+    X216 sqrtBegin,
+    X216 sqrtTarget
+  ) public returns (
+    X59 guess,
+    uint256 gasUsed
+  ) {
+    gasUsed = gasleft();
+    guess = refineTargetGuess(
+      x,
+      xLimit,
+      gBegin,
+      gTarget,
+      sqrtBegin,
+      sqrtTarget
+    );
+    gasUsed = gasUsed - gasleft();
+  }
+
+  function _loadTargetSearch(
+    uint256[8] calldata input
+  ) private pure {
+    {
+      uint256 beginContent0 = input[0];
+      uint256 beginContent1 = input[1];
+      assembly {
+        mstore(0, beginContent0)
+        mcopy(_begin_, 2, 30)
+        mstore(add(_begin_, 30), beginContent1)
+      }
+    }
+
+    {
+      uint256 targetContent0 = input[2];
+      uint256 targetContent1 = input[3];
+      assembly {
+        mstore(0, targetContent0)
+        mcopy(_target_, 2, 30)
+        mstore(add(_target_, 30), targetContent1)
+      }
+    }
+
+    {
+      uint256 total0Content0 = input[4];
+      uint256 total0Content1 = input[5];
+      assembly {
+        mstore(sub(_total0_, 2), total0Content0)
+        mstore(add(_total0_, 30), total0Content1)
+      }
+    }
+
+    {
+      uint256 total1Content0 = input[6];
+      uint256 total1Content1 = input[7];
+      assembly {
+        mstore(sub(_total1_, 2), total1Content0)
+        mstore(add(_total1_, 30), total1Content1)
+      }
+    }
+  }
+
+  function _unloadTargetSearch() private pure returns (
+    uint256[4] memory output
+  ) {
+    {
+      uint256 content0;
+      uint256 content1;
+      assembly {
+        content0 := mload(sub(_overshoot_, 2))
+        content1 := mload(add(_overshoot_, 30))
+      }
+      output[0] = content0;
+      output[1] = content1;
+    }
+
+    {
+      uint256 content0;
+      uint256 content1;
+      assembly {
+        content0 := mload(sub(_target_, 2))
+        content1 := mload(add(_target_, 30))
+      }
+      output[2] = content0;
+      output[3] = content1;
+    }
+  }
+
+  // Same as '_searchOutgoingTarget' for 'searchOutgoingTargetRefined'.
+  function _searchOutgoingTargetRefined(
+    X216 integralLimit,
+    X216 currentToTarget,
+    bool zeroForOne,
+    uint256[8] calldata input
+  ) public returns (
+    bool exactAmount,
+    X216 outgoing,
+    uint256[4] memory output
+  ) {
+    setIntegralLimit(integralLimit);
+    _currentToTarget_.setIntegral(currentToTarget);
+    setZeroForOne(zeroForOne);
+    _loadTargetSearch(input);
+    (exactAmount, outgoing) = searchOutgoingTargetRefined();
+    output = _unloadTargetSearch();
+  }
+
+  // Same as '_searchIncomingTarget' for 'searchIncomingTargetRefined'.
+  function _searchIncomingTargetRefined(
+    X216 integralLimit,
+    X216 incomingCurrentToTarget,
+    bool zeroForOne,
+    uint256[8] calldata input
+  ) public returns (
+    bool exactAmount,
+    X216 incoming,
+    uint256[4] memory output
+  ) {
+    setIntegralLimit(integralLimit);
+    _incomingCurrentToTarget_.setIntegral(incomingCurrentToTarget);
+    setZeroForOne(zeroForOne);
+    _loadTargetSearch(input);
+    (exactAmount, incoming) = searchIncomingTargetRefined();
+    output = _unloadTargetSearch();
+  }
+
+  // Replays the Halley iterations of 'searchOutgoingTargetRefined' while
+  // emitting 'HalleyIteration' for each of them. Then, the gas spent by
+  // 'searchOutgoingTargetRefined' itself is measured. The inputs are the same
+  // as '_searchOutgoingTarget'.
+  function _traceOutgoingTarget(
+    X216 integralLimit,
+    X216 currentToTarget,
+    bool zeroForOne,
+    uint256[8] calldata input
+  ) public returns (
+    uint256 iterations,
+    uint256 gasUsed
+  ) {
+    setIntegralLimit(integralLimit);
+    _currentToTarget_.setIntegral(currentToTarget);
+    setZeroForOne(zeroForOne);
+    _loadTargetSearch(input);
+
+    X216 outgoingLimit = integralLimit - currentToTarget;
+    X216 outgoing = _total0_.outgoing(_begin_, _target_);
+    if (outgoingLimit < outgoing) {
+      (
+        X59 x,
+        X59 xLimit,
+        X15 dc,
+        X74 q2,
+        X74 q1,
+        X216 q0
+      ) = prepareOutgoingSearch(outgoingLimit, outgoing);
+      while (true) {
+        uint256 stepGas = gasleft();
+        X59 step = outgoingHalleyStep(x, dc, q2, q1, q0);
+        stepGas = stepGas - gasleft();
+        emit HalleyIteration(x, step, stepGas);
+        ++iterations;
+        if (step == zeroX59) break;
+        x = min(max(epsilonX59, x + step), xLimit);
+      }
+    }
+
+    gasUsed = gasleft();
+    searchOutgoingTargetRefined();
+    gasUsed = gasUsed - gasleft();
+    emit TargetSearch(iterations, gasUsed);
+  }
+
+  // Same as '_traceOutgoingTarget' for 'searchIncomingTargetRefined'.
+  function _traceIncomingTarget(
+    X216 integralLimit,
+    X216 incomingCurrentToTarget,
+    bool zeroForOne,
+    uint256[8] calldata input
+  ) public returns (
+    uint256 iterations,
+    uint256 gasUsed
+  ) {
+    setIntegralLimit(integralLimit);
+    _incomingCurrentToTarget_.setIntegral(incomingCurrentToTarget);
+    setZeroForOne(zeroForOne);
+    _loadTargetSearch(input);
+
+    X216 incomingLimit = integralLimit - incomingCurrentToTarget;
+    X216 incoming = _total0_.incoming(_begin_, _target_);
+    if (incomingLimit < incoming) {
+      (
+        X59 x,
+        X59 xLimit,
+        X15 dc,
+        X74 q2,
+        X74 q1,
+        X216 q0
+      ) = prepareIncomingSearch(incomingLimit, incoming);
+      while (true) {
+        uint256 stepGas = gasleft();
+        X59 step = incomingHalleyStep(x, dc, q2, q1, q0);
+        stepGas = stepGas - gasleft();
+        emit HalleyIteration(x, step, stepGas);
+        ++iterations;
+        if (step == zeroX59) break;
+        x = min(max(epsilonX59, x - step), xLimit);
+      }
+    }
+
+    gasUsed = gasleft();
+    searchIncomingTargetRefined();
+    gasUsed = gasUsed - gasleft();
+    emit TargetSearch(iterations, gasUsed);
+  }
+
   function _moveTarget(
     bool direction,
     bool zeroForOne,
@@ -0,0 +1,150 @@
+// Copyright 2025, NoFeeSwap LLC - All rights reserved.
+pragma solidity ^0.8.28;
+
+import {IHook} from "../interfaces/IHook.sol";
+import {BaseHook} from "../hooks/BaseHook.sol";
+import {
+  getPoolIdFromCalldata,
+  getAmount0FromCalldata,
+  getAmount1FromCalldata
+} from "../hooks/HookCalldata.sol";
+import {X127} from "../utilities/X127.sol";
+
+/// @title This contract is a notional nofeeswap hook for test purposes. As
+/// opposed to 'MockHook', it does not copy 'hookInput'. Instead, 'poolId',
+/// 'amount0' and 'amount1' are read directly from calldata via
+/// 'HookCalldata.sol'. Hence, its cost does not depend on the size of the
+/// memory snapshot.
+contract MockHookCalldata is BaseHook {
+  event Invoked(uint256 indexed poolId, X127 amount0, X127 amount1);
+
+  uint256 public invocations;
+
+  function record() private {
+    ++invocations;
+    emit Invoked(
+      getPoolIdFromCalldata(),
+      getAmount0FromCalldata(),
+      getAmount1FromCalldata()
+    );
+  }
+
+  function preInitialize(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.preInitialize.selector;
+  }
+
+  function postInitialize(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.postInitialize.selector;
+  }
+
+  function preMint(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.preMint.selector;
+  }
+
+  function midMint(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.midMint.selector;
+  }
+
+  function postMint(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.postMint.selector;
+  }
+
+  function preBurn(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.preBurn.selector;
+  }
+
+  function midBurn(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.midBurn.selector;
+  }
+
+  function postBurn(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.postBurn.selector;
+  }
+
+  function preSwap(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.preSwap.selector;
+  }
+
+  function midSwap(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.midSwap.selector;
+  }
+
+  function postSwap(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.postSwap.selector;
+  }
+
+  function preDonate(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.preDonate.selector;
+  }
+
+  function midDonate(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.midDonate.selector;
+  }
+
+  function postDonate(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.postDonate.selector;
+  }
+
+  function preModifyKernel(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.preModifyKernel.selector;
+  }
+
+  function midModifyKernel(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.midModifyKernel.selector;
+  }
+
+  function postModifyKernel(
+    bytes calldata hookInput
+  ) external override returns (bytes4) {
+    record();
+    return IHook.postModifyKernel.selector;
+  }
+}
\ No newline at end of file
@@ -0,0 +1,46 @@
+// Copyright 2025, NoFeeSwap LLC - All rights reserved.
+pragma solidity ^0.8.28;
+
+import {IUnlockCallback} from "../callback/IUnlockCallback.sol";
+
+/// @title This contract is a notional unlock target for test purposes. It
+/// executes a sequence of calls which are encoded as
+/// 'abi.encode(address[] targets, uint256[] values, bytes[] calls)'.
+contract MockOperator is IUnlockCallback {
+  address public immutable nofeeswap;
+
+  constructor(address _nofeeswap) {
+    nofeeswap = _nofeeswap;
+  }
+
+  function unlockCallback(
+    address caller,
+    bytes calldata data
+  ) external payable override returns (
+    bytes memory returnData
+  ) {
+    require(msg.sender == nofeeswap);
+    (
+      address[] memory targets,
+      uint256[] memory values,
+      bytes[] memory calls
+    ) = abi.decode(data, (address[], uint256[], bytes[]));
+    require(targets.length == values.length);
+    require(targets.length == calls.length);
+
+    bytes[] memory results = new bytes[](calls.length);
+    for (uint256 k = 0; k < calls.length; ++k) {
+      (bool success, bytes memory result) =
+        targets[k].call{value: values[k]}(calls[k]);
+      if (!success) {
+        assembly {
+          revert(add(result, 32), mload(result))
+        }
+      }
+      results[k] = result;
+    }
+    returnData = abi.encode(caller, results);
+  }
+
+  receive() external payable {}
+}
@@ -0,0 +1,65 @@
+// Copyright 2025, NoFeeSwap LLC - All rights reserved.
+pragma solidity ^0.8.28;
+
+import {IERC20} from "@openzeppelin/interfaces/IERC20.sol";
+import {IUnlockCallback} from "../callback/IUnlockCallback.sol";
+import {INofeeswap} from "../interfaces/INofeeswap.sol";
+import {X59} from "../utilities/X59.sol";
+
+/// @title This contract is a notional unlock target for test purposes. It
+/// performs a single swap, settles the resulting amounts with the caller of
+/// 'unlock' and returns 'abi.encode(gasUsed, amount0, amount1)' where
+/// 'gasUsed' is the amount of gas spent by 'swap'.
+contract MockSwapper is IUnlockCallback {
+  INofeeswap public immutable nofeeswap;
+
+  constructor(INofeeswap _nofeeswap) {
+    nofeeswap = _nofeeswap;
+  }
+
+  function unlockCallback(
+    address caller,
+    bytes calldata data
+  ) external payable override returns (
+    bytes memory returnData
+  ) {
+    require(msg.sender == address(nofeeswap));
+    (
+      uint256 poolId,
+      int256 amountSpecified,
+      X59 logPriceLimit,
+      uint256 zeroForOne,
+      address token0,
+      address token1
+    ) = abi.decode(data, (uint256, int256, X59, uint256, address, address));
+
+    uint256 gasUsed = gasleft();
+    (int256 amount0, int256 amount1) = nofeeswap.swap(
+      poolId,
+      amountSpecified,
+      logPriceLimit,
+      zeroForOne,
+      ""
+    );
+    gasUsed = gasUsed - gasleft();
+
+    settle(caller, token0, amount0);
+    settle(caller, token1, amount1);
+
+    returnData = abi.encode(gasUsed, amount0, amount1);
+  }
+
+  function settle(
+    address payer,
+    address token,
+    int256 amount
+  ) private {
+    if (amount > 0) {
+      nofeeswap.sync(token);
+      IERC20(token).transferFrom(payer, address(nofeeswap), uint256(amount));
+      nofeeswap.settle();
+    } else if (amount < 0) {
+      nofeeswap.take(token, payer, uint256(- amount));
+    }
+  }
+}
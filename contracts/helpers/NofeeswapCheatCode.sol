@@ -3,9 +3,12 @@ pragma solidity ^0.8.28;
 
 import {Nofeeswap} from '../Nofeeswap.sol';
 import {Index} from '../utilities/Index.sol';
+import {Kernel} from '../utilities/Kernel.sol';
 import {
   _staticParams_,
+  _endOfStaticParams_,
   setPoolId,
+  setKernel,
   setKernelLength
 } from '../utilities/Memory.sol';
 import {writeStaticParams} from '../utilities/Storage.sol';
@@ -48,13 +51,16 @@ contract Manipulator {
   ) external {
     setPoolId(poolId);
     setKernelLength(kernelLength);
+    Kernel kernel;
     assembly {
+      kernel := _endOfStaticParams_
       calldatacopy(
         _staticParams_,
         add(36, calldataload(100)),
         calldataload(add(4, calldataload(100)))
       )
     }
+    setKernel(kernel);
     writeStaticParams(storagePointer);
   }
 }
\ No newline at end of file
@@ -708,6 +708,49 @@ contract StorageWrapper {
     }
   }
 
+  function _writeCurveFrom(
+    uint256 poolId,
+    Index curveLength,
+    Index curveIndex,
+    uint256[] calldata curveArray,
+    uint256[] calldata previousCurveArray
+  ) public returns (
+    uint256[] memory curveArrayResult
+  ) {
+    setPoolId(poolId);
+    uint256 storageSlot = getCurveSlot(poolId);
+    for (uint256 kk = 0; kk < previousCurveArray.length; ++kk) {
+      writeStorage(storageSlot, previousCurveArray[kk]);
+      ++storageSlot;
+    }
+    setCurveLength(curveLength);
+    Curve curve;
+    assembly {
+      curve := _endOfStaticParams_
+      calldatacopy(
+        _endOfStaticParams_,
+        add(36, calldataload(100)),
+        mul(8, curveLength)
+      )
+    }
+    setCurve(curve);
+    writeCurve(curveIndex);
+    uint256 length = curveArray.length > previousCurveArray.length ?
+      curveArray.length : previousCurveArray.length;
+    assembly {
+      curveArrayResult := add(
+        _endOfStaticParams_,
+        shl(5, add(shr(2, curveLength), 1))
+      )
+      mstore(curveArrayResult, length)
+    }
+    storageSlot = getCurveSlot(poolId);
+    for (uint256 kk = 0; kk < length; ++kk) {
+      curveArrayResult[kk] = readStorage(storageSlot);
+      ++storageSlot;
+    }
+  }
+
   function _writeStaticParams(
     uint256 poolId,
     Index kernelLength,
@@ -719,15 +762,17 @@ contract StorageWrapper {
   ) {
     setPoolId(poolId);
     setKernelLength(kernelLength);
+    Kernel kernel;
     assembly {
+      kernel := _endOfStaticParams_
       calldatacopy(
         _staticParams_,
         add(36, calldataload(132)),
         calldataload(add(4, calldataload(132)))
       )
     }
+    setKernel(kernel);
     writeStaticParams(storagePointer);
-    Index length = getKernelLength();
     assembly {
       contentResult := add(
         _staticParams_,
@@ -743,6 +788,60 @@ contract StorageWrapper {
     }
   }
 
+  // Deploys a single storage contract per pool which hosts both the static
+  // parameters and the kernel, i.e., the layout which preceded shared kernel
+  // storage contracts. It is only used as a reference for gas comparisons.
+  function _writeStaticParamsAndKernel(
+    uint256 poolId,
+    Index kernelLength,
+    uint256 storagePointer,
+    bytes calldata content
+  ) public {
+    setPoolId(poolId);
+    assembly {
+      calldatacopy(
+        _staticParams_,
+        add(36, calldataload(100)),
+        calldataload(add(4, calldataload(100)))
+      )
+    }
+
+    address proxy;
+    assembly {
+      mstore(0, poolId)
+      mstore(32, storagePointer)
+      storagePointer := keccak256(0, 64)
+      mstore(0x00, PROXY_CREATION_CODE)
+      proxy := create2(0, 0x10, 0x10, storagePointer)
+    }
+    require(proxy != address(0), DeploymentFailed());
+
+    uint256 length;
+    uint256 deploymentCreationCode;
+    assembly {
+      length := add(
+        sub(_endOfStaticParams_, _staticParams_),
+        shl(6, sub(kernelLength, 1))
+      )
+      deploymentCreationCode := or(DEPLOYMENT_CODE, shl(64, add(length, 1)))
+    }
+    setDeploymentCreationCode(deploymentCreationCode);
+
+    bool success;
+    assembly {
+      success := call(
+        gas(),
+        proxy,
+        0,
+        _deploymentCreationCode_,
+        add(length, 11),
+        0,
+        0
+      )
+    }
+    require(success, DeploymentFailed());
+  }
+
   function _getStaticParamsStorageAddress(
     uint256 poolId,
     uint256 storagePointer
@@ -763,6 +862,14 @@ contract StorageWrapper {
     return getStaticParamsStorageAddress(nofeeswap, poolId, storagePointer);
   }
 
+  function _getKernelStorageAddress(
+    uint256 kernelHash
+  ) public returns (
+    address kernelStorageAddress
+  ) {
+    return getKernelStorageAddress(kernelHash);
+  }
+
   function _readStaticParams(
     bytes calldata content
   ) public returns (
@@ -793,32 +900,23 @@ contract StorageWrapper {
   }
 
   function _readStaticParamsAndKernel(
-    bytes calldata content
+    bytes calldata staticContent,
+    bytes calldata kernelContent
   ) public returns (
     bytes memory contentResult
   ) {
+    address kernelStorageAddress = deployContent(kernelContent, 0, 0);
+    address storageAddress = deployContent(
+      staticContent,
+      (uint256(uint160(kernelStorageAddress)) << 96) + 
+        ((1 + kernelContent.length / 64) << 80),
+      22
+    );
     Kernel kernel;
     assembly {
       kernel := _endOfStaticParams_
     }
     setKernel(kernel);
-    address storageAddress;
-    assembly {
-      mstore8(128, 0x63)
-      mstore(129, shl(224, sub(calldatasize(), 67)))
-      mstore8(133, 0x80)
-      mstore8(134, 0x60)
-      mstore8(135, 0x0E)
-      mstore8(136, 0x60)
-      mstore8(137, 0x00)
-      mstore8(138, 0x39)
-      mstore8(139, 0x60)
-      mstore8(140, 0x00)
-      mstore8(141, 0xF3)
-      mstore(142, 0x00)
-      calldatacopy(143, 68, sub(calldatasize(), 68))
-      storageAddress := create(0, 128, sub(calldatasize(), 53))
-    }
     readStaticParamsAndKernel(storageAddress);
     Index kernelLength = getKernelLength();
     assembly {
@@ -833,29 +931,13 @@ contract StorageWrapper {
     }
   }
 
-  function _readKernelLength(
+  function _readKernelStorage(
     bytes calldata content
   ) public returns (
+    address kernelStorageAddress,
     Index length
   ) {
-    address storageAddress;
-    assembly {
-      mstore8(128, 0x63)
-      mstore(129, shl(224, sub(calldatasize(), 67)))
-      mstore8(133, 0x80)
-      mstore8(134, 0x60)
-      mstore8(135, 0x0E)
-      mstore8(136, 0x60)
-      mstore8(137, 0x00)
-      mstore8(138, 0x39)
-      mstore8(139, 0x60)
-      mstore8(140, 0x00)
-      mstore8(141, 0xF3)
-      mstore(142, 0x00)
-      calldatacopy(143, 68, sub(calldatasize(), 68))
-      storageAddress := create(0, 128, sub(calldatasize(), 53))
-    }
-    return readKernelLength(storageAddress);
+    return readKernelStorage(deployContent(content, 0, 0));
   }
 
   function _readKernel(
@@ -863,15 +945,35 @@ contract StorageWrapper {
   ) public returns (
     bytes memory contentResult
   ) {
+    address kernelStorageAddress = deployContent(content, 0, 0);
     Kernel kernel;
     assembly {
       kernel := _endOfStaticParams_
     }
-    setKernel(kernel);
-    address storageAddress;
+    Index kernelLength = Index.wrap(1 + content.length / 64);
+    readKernel(kernel, kernelStorageAddress, kernelLength);
     assembly {
+      contentResult := sub(_endOfStaticParams_, 32)
+      mstore(
+        contentResult,
+        mul(64, sub(kernelLength, 1))
+      )
+    }
+  }
+
+  // Deploys a contract whose bytecode is '0x00' followed by 'content' and the
+  // 'suffixLength' most significant bytes of 'suffix'.
+  function deployContent(
+    bytes calldata content,
+    uint256 suffix,
+    uint256 suffixLength
+  ) private returns (
+    address storageAddress
+  ) {
+    assembly {
+      let length := add(content.length, suffixLength)
       mstore8(128, 0x63)
-      mstore(129, shl(224, sub(calldatasize(), 67)))
+      mstore(129, shl(224, add(length, 1)))
       mstore8(133, 0x80)
       mstore8(134, 0x60)
       mstore8(135, 0x0E)
@@ -882,17 +984,9 @@ contract StorageWrapper {
       mstore8(140, 0x00)
       mstore8(141, 0xF3)
       mstore(142, 0x00)
-      calldatacopy(143, 68, sub(calldatasize(), 68))
-      storageAddress := create(0, 128, sub(calldatasize(), 53))
-    }
-    Index kernelLength = readKernelLength(storageAddress);
-    readKernel(kernel, storageAddress, kernelLength);
-    assembly {
-      contentResult := sub(_endOfStaticParams_, 32)
-      mstore(
-        contentResult,
-        mul(64, sub(kernelLength, 1))
-      )
+      calldatacopy(143, content.offset, content.length)
+      mstore(add(143, content.length), suffix)
+      storageAddress := create(0, 128, add(length, 15))
     }
   }
 
@@ -916,13 +1010,16 @@ contract StorageWrapper {
     }
     setPoolId(poolId);
     setKernelLength(kernelLength);
+    Kernel kernel;
     assembly {
+      kernel := _endOfStaticParams_
       calldatacopy(
         _staticParams_,
         add(36, calldataload(260)),
         calldataload(add(4, calldataload(260)))
       )
     }
+    setKernel(kernel);
     writeStaticParams(storagePointer);
   }
 
@@ -0,0 +1,74 @@
+// Copyright 2025, NoFeeSwap LLC - All rights reserved.
+pragma solidity ^0.8.28;
+
+import {IUnlockCallback} from "../callback/IUnlockCallback.sol";
+import {INofeeswap} from "../interfaces/INofeeswap.sol";
+
+/// @title This contract is not meant to be deployed. Its runtime bytecode is
+/// placed at an arbitrary address through the state override set of
+/// 'eth_call' in order to simulate a swap against a hypothetical pool state
+/// (see 'tests/SwapSimulator.py'). Hence, it should not have any immutable
+/// variables.
+contract SwapSimulator is IUnlockCallback {
+  /// @notice Thrown by 'unlockCallback' so that the swap is reverted while
+  /// its outcome is relayed to 'simulate'.
+  error SimulatedSwap(int256 amount0, int256 amount1, uint256 gasUsed);
+
+  /// @notice Unlocks 'nofeeswap' and performs 'swapCalldata' which is the
+  /// calldata of 'INofeeswap.swap'. Nothing is settled since the swap is
+  /// reverted in any case. Any revert other than 'SimulatedSwap' is relayed
+  /// as is.
+  ///
+  /// @param nofeeswap The protocol's address.
+  /// @param swapCalldata The calldata of 'INofeeswap.swap'.
+  /// @return amount0 The amount of tag0 owed to 'nofeeswap'.
+  /// @return amount1 The amount of tag1 owed to 'nofeeswap'.
+  /// @return gasUsed The amount of gas spent by 'swap'.
+  function simulate(
+    INofeeswap nofeeswap,
+    bytes calldata swapCalldata
+  ) external returns (
+    int256 amount0,
+    int256 amount1,
+    uint256 gasUsed
+  ) {
+    try nofeeswap.unlock(address(this), swapCalldata) {
+    } catch (bytes memory reason) {
+      bytes4 selector;
+      assembly {
+        selector := mload(add(reason, 32))
+      }
+      if (selector != SimulatedSwap.selector || reason.length != 100) {
+        assembly {
+          revert(add(reason, 32), mload(reason))
+        }
+      }
+      assembly {
+        amount0 := mload(add(reason, 36))
+        amount1 := mload(add(reason, 68))
+        gasUsed := mload(add(reason, 100))
+      }
+    }
+  }
+
+  function unlockCallback(
+    address,
+    bytes calldata data
+  ) external payable override returns (
+    bytes memory
+  ) {
+    uint256 gasUsed = gasleft();
+    (bool success, bytes memory returnData) = msg.sender.call(data);
+    gasUsed = gasUsed - gasleft();
+    if (!success) {
+      assembly {
+        revert(add(returnData, 32), mload(returnData))
+      }
+    }
+    (int256 amount0, int256 amount1) = abi.decode(
+      returnData,
+      (int256, int256)
+    );
+    revert SimulatedSwap(amount0, amount1, gasUsed);
+  }
+}
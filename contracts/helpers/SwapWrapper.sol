@@ -698,7 +698,10 @@ contract SwapWrapper {
       );
     }
 
-    transition();
+    (uint256 nextSlot, bool pending) = transition(
+      getGrowthMultiplierSlot(getPoolId(), _next_.log())
+    );
+    if (pending) writeGrowthMultiplier(nextSlot, getNextGrowthMultiplier());
 
     X59 member0 = getCurve().member(zeroIndex);
     X59 member1 = getCurve().member(oneIndex);
@@ -719,6 +722,12 @@ contract SwapWrapper {
     
     setKernelLength(kernelLength0);
 
+    Kernel kernel;
+    assembly {
+      kernel := _endOfStaticParams_
+    }
+    setKernel(kernel);
+
     uint256 start;
     uint256 byteCount;
 
@@ -743,19 +752,14 @@ contract SwapWrapper {
       mcopy(_staticParams_, add(start, byteCount), byteCount)
     }
 
-    Kernel kernel;
-    assembly {
-      kernel := _endOfStaticParams_
-    }
-    setKernel(kernel);
-    readStaticParams(
-      getStaticParamsStorageAddress(address(this), poolId, storagePointer)
-    );
-    readKernel(
-      kernel,
-      getStaticParamsStorageAddress(address(this), poolId, storagePointer),
-      kernelLength0
+    address storageAddress = getStaticParamsStorageAddress(
+      address(this),
+      poolId,
+      storagePointer
     );
+    readStaticParams(storageAddress);
+    (address kernelStorageAddress, ) = readKernelStorage(storageAddress);
+    readKernel(kernel, kernelStorageAddress, kernelLength0);
     setStaticParamsStoragePointerExtension(storagePointer);
 
     updateKernel();
@@ -110,7 +110,8 @@ uint16 constant _poolGrowthPortionCalldata_ = 1908;
 uint16 constant _maxPoolGrowthPortionCalldata_ = 1914;
 uint16 constant _protocolGrowthPortionCalldata_ = 1920;
 uint16 constant _pendingKernelLengthCalldata_ = 1926;
-uint16 constant _endOfStaticParamsCalldata_ = 1928;
+uint16 constant _qExpTableCalldata_ = 1928;
+uint16 constant _endOfStaticParamsCalldata_ = 1936;
 
 uint16 constant _modifyPositionInputCalldata_ = 120;
 uint16 constant _logPriceMinOffsettedCalldata_ = 120;
@@ -529,6 +530,15 @@ function getPendingKernelLengthFromCalldata() pure returns (
   }
 }
 
+function getQExpTableFromCalldata() pure returns (
+  X59 qExpTableCalldata
+) {
+  assembly {
+    qExpTableCalldata := 
+      shr(192, calldataload(_qExpTableCalldata_))
+  }
+}
+
 function getLogPriceMinOffsettedFromCalldata() pure returns (
   X59 logPriceMinOffsettedCalldata
 ) {
@@ -465,4 +465,16 @@ interface INofeeswap is IStorageAccess, ITransientAccess {
     address indexed caller,
     bytes32 data
   );
+
+  /// @notice Emitted when the exp table of a nofeeswap pool is modified.
+  /// @param poolId The target pool identifier.
+  /// @param caller Current owner of the target pool.
+  /// @param logPriceMin The first log price covered by the exp table.
+  /// @param logPriceMax The last log price covered by the exp table.
+  event ModifyExpTable(
+    uint256 indexed poolId,
+    address indexed caller,
+    X59 logPriceMin,
+    X59 logPriceMax
+  );
 }
\ No newline at end of file
@@ -352,6 +352,24 @@ interface INofeeswapDelegatee {
     X47 poolGrowthPortion
   ) external;
 
+  /// @notice This function deploys a new storage contract for the static
+  /// parameters of the target pool which hosts an exp table, i.e., the square
+  /// roots of the prices for every spaced log price between 'logPriceMin' and
+  /// 'logPriceMax'. The table replaces any existing table and it is carried
+  /// over whenever static parameters are redeployed. Swaps and position
+  /// modifications read square roots from the table instead of calculating
+  /// them whenever possible. Must be called by the current owner of the
+  /// target pool only. The table may cover at most 'maxExpTableEntries'
+  /// spaced log prices so that the storage contract respects EIP-170.
+  /// @param poolId The target pool identifier.
+  /// @param logPriceMin The first log price covered by the exp table.
+  /// @param logPriceMax The last log price covered by the exp table.
+  function modifyExpTable(
+    uint256 poolId,
+    X59 logPriceMin,
+    X59 logPriceMax
+  ) external;
+
   /// @notice Allows any address to update 'maxPoolGrowthPortion' and/or 
   /// 'protocolGrowthPortion' of a pool to the most recent values set by the 
   /// sentinel contract or protocol owner.
@@ -678,6 +678,59 @@ function readUpdateGrowthPortionsInput() pure {
   setFreeMemoryPointer(_endOfStaticParams_);
 }
 
+/// @notice Reads inputs of the external function 'modifyExpTable' and places
+/// each in the appropriate memory location.
+function readModifyExpTableInput() pure {
+  // Calldata layout for 'modifyExpTable' is as follows:
+  //
+  // '0x00': 'INofeeswapDelegatee.modifyExpTable.selector'
+  // '0x04': 'poolId'
+  // '0x24': 'logPriceMin'
+  // '0x44': 'logPriceMax'
+
+  // 'poolId' is read from calldata and placed in memory.
+  uint256 poolId;
+  assembly {
+    poolId := calldataload(4)
+  }
+  setPoolId(poolId);
+
+  // Normalized log price values are calculated next.
+  X59 shift = getLogOffsetFromPoolId(poolId) - sixteenX59;
+
+  // 'logPriceMin' is read from calldata and placed in memory.
+  X59 logPriceMin;
+  assembly {
+    logPriceMin := calldataload(36)
+  }
+  setLogPriceMin(logPriceMin);
+  X59 qMin = logPriceMin - shift;
+  require(qMin > zeroX59, LogPriceOutOfRange(logPriceMin));
+  require(qMin < thirtyTwoX59, LogPriceOutOfRange(logPriceMin));
+  setLogPriceMinOffsetted(qMin);
+
+  // 'logPriceMax' is read from calldata and placed in memory.
+  X59 logPriceMax;
+  assembly {
+    logPriceMax := calldataload(68)
+  }
+  setLogPriceMax(logPriceMax);
+  X59 qMax = logPriceMax - shift;
+  require(qMax > zeroX59, LogPriceOutOfRange(logPriceMax));
+  require(qMax < thirtyTwoX59, LogPriceOutOfRange(logPriceMax));
+  setLogPriceMaxOffsetted(qMax);
+
+  // 32 bytes are reserved for the first slot of the curve sequence.
+  Curve curve;
+  assembly {
+    curve := _endOfStaticParams_
+  }
+  setCurve(curve);
+
+  // Free memory appears immediately after the first slot of the curve.
+  setFreeMemoryPointer(_endOfStaticParams_ + 32);
+}
+
 /// @notice Reads the inputs of the external function 'swap' and places each in
 /// the appropriate memory location.
 function readSwapInput() view {
@@ -255,6 +255,10 @@ error LogPriceMaxIsInBlankArea(X59 logPriceMax);
 /// correct order.
 error LogPricesOutOfOrder(X59 logPriceMin, X59 logPriceMax);
 
+/// @notice Thrown when the exp table requested via 'modifyExpTable' has more
+/// entries than a storage contract can host within the EIP-170 size limit.
+error ExpTableTooLarge(X59 logPriceMin, X59 logPriceMax);
+
 /// @notice Thrown when attempting donate to a pool whose donate flag is not 
 /// active.
 error DonateIsNotAllowed(uint256 poolId);
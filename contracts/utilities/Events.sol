@@ -15,7 +15,9 @@ import {
   getTag1,
   getHookData,
   getCurve,
-  getCurveLength
+  getCurveLength,
+  getLogPriceMin,
+  getLogPriceMax
 } from "./Memory.sol";
 import {getProtocolOwner} from "./Storage.sol";
 import {KernelCompact} from "./KernelCompact.sol";
@@ -372,4 +374,13 @@ function emitUpdateGrowthPortionsEvent() {
     // Now we restore the cached content.
     mstore(add(_maxPoolGrowthPortion_, 12), content)
   }
-}
\ No newline at end of file
+}
+
+function emitModifyExpTableEvent() {
+  emit INofeeswap.ModifyExpTable(
+    getPoolId(),
+    msg.sender,
+    getLogPriceMin(),
+    getLogPriceMax()
+  );
+}
@@ -167,6 +167,44 @@ library FullMathLibrary {
     }
   }
 
+  /// @notice Calculates 'floor(sqrt(value))'.
+  /// Credit to Solady under MIT license https://github.com/vectorized/solady
+  /// for this function.
+  /// @param value The radicand.
+  /// @return root The floor of the square root of 'value'.
+  function sqrt(
+    uint256 value
+  ) internal pure returns (
+    uint256 root
+  ) {
+    assembly {
+      // The initial estimate is '181 * (2 ** (r / 2))' where 'r' is the
+      // largest multiple of '16' such that 'value >> r' exceeds '2 ** 24' or
+      // zero otherwise. It is then scaled by '((value >> r) + 65536) / 2 ** 18'
+      // so that it is within a factor of '1.5' from 'sqrt(value)'.
+      root := 181
+      let r := shl(7, lt(0xffffffffffffffffffffffffffffffffff, value))
+      r := or(r, shl(6, lt(0xffffffffffffffffff, shr(r, value))))
+      r := or(r, shl(5, lt(0xffffffffff, shr(r, value))))
+      r := or(r, shl(4, lt(0xffffff, shr(r, value))))
+      root := shl(shr(1, r), root)
+      root := shr(18, mul(root, add(shr(r, value), 65536)))
+
+      // Seven Babylonian iterations double the number of correct bits each
+      // time, which is sufficient for any 256-bit radicand.
+      root := shr(1, add(root, div(value, root)))
+      root := shr(1, add(root, div(value, root)))
+      root := shr(1, add(root, div(value, root)))
+      root := shr(1, add(root, div(value, root)))
+      root := shr(1, add(root, div(value, root)))
+      root := shr(1, add(root, div(value, root)))
+      root := shr(1, add(root, div(value, root)))
+
+      // The outcome is either 'floor(sqrt(value))' or one more than that.
+      root := sub(root, lt(div(value, root), root))
+    }
+  }
+
   /// @notice Calculates the modular inverse of an odd number modulo '2 ** 256'
   /// Input should be odd.
   /// @param value The number whose modular inverse to be calculated.
@@ -18,6 +18,11 @@ function getHook() pure returns (IHook hookAddress) {
 }
 
 /// @notice Makes a call to the hook.
+///
+/// The memory snapshot is already in place when this function is invoked.
+/// Hence, the cost of 'call' does not depend on 'hookInputByteCount' and
+/// hooks which only need a few values (e.g., 'poolId' and the two amounts)
+/// can read them via 'HookCalldata.sol' without copying 'hookInput'.
 function invokeHook(bytes4 selector) {
   // The appropriate selector corresponding to the method to be invoked is
   // placed in memory. 'selector' is cast as a 'uint32' because the setter
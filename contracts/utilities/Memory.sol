@@ -4947,9 +4947,9 @@ uint16 constant _pointers_ = 1519;
 // kernel.
 // The memory space starting from 'getKernel()' to
 // 'getKernel() + 64 * (getKernelLength() - 1)' hosts the kernel breakpoints
-// that are loaded from the bytecode of the storage smart contract (64 bytes
-// for each breakpoint of the kernel function except for '(b[0], c[0])' which
-// is omitted).
+// that are loaded from the bytecode of the kernel storage smart contract (64
+// bytes for each breakpoint of the kernel function except for '(b[0], c[0])'
+// which is omitted).
 uint16 constant _kernel_ = 1519;
 
 // The content of this 32 bytes memory space points to the beginning of the
@@ -4965,7 +4965,7 @@ uint16 constant _curve_ = 1551;
 uint16 constant _hookData_ = 1583;
 
 // This 2 bytes memory space hosts the number of breakpoints of the kernel
-// function which is calculated from the size of the storage smart contract.
+// function which is read from the storage smart contract.
 uint16 constant _kernelLength_ = 1615;
 
 // This 2 bytes memory space hosts the number of members of the curve sequence.
@@ -5190,20 +5190,24 @@ uint16 constant _integral0_ = 1695;
 //
 uint16 constant _integral1_ = 1722;
 
-// For every pool, the static parameters and the kernel are encoded in the
-// source code of a storage smart contract which is deployed using a disposable
-// proxy contract. When deploying a new storage smart contract, its creation
-// code is stored in this 11 bytes memory space with static parameters and
-// kernel appearing immediately after. This way, a chunk of memory can be sent
-// to the proxy in order to deploy the storage smart contract.
+// For every pool, the static parameters are encoded in the source code of a
+// storage smart contract which is deployed using a disposable proxy contract.
+// The storage smart contract refers to a kernel storage smart contract which
+// hosts the kernel and is shared among all pools with the same kernel (see
+// 'Storage.sol'). When deploying a new storage smart contract, its creation
+// code is stored in this 11 bytes memory space with static parameters
+// appearing immediately after. This way, a chunk of memory can be sent to the
+// proxy in order to deploy the storage smart contract.
 uint16 constant _deploymentCreationCode_ = 1749;
 
 // Static Parameters
 // ----------------------------------------------------------------------------
 // The following memory pointers are dedicated to the static parameters of the
 // pool that do not change as frequently as dynamic parameters. They are stored
-// along with the kernel. Hence, everytime the kernel or any of the growth
-// portions are updated, the entire storage smart contract is redeployed.
+// along with a reference to the kernel. Hence, everytime the kernel or any of
+// the growth portions are updated, the storage smart contract is redeployed.
+// A kernel storage smart contract is deployed only if no pool has used the
+// same kernel before.
 uint16 constant _staticParams_ = 1760;
 
 // The arithmetically smaller tag to be traded by the pool. This value is
@@ -5467,7 +5471,15 @@ uint16 constant _protocolGrowthPortion_ = 2048;
 // the middle of a swap, i.e., read from the new storage smart contract.
 uint16 constant _pendingKernelLength_ = 2054;
 
-uint16 constant _endOfStaticParams_ = 2056;
+// The first log price of the exp table which is hosted by the storage smart
+// contract after the reference to the kernel storage smart contract (see
+// 'Storage.sol'). The value '0' indicates that there is no exp table, in which
+// case 'readExp' does not access the storage smart contract. This value is
+// set by 'modifyExpTable' and it is carried over whenever static parameters
+// are redeployed along with the table.
+uint16 constant _qExpTable_ = 2056;
+
+uint16 constant _endOfStaticParams_ = 2064;
 
 // Modify Position Parameters
 // ----------------------------------------------------------------------------
@@ -6445,6 +6457,28 @@ function setPendingKernelLength(
   }
 }
 
+function getQExpTable() pure returns (
+  X59 qExpTable
+) {
+  assembly {
+    qExpTable := shr(192, mload(_qExpTable_))
+  }
+}
+
+function setQExpTable(
+  X59 qExpTable
+) pure {
+  assembly {
+    mstore(
+      _qExpTable_,
+      or(
+        shl(192, qExpTable),
+        shr(64, mload(add(_qExpTable_, 8)))
+      )
+    )
+  }
+}
+
 function getLogPriceMinOffsetted() pure returns (
   X59 logPriceMinOffsetted
 ) {
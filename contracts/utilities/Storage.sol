@@ -24,6 +24,8 @@ import {
   getCurve,
   getCurveLength,
   getLogPriceCurrent,
+  getQExpTable,
+  setQExpTable,
   getKernelLength,
   getKernel,
   getPoolGrowthPortion,
@@ -54,7 +56,7 @@ import {Index, zeroIndex, oneIndex, twoIndex, max} from "./Index.sol";
 import {Tag} from "./Tag.sol";
 import {X23} from "./X23.sol";
 import {X47, oneX47, min} from "./X47.sol";
-import {X59} from "./X59.sol";
+import {X59, zeroX59} from "./X59.sol";
 import {zeroX111} from "./X111.sol";
 import {X127, zeroX127, accruedMax} from "./X127.sol";
 import {X208, zeroX208, exp8X208} from "./X208.sol";
@@ -71,6 +73,7 @@ import {
 } from "./Errors.sol";
 
 using PriceLibrary for uint16;
+using PriceLibrary for uint256;
 
 /// @notice Writes a single slot on storage.
 /// @param storageSlot the slot to be populated.
@@ -869,8 +872,14 @@ function readGrowthMultiplier0(
   // If 'growthMultiplier[qBoundary]' is not set before, then it should be
   // calculated, written on storage and returned.
   if (growthMultiplier == zeroX208) {
-    // The default value for 'growthMultiplier[qBoundary]' is calculated.
-    growthMultiplier = calculateGrowthMultiplier0(qBoundary);
+    // The default value for 'growthMultiplier[qBoundary]' is calculated as
+    // in 'calculateGrowthMultiplier0' except that the exp table is used, if
+    // available.
+    (X216 sqrtPrice, ) = readExp(qBoundary);
+    growthMultiplier = exp8X208.mulDiv(
+      sqrtPrice,
+      oneX216 - _spacing_.sqrt(false)
+    );
 
     // The calculation for 'growthMultiplier[qBoundary]' is written on storage.
     writeGrowthMultiplier(storageSlot, growthMultiplier);
@@ -901,8 +910,14 @@ function readGrowthMultiplier1(
   // If 'growthMultiplier[qBoundary]' is not set before, then it should be
   // calculated, written on storage and returned.
   if (growthMultiplier == zeroX208) {
-    // The default value for 'growthMultiplier[qBoundary]' is calculated.
-    growthMultiplier = calculateGrowthMultiplier1(qBoundary);
+    // The default value for 'growthMultiplier[qBoundary]' is calculated as
+    // in 'calculateGrowthMultiplier1' except that the exp table is used, if
+    // available.
+    (, X216 sqrtInversePrice) = readExp(qBoundary);
+    growthMultiplier = exp8X208.mulDiv(
+      sqrtInversePrice,
+      oneX216 - _spacing_.sqrt(false)
+    );
 
     // The calculated for 'growthMultiplier[qBoundary]' is written on storage.
     writeGrowthMultiplier(storageSlot, growthMultiplier);
@@ -1298,6 +1313,18 @@ function readCurve() view returns (Index curveLength) {
 
 /// @notice Writes the current curve sequence on storage.
 function writeCurve() {
+  writeCurve(zeroIndex);
+}
+
+/// @notice Writes the current curve sequence on storage, starting from the
+/// slot which hosts the member 'curveIndex'.
+///
+/// @param curveIndex The lowest index among the members of the curve sequence
+/// which may have been modified since the curve was read from storage. Every
+/// slot prior to the one hosting 'curveIndex' is identical on storage and in
+/// memory. Hence, these slots are not written again. 'curveIndex' should be
+/// less than 'getCurveLength()'.
+function writeCurve(Index curveIndex) {
   // Reads the first slot of the curve sequence from storage.
   uint256 storageSlot = getCurveSlot(getPoolId());
 
@@ -1312,8 +1339,13 @@ function writeCurve() {
     // The last storage slot for the curve sequence is read derived.
     let finalSlot := add(storageSlot, shr(2, sub(curveLength, 1)))
 
-    // The first slot of the curve sequence is loaded from memory and written
-    // on storage.
+    // Both 'storageSlot' and 'memoryPointer' are moved to the slot which hosts
+    // 'curveIndex'.
+    storageSlot := add(storageSlot, shr(2, curveIndex))
+    memoryPointer := add(memoryPointer, shl(5, shr(2, curveIndex)))
+
+    // The slot of the curve sequence which hosts 'curveIndex' is loaded from
+    // memory and written on storage.
     sstore(storageSlot, mload(memoryPointer))
 
     // This loop continues until we encounter 'finalSlot'.
@@ -1333,12 +1365,90 @@ function writeCurve() {
 
 ////////////////////////////////////////// Static parameters and kernel storage
 
+// The static parameters of each pool are stored in the bytecode of a
+// dedicated 'storage contract' with the following content:
+//
+//  '0x00 | static parameters | kernelStorageAddress | kernelLength'
+//
+// where 'kernelStorageAddress' (20 bytes) is the address of a 'kernel storage
+// contract' and 'kernelLength' (2 bytes) is the number of kernel breakpoints.
+// Optionally, the storage contract may also host an exp table:
+//
+//  '0x00 | static parameters | kernelStorageAddress | kernelLength |
+//   price(qExpTable) | price(qExpTable + qSpacing) | ...'
+//
+// where 'qExpTable', i.e., the last static parameter, is the first spaced log
+// price of the table and each 'price' (62 bytes) is the output of 'exp' with
+// the layout of 'storePrice' in 'Price.sol'. The table is calculated on chain
+// via 'modifyExpTable' and it is carried over whenever the storage contract is
+// redeployed. Storage contracts without a table end right after
+// 'kernelLength' and their 'qExpTable' is '0'.
+//
+// The bytecode of a storage contract may not exceed the EIP-170 limit of 24576
+// bytes. Hence, the table may host at most
+//
+//  '(24576 - 1 - (_endOfStaticParams_ - _staticParams_) - 22) / 62 == 391'
+//
+// entries.
+uint256 constant maxExpTableEntries = 391;
+//
+// The content of a kernel storage contract is:
+//
+//  '0x00 | kernel breakpoints'
+//
+// Kernel storage contracts are content-addressed, i.e., the address of each
+// one is derived from the hash of its breakpoints. Hence, pools with identical
+// kernels share a single kernel storage contract which is deployed only once.
+
 /// @notice This function deploys a storage contract whose bytecode contains
-/// the pool's static parameters.
+/// the pool's static parameters. The kernel storage contract for the current
+/// kernel is deployed as well, unless it already exists.
 ///
 /// @param storagePointer The pointer which is used to derive the address of
 /// the storage smart contract.
 function writeStaticParams(uint256 storagePointer) {
+  writeStaticParams(storagePointer, writeKernel());
+}
+
+/// @notice This function deploys a storage contract whose bytecode contains
+/// the pool's static parameters along with a reference to an existing kernel
+/// storage contract. The storage contract does not host an exp table.
+///
+/// @param storagePointer The pointer which is used to derive the address of
+/// the storage smart contract.
+/// @param kernelStorageAddress The address of the kernel storage contract
+/// whose bytecode comprises the breakpoints of the current kernel.
+function writeStaticParams(
+  uint256 storagePointer,
+  address kernelStorageAddress
+) {
+  writeStaticParams(storagePointer, kernelStorageAddress, 0, 0);
+}
+
+/// @notice This function deploys a storage contract whose bytecode contains
+/// the pool's static parameters along with a reference to an existing kernel
+/// storage contract, followed by the given exp table.
+///
+/// @param storagePointer The pointer which is used to derive the address of
+/// the storage smart contract.
+/// @param kernelStorageAddress The address of the kernel storage contract
+/// whose bytecode comprises the breakpoints of the current kernel.
+/// @param expTable The memory pointer referring to the exp table, as produced
+/// by either 'readExpTable' or 'calculateExpTable'. No other data should be
+/// placed in memory after the table. If there is a table, its first log price
+/// should be present in memory as 'qExpTable'.
+/// @param expTableByteCount The number of bytes occupied by the exp table
+/// which is '0' if there is no table.
+function writeStaticParams(
+  uint256 storagePointer,
+  address kernelStorageAddress,
+  uint256 expTable,
+  uint256 expTableByteCount
+) {
+  // Without a table, 'qExpTable' is deployed as '0' so that 'readExp' does not
+  // look for one.
+  if (expTableByteCount == 0) setQExpTable(zeroX59);
+
   uint256 poolId = getPoolId();
   address proxy;
   assembly {
@@ -1357,16 +1467,18 @@ function writeStaticParams(uint256 storagePointer) {
 
   require(proxy != address(0), DeploymentFailed());
 
-  // The total number of bytes to be written.
-  Index length = getKernelLength();
+  // The total number of bytes to be written, i.e., static parameters followed
+  // by 20 bytes of 'kernelStorageAddress', 2 bytes of 'kernelLength' and the
+  // exp table.
+  Index kernelLength = getKernelLength();
+  uint256 length;
   uint256 deploymentCreationCode;
   assembly {
     length := add(
-      sub(_endOfStaticParams_, _staticParams_), // Length of static parameters.
-      shl(6, sub(length, 1)) // Length of kernel.
+      add(sub(_endOfStaticParams_, _staticParams_), 22),
+      expTableByteCount
     )
-    // '1' is added to include the '00' padding bytes. Due the '1019' limit on
-    // the size of kernel, the addition is always safe.
+    // '1' is added to include the '00' padding bytes.
     deploymentCreationCode := or(DEPLOYMENT_CODE, shl(64, add(length, 1)))
   }
   setDeploymentCreationCode(deploymentCreationCode);
@@ -1374,27 +1486,193 @@ function writeStaticParams(uint256 storagePointer) {
   // Data is written from memory to a new contract via the proxy.
   bool success;
   assembly {
-    success := call(
-      gas(),
-      proxy,
-      0,
-      _deploymentCreationCode_,
-      add(length, 11), // Because 'DEPLOYMENT_CODE' is 11 bytes.
-      0,
-      0
-    )
+    let kernelReference :=
+      or(shl(96, kernelStorageAddress), shl(80, kernelLength))
+
+    switch expTableByteCount
+    case 0 {
+      // The reference to the kernel storage contract is placed immediately
+      // after static parameters. The overwritten memory slot is restored
+      // after the deployment.
+      let overwritten := mload(_endOfStaticParams_)
+      mstore(_endOfStaticParams_, kernelReference)
+      success := call(
+        gas(),
+        proxy,
+        0,
+        _deploymentCreationCode_,
+        add(length, 11), // Because 'DEPLOYMENT_CODE' is 11 bytes.
+        0,
+        0
+      )
+      mstore(_endOfStaticParams_, overwritten)
+    }
+    default {
+      // The exp table may start at '_endOfStaticParams_'. Hence, the creation
+      // code, static parameters, the reference to the kernel storage contract
+      // and the exp table are assembled right after the table in memory.
+      let creationCode := add(expTable, expTableByteCount)
+      let header := add(sub(_endOfStaticParams_, _deploymentCreationCode_), 22)
+      mcopy(creationCode, _deploymentCreationCode_, header)
+      mstore(add(creationCode, sub(header, 22)), kernelReference)
+      mcopy(add(creationCode, header), expTable, expTableByteCount)
+      success := call(
+        gas(),
+        proxy,
+        0,
+        creationCode,
+        add(length, 11), // Because 'DEPLOYMENT_CODE' is 11 bytes.
+        0,
+        0
+      )
+    }
   }
 
   require(success, DeploymentFailed());
 }
 
+/// @notice This function redeploys the static parameters of the storage
+/// contract at 'sourcePointer' to 'targetPointer' along with the given exp
+/// table. The new storage contract refers to the same kernel storage contract.
+///
+/// @param sourcePointer The pointer which is used to derive the address of
+/// the existing storage smart contract.
+/// @param targetPointer The pointer which is used to derive the address of
+/// the new storage smart contract.
+/// @param qExpTable The first log price of the exp table.
+/// @param expTable The memory pointer referring to the exp table.
+/// @param expTableByteCount The number of bytes occupied by the exp table.
+function redeployStaticParams(
+  uint256 sourcePointer,
+  uint256 targetPointer,
+  X59 qExpTable,
+  uint256 expTable,
+  uint256 expTableByteCount
+) {
+  address storageAddress = getStaticParamsStorageAddress(sourcePointer);
+  readStaticParams(storageAddress);
+  setQExpTable(qExpTable);
+  (
+    address kernelStorageAddress,
+    Index kernelLength
+  ) = readKernelStorage(storageAddress);
+  setKernelLength(kernelLength);
+  writeStaticParams(
+    targetPointer,
+    kernelStorageAddress,
+    expTable,
+    expTableByteCount
+  );
+}
+
+/// @notice This function deploys a kernel storage contract whose bytecode
+/// contains the breakpoints of the current kernel, unless a kernel storage
+/// contract with the same content already exists.
+///
+/// @return kernelStorageAddress The address of the kernel storage contract
+/// whose bytecode comprises the breakpoints of the current kernel.
+function writeKernel() returns (
+  address kernelStorageAddress
+) {
+  Kernel kernel = getKernel();
+  Index length = getKernelLength();
+  uint256 byteCount;
+  uint256 overwritten;
+  uint256 kernelHash;
+  assembly {
+    // Each breakpoint of the kernel is 64 bytes. The first breakpoint is
+    // omitted.
+    byteCount := shl(6, sub(length, 1))
+
+    // The memory slot prior to the kernel is overwritten temporarily and is
+    // restored at the end.
+    overwritten := mload(sub(kernel, 32))
+
+    // The byte count is hashed along with the breakpoints. Hence, the input
+    // of the hash is never 64 bytes which rules out any collision with the
+    // storage pointers of static parameters.
+    mstore(sub(kernel, 32), byteCount)
+    kernelHash := keccak256(sub(kernel, 32), add(byteCount, 32))
+  }
+
+  kernelStorageAddress = getKernelStorageAddress(kernelHash);
+
+  bool success = true;
+  assembly {
+    if iszero(extcodesize(kernelStorageAddress)) {
+      // The 'proxy contract' is deployed first.
+      mstore(0x00, PROXY_CREATION_CODE)
+      let proxy := create2(0, 0x10, 0x10, kernelHash)
+
+      // 'DEPLOYMENT_CODE' occupies the 11 bytes prior to the kernel. '1' is
+      // added to include the '00' padding bytes. Due the '1019' limit on the
+      // size of kernel, the addition is always safe.
+      mstore(
+        sub(kernel, 32),
+        or(DEPLOYMENT_CODE, shl(64, add(byteCount, 1)))
+      )
+
+      // Data is written from memory to a new contract via the proxy.
+      success := and(
+        iszero(iszero(proxy)),
+        call(gas(), proxy, 0, sub(kernel, 11), add(byteCount, 11), 0, 0)
+      )
+    }
+    mstore(sub(kernel, 32), overwritten)
+  }
+
+  require(success, DeploymentFailed());
+}
+
+/// @notice This function calculates the address of a storage contract which
+/// is deployed by 'nofeeswap' via a 'proxy contract'.
+///
+/// @param nofeeswap The protocol's address.
+/// @param salt The salt which is used to deploy the 'proxy contract'.
+/// @return storageAddress The address of the storage contract.
+function getStorageAddress(
+  address nofeeswap,
+  uint256 salt
+) pure returns (
+  address storageAddress
+) {
+  assembly {
+    // Fetch free memory pointer so that we can use '0x40' as scratch space.
+    let freeMemoryPointer := mload(0x40)
+
+    // Storage contracts are deployed by 'proxy contracts'. First the
+    // 'proxy contract' address is derived.
+    // 'nofeeswap' address is written in first memory slot along with a '0xff'
+    // prefix. The salt and 'PROXY_CREATION_HASH' are written in the second
+    // and third memory slots, respectively.
+    mstore(0x00, nofeeswap)
+    mstore8(0x0b, 0xff)
+    mstore(0x20, salt)
+    mstore(0x40, PROXY_CREATION_HASH)
+
+    // This 85 byte hash gives the 'proxy contract' address.
+    mstore(0x14, keccak256(0x0b, 0x55))
+
+    // Restores 'freeMemoryPointer'.
+    mstore(0x40, freeMemoryPointer)
+
+    // 0xd6 = 0xc0 (short RLP prefix) + 0x16 (length of 0x94 ++ proxy ++ 0x01)
+    // 0x94 = 0x80 + 0x14 (0x14 = the length of an address, 20 bytes, in hex)
+    mstore(0x00, 0xd694)
+    mstore8(0x34, 0x01)
+
+    // Gives the 'storage contract' address.
+    storageAddress := and(keccak256(0x1e, 0x17), shr(96, not(0)))
+  }
+}
+
 /// @notice This function calculates the address of the storage contract
-/// containing static parameters and kernel.
+/// containing static parameters.
 ///
 /// @param storagePointer The pointer which is used to derive the address of
 /// the storage smart contract.
 /// @return storageAddress The address of the storage contract whose bytecode
-/// comprises static parameters and kernel.
+/// comprises static parameters.
 function getStaticParamsStorageAddress(
   uint256 storagePointer
 ) view returns (
@@ -1412,14 +1690,14 @@ function getStaticParamsStorageAddress(
 }
 
 /// @notice This function calculates the address of the storage contract
-/// containing static parameters and kernel.
+/// containing static parameters.
 ///
 /// @param nofeeswap The protocol's address.
 /// @param poolId The corresponding 'poolId'.
 /// @param storagePointer The pointer which is used to derive the address of
 /// the storage smart contract.
 /// @return storageAddress The address of the storage contract whose bytecode
-/// comprises static parameters and kernel.
+/// comprises static parameters.
 function getStaticParamsStorageAddress(
   address nofeeswap,
   uint256 poolId,
@@ -1432,42 +1710,34 @@ function getStaticParamsStorageAddress(
     mstore(0, poolId)
     mstore(32, storagePointer)
     storagePointer := keccak256(0, 64)
+  }
+  return getStorageAddress(nofeeswap, storagePointer);
+}
 
-    // Fetch free memory pointer so that we can use '0x40' as scratch space.
-    let freeMemoryPointer := mload(0x40)
-
-    // Pool static parameters are stored in a 'storage contract' which is 
-    // deployed by a 'proxy contract'. First the 'proxy contract' address is
-    // derived.
-    // 'nofeeswap' address is written in first memory slot along with a '0xff'
-    // prefix. The storage pointer and 'PROXY_CREATION_HASH' are written in
-    // the second and third memory slots, respectively.
-    mstore(0x00, nofeeswap)
-    mstore8(0x0b, 0xff)
-    mstore(0x20, storagePointer)
-    mstore(0x40, PROXY_CREATION_HASH)
-
-    // This 85 byte hash gives the 'proxy contract' address.
-    mstore(0x14, keccak256(0x0b, 0x55))
-
-    // Restores 'freeMemoryPointer'.
-    mstore(0x40, freeMemoryPointer)
-
-    // 0xd6 = 0xc0 (short RLP prefix) + 0x16 (length of 0x94 ++ proxy ++ 0x01)
-    // 0x94 = 0x80 + 0x14 (0x14 = the length of an address, 20 bytes, in hex)
-    mstore(0x00, 0xd694)
-    mstore8(0x34, 0x01)
-
-    // Gives the 'storage contract' address.
-    storageAddress := and(keccak256(0x1e, 0x17), shr(96, not(0)))
+/// @notice This function calculates the address of the kernel storage
+/// contract for a given kernel.
+///
+/// @param kernelHash The hash of the kernel breakpoints prefixed with their
+/// byte count.
+/// @return kernelStorageAddress The address of the kernel storage contract
+/// whose bytecode comprises the kernel breakpoints.
+function getKernelStorageAddress(
+  uint256 kernelHash
+) view returns (
+  address kernelStorageAddress
+) {
+  address nofeeswap;
+  assembly {
+    nofeeswap := address()
   }
+  return getStorageAddress(nofeeswap, kernelHash);
 }
 
 /// @notice This function reads pool's static parameters from storageAddress 
 /// and sets them in appropriate memory locations:
 ///
 /// @param storageAddress The address of the storage contract whose bytecode
-/// comprises static parameters and kernel.
+/// comprises static parameters.
 function readStaticParams(
   address storageAddress
 ) view {
@@ -1485,73 +1755,206 @@ function readStaticParams(
 /// them in appropriate memory locations.
 ///
 /// @param storageAddress The address of the storage contract whose bytecode
-/// comprises static parameters and kernel.
+/// comprises static parameters.
 function readStaticParamsAndKernel(
   address storageAddress
 ) view {
   readStaticParams(storageAddress);
-  Index kernelLength = readKernelLength(storageAddress);
+  (
+    address kernelStorageAddress,
+    Index kernelLength
+  ) = readKernelStorage(storageAddress);
   setKernelLength(kernelLength);
-  readKernel(getKernel(), storageAddress, kernelLength);
+  readKernel(getKernel(), kernelStorageAddress, kernelLength);
 }
 
-/// @notice This function reads kernel length.
+/// @notice This function reads the address of the kernel storage contract as
+/// well as the kernel length.
 ///
 /// @param storageAddress The address of the storage contract whose bytecode
-/// comprises static parameters and kernel.
+/// comprises static parameters.
+/// @return kernelStorageAddress The address of the kernel storage contract
+/// whose bytecode comprises the kernel breakpoints.
 /// @return length The number of kernel breakpoints.
-function readKernelLength(
+function readKernelStorage(
   address storageAddress
 ) view returns (
+  address kernelStorageAddress,
   Index length
 ) {
   assembly {
-    // The total number of bytes to be loaded.
-    // Each breakpoint of the kernel is 64 bytes. The first breakpoint is 
-    // omitted.
-    length := add(
-      shr(
-        6,
-        sub(
-          sub(extcodesize(storageAddress), 1),
-          sub(_endOfStaticParams_, _staticParams_)
-        )
-      ),
-      1
+    // The 22 bytes after static parameters are loaded in scratch space.
+    extcodecopy(
+      storageAddress,
+      0,
+      add(1, sub(_endOfStaticParams_, _staticParams_)),
+      22
     )
+    let content := mload(0)
+    kernelStorageAddress := shr(96, content)
+    length := and(shr(80, content), 0xFFFF)
+  }
+}
+
+/// @notice This function copies the exp table of a storage contract, if any,
+/// to memory.
+///
+/// @param storageAddress The address of the storage contract whose bytecode
+/// comprises static parameters.
+/// @param expTable The memory pointer to which the exp table is copied.
+/// @return expTableByteCount The number of bytes occupied by the exp table
+/// which is '0' if there is no table.
+function readExpTable(
+  address storageAddress,
+  uint256 expTable
+) view returns (
+  uint256 expTableByteCount
+) {
+  assembly {
+    // The exp table starts after the '00' padding byte, static parameters,
+    // and the 22 bytes of the reference to the kernel storage contract.
+    let start := add(23, sub(_endOfStaticParams_, _staticParams_))
+    let size := extcodesize(storageAddress)
+    if gt(size, start) {
+      expTableByteCount := sub(size, start)
+      extcodecopy(storageAddress, expTable, start, expTableByteCount)
+    }
+  }
+}
+
+/// @notice This function calculates the exp table for the spaced log prices
+/// 'qMin, qMin + qSpacing, ..., qMax' and places it in memory with the
+/// following layout:
+///
+///  'price(qMin) | price(qMin + qSpacing) | ... | price(qMax)'
+///
+/// where each 'price' takes 62 bytes with the layout of 'storePrice' in
+/// 'Price.sol'. 'qMin' itself is recorded as 'qExpTable' by
+/// 'redeployStaticParams'.
+///
+/// 'qMin' and 'qMax' should be spaced with 'qMin <= qMax'. Both should be
+/// greater than 0 and less than (2 ** 64).
+///
+/// @param expTable The memory pointer to which the exp table is written.
+/// @param qMin The first spaced log price of the table.
+/// @param qMax The last spaced log price of the table.
+/// @return expTableByteCount The number of bytes occupied by the exp table.
+function calculateExpTable(
+  uint256 expTable,
+  X59 qMin,
+  X59 qMax
+) pure returns (
+  uint256 expTableByteCount
+) {
+  X59 qSpacing = _spacing_.log();
+
+  // The requirements of 'storePrice' are satisfied here because every
+  // spaced log price of the table is between 'qMin' and 'qMax'.
+  uint256 pointer = expTable;
+  for (X59 logPrice = qMin; logPrice <= qMax; logPrice = logPrice + qSpacing) {
+    pointer.storePrice(logPrice);
+    pointer += 62;
   }
+  expTableByteCount = pointer - expTable;
 }
 
-/// @notice This function reads kernel from storageAddress and sets it in
+/// @notice This function returns the output of 'exp' for a given spaced
+/// 'logPrice'. If 'logPrice' is covered by the exp table of the current
+/// storage contract, the output is read from the table. Otherwise, it is
+/// calculated via 'exp'.
+///
+/// The table is calculated on chain via 'exp'. Hence, an entry whose log
+/// price matches 'logPrice' is identical to the output of 'exp'.
+///
+/// 'logPrice' should be greater than 0 and less than (2 ** 64). Static
+/// parameters, including 'qExpTable', should have been read via
+/// 'readStaticParams'. If there is no table, the storage contract is not
+/// accessed.
+///
+/// @param logPrice The spaced log price whose exponential is to be derived.
+/// @return sqrtPrice '(2 ** 216) * exp(- logPrice / (2 ** 60))'.
+/// @return sqrtInversePrice '(2 ** 216) * exp(- 16 + logPrice / (2 ** 60))'.
+function readExp(
+  X59 logPrice
+) view returns (
+  X216 sqrtPrice,
+  X216 sqrtInversePrice
+) {
+  X59 qExpTable = getQExpTable();
+  bool found;
+  if (qExpTable != zeroX59 && logPrice >= qExpTable) {
+    address storageAddress = getStaticParamsStorageAddress(
+      getStaticParamsStoragePointerExtension()
+    );
+    X59 qSpacing = _spacing_.log();
+    assembly {
+      // The exp table starts after the '00' padding byte, static parameters
+      // and the 22 bytes of the reference to the kernel storage contract.
+      let start := add(23, sub(_endOfStaticParams_, _staticParams_))
+
+      // The corresponding entry is loaded in the first 62 bytes of scratch
+      // space. Entries beyond the end of the table are padded with zeros
+      // and do not match 'logPrice'. The multiplication is safe because
+      // 'qSpacing >= minLogSpacing'.
+      extcodecopy(
+        storageAddress,
+        0,
+        add(start, mul(62, div(sub(logPrice, qExpTable), qSpacing))),
+        62
+      )
+      found := eq(shr(192, mload(0)), logPrice)
+      sqrtPrice := shr(40, mload(8))
+      sqrtInversePrice := shr(40, mload(35))
+    }
+  }
+
+  // The requirements of 'exp' are satisfied here due to the input
+  // requirement of the present function.
+  if (!found) (sqrtPrice, sqrtInversePrice) = logPrice.exp();
+}
+
+/// @notice This function reads kernel from kernelStorageAddress and sets it in
 /// the appropriate memory location.
 ///
 /// @param kernel The memory pointer referring to the memory space which hosts
 /// the list of kernel breakpoints.
-/// @param storageAddress The address of the storage contract whose bytecode
-/// comprises static parameters and kernel.
+/// @param kernelStorageAddress The address of the kernel storage contract
+/// whose bytecode comprises the kernel breakpoints.
 /// @param length The number of kernel breakpoints.
 function readKernel(
   Kernel kernel,
-  address storageAddress,
+  address kernelStorageAddress,
   Index length
 ) view {
   assembly {
-    // Data is loaded from the 'storageAddress' to memory.
-    extcodecopy(
-      storageAddress,
-      kernel,
-      add(1, sub(_endOfStaticParams_, _staticParams_)),
-      shl(6, sub(length, 1))
-    )
+    // Data is loaded from the 'kernelStorageAddress' to memory.
+    extcodecopy(kernelStorageAddress, kernel, 1, shl(6, sub(length, 1)))
   }
 }
 
 /// @notice Reads pool data and sets it in the appropriate memory location.
 function readPoolData() view {
+  address kernelStorageAddress = readPoolDataExceptKernel();
+
+  // Kernel breakpoints are read from the kernel storage contract and stored
+  // in memory.
+  readKernel(getKernel(), kernelStorageAddress, getKernelLength());
+}
+
+/// @notice Reads pool data except for the kernel breakpoints and sets it in the
+/// appropriate memory location. The memory space for the kernel is reserved
+/// so that the breakpoints can be loaded later via 'readKernel', only if they
+/// are needed.
+///
+/// @return kernelStorageAddress The address of the kernel storage contract
+/// whose bytecode comprises the kernel breakpoints.
+function readPoolDataExceptKernel() view returns (
+  address kernelStorageAddress
+) {
   readDynamicParams();
 
   // The address of the storage contract whose bytecode comprises static
-  // parameters and kernel.
+  // parameters.
   address storageAddress = getStaticParamsStorageAddress(
     getStaticParamsStoragePointerExtension()
   );
@@ -1564,14 +1967,13 @@ function readPoolData() view {
     min(getPoolGrowthPortion(), getMaxPoolGrowthPortion())
   );
 
-  // The length of the kernel is determined.
-  Index length = readKernelLength(storageAddress);
+  // The kernel storage contract and the length of the kernel are determined.
+  Index length;
+  (kernelStorageAddress, length) = readKernelStorage(storageAddress);
   setKernelLength(length);
 
-  // Kernel breakpoints are read from the storage contract and stored in
-  // memory.
+  // The memory pointer for the kernel breakpoints.
   Kernel kernel = getKernel();
-  readKernel(kernel, storageAddress, length);
 
   // If needed, additional space is reserved in memory for the pending kernel.
   length = max(length, getPendingKernelLength());
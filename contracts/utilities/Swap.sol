@@ -34,7 +34,6 @@ import {
   getKernel,
   getGrowth,
   getStaticParamsStoragePointerExtension,
-  getPendingKernelLength,
   getNextGrowthMultiplier,
   getBackGrowthMultiplier,
   getPoolRatio0,
@@ -91,10 +90,12 @@ import {
   getGrowthMultiplierSlot,
   readSharesDelta,
   getStaticParamsStorageAddress,
+  readKernelStorage,
   readKernel,
   readGrowthMultiplier,
   writeGrowthMultiplier,
   readStaticParams,
+  readExp,
   getSharesDeltaSlot
 } from "./Storage.sol";
 import {InvalidDirection} from "./Errors.sol";
@@ -186,7 +187,7 @@ function updateAmounts(
 }
 
 /// @notice Calculates prerequisite parameters that are needed to perform swaps.
-function setSwapParams() pure {
+function setSwapParams() view {
   // Interval boundaries are read from the curve sequence in memory.
   (X59 qLower, X59 qUpper) = getCurve().boundaries();
 
@@ -240,10 +241,14 @@ function setSwapParams() pure {
   // of the swap.
   (qLower, qUpper) = zeroForOne ? (qUpper, qLower) : (qLower, qUpper);
 
-  // Square root of the price for 'back' is calculated via the exponential 
+  // Square root of the price for 'back' is read from the exp table of the
+  // pool, if available. Otherwise, it is calculated via the exponential
   // function.
-  // The requirement of 'exp' is satisfied because '0 < qLower < 2 ** 64'.
-  _back_.storePrice(qLower);
+  // The requirement of 'readExp' is satisfied because '0 < qLower < 2 ** 64'.
+  {
+    (X216 sqrtPrice, X216 sqrtInversePrice) = readExp(qLower);
+    _back_.storePrice(qLower, sqrtPrice, sqrtInversePrice);
+  }
 
   // Square root of the price for 'next' is calculated.
   // Multiplications are safe because the results are smaller than 'oneX216'.
@@ -702,7 +707,24 @@ function cross() pure returns (bool halt) {
 }
 
 /// @notice Transitions to the next interval.
-function transition() {
+///
+/// 'backSlot' is the storage slot for the growth multiplier of 'qNext' prior
+/// to the transition, i.e., the boundary being crossed. The storage slot for
+/// the growth multiplier of the new 'qNext' is returned as 'nextSlot' so that
+/// the subsequent transition does not recompute the same hash.
+///
+/// If the growth multiplier of the new 'qNext' is not populated on storage, a
+/// default value is set in memory but it is not written on storage and
+/// 'pending' is returned as true. In this case, the caller should write
+/// 'getNextGrowthMultiplier()' on 'nextSlot' once the swap comes to an end,
+/// unless a subsequent transition crosses 'qNext' in which case the default
+/// value is overwritten anyway.
+function transition(
+  uint256 backSlot
+) returns (
+  uint256 nextSlot,
+  bool pending
+) {
   bool zeroForOne = getZeroForOne();
 
   // The two reserve integrals are moved next.
@@ -741,15 +763,15 @@ function transition() {
   // growth ratios are updated next.
   X208 growthMultiplierCurrent = getNextGrowthMultiplier();
 
-  uint256 storageSlot = getGrowthMultiplierSlot(getPoolId(), _next_.log());
-  X208 growthMultiplier = readGrowthMultiplier(storageSlot);
+  nextSlot = getGrowthMultiplierSlot(getPoolId(), _next_.log());
+  X208 growthMultiplier = readGrowthMultiplier(nextSlot);
   if (growthMultiplier == zeroX208) {
     // 'mulDiv' is safe because the output does not exceed 256-bits.
     growthMultiplier = exp8X208.mulDiv(
       _next_.sqrt(zeroForOne),
       oneX216 - _spacing_.sqrt(false)
     );
-    writeGrowthMultiplier(storageSlot, growthMultiplier);
+    pending = true;
   }
   setNextGrowthMultiplier(growthMultiplier);
 
@@ -760,8 +782,7 @@ function transition() {
     _back_.sqrt(!zeroForOne)
   );
   setBackGrowthMultiplier(growthMultiplier);
-  storageSlot = getGrowthMultiplierSlot(getPoolId(), _back_.log());
-  writeGrowthMultiplier(storageSlot, growthMultiplier);
+  writeGrowthMultiplier(backSlot, growthMultiplier);
 
   // Here, the new value for 'growth' is determined.
   // The requirements of 'mulDivByExpInv8' are satisfied because the resulting
@@ -806,13 +827,16 @@ function updateKernel() view {
     // the limit of '2 ** 256 - 1'.
     uint256 pointer = getStaticParamsStoragePointerExtension() + 1;
     setStaticParamsStoragePointerExtension(pointer);
-    Index length = getPendingKernelLength();
     address storageAddress = getStaticParamsStorageAddress(pointer);
     readStaticParams(storageAddress);
     setPoolGrowthPortion(
       min(getPoolGrowthPortion(), getMaxPoolGrowthPortion())
     );
-    readKernel(getKernel(), storageAddress, length);
+    (
+      address kernelStorageAddress,
+      Index length
+    ) = readKernelStorage(storageAddress);
+    readKernel(getKernel(), kernelStorageAddress, length);
     setKernelLength(length);
   }
 }
\ No newline at end of file
@@ -0,0 +1,211 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import sys
+import glob
+import json
+import shutil
+import hashlib
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# Runs the echidna campaigns of this directory in parallel:
+#
+#   python echidna/Orchestrator.py [--workers N] [--round S] [--patience R] [target ...]
+#
+# Every target is fuzzed by 'workers' echidna processes at a time, each with
+# a distinct seed and a corpus directory of its own. Campaigns proceed in
+# rounds of 'round' seconds. After every round:
+#
+# - the call sequences of all workers are merged into a shared corpus which
+#   is minimized and handed to every worker for the next round,
+# - the coverage reports of all workers are merged into 'covered.lcov', and
+# - the target is stopped once its covered lines have not increased for
+#   'patience' consecutive rounds, or once echidna reports a failure.
+#
+# Everything is written under 'corpus/<target>/'.
+targets = {
+    'Integral': ('IntegralTest.sol', 'IntegralTest', 'echidna.config.Integral.yml'),
+    'SearchIncoming': ('SearchIncomingTest.sol', 'SearchIncomingTest', 'echidna.config.SearchIncoming.yml'),
+    'SearchOutgoing': ('SearchOutgoingTest.sol', 'SearchOutgoingTest', 'echidna.config.SearchOutgoing.yml'),
+    'SearchOvershoot': ('SearchOvershootTest.sol', 'SearchOvershootTest', 'echidna.config.SearchOvershoot.yml')
+}
+
+echidnaPath = os.path.dirname(os.path.abspath(__file__))
+
+corpusPath = 'corpus'
+
+def getTargetPath(target):
+    return os.path.join(corpusPath, target)
+
+def getWorkerPath(target, k):
+    return os.path.join(getTargetPath(target), 'worker' + str(k))
+
+def getMergedPath(target):
+    return os.path.join(getTargetPath(target), 'merged', 'coverage')
+
+# The configuration of a worker is that of its target with its own corpus
+# directory and seed. Coverage is additionally reported in lcov format so
+# that the reports of workers can be merged.
+def writeConfig(target, k, seed):
+    source, contract, config = targets[target]
+    with open(os.path.join(echidnaPath, config), 'r') as f:
+        lines = [line.rstrip('\n') for line in f]
+    lines = [line for line in lines if line.split(':')[0].strip() not in ['corpusDir', 'seed', 'coverageFormats']]
+    lines.append("corpusDir: '" + getWorkerPath(target, k) + "'")
+    lines.append('seed: ' + str(seed))
+    lines.append('coverageFormats: ["txt", "lcov"]')
+    path = os.path.join(getWorkerPath(target, k), 'echidna.config.yml')
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    return path
+
+def readSequence(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def getSequenceName(sequence):
+    return hashlib.sha256(json.dumps(sequence, sort_keys=True).encode()).hexdigest() + '.txt'
+
+# Every transaction of a sequence is executed regardless of whether the
+# previous ones revert. Hence, the coverage of a sequence includes that of
+# each of its prefixes and such prefixes are dropped. Identical sequences are
+# stored once since files are named after their content.
+def minimize(sequences):
+    kept = []
+    for sequence in sorted(sequences, key=len, reverse=True):
+        if not any(other[0 : len(sequence)] == sequence for other in kept):
+            kept.append(sequence)
+    return kept
+
+def mergeCorpora(target, workerCount):
+    merged = getMergedPath(target)
+    sequences = dict()
+    paths = glob.glob(os.path.join(merged, '*.txt'))
+    for k in range(workerCount):
+        paths += glob.glob(os.path.join(getWorkerPath(target, k), 'coverage', '*.txt'))
+    for path in paths:
+        try:
+            sequence = readSequence(path)
+        except (ValueError, OSError):
+            continue
+        sequences[getSequenceName(sequence)] = sequence
+
+    kept = minimize(list(sequences.values()))
+    shutil.rmtree(merged, ignore_errors=True)
+    os.makedirs(merged)
+    for sequence in kept:
+        with open(os.path.join(merged, getSequenceName(sequence)), 'w') as f:
+            json.dump(sequence, f)
+    return len(kept)
+
+# Each worker starts the next round from the shared corpus only.
+def distributeCorpus(target, workerCount):
+    for k in range(workerCount):
+        coverage = os.path.join(getWorkerPath(target, k), 'coverage')
+        shutil.rmtree(coverage, ignore_errors=True)
+        shutil.copytree(getMergedPath(target), coverage)
+
+# Returns a dictionary which maps every source file to a dictionary from
+# line numbers to hit counts.
+def readLcov(path, lines):
+    source = None
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('SF:'):
+                source = line[3:]
+                lines.setdefault(source, dict())
+            elif line.startswith('DA:') and source is not None:
+                number, hits = line[3:].split(',')[0 : 2]
+                lines[source][int(number)] = max(lines[source].get(int(number), 0), int(hits))
+    return lines
+
+def writeLcov(path, lines):
+    with open(path, 'w') as f:
+        for source in sorted(lines.keys()):
+            f.write('SF:' + source + '\n')
+            for number in sorted(lines[source].keys()):
+                f.write('DA:' + str(number) + ',' + str(lines[source][number]) + '\n')
+            f.write('end_of_record\n')
+
+def countCovered(lines):
+    return sum(1 for source in lines.values() for hits in source.values() if hits > 0)
+
+# Merges the latest report of every worker into the aggregate of the target.
+def mergeCoverage(target, workerCount):
+    aggregate = os.path.join(getTargetPath(target), 'covered.lcov')
+    lines = readLcov(aggregate, dict()) if os.path.isfile(aggregate) else dict()
+    for k in range(workerCount):
+        reports = sorted(glob.glob(os.path.join(getWorkerPath(target, k), 'covered.*.lcov')), key=os.path.getmtime)
+        if len(reports) > 0:
+            readLcov(reports[-1], lines)
+        for report in glob.glob(os.path.join(getWorkerPath(target, k), 'covered.*')):
+            os.remove(report)
+    writeLcov(aggregate, lines)
+    return countCovered(lines)
+
+def runRound(target, workerCount, seconds, seed):
+    source, contract, config = targets[target]
+    processes = []
+    for k in range(workerCount):
+        os.makedirs(getWorkerPath(target, k), exist_ok=True)
+        log = open(os.path.join(getWorkerPath(target, k), 'echidna.log'), 'a')
+        processes.append((log, subprocess.Popen(
+            [
+                'echidna', os.path.join(echidnaPath, source),
+                '--contract', contract,
+                '--config', writeConfig(target, k, seed + k),
+                '--timeout', str(seconds),
+                '--format', 'text'
+            ],
+            stdout=log,
+            stderr=subprocess.STDOUT
+        )))
+    failed = False
+    for log, process in processes:
+        failed = (process.wait() != 0) or failed
+        log.close()
+    return failed
+
+def runTarget(target, workerCount, seconds, patience, seed):
+    os.makedirs(getMergedPath(target), exist_ok=True)
+    best = -1
+    stale = 0
+    roundIndex = 0
+    while stale < patience:
+        distributeCorpus(target, workerCount)
+        failed = runRound(target, workerCount, seconds, seed + roundIndex * workerCount)
+        corpusSize = mergeCorpora(target, workerCount)
+        covered = mergeCoverage(target, workerCount)
+        print(target + ': round ' + str(roundIndex) + ', ' + str(covered) + ' lines covered, ' + str(corpusSize) + ' sequences', flush=True)
+        if failed:
+            print(target + ': echidna reported a failure, see ' + os.path.join(getTargetPath(target), 'worker*', 'echidna.log'), flush=True)
+            return target, covered, False
+        if covered > best:
+            best = covered
+            stale = 0
+        else:
+            stale += 1
+        roundIndex += 1
+    return target, best, True
+
+def orchestrate(names, workerCount, seconds, patience, seed):
+    with ThreadPoolExecutor(len(names)) as executor:
+        results = list(executor.map(lambda target: runTarget(target, workerCount, seconds, patience, seed), names))
+    for target, covered, passed in results:
+        print(target + ': ' + ('plateaued' if passed else 'failed') + ' at ' + str(covered) + ' lines covered')
+    return all(passed for _, _, passed in results)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('targets', nargs='*', help='Any of ' + ', '.join(targets.keys()) + ', all by default.')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 1) // len(targets)))
+    parser.add_argument('--round', type=int, default=600, help='Duration of each round in seconds.')
+    parser.add_argument('--patience', type=int, default=3, help='Rounds without new coverage before a target is stopped.')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    for target in args.targets:
+        if target not in targets:
+            parser.error('unknown target ' + target)
+    sys.exit(0 if orchestrate(args.targets or list(targets.keys()), args.workers, args.round, args.patience, args.seed) else 1)
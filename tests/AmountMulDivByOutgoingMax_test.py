@@ -2,7 +2,7 @@
 import pytest
 import brownie
 from Nofee import logTest
-from brownie import accounts, AmountWrapper
+from brownie import AmountWrapper
 from sympy import Integer, floor, ceiling
 
 listOutgoingMax = [((1 << 216) - 1) // 5, ((1 << 216) - 1) // 3, ((1 << 216) - 1), ((1 << 100) - 1)]
@@ -15,16 +15,16 @@ listShares = [((1 << 127) - 1) // 5, ((1 << 127) - 1) // 3, ((1 << 127) - 1), (1
 listGrowthMultiplier = [((1 << 256) - 1) // 5, ((1 << 256) - 1) // 3, ((1 << 256) - 1), ((1 << 256) - 1)]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return AmountWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(AmountWrapper)
 
 @pytest.mark.parametrize('sqrtOffset', listSqrtOffset)
 @pytest.mark.parametrize('integral', listIntegral + [0])
 @pytest.mark.parametrize('growth', listGrowth)
 @pytest.mark.parametrize('shares', listShares + [0])
 @pytest.mark.parametrize('outgoingMax', listOutgoingMax)
-@pytest.mark.parametrize('zeroOrOne', [True])
-@pytest.mark.parametrize('roundUp', [True])
+@pytest.mark.parametrize('zeroOrOne', [False, True])
+@pytest.mark.parametrize('roundUp', [False, True])
 def test_mulDivByOutgoingMax(wrapper, sqrtOffset, integral, growth, shares, outgoingMax, zeroOrOne, roundUp, request, worker_id):
     logTest(request, worker_id)
     
@@ -2,7 +2,7 @@
 import pytest
 import brownie
 from Nofee import logTest
-from brownie import accounts, AmountWrapper
+from brownie import AmountWrapper
 from sympy import Integer, ceiling
 
 
@@ -16,8 +16,8 @@ listShares = [((1 << 127) - 1) // 5, ((1 << 127) - 1) // 3, ((1 << 127) - 1), (1
 listGrowthMultiplier = [((1 << 256) - 1) // 5, ((1 << 256) - 1) // 3, ((1 << 256) - 1), ((1 << 256) - 1)]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return AmountWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(AmountWrapper)
 
 @pytest.mark.parametrize('outgoingMax', listOutgoingMax)
 @pytest.mark.parametrize('sqrtOffset', listSqrtOffset)
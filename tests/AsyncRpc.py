@@ -0,0 +1,237 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import json
+import asyncio
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+# An asyncio JSON-RPC client over HTTP/1.1 which only depends on the standard
+# library, i.e.,
+#
+#   rpc = AsyncJsonRpc('http://127.0.0.1:8545')
+#   block = await rpc.blockNumber()
+#   values = await asyncio.gather(*[
+#       rpc.call('eth_getStorageAt', [address, slot], block) for slot in slots
+#   ])
+#   await rpc.close()
+#
+# Every call is queued rather than sent right away:
+#
+# - queued calls are packed into JSON-RPC batches of at most 'maxBatchSize'
+#   calls and 'maxBatchBytes' bytes once 'batchDelay' seconds have passed
+#   since the first of them, or as soon as a batch is full,
+#
+# - batches are sent over at most 'poolSize' keep-alive connections which are
+#   reused by subsequent batches,
+#
+# - a call which is identical to a queued or an in-flight call is not sent
+#   again but awaits the same response, and
+#
+# - the responses of calls which are pinned to a block number are cached for
+#   the most recent 'cacheBlocks' blocks.
+#
+# 'stats' counts the calls which are sent, coalesced and served from cache as
+# well as the batches and the connections which are opened.
+
+class RpcError(Exception):
+    def __init__(self, error):
+        super().__init__(error.get('message', str(error)) if isinstance(error, dict) else str(error))
+        self.error = error
+
+class AsyncJsonRpc:
+    def __init__(
+        self,
+        endpoint,
+        poolSize=8,
+        maxBatchSize=200,
+        maxBatchBytes=1 << 20,
+        batchDelay=0.001,
+        cacheBlocks=4,
+        timeout=60
+    ):
+        url = urlsplit(endpoint)
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == 'https' else 80)
+        self.ssl = url.scheme == 'https'
+        self.path = url.path or '/'
+        self.poolSize = poolSize
+        self.maxBatchSize = maxBatchSize
+        self.maxBatchBytes = maxBatchBytes
+        self.batchDelay = batchDelay
+        self.cacheBlocks = cacheBlocks
+        self.timeout = timeout
+
+        self.id = 0
+        self.idle = []
+        self.slots = None
+        self.queue = []
+        self.queueBytes = 0
+        self.timer = None
+        self.inflight = dict()
+        self.cache = OrderedDict()
+        self.tasks = set()
+        self.stats = {'calls': 0, 'sent': 0, 'coalesced': 0, 'cached': 0, 'batches': 0, 'connections': 0}
+
+    # Returns the result of 'method', raising 'RpcError' if the node reports
+    # an error. If 'block' is given, it is appended to 'params' as a hex
+    # quantity and the result is cached for that block.
+    async def call(self, method, params, block=None):
+        self.stats['calls'] += 1
+        if block is not None:
+            params = list(params) + [hex(block)]
+        key = json.dumps([method, params], separators=(',', ':'))
+
+        if block is not None and key in self.cache.get(block, {}):
+            self.stats['cached'] += 1
+            return self.cache[block][key]
+
+        if key in self.inflight:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(self.inflight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        self._enqueue(method, params, key, block, future)
+        return await asyncio.shield(future)
+
+    async def blockNumber(self):
+        return int(await self.call('eth_blockNumber', []), 16)
+
+    def _enqueue(self, method, params, key, block, future):
+        self.id += 1
+        body = json.dumps({'jsonrpc': '2.0', 'id': self.id, 'method': method, 'params': params}, separators=(',', ':'))
+        # A batch whose byte count exceeds 'maxBatchBytes' is sent first.
+        if len(self.queue) > 0 and self.queueBytes + len(body) + 1 > self.maxBatchBytes:
+            self._flush()
+        self.queue.append((self.id, body, key, block, future))
+        self.queueBytes += len(body) + 1
+        if len(self.queue) >= self.maxBatchSize:
+            self._flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.batchDelay, self._flush)
+
+    def _flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if len(self.queue) == 0:
+            return
+        items, self.queue, self.queueBytes = self.queue, [], 0
+        task = asyncio.get_running_loop().create_task(self._send(items))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def _resolve(self, item, response):
+        _, _, key, block, future = item
+        self.inflight.pop(key, None)
+        if future.done():
+            return
+        if isinstance(response, Exception):
+            future.set_exception(response)
+        elif 'error' in response:
+            future.set_exception(RpcError(response['error']))
+        else:
+            if block is not None:
+                self._store(block, key, response['result'])
+            future.set_result(response['result'])
+
+    def _store(self, block, key, result):
+        if block not in self.cache:
+            self.cache[block] = dict()
+            while len(self.cache) > self.cacheBlocks:
+                self.cache.popitem(last=False)
+        if block in self.cache:
+            self.cache[block][key] = result
+
+    async def _send(self, items):
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.poolSize)
+        payload = ('[' + ','.join(body for _, body, _, _, _ in items) + ']').encode('utf-8')
+        self.stats['batches'] += 1
+        self.stats['sent'] += len(items)
+        try:
+            async with self.slots:
+                responses = await asyncio.wait_for(self._post(payload), self.timeout)
+            if isinstance(responses, dict):
+                # A node may answer a whole batch with a single error.
+                responses = [dict(responses, id=identifier) for identifier, _, _, _, _ in items]
+            responses = {response.get('id'): response for response in responses}
+            for item in items:
+                self._resolve(item, responses.get(item[0], {'error': {'message': 'missing response'}}))
+        except Exception as exception:
+            for item in items:
+                self._resolve(item, exception)
+
+    async def _connect(self):
+        self.stats['connections'] += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl or None)
+
+    # Posts 'payload' over an idle connection if there is one. A stale
+    # keep-alive connection is replaced once.
+    async def _post(self, payload):
+        for attempt in range(2):
+            reused = len(self.idle) > 0
+            reader, writer = self.idle.pop() if reused else await self._connect()
+            try:
+                writer.write(
+                    (
+                        'POST ' + self.path + ' HTTP/1.1\r\n' +
+                        'Host: ' + self.host + ':' + str(self.port) + '\r\n' +
+                        'Content-Type: application/json\r\n' +
+                        'Content-Length: ' + str(len(payload)) + '\r\n' +
+                        'Connection: keep-alive\r\n\r\n'
+                    ).encode('ascii') + payload
+                )
+                await writer.drain()
+                status, headers, body = await readResponse(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            if headers.get('connection', '').lower() == 'close':
+                writer.close()
+            else:
+                self.idle.append((reader, writer))
+            if status != 200:
+                raise RpcError({'message': 'HTTP ' + str(status), 'data': body.decode('utf-8', 'replace')})
+            return json.loads(body)
+
+    async def close(self):
+        self._flush()
+        if len(self.tasks) > 0:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+        for _, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+# Reads an HTTP/1.1 message and returns '(status, headers, body)' where the
+# body is delimited either by 'Content-Length' or by chunked encoding. The
+# same function serves requests on the side of 'RpcStandIn.py', in which case
+# 'status' is the request line.
+async def readResponse(reader):
+    head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+    headers = dict()
+    for line in head[1:]:
+        if ':' in line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+    parts = head[0].split(' ')
+    status = int(parts[1]) if parts[0].startswith('HTTP/') else head[0]
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        body = b''
+        while True:
+            size = int((await reader.readuntil(b'\r\n')).split(b';')[0], 16)
+            if size == 0:
+                await reader.readuntil(b'\r\n')
+                break
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+    else:
+        body = await reader.readexactly(int(headers.get('content-length', '0')))
+    return status, headers, body
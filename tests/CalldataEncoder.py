@@ -0,0 +1,167 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+from UnlockSession import selector, modifyPositionSignature, donateSignature, swapSignature, dispatchSignature
+
+# Encoders for the entry points whose calldata is parsed by 'Calldata.sol'.
+# The outputs are identical to 'encode_input' of brownie, i.e., standard ABI
+# encoding, but the head of each layout is fixed. Hence, selectors and the
+# offsets of dynamic members are precomputed and static members are written
+# directly:
+#
+#  - 'initialize': 7 head slots, 'kernelCompactArray' at '0xE0',
+#  - 'modifyPosition' and 'swap': 5 head slots, 'hookData' at '0xA0',
+#  - 'donate' and 'modifyKernel': 3 head slots, dynamic members from '0x60'.
+#
+# Signed members (i.e., 'X59' and 'int256') are written in two's complement.
+
+initializeSelector = selector('initialize(uint256,uint256,uint256,uint256,uint256[],uint256[],bytes)')
+modifyPositionSelector = selector(modifyPositionSignature)
+donateSelector = selector(donateSignature)
+modifyKernelSelector = selector('modifyKernel(uint256,uint256[],bytes)')
+swapSelector = selector(swapSignature)
+dispatchSelector = selector(dispatchSignature)
+
+def uint256(value):
+    return value.to_bytes(32, 'big')
+
+def int256(value):
+    return value.to_bytes(32, 'big', signed=True)
+
+def offset(value):
+    return value.to_bytes(32, 'big')
+
+# 'bytes' in ABI tail format: byte count followed by the right-padded content.
+def tailBytes(data):
+    return len(data).to_bytes(32, 'big') + bytes(data) + bytes((- len(data)) % 32)
+
+# 'uint256[]' in ABI tail format: length followed by the members.
+def tailArray(array):
+    return len(array).to_bytes(32, 'big') + b''.join([value.to_bytes(32, 'big') for value in array])
+
+def initialize(unsaltedPoolId, tag0, tag1, poolGrowthPortion, kernelCompactArray, curveArray, hookData):
+    kernelTail = tailArray(kernelCompactArray)
+    curveTail = tailArray(curveArray)
+    return b''.join([
+        initializeSelector,
+        uint256(unsaltedPoolId),
+        uint256(tag0),
+        uint256(tag1),
+        uint256(poolGrowthPortion),
+        offset(0xE0),
+        offset(0xE0 + len(kernelTail)),
+        offset(0xE0 + len(kernelTail) + len(curveTail)),
+        kernelTail,
+        curveTail,
+        tailBytes(hookData)
+    ])
+
+def modifyPosition(poolId, logPriceMin, logPriceMax, shares, hookData):
+    return b''.join([
+        modifyPositionSelector,
+        uint256(poolId),
+        int256(logPriceMin),
+        int256(logPriceMax),
+        int256(shares),
+        offset(0xA0),
+        tailBytes(hookData)
+    ])
+
+def donate(poolId, shares, hookData):
+    return b''.join([
+        donateSelector,
+        uint256(poolId),
+        uint256(shares),
+        offset(0x60),
+        tailBytes(hookData)
+    ])
+
+def modifyKernel(poolId, kernelCompactArray, hookData):
+    kernelTail = tailArray(kernelCompactArray)
+    return b''.join([
+        modifyKernelSelector,
+        uint256(poolId),
+        offset(0x60),
+        offset(0x60 + len(kernelTail)),
+        kernelTail,
+        tailBytes(hookData)
+    ])
+
+def swap(poolId, amountSpecified, logPriceLimit, zeroForOne, hookData):
+    return b''.join([
+        swapSelector,
+        uint256(poolId),
+        int256(amountSpecified),
+        int256(logPriceLimit),
+        uint256(zeroForOne),
+        offset(0xA0),
+        tailBytes(hookData)
+    ])
+
+# Wraps the calldata of a delegatee entry point as 'nofeeswap.dispatch(input)'.
+def dispatch(input):
+    return dispatchSelector + offset(0x20) + tailBytes(input)
+
+# Encodes many swaps with the same 'hookData'. The selector, the 'hookData'
+# offset and the 'hookData' tail are encoded once and only the four static
+# members are encoded per swap.
+class SwapEncoder:
+    def __init__(self, hookData=b''):
+        self.hookData = bytes(hookData)
+        self.tail = offset(0xA0) + tailBytes(self.hookData)
+
+    def encode(self, poolId, amountSpecified, logPriceLimit, zeroForOne):
+        return b''.join((
+            swapSelector,
+            poolId.to_bytes(32, 'big'),
+            amountSpecified.to_bytes(32, 'big', signed=True),
+            logPriceLimit.to_bytes(32, 'big', signed=True),
+            zeroForOne.to_bytes(32, 'big'),
+            self.tail
+        ))
+
+    # 'swaps' is an iterable of '(poolId, amountSpecified, logPriceLimit,
+    # zeroForOne)' tuples.
+    def encodeBatch(self, swaps):
+        encode = self.encode
+        return [encode(*swap) for swap in swaps]
+
+# Compares the encoders above against 'eth_abi', which brownie relies on for
+# 'encode_input', and returns the time per call of each in microseconds.
+def benchmark(n=10000):
+    import time
+    from eth_abi import encode
+
+    swaps = [
+        ((k << 160) + 0xF00FF00F, (- 1) ** k * (k << 64), (k % 32) << 59, k % 2)
+        for k in range(n)
+    ]
+    hookData = b'HookData'
+
+    results = dict()
+
+    begin = time.perf_counter()
+    reference = [
+        swapSelector + encode(
+            ['uint256', 'int256', 'int256', 'uint256', 'bytes'],
+            [poolId, amountSpecified, logPriceLimit, zeroForOne, hookData]
+        ) for poolId, amountSpecified, logPriceLimit, zeroForOne in swaps
+    ]
+    results['eth_abi'] = 1e6 * (time.perf_counter() - begin) / n
+
+    begin = time.perf_counter()
+    output = [
+        swap(poolId, amountSpecified, logPriceLimit, zeroForOne, hookData)
+        for poolId, amountSpecified, logPriceLimit, zeroForOne in swaps
+    ]
+    results['swap'] = 1e6 * (time.perf_counter() - begin) / n
+    assert output == reference
+
+    begin = time.perf_counter()
+    output = SwapEncoder(hookData).encodeBatch(swaps)
+    results['SwapEncoder'] = 1e6 * (time.perf_counter() - begin) / n
+    assert output == reference
+
+    return results
+
+if __name__ == '__main__':
+    for name, value in benchmark().items():
+        print(name + ': ' + '{:.2f}'.format(value) + ' us per swap')
@@ -0,0 +1,73 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import accounts, Nofeeswap, NofeeswapDelegatee
+from Nofee import logTest, toInt, twosComplementInt8, encodeKernelCompact, encodeCurve, dataGeneration
+import CalldataEncoder
+
+initializations, swaps, kernelsValid, kernelsInvalid = dataGeneration(20)
+
+hookDataList = [b"", b"HookData", b"\xF0" * 32, b"\x0F" * 65]
+
+@pytest.fixture(autouse=True)
+def deployment(fn_isolation):
+    root = accounts[0]
+    delegatee = NofeeswapDelegatee.deploy(root, {'from': root})
+    nofeeswap = Nofeeswap.deploy(delegatee, root, {'from': root})
+    return root, nofeeswap, delegatee
+
+def toBytes(calldata):
+    return bytes.fromhex(calldata[2:])
+
+@pytest.mark.parametrize('n', range(len(initializations['kernel'])))
+@pytest.mark.parametrize('hookData', hookDataList)
+def test_initializeModifyKernel(deployment, n, hookData, request, worker_id):
+    logTest(request, worker_id)
+
+    root, nofeeswap, delegatee = deployment
+
+    kernel = encodeKernelCompact(initializations['kernel'][n])
+    curve = encodeCurve(initializations['curve'][n])
+    unsaltedPoolId = (n << 188) + (twosComplementInt8(-5) << 180) + (0b11111111111111111111 << 160) + toInt(root.address)
+
+    calldata = CalldataEncoder.initialize(unsaltedPoolId, n, n + 1, 0x800000000000, kernel, curve, hookData)
+    assert calldata == toBytes(delegatee.initialize.encode_input(unsaltedPoolId, n, n + 1, 0x800000000000, kernel, curve, hookData))
+    assert CalldataEncoder.dispatch(calldata) == toBytes(nofeeswap.dispatch.encode_input(calldata))
+
+    calldata = CalldataEncoder.modifyKernel(unsaltedPoolId, kernel, hookData)
+    assert calldata == toBytes(delegatee.modifyKernel.encode_input(unsaltedPoolId, kernel, hookData))
+
+@pytest.mark.parametrize('hookData', hookDataList)
+def test_modifyPositionDonate(deployment, hookData, request, worker_id):
+    logTest(request, worker_id)
+
+    root, nofeeswap, delegatee = deployment
+
+    poolId = 0xF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00F
+    for logPriceMin, logPriceMax, shares in [(-(2 ** 63), 2 ** 63, 1), (2 ** 59, 3 * 2 ** 59, - (2 ** 127 - 1)), (0, 1, 2 ** 127 - 1)]:
+        calldata = CalldataEncoder.modifyPosition(poolId, logPriceMin, logPriceMax, shares, hookData)
+        assert calldata == toBytes(delegatee.modifyPosition.encode_input(poolId, logPriceMin, logPriceMax, shares, hookData))
+
+    for shares in [1, 2 ** 127 - 1]:
+        calldata = CalldataEncoder.donate(poolId, shares, hookData)
+        assert calldata == toBytes(delegatee.donate.encode_input(poolId, shares, hookData))
+
+@pytest.mark.parametrize('hookData', hookDataList)
+def test_swap(deployment, hookData, request, worker_id):
+    logTest(request, worker_id)
+
+    root, nofeeswap, delegatee = deployment
+
+    poolId = 0xF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00F
+    batch = [
+        (poolId, amountSpecified, logPriceLimit, (crossThreshold << 128) + zeroForOne)
+        for amountSpecified in [- (2 ** 255), - 1, 0, 2 ** 255 - 1]
+        for logPriceLimit in [- (2 ** 63), 2 ** 59, 2 ** 63]
+        for crossThreshold in [0, 2 ** 128 - 1]
+        for zeroForOne in [0, 1, 2]
+    ]
+
+    encoder = CalldataEncoder.SwapEncoder(hookData)
+    for swap, calldata in zip(batch, encoder.encodeBatch(batch)):
+        expected = toBytes(nofeeswap.swap.encode_input(*swap, hookData))
+        assert calldata == expected
+        assert CalldataEncoder.swap(*swap, hookData) == expected
@@ -55,7 +55,7 @@ poolId1Invalid = (0xF0F0F0F0F0F0F0F0F << 188) + (twosComplementInt8(+90) << 180)
 def wrapper(fn_isolation):
     return CalldataWrapper.deploy({'from': accounts[0]})
 
-@pytest.mark.parametrize('poolId', [poolId0])
+@pytest.mark.parametrize('poolId', [poolId0, poolId1, poolId2, poolId3, poolId4])
 @pytest.mark.parametrize('logPrices', [[logPrice1, logPrice2], [logPrice1, logPrice3], [logPrice2, logPrice3]])
 @pytest.mark.parametrize('shares', [balance1, balance3, balance5, balance7])
 @pytest.mark.parametrize('content', [value0, value1, value2, value3, value4])
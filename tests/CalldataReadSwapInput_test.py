@@ -55,7 +55,7 @@ poolId1Invalid = (0xF0F0F0F0F0F0F0F0F << 188) + (twosComplementInt8(+90) << 180)
 def wrapper(fn_isolation):
     return CalldataWrapper.deploy({'from': accounts[0]})
 
-@pytest.mark.parametrize('poolId', [poolId0])
+@pytest.mark.parametrize('poolId', [poolId0, poolId1, poolId2, poolId3, poolId4])
 @pytest.mark.parametrize('amountSpecified', [balance0, balance1, balance2, balance3, balance4, balance5, balance6, balance7, balance8])
 @pytest.mark.parametrize('qLimit', [logPrice2])
 @pytest.mark.parametrize('zeroForOne', [zeroForOne0, zeroForOne1, zeroForOne2])
@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 import brownie
-from brownie import accounts, CurveWrapper
+from brownie import CurveWrapper
 from sympy import Integer, floor, exp
 from eth_abi.packed import encode_packed
 from Nofee import logTest, amend, dataGeneration, encodeCurve, thirtyTwoX59, minLogSpacing
@@ -23,8 +23,8 @@ logPrice3 = 0x8FFFFFFFFFFFFFFF
 logPrice4 = 0xFFFFFFFFFFFFFFFF
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return CurveWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(CurveWrapper)
 
 @pytest.mark.parametrize('content', [value0, value1, value2, value3, value4])
 @pytest.mark.parametrize('curveLength', [2, maxCurveIndex // 2, maxCurveIndex])
@@ -0,0 +1,184 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import re
+from sha3 import keccak_256
+from eth_abi import decode
+from eth_utils import to_checksum_address
+
+# The table is absent only before its first generation.
+try:
+    from ErrorTable import errors
+except ImportError:
+    errors = dict()
+
+# Classifies reverts by the selector of the custom errors in 'Errors.sol':
+#
+#   error = getError(exception)
+#   assert error.name == 'LogPricesOutOfOrder'
+#   assert error['logPriceMin'] == logPriceMin
+#
+# 'ErrorTable.py' maps each selector to the name of an error together with the
+# declared type, the ABI type and the name of each argument. It is generated
+# from 'Errors.sol' by:
+#
+#   python tests/CustomErrors.py
+errorsPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'contracts', 'utilities', 'Errors.sol')
+
+tablePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ErrorTable.py')
+
+# The user-defined value types of 'contracts/utilities' which appear in
+# 'Errors.sol' and their underlying types, i.e., the types of their selectors.
+valueTypes = {
+    'Index': 'uint256',
+    'Tag': 'uint256',
+    'X15': 'uint256',
+    'X23': 'uint256',
+    'X47': 'uint256',
+    'X59': 'int256',
+    'X111': 'int256',
+    'X127': 'int256',
+    'X208': 'uint256',
+    'X216': 'int256'
+}
+
+# Arguments are decoded to integers except for the following types. Values of
+# fixed point types are kept as integers, i.e., 'X59' values are multiples of
+# '2 ** -59' as everywhere else in the tests.
+decoders = {
+    'address': to_checksum_address,
+    'bytes4': bytes
+}
+
+# Parses the arguments of a revert message of brownie.
+parsers = {
+    'address': to_checksum_address,
+    'bytes4': lambda value: bytes.fromhex(value[2:] if value.startswith('0x') else value)
+}
+
+nameIndex = {name: selector for selector, (name, _) in errors.items()}
+
+class CustomError:
+    def __init__(self, selector, name, arguments, values):
+        self.selector = selector
+        self.name = name
+        self.types = [declared for declared, _, _ in arguments]
+        self.names = [argument for _, _, argument in arguments]
+        self.values = values
+
+    # Arguments are accessible by position or by name.
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.values[self.names.index(key)]
+        return self.values[key]
+
+    def __eq__(self, other):
+        if isinstance(other, CustomError):
+            return (self.selector, self.values) == (other.selector, other.values)
+        return str(self) == other
+
+    # The same format as the revert messages of brownie.
+    def __str__(self):
+        return self.name + ': ' + ', '.join('0x' + value.hex() if isinstance(value, bytes) else str(value) for value in self.values)
+
+    def __repr__(self):
+        return '<CustomError ' + str(self) + '>'
+
+def decodeArguments(arguments, data):
+    values = decode([abiType for _, abiType, _ in arguments], data)
+    return [decoders.get(abiType, int)(value) for (_, abiType, _), value in zip(arguments, values)]
+
+# Returns the custom error which is encoded by 'data' (bytes or hex), or
+# 'None' if 'data' is not a custom error of 'Errors.sol'.
+def decodeError(data):
+    if isinstance(data, str):
+        data = bytes.fromhex(data[2:] if data.startswith('0x') else data)
+    if len(data) < 4:
+        return None
+    selector = int.from_bytes(data[0 : 4], 'big')
+    if selector not in errors:
+        return None
+    name, arguments = errors[selector]
+    return CustomError(selector, name, arguments, decodeArguments(arguments, data[4:]))
+
+# Returns the revert data of an exception which is raised by brownie, or by
+# the in-process backend of 'Evm.py', if available. Reverted transactions are
+# raised without their data, in which case 'None' is returned.
+def getRevertData(error):
+    exc = error.args[0] if len(error.args) > 0 else None
+    if isinstance(exc, ValueError) and len(exc.args) > 0:
+        exc = exc.args[0]
+    if isinstance(exc, dict) and isinstance(exc.get('data'), str) and exc['data'].startswith('0x'):
+        return exc['data']
+    return None
+
+# Recovers a custom error from a revert message of the form 'Name: a, b' or
+# 'Unknown typed error: 0x...'.
+def parseRevertMessage(message):
+    if message is None:
+        return None
+    if 'typed error: 0x' in message:
+        return decodeError(message[message.index('0x'):])
+    name, _, values = message.partition(':')
+    if name not in nameIndex:
+        return None
+    selector = nameIndex[name]
+    _, arguments = errors[selector]
+    values = [value.strip() for value in values.split(',')] if len(arguments) > 0 else []
+    return CustomError(
+        selector,
+        name,
+        arguments,
+        [parsers.get(abiType, int)(value) for (_, abiType, _), value in zip(arguments, values)]
+    )
+
+# Returns the custom error of a revert raised by brownie, or 'None' if the
+# revert is not due to a custom error of 'Errors.sol'. Revert data is decoded
+# by selector whenever available. Otherwise, the revert message of brownie is
+# parsed.
+def getError(error):
+    data = getRevertData(error)
+    if data is not None:
+        return decodeError(data)
+    return parseRevertMessage(getattr(error, 'revert_msg', None))
+
+def isError(error, *names):
+    customError = getError(error)
+    return customError is not None and customError.name in names
+
+# Returns the errors of 'source' as a list of '(name, arguments)' where each
+# argument is '(declared type, ABI type, name)'.
+def parseErrors(source):
+    source = re.sub(r'//[^\n]*', '', source)
+    parsed = []
+    for name, parameters in re.findall(r'\berror\s+(\w+)\s*\(([^)]*)\)\s*;', source):
+        arguments = []
+        for kk, parameter in enumerate(parameter.split() for parameter in parameters.split(',') if parameter.strip() != ''):
+            declared = parameter[0]
+            arguments.append((declared, valueTypes.get(declared, declared), parameter[1] if len(parameter) > 1 else 'arg' + str(kk)))
+        parsed.append((name, arguments))
+    return parsed
+
+def getSelector(name, arguments):
+    signature = name + '(' + ','.join(abiType for _, abiType, _ in arguments) + ')'
+    return int.from_bytes(keccak_256(signature.encode()).digest()[0 : 4], 'big')
+
+def generateTable(source):
+    lines = [
+        '# Copyright 2025, NoFeeSwap LLC - All rights reserved.',
+        '',
+        '# Generated from \'contracts/utilities/Errors.sol\' by \'python tests/CustomErrors.py\'.',
+        'errors = {'
+    ]
+    entries = []
+    for name, arguments in parseErrors(source):
+        entries.append('    0x' + format(getSelector(name, arguments), '08x') + ': (' + repr(name) + ', ' + repr(arguments) + ')')
+    lines.append(',\n'.join(entries))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+if __name__ == '__main__':
+    with open(errorsPath, 'r') as f:
+        table = generateTable(f.read())
+    with open(tablePath, 'w') as f:
+        f.write(table)
+    print(str(table.count('\n    0x')) + ' errors written to ' + tablePath)
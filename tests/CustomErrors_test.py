@@ -0,0 +1,41 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from eth_abi import encode
+from Nofee import logTest
+from CustomErrors import errorsPath, tablePath, errors, generateTable, decodeError, parseRevertMessage
+
+def test_errorTable(request, worker_id):
+    logTest(request, worker_id)
+
+    # 'ErrorTable.py' should be regenerated whenever 'Errors.sol' changes.
+    with open(errorsPath, 'r') as f:
+        table = generateTable(f.read())
+    with open(tablePath, 'r') as f:
+        assert f.read() == table
+
+@pytest.mark.parametrize('selector', sorted(errors.keys()))
+def test_decodeError(selector, request, worker_id):
+    logTest(request, worker_id)
+
+    name, arguments = errors[selector]
+    values = []
+    for kk, (_, abiType, _) in enumerate(arguments):
+        if abiType == 'address':
+            values.append('0x' + format(kk + 1, '040x'))
+        elif abiType == 'bytes4':
+            values.append((kk + 1).to_bytes(4, 'big'))
+        elif abiType == 'int256':
+            values.append(- (kk + 1) * (2 ** 200))
+        else:
+            values.append((kk + 1) * (2 ** 200))
+
+    data = selector.to_bytes(4, 'big') + encode([abiType for _, abiType, _ in arguments], values)
+    customError = decodeError(data)
+    assert customError.name == name
+    assert customError.selector == selector
+    assert [value.lower() if isinstance(value, str) else value for value in customError.values] == values
+    assert decodeError('0x' + data.hex()) == customError
+
+    # The revert messages of brownie lead to the same error.
+    assert parseRevertMessage(str(customError)) == customError
+    assert parseRevertMessage('Unknown typed error: 0x' + data.hex()) == customError
@@ -0,0 +1,70 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+
+# Generated from 'contracts/utilities/Errors.sol' by 'python tests/CustomErrors.py'.
+errors = {
+    0x6c59da12: ('MulDivOverflow', [('uint256', 'uint256', 'a'), ('uint256', 'uint256', 'b'), ('uint256', 'uint256', 'denominator')]),
+    0x93895591: ('SafeAddFailed', [('X127', 'int256', 'a'), ('X127', 'int256', 'b')]),
+    0x0c21b20e: ('BalanceOverflow', [('uint256', 'uint256', 'balance')]),
+    0x3590f204: ('SafeCastOverflow', [('uint256', 'uint256', 'value')]),
+    0x87a53ed3: ('LogSpacingIsTooSmall', [('X59', 'int256', 'qSpacing')]),
+    0x30d2e554: ('BlankIntervalsShouldBeAvoided', [('X59', 'int256', 'qLower'), ('X59', 'int256', 'qUpper')]),
+    0x0a4912d8: ('CurveLengthIsZero', []),
+    0x40fae3c2: ('InvalidCurveArrangement', [('X59', 'int256', 'q0'), ('X59', 'int256', 'q1'), ('X59', 'int256', 'q2')]),
+    0x855b486b: ('CurveIndexOutOfRange', [('Index', 'uint256', 'length')]),
+    0x872deb8f: ('SafeOutOfRangeAmountOverflow', [('X127', 'int256', 'sqrtOffsetOrSqrtInverseOffset'), ('X208', 'uint256', 'growthMultiplier'), ('int256', 'int256', 'shares')]),
+    0xb395f420: ('SafeInRangeAmountOverflow', [('X127', 'int256', 'sqrtOffsetOrSqrtInverseOffset'), ('X216', 'int256', 'integral'), ('X111', 'int256', 'liquidity'), ('X216', 'int256', 'outgoingMax'), ('uint256', 'uint256', 'outgoingMaxModularInverse')]),
+    0x9d6f8497: ('SecondHorizontalCoordinateIsZero', []),
+    0x5d9715ee: ('NonMonotonicHorizontalCoordinates', [('X59', 'int256', 'q_i'), ('X59', 'int256', 'q_j')]),
+    0x6d012273: ('NonMonotonicVerticalCoordinates', [('X15', 'uint256', 'c_i'), ('X15', 'uint256', 'c_j')]),
+    0x9743dfb1: ('RepetitiveKernelPoints', [('X15', 'uint256', 'c_i'), ('X59', 'int256', 'q_i')]),
+    0x342d80b2: ('SlopeTooHigh', [('X59', 'int256', 'q_i'), ('X59', 'int256', 'q_j')]),
+    0x0f8c0ef3: ('HorizontalCoordinatesMayNotExceedLogSpacing', [('X59', 'int256', 'q_j'), ('X59', 'int256', 'qSpacing')]),
+    0xf8485886: ('RepetitiveHorizontalCoordinates', [('X59', 'int256', 'q_i')]),
+    0xd0c02e3a: ('RepetitiveVerticalCoordinates', [('X15', 'uint256', 'c_i')]),
+    0xcae6a1e1: ('KernelIndexOutOfRange', [('Index', 'uint256', 'length')]),
+    0xd6622c31: ('LastVerticalCoordinateMismatch', [('X15', 'uint256', 'c_j')]),
+    0xdba763ba: ('GrowthOverflow', []),
+    0xb8c6d838: ('AccruedGrowthPortionOverflow', [('X127', 'int256', 'accruedValue')]),
+    0xb863a6aa: ('InvalidFlags', [('uint256', 'uint256', 'arg0')]),
+    0x1f2eb402: ('SearchingForOutgoingTargetFailed', []),
+    0x7fbbcd67: ('SearchingForIncomingTargetFailed', []),
+    0x4e2ef45a: ('SearchingForOvershootFailed', []),
+    0x2ab80977: ('AlreadyUnlocked', [('address', 'address', 'currentCaller')]),
+    0x892e4e57: ('ProtocolIsLocked', []),
+    0x76f8d707: ('PoolIsLocked', [('uint256', 'uint256', 'poolId')]),
+    0x30116425: ('DeploymentFailed', []),
+    0x7275462b: ('CannotRedeployStaticParamsAndKernelExternally', []),
+    0xc0a7e469: ('NativeTokenCannotBeSynced', []),
+    0x731555bd: ('InsufficientPermission', [('address', 'address', 'spender'), ('Tag', 'uint256', 'tag')]),
+    0x8c5bf00a: ('SharesGrossOverflow', [('int256', 'int256', 'sharesGross')]),
+    0x1e657b1d: ('PoolDoesNotExist', [('uint256', 'uint256', 'poolId')]),
+    0xf6deaa04: ('InsufficientBalance', [('address', 'address', 'owner'), ('Tag', 'uint256', 'tag')]),
+    0x3438289f: ('InvalidSentinelResponse', [('bytes4', 'bytes4', 'response')]),
+    0xb5bbe198: ('InvalidDirection', [('X59', 'int256', 'current'), ('X59', 'int256', 'limit')]),
+    0xa3a300c7: ('PoolExists', [('uint256', 'uint256', 'poolId')]),
+    0xa2ff8abd: ('LogOffsetOutOfRange', [('X59', 'int256', 'qOffset')]),
+    0xfe92479c: ('TagsOutOfOrder', [('Tag', 'uint256', 'tag0'), ('Tag', 'uint256', 'tag1')]),
+    0x1f84bbb3: ('InvalidGrowthPortion', [('X47', 'uint256', 'poolGrowthPortion')]),
+    0x42d01168: ('LogPriceOutOfRange', [('X59', 'int256', 'logPrice')]),
+    0xc270deb3: ('InvalidNumberOfShares', [('int256', 'int256', 'shares')]),
+    0x4e791786: ('PoolIdCannotBeZero', []),
+    0x6a9dad8a: ('OnlyByProtocol', [('address', 'address', 'attemptingAddress'), ('address', 'address', 'protocolAddress')]),
+    0xf3a59685: ('OnlyByPoolOwner', [('address', 'address', 'attemptingAddress'), ('address', 'address', 'poolOwnerAddress')]),
+    0xf7666dbf: ('LogPriceMinIsNotSpaced', [('X59', 'int256', 'logPriceMin')]),
+    0x89cd66bc: ('LogPriceMaxIsNotSpaced', [('X59', 'int256', 'logPriceMax')]),
+    0x94c82f12: ('LogPriceMinIsInBlankArea', [('X59', 'int256', 'logPriceMin')]),
+    0x7c5a2d3c: ('LogPriceMaxIsInBlankArea', [('X59', 'int256', 'logPriceMax')]),
+    0xac18c0ce: ('LogPricesOutOfOrder', [('X59', 'int256', 'logPriceMin'), ('X59', 'int256', 'logPriceMax')]),
+    0x83e17ac7: ('ExpTableTooLarge', [('X59', 'int256', 'logPriceMin'), ('X59', 'int256', 'logPriceMax')]),
+    0xd2646f0f: ('DonateIsNotAllowed', [('uint256', 'uint256', 'poolId')]),
+    0xa6c66ba7: ('CannotDonateToEmptyInterval', []),
+    0x88cb5bc1: ('ImmutableKernel', [('uint256', 'uint256', 'poolId')]),
+    0x06db803b: ('ImmutablePoolGrowthPortion', [('uint256', 'uint256', 'poolId')]),
+    0x1569cf53: ('NoDelegateCall', [('address', 'address', 'context')]),
+    0x3bce3d40: ('OutstandingAmount', []),
+    0xa7cd662f: ('CannotTransferToAddressZero', []),
+    0xdccd0a6c: ('NotEqualToTransientBalance', [('int256', 'int256', 'currentBalance')]),
+    0x805cfd4b: ('HookDataTooLong', [('uint256', 'uint256', 'hookDataByteCount')]),
+    0xb99c5844: ('AdminCannotBeAddressZero', []),
+    0x833bded7: ('MsgValueIsNonZero', [('uint256', 'uint256', 'msgValue')])
+}
@@ -0,0 +1,216 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+from hexbytes import HexBytes
+from eth_abi import encode, decode
+from eth_utils import to_checksum_address
+from brownie.convert.normalize import format_input, format_output
+from brownie.convert.utils import build_function_selector, get_type_strings
+from brownie.exceptions import VirtualMachineError
+from brownie.network.event import _decode_logs
+
+# An in-process alternative to the development network for the wrappers in
+# 'contracts/helpers' which are tested in isolation. The compiled bytecode of
+# each wrapper is executed by py-evm and the outcome is exposed through the
+# same attributes of brownie that the tests read:
+#
+#   tx.return_value, tx.events, tx.gas_used, tx.trace and 'brownie.reverts'
+#
+# 'tx.trace' only contains the 'LOG' steps of a transaction together with the
+# memory at the time of each log, which is the part of the trace that the
+# tests inspect.
+#
+# Unlike brownie, 'InProcessMethod.select' resolves overloaded functions by the
+# number of arguments only, not by their types. Calling a function which has
+# several overloads with the same number of arguments (e.g., 'storageAccess'
+# of 'EventsWrapper') raises 'ValueError' instead of picking one of them.
+#
+# py-evm is an optional dependency which is only imported once this backend
+# is selected via 'conftest.py':
+#
+#   pip install py-evm
+#   brownie test --evm inprocess
+
+# The block gas limit of the hardhat network, which is the gas limit of every
+# transaction since 'gas_limit' is set to 'max' in 'brownie-config.yaml'.
+gasLimit = 30000000
+
+chainId = 31337
+
+sender = bytes.fromhex('f39Fd6e51aad88F6F4ce6aB8827279cffFb92266')
+
+def getWords(memory):
+    return [memory[kk : kk + 32].hex() for kk in range(0, len(memory), 32)]
+
+class InProcessEvm:
+    def __init__(self):
+        from eth.db.atomic import AtomicDB
+        from eth.constants import BLANK_ROOT_HASH, ZERO_ADDRESS, ZERO_HASH32, CREATE_CONTRACT_ADDRESS
+        from eth.vm.execution_context import ExecutionContext
+        from eth.vm.forks.cancun import CancunVM
+        from eth.vm.forks.cancun.computation import CancunComputation
+        from eth.vm.forks.cancun.state import CancunState
+        from eth.vm.spoof import SpoofTransaction
+
+        evm = self
+
+        # Every log is recorded as a trace step along with the memory of the
+        # frame which emits it.
+        class TracingComputation(CancunComputation):
+            def add_log_entry(self, account, topics, data):
+                super().add_log_entry(account, topics, data)
+                evm.steps.append({
+                    'op': 'LOG' + str(len(topics)),
+                    'depth': self.msg.depth,
+                    'address': to_checksum_address(account),
+                    'memory': getWords(bytes(self._memory._bytes))
+                })
+
+        class TracingState(CancunState):
+            computation_class = TracingComputation
+
+        self.createAddress = CREATE_CONTRACT_ADDRESS
+        self.builder = CancunVM.get_transaction_builder()
+        self.spoof = SpoofTransaction
+        self.stateClass = TracingState
+        self.db = AtomicDB()
+        self.executionContext = ExecutionContext(
+            coinbase=ZERO_ADDRESS,
+            timestamp=1,
+            block_number=1,
+            difficulty=0,
+            mix_hash=ZERO_HASH32,
+            gas_limit=gasLimit,
+            prev_hashes=(),
+            chain_id=chainId,
+            base_fee_per_gas=0,
+            excess_blob_gas=0
+        )
+        self.root = BLANK_ROOT_HASH
+        self.steps = []
+        # Every revert of a transaction is recorded since, unlike those of
+        # brownie, they do not reach 'brownie.network.history' (see
+        # 'conftest.py').
+        self.reverts = []
+        self.reset()
+
+    # Discards every change since the genesis state. Changes are never
+    # persisted to 'db'. Hence, a fresh state on top of the same root is an
+    # isolated copy of the genesis state.
+    def reset(self):
+        self.state = self.stateClass(self.db, self.executionContext, self.root)
+
+    # Returns the computation and the gas used by a transaction from 'sender'.
+    # The state is committed unless 'commit' is 'False'.
+    def execute(self, to, data, commit=True):
+        transaction = self.builder.new_transaction(
+            nonce=self.state.get_nonce(sender),
+            gas_price=0,
+            gas=gasLimit,
+            to=to,
+            value=0,
+            data=data,
+            v=27,
+            r=1,
+            s=1
+        )
+        self.steps = []
+        snapshot = self.state.snapshot()
+        computation = self.state.apply_transaction(self.spoof(transaction, sender=sender))
+        if commit:
+            self.state.lock_changes()
+        else:
+            self.state.revert(snapshot)
+        if computation.is_error:
+            error = VirtualMachineError(ValueError({
+                'message': 'VM Exception while processing transaction: revert',
+                'data': '0x' + computation.output.hex()
+            }))
+            if commit:
+                self.reverts.append(error)
+            raise error
+        gasUsed = gasLimit - computation.get_gas_remaining()
+        gasUsed -= min(computation.get_gas_refund(), gasUsed // 5)
+        return computation, gasUsed
+
+    def deploy(self, container, *args):
+        bytecode = container.bytecode[2:] if container.bytecode.startswith('0x') else container.bytecode
+        data = bytes.fromhex(bytecode)
+        for abi in container.abi:
+            if abi['type'] == 'constructor':
+                data += encode(get_type_strings(abi['inputs']), format_input(abi, args))
+        computation, gasUsed = self.execute(self.createAddress, data)
+        return InProcessContract(self, computation.msg.storage_address, container.abi, container._name)
+
+class InProcessReceipt:
+    def __init__(self, abi, computation, gasUsed, steps):
+        self.status = 1
+        self.fn_name = abi['name']
+        self.gas_used = gasUsed
+        self.trace = steps
+        self.return_value = decodeOutput(abi, computation.output)
+        self.logs = [{
+            'logIndex': kk,
+            'address': to_checksum_address(address),
+            'topics': [HexBytes(topic.to_bytes(32, 'big')) for topic in topics],
+            'data': HexBytes(data)
+        } for kk, (address, topics, data) in enumerate(computation.get_log_entries())]
+        self.events = _decode_logs(self.logs)
+
+def decodeOutput(abi, output):
+    if len(abi['outputs']) == 0:
+        return None
+    result = format_output(abi, decode(get_type_strings(abi['outputs']), output))
+    return result[0] if len(result) == 1 else result
+
+class InProcessMethod:
+    def __init__(self, contract, abis):
+        self.contract = contract
+        self.abis = abis
+        self.abi = abis[0]
+        self.signature = build_function_selector(self.abi)
+
+    # A trailing dictionary of transaction parameters is accepted and ignored
+    # for compatibility with brownie.
+    def select(self, args):
+        if len(args) > 0 and isinstance(args[-1], dict):
+            args = args[:-1]
+        candidates = [abi for abi in self.abis if len(abi['inputs']) == len(args)]
+        if len(candidates) == 1:
+            return candidates[0], args
+        if len(candidates) == 0:
+            raise ValueError(self.abi['name'] + ': no overload accepts ' + str(len(args)) + ' arguments')
+        raise ValueError(self.abi['name'] + ': ' + str(len(candidates)) + ' overloads accept ' + str(len(args)) + ' arguments')
+
+    def encode_input(self, *args):
+        abi, args = self.select(args)
+        return build_function_selector(abi) + encode(get_type_strings(abi['inputs']), format_input(abi, args)).hex()
+
+    def call(self, *args):
+        abi, args = self.select(args)
+        computation, gasUsed = self.contract._evm.execute(self.contract._address, HexBytes(self.encode_input(*args)), False)
+        return decodeOutput(abi, computation.output)
+
+    def transact(self, *args):
+        abi, args = self.select(args)
+        evm = self.contract._evm
+        computation, gasUsed = evm.execute(self.contract._address, HexBytes(self.encode_input(*args)))
+        return InProcessReceipt(abi, computation, gasUsed, evm.steps)
+
+    def __call__(self, *args):
+        abi, _ = self.select(args)
+        if abi['stateMutability'] in ['view', 'pure']:
+            return self.call(*args)
+        return self.transact(*args)
+
+class InProcessContract:
+    def __init__(self, evm, address, abi, name):
+        self._evm = evm
+        self._address = address
+        self._name = name
+        self.abi = abi
+        self.address = to_checksum_address(address)
+        methods = dict()
+        for item in abi:
+            if item['type'] == 'function':
+                methods.setdefault(item['name'], []).append(item)
+        for methodName, abis in methods.items():
+            setattr(self, methodName, InProcessMethod(self, abis))
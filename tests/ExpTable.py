@@ -0,0 +1,66 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+from Nofee import _staticParams_, _qExpTable_, _endOfStaticParams_
+from IntervalModel import storePrice, log, sqrt
+
+# The exp table of a pool as it appears in the bytecode of its storage
+# contract after 'modifyExpTable' (see 'Storage.sol'):
+#
+#   '0x00 | static parameters | kernelStorageAddress | kernelLength |
+#    price(qExpTable) | price(qExpTable + qSpacing) | ...'
+#
+# where 'qExpTable' is the last static parameter. Each price is the output of
+# 'storePrice' in 'Price.sol', i.e., 8 bytes of 'log' followed by 27 bytes of
+# 'sqrt' and 27 bytes of 'sqrtInverse'. The entries are derived from the model
+# of 'exp' in 'IntervalModel.py'.
+expTableOffset = 1 + (_endOfStaticParams_ - _staticParams_) + 22
+
+qExpTableOffset = 1 + (_qExpTable_ - _staticParams_)
+
+entryByteCount = 62
+
+# The storage contract is subject to the '24576' byte limit of EIP-170. This
+# is 'maxExpTableEntries' in 'Storage.sol'.
+maxEntries = (24576 - expTableOffset) // entryByteCount
+
+# Every byte of bytecode costs '200' gas to deposit.
+depositGasPerEntry = 200 * entryByteCount
+
+def encodeExpTable(qMin, qMax, qSpacing):
+    content = b''
+    for logPrice in range(qMin, qMax + 1, qSpacing):
+        content += storePrice(logPrice).to_bytes(entryByteCount, 'big')
+    return content
+
+# Returns the exp table of the given storage contract bytecode, which is empty
+# if there is no table.
+def getExpTable(code):
+    return bytes(code)[expTableOffset:]
+
+# Returns 'qExpTable' of the given storage contract bytecode, which is '0' if
+# there is no table.
+def getQExpTable(code):
+    return int.from_bytes(bytes(code)[qExpTableOffset : qExpTableOffset + 8], 'big')
+
+# Returns the list of '(log, sqrt, sqrtInverse)'.
+def decodeExpTable(content):
+    entries = []
+    for kk in range(0, len(content), entryByteCount):
+        price = int.from_bytes(content[kk : kk + entryByteCount], 'big')
+        entries.append((log(price), sqrt(price, False), sqrt(price, True)))
+    return entries
+
+# Mirrors 'readExp' in 'Storage.sol'. Returns '(sqrt, sqrtInverse)' if
+# 'logPrice' is covered by the table and 'None' otherwise, in which case
+# 'exp' is calculated on chain.
+def lookup(qExpTable, content, qSpacing, logPrice):
+    entries = decodeExpTable(content)
+    if qExpTable == 0 or logPrice < qExpTable:
+        return None
+    index = (logPrice - qExpTable) // qSpacing
+    if index >= len(entries) or entries[index][0] != logPrice:
+        return None
+    return entries[index][1], entries[index][2]
+
+if __name__ == '__main__':
+    print('entries per storage contract: ' + str(maxEntries))
+    print('deposit gas per entry: ' + str(depositGasPerEntry))
@@ -0,0 +1,251 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+import brownie
+from brownie import accounts, web3, Access, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockHook, MockOperator, MockSwapper, DeployerHelper
+from brownie.convert import to_address
+from eth_abi import decode
+from Nofee import logTest, logGas, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeCurve, getPoolId, getStaticParamsStorageAddress
+from PositionValuation import PoolSnapshot, PositionValuation, fromOffsetted
+from UnlockSession import UnlockSession
+from ExpTable import expTableOffset, qExpTableOffset, entryByteCount, maxEntries, encodeExpTable, getExpTable, getQExpTable, lookup
+from IntervalModel import exp
+
+logOffset = -5
+spacing = 2 ** 56
+kernel = [[0, 0], [spacing, 2 ** 15]]
+curve = [2 ** 62, 2 ** 62 + spacing, 2 ** 62 + (spacing // 2)]
+
+# The exp table covers the first '40' intervals on each side of the initial
+# interval.
+qMin = curve[0] - 40 * spacing
+qMax = curve[1] + 40 * spacing
+
+@pytest.fixture(autouse=True)
+def deployment(fn_isolation):
+    root = accounts[0]
+    owner = accounts[1]
+    deployer = DeployerHelper.deploy(root, {'from': root})
+    delegatee = deployer.addressOf(1)
+    nofeeswap = deployer.addressOf(2)
+    deployer.create3(
+        1,
+        NofeeswapDelegatee.bytecode + encode(
+            ['address'],
+            [nofeeswap]
+        ).hex(),
+        {'from': root}
+    )
+    deployer.create3(
+        2,
+        Nofeeswap.bytecode + encode(
+            ['address', 'address'],
+            [delegatee, root.address]
+        ).hex(),
+        {'from': root}
+    )
+    delegatee = NofeeswapDelegatee.at(delegatee)
+    nofeeswap = Nofeeswap.at(nofeeswap)
+    access = Access.deploy({'from': root})
+    hook = MockHook.deploy({'from': root})
+    operator = MockOperator.deploy(nofeeswap, {'from': root})
+    swapper = MockSwapper.deploy(nofeeswap, {'from': root})
+
+    token0 = ERC20FixedSupply.deploy("ERC20_0", "ERC20_0", 2**120, owner, {'from': owner})
+    token1 = ERC20FixedSupply.deploy("ERC20_1", "ERC20_1", 2**120, owner, {'from': owner})
+    if toInt(token0.address) > toInt(token1.address):
+        token0, token1 = token1, token0
+
+    for spender in [operator, swapper]:
+        token0.approve(spender, 2**120, {'from': owner})
+        token1.approve(spender, 2**120, {'from': owner})
+
+    return root, owner, nofeeswap, delegatee, access, hook, operator, swapper, token0, token1
+
+# Returns the gas spent by 'modifyPosition'.
+def modifyPosition(deployment, poolId, qLower, qUpper, shares):
+    root, owner, nofeeswap, delegatee, access, hook, operator, swapper, token0, token1 = deployment
+
+    pool = PoolSnapshot.fromAccess(access, nofeeswap, poolId)
+    amount0, amount1 = PositionValuation(pool).modifyPositionAmounts(qLower, qUpper, shares)
+    session = UnlockSession(nofeeswap.address, operator.address)
+    tag0 = session.registerERC20(token0.address)
+    tag1 = session.registerERC20(token1.address)
+    session.modifyPosition(
+        poolId,
+        fromOffsetted(poolId, qLower),
+        fromOffsetted(poolId, qUpper),
+        shares,
+        b"",
+        tag0,
+        tag1,
+        amount0,
+        amount1
+    )
+    session.settle(owner.address, owner.address, owner.address)
+    tx = nofeeswap.unlock(operator, session.encode(), {'from': owner})
+    return tx.gas_used
+
+# Initializes a pool and mints 'shares' over the current interval only.
+def initialize(deployment, salt, shares, kernel=kernel, curve=curve):
+    root, owner, nofeeswap, delegatee, access, hook, operator, swapper, token0, token1 = deployment
+
+    unsaltedPoolId = (salt << 188) + (twosComplementInt8(logOffset) << 180) + (0 << 160)
+    poolId = getPoolId(owner.address, unsaltedPoolId)
+
+    nofeeswap.dispatch(
+      delegatee.initialize.encode_input(
+          unsaltedPoolId,
+          toInt(token0.address),
+          toInt(token1.address),
+          0,
+          encodeKernelCompact(kernel),
+          encodeCurve(curve),
+          b""
+      ),
+      {'from': owner}
+    )
+
+    modifyPosition(deployment, poolId, curve[0], curve[1], shares)
+
+    return poolId
+
+def modifyExpTable(deployment, poolId, qMin, qMax):
+    root, owner, nofeeswap, delegatee, access, hook, operator, swapper, token0, token1 = deployment
+
+    return nofeeswap.dispatch(
+        delegatee.modifyExpTable.encode_input(
+            poolId,
+            fromOffsetted(poolId, qMin),
+            fromOffsetted(poolId, qMax)
+        ),
+        {'from': owner}
+    )
+
+def getCode(nofeeswap, poolId, storagePointer):
+    storageAddress = getStaticParamsStorageAddress(nofeeswap.address, poolId, storagePointer)
+    return bytes(web3.eth.get_code(to_address('0x' + format(storageAddress, '040x'))))
+
+# Returns the gas spent by 'swap' along with the resulting amounts.
+def swap(deployment, poolId, amountSpecified, logPriceLimit, zeroForOne):
+    root, owner, nofeeswap, delegatee, access, hook, operator, swapper, token0, token1 = deployment
+
+    tx = nofeeswap.unlock(
+        swapper,
+        encode(
+            ['uint256', 'int256', 'int256', 'uint256', 'address', 'address'],
+            [poolId, amountSpecified, logPriceLimit, zeroForOne, token0.address, token1.address]
+        ),
+        {'from': owner}
+    )
+    return decode(['uint256', 'int256', 'int256'], bytes(tx.return_value))
+
+def test_modifyExpTable(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, access, hook, operator, swapper, token0, token1 = deployment
+
+    poolId = initialize(deployment, 0, 2 ** 60)
+    code = getCode(nofeeswap, poolId, 0)
+    assert len(getExpTable(code)) == 0
+    assert getQExpTable(code) == 0
+
+    # The table is calculated on chain and it matches the Python model of
+    # 'exp'.
+    tx = modifyExpTable(deployment, poolId, qMin, qMax)
+    assert tx.events['ModifyExpTable']['poolId'] == poolId
+    assert tx.events['ModifyExpTable']['caller'] == owner.address
+    assert tx.events['ModifyExpTable']['logPriceMin'] == fromOffsetted(poolId, qMin)
+    assert tx.events['ModifyExpTable']['logPriceMax'] == fromOffsetted(poolId, qMax)
+
+    staticParamsStoragePointerExtension, _, _, _, _, _, _ = access._readDynamicParams(nofeeswap, poolId)
+    assert staticParamsStoragePointerExtension == 1
+
+    newCode = getCode(nofeeswap, poolId, 1)
+    content = getExpTable(newCode)
+    assert content == encodeExpTable(qMin, qMax, spacing)
+    assert getQExpTable(newCode) == qMin
+
+    # Apart from 'qExpTable', static parameters are carried over.
+    assert newCode[0 : qExpTableOffset] == code[0 : qExpTableOffset]
+    assert newCode[qExpTableOffset + 8 : expTableOffset] == code[qExpTableOffset + 8 : expTableOffset]
+    for q in [qMin, curve[0], curve[1], qMax]:
+        assert lookup(qMin, content, spacing, q) == exp(q)
+    assert lookup(qMin, content, spacing, qMin - spacing) is None
+    assert lookup(qMin, content, spacing, qMax + spacing) is None
+
+    # A new table replaces the current one.
+    modifyExpTable(deployment, poolId, curve[1], curve[1])
+    assert getExpTable(getCode(nofeeswap, poolId, 2)) == encodeExpTable(curve[1], curve[1], spacing)
+    assert getQExpTable(getCode(nofeeswap, poolId, 2)) == curve[1]
+
+    with brownie.reverts('LogPricesOutOfOrder: ' + str(qMax) + ', ' + str(qMin)):
+        modifyExpTable(deployment, poolId, qMax, qMin)
+
+    with brownie.reverts('LogPriceMinIsNotSpaced: ' + str(qMin + 1)):
+        modifyExpTable(deployment, poolId, qMin + 1, qMax)
+
+# A table with more than 'maxEntries' entries does not fit in a storage
+# contract and it is rejected before any entry is calculated.
+def test_modifyExpTableTooLarge(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, access, hook, operator, swapper, token0, token1 = deployment
+
+    # A narrower spacing is needed to fit 'maxEntries + 1' spaced log prices
+    # between the two blank areas.
+    narrow = 2 ** 50
+    narrowKernel = [[0, 0], [narrow, 2 ** 15]]
+    narrowCurve = [2 ** 62, 2 ** 62 + narrow, 2 ** 62 + (narrow // 2)]
+    poolId = initialize(deployment, 0, 2 ** 60, narrowKernel, narrowCurve)
+
+    first = narrowCurve[0] - 200 * narrow
+    last = first + maxEntries * narrow
+    with brownie.reverts('ExpTableTooLarge: ' + str(first) + ', ' + str(last)):
+        modifyExpTable(deployment, poolId, first, last)
+
+    last = last - narrow
+    modifyExpTable(deployment, poolId, first, last)
+    code = getCode(nofeeswap, poolId, 1)
+    assert len(code) <= 24576
+    assert len(getExpTable(code)) == maxEntries * entryByteCount
+    assert getQExpTable(code) == first
+    assert getExpTable(code) == encodeExpTable(first, last, narrow)
+
+# Swaps and position modifications on a pool with an exp table should lead to
+# exactly the same outcome as a pool without one. The gas spent by each is
+# recorded in 'testLogs/gas.jsonl'.
+def test_expTableGas(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, access, hook, operator, swapper, token0, token1 = deployment
+
+    measurements = {}
+    for salt, k in enumerate([1, 4, 16]):
+        gas = []
+        outcomes = []
+        for table in [False, True]:
+            poolId = initialize(deployment, 2 * salt + table, 2 ** 60)
+            if table:
+                modifyExpTable(deployment, poolId, qMin, qMax)
+
+            # Mints a position which touches two fresh boundaries.
+            mintGas = modifyPosition(deployment, poolId, curve[1] + (k + 1) * spacing, curve[1] + (k + 2) * spacing, 2 ** 40)
+
+            limit = fromOffsetted(poolId, curve[1] + k * spacing)
+            swapGas, amount0, amount1 = swap(deployment, poolId, 2 ** 100, limit, 2)
+            assert amount0 * amount1 < 0
+
+            _, _, logPriceCurrent, sharesTotal, growth, integral0, integral1 = access._readDynamicParams(nofeeswap, poolId)
+            growthMultipliers = [
+                access._readGrowthMultiplier(nofeeswap, poolId, curve[1] + j * spacing) for j in range(k + 3)
+            ]
+            outcomes.append((amount0, amount1, logPriceCurrent, sharesTotal, growth, integral0, integral1, growthMultipliers))
+            gas.append((mintGas, swapGas))
+
+        assert outcomes[0] == outcomes[1]
+        for table in [False, True]:
+            label = 'intervals crossed: ' + str(k) + (', with exp table' if table else ', without exp table')
+            measurements[label + ', mint'] = gas[table][0]
+            measurements[label + ', swap'] = gas[table][1]
+
+    logGas(request, measurements)
@@ -2,8 +2,9 @@
 import pytest
 import brownie
 from Nofee import logTest
-from brownie import accounts, FullMathWrapper
+from brownie import FullMathWrapper
 from sympy import Integer, floor, ceiling
+from math import isqrt
 
 value0 = 0x0000000000000000000000000000000000000000000000000000000000000000
 value1 = 0x0000000000000000000000000000000000000000000000000000000000000001
@@ -12,8 +13,8 @@ value3 = 0x8FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
 value4 = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return FullMathWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(FullMathWrapper)
 
 @pytest.mark.parametrize('a0', [value2 // 7, value2 // 5, value2 // 3, value2])
 @pytest.mark.parametrize('a1', [value2 // 7, value2 // 5, value2 // 3, value2])
@@ -63,6 +64,14 @@ def test_cheapMulDiv(wrapper, value, numerator, denominator, request, worker_id)
         result = tx.return_value
         assert result == (value * numerator) // denominator
 
+@pytest.mark.parametrize('value', [value0, value1, value2, value3, value4, value2 >> 128, (value2 >> 128) ** 2, (value2 >> 128) ** 2 - 1, (1 << 24) + 1])
+def test_sqrt(wrapper, value, request, worker_id):
+    logTest(request, worker_id)
+
+    tx = wrapper.sqrt(value)
+    result = tx.return_value
+    assert result == isqrt(value)
+
 @pytest.mark.parametrize('value', [value1, value2, value3, value4])
 def test_modularInverse(wrapper, value, request, worker_id):
     logTest(request, worker_id)
@@ -0,0 +1,242 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import sys
+import glob
+import json
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from sha3 import keccak_256
+from sympy import Integer
+import Nofee
+
+# A store of precomputed outputs of the reference model in 'Nofee.py'. The
+# functions 'outgoing', 'incoming' and 'getMaxIntegrals' of this module are
+# drop-in replacements for their counterparts in 'Nofee.py' which read their
+# outputs from 'golden.bin' whenever possible.
+#
+# 'golden.bin' is an open addressing hash table of fixed-width records which
+# is memory-mapped by every test process:
+#
+#   header: 'magic' (8 bytes) | slotCount (8 bytes) | oracleVersion (32 bytes)
+#   record: key (32 bytes) | status (1 byte) | value0 (64 bytes) | value1 (64 bytes)
+#
+# where key is the keccak of the function name and its arguments, and records
+# are placed at 'key % slotCount' with linear probing. Values are signed and
+# big-endian. 'oracleVersion' is the keccak of the source of 'NofeeOracle.py'.
+# A table or a journal entry which was produced by a different version of the
+# reference model is ignored, i.e., every output is recomputed until the next
+# build replaces the table.
+#
+# Any output which is missing from the table is computed by 'Nofee.py' and is
+# appended to a journal which is merged into the table by the next build:
+#
+#   python tests/Golden.py [processes]
+goldenPath = os.path.join('testLogs', 'golden.bin')
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'NofeeOracle.py'), 'rb') as f:
+    oracleVersion = keccak_256(f.read()).digest()
+
+magic = b'NOFEEGL2'
+headerSize = 48
+keySize = 32
+valueSize = 64
+recordSize = keySize + 1 + 2 * valueSize
+
+emptyRecord = 0
+noneRecord = 1
+oneValue = 2
+twoValues = 3
+
+functions = {
+    'outgoing': Nofee.outgoing,
+    'incoming': Nofee.incoming,
+    'getMaxIntegrals': Nofee.getMaxIntegrals
+}
+
+table = None
+
+def canonical(value):
+    if isinstance(value, (list, tuple)):
+        return [canonical(member) for member in value]
+    return int(value)
+
+def getKey(name, args):
+    return keccak_256((name + repr(canonical(args))).encode()).digest()
+
+def encodeResult(result):
+    if result is None:
+        return bytes([noneRecord]) + bytes(2 * valueSize)
+    if isinstance(result, tuple):
+        return bytes([twoValues]) + b''.join(int(value).to_bytes(valueSize, 'big', signed=True) for value in result)
+    return bytes([oneValue]) + int(result).to_bytes(valueSize, 'big', signed=True) + bytes(valueSize)
+
+def decodeResult(record):
+    status = record[0]
+    value0 = Integer(int.from_bytes(record[1 : 1 + valueSize], 'big', signed=True))
+    value1 = Integer(int.from_bytes(record[1 + valueSize : 1 + 2 * valueSize], 'big', signed=True))
+    if status == noneRecord:
+        return None
+    if status == twoValues:
+        return value0, value1
+    return value0
+
+# A table of a previous format or of a different 'oracleVersion' is treated
+# as absent.
+def openTable(path, version=None):
+    version = oracleVersion if version is None else version
+    if os.path.isfile(path) == False:
+        return None, 0
+    with open(path, 'rb') as f:
+        content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if content[0 : 8] != magic or content[16 : headerSize] != version:
+        content.close()
+        return None, 0
+    return content, int.from_bytes(content[8 : 16], 'big')
+
+# Returns the content of the record with the given key excluding the key, or
+# 'None' if the key is absent.
+def lookup(content, slotCount, key):
+    if slotCount == 0:
+        return None
+    slot = int.from_bytes(key, 'big') % slotCount
+    while True:
+        offset = headerSize + slot * recordSize
+        if content[offset + keySize] == emptyRecord:
+            return None
+        if content[offset : offset + keySize] == key:
+            return content[offset + keySize : offset + recordSize]
+        slot = (slot + 1) % slotCount
+
+def readTable(path, version=None):
+    content, slotCount = openTable(path, version)
+    entries = dict()
+    for slot in range(slotCount):
+        offset = headerSize + slot * recordSize
+        if content[offset + keySize] != emptyRecord:
+            entries[content[offset : offset + keySize]] = content[offset + keySize : offset + recordSize]
+    return entries
+
+# The table is written to a temporary file which then replaces 'path'. Hence,
+# processes which have mapped the previous table are not affected.
+def writeTable(path, entries, version=None):
+    version = oracleVersion if version is None else version
+    slotCount = 2 * len(entries) + 1
+    content = bytearray(headerSize + slotCount * recordSize)
+    content[0 : 8] = magic
+    content[8 : 16] = slotCount.to_bytes(8, 'big')
+    content[16 : headerSize] = version
+    for key in sorted(entries.keys()):
+        slot = int.from_bytes(key, 'big') % slotCount
+        while content[headerSize + slot * recordSize + keySize] != emptyRecord:
+            slot = (slot + 1) % slotCount
+        offset = headerSize + slot * recordSize
+        content[offset : offset + keySize] = key
+        content[offset + keySize : offset + recordSize] = entries[key]
+    if os.path.exists(os.path.dirname(path)) == False:
+        os.mkdir(os.path.dirname(path))
+    with open(path + '.tmp', 'wb') as f:
+        f.write(content)
+    os.replace(path + '.tmp', path)
+
+def getJournalPath():
+    return os.path.join(os.path.dirname(goldenPath), 'golden.' + str(os.getpid()) + '.jsonl')
+
+def evaluate(name, args):
+    global table
+    if table is None:
+        table = openTable(goldenPath)
+    key = getKey(name, args)
+    record = lookup(table[0], table[1], key)
+    if record is not None:
+        return decodeResult(record)
+    result = functions[name](*args)
+    if os.path.exists(os.path.dirname(goldenPath)) == False:
+        os.mkdir(os.path.dirname(goldenPath))
+    with open(getJournalPath(), 'a') as f:
+        f.write(json.dumps([oracleVersion.hex(), name, canonical(args), encodeResult(result).hex()]) + '\n')
+    return result
+
+def outgoing(curve, kernel, qMinX59, qMaxX59):
+    return evaluate('outgoing', [curve, kernel, qMinX59, qMaxX59])
+
+def incoming(curve, kernel, qMinX59, qMaxX59):
+    return evaluate('incoming', [curve, kernel, qMinX59, qMaxX59])
+
+def getMaxIntegrals(kernel):
+    return evaluate('getMaxIntegrals', [kernel])
+
+# The reference model evaluations which follow from 'dataGeneration' alone,
+# i.e., those of 'Initialize', 'IntervalCalculateMaxIntegrals' and
+# 'SwapWithin' prior to the swap. The remaining evaluations depend on the
+# outcome of the swaps and are collected via journals.
+def jobs():
+    initializations, swaps, kernelsValid, kernelsInvalid = Nofee.dataGeneration(1000)
+    output = []
+    for kernel, curve in zip(initializations['kernel'], initializations['curve']):
+        lower = min(curve[0], curve[1])
+        upper = max(curve[0], curve[1])
+        output.append(['getMaxIntegrals', [kernel]])
+        output.append(['outgoing', [curve, kernel, curve[-1], upper]])
+        output.append(['outgoing', [curve, kernel, lower, curve[-1]]])
+    for kernel, curve, qLimit in zip(swaps['kernel'], swaps['curve'], swaps['target']):
+        qLower = min(curve[0], curve[1])
+        qUpper = max(curve[0], curve[1])
+        qCurrent = curve[-1]
+        output.append(['getMaxIntegrals', [kernel]])
+        output.append(['outgoing', [curve, kernel, qCurrent, qUpper]])
+        output.append(['outgoing', [curve, kernel, qLower, qCurrent]])
+        if qLimit <= qCurrent:
+            output.append(['incoming', [curve, kernel, qLimit, qCurrent]])
+            output.append(['outgoing', [curve, kernel, qLimit, qCurrent]])
+        else:
+            output.append(['outgoing', [curve, kernel, qCurrent, qLimit]])
+            output.append(['incoming', [curve, kernel, qCurrent, qLimit]])
+    return output
+
+def compute(job):
+    name, args = job
+    return encodeResult(functions[name](*args))
+
+def build(processes):
+    entries = readTable(goldenPath)
+
+    # Each journal is renamed before it is merged so that processes which are
+    # still running append to a new journal rather than to one which is about
+    # to be deleted. Journals which were renamed by an interrupted build are
+    # merged as well. Journal entries of a different 'oracleVersion', of a
+    # previous format, or which are only partially written are dropped.
+    directory = os.path.dirname(goldenPath)
+    for journal in glob.glob(os.path.join(directory, 'golden.*.jsonl')):
+        try:
+            os.rename(journal, journal[: - len('.jsonl')] + '.merging')
+        except FileNotFoundError:
+            pass
+    journals = glob.glob(os.path.join(directory, 'golden.*.merging'))
+    for journal in journals:
+        with open(journal, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if len(entry) == 4 and entry[0] == oracleVersion.hex():
+                    _, name, args, record = entry
+                    entries[getKey(name, args)] = bytes.fromhex(record)
+
+    pending = dict()
+    for name, args in jobs():
+        key = getKey(name, args)
+        if key not in entries:
+            pending[key] = [name, canonical(args)]
+
+    with ProcessPoolExecutor(processes) as executor:
+        for key, record in zip(pending.keys(), executor.map(compute, pending.values(), chunksize=16)):
+            entries[key] = record
+
+    writeTable(goldenPath, entries)
+    for journal in journals:
+        os.remove(journal)
+    print(str(len(entries)) + ' records, ' + str(len(pending)) + ' computed, ' + str(len(journals)) + ' journals merged.')
+
+if __name__ == '__main__':
+    build(int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count())
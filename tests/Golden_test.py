@@ -0,0 +1,110 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import json
+import pytest
+import Golden
+from sympy import Integer
+from Nofee import logTest
+from Golden import getKey, encodeResult, decodeResult, openTable, readTable, writeTable, lookup, oracleVersion
+
+def getEntries(count):
+    entries = dict()
+    for k in range(count):
+        result = [None, Integer(- k), (Integer(k), Integer(- (1 << 255) + k))][k % 3]
+        entries[getKey('outgoing', [[k, k + 1], [[0, 0], [k, 1 << 15]], k, k + 1])] = encodeResult(result)
+    return entries
+
+# Every record which is written is found by 'lookup' and decoded back, while
+# absent keys are not found.
+@pytest.mark.parametrize('count', [0, 1, 2, 50])
+def test_roundTrip(tmp_path, count, request, worker_id):
+    logTest(request, worker_id)
+
+    path = str(tmp_path / 'golden.bin')
+    entries = getEntries(count)
+    writeTable(path, entries)
+
+    content, slotCount = openTable(path)
+    assert slotCount == 2 * count + 1
+    for key, record in entries.items():
+        assert lookup(content, slotCount, key) == record
+        assert decodeResult(lookup(content, slotCount, key)) == decodeResult(record)
+    assert lookup(content, slotCount, getKey('incoming', [[0, 1], [[0, 0]], 0, 1])) is None
+    assert readTable(path) == entries
+
+# A table of a different version of 'NofeeOracle.py' is ignored.
+def test_staleTable(tmp_path, request, worker_id):
+    logTest(request, worker_id)
+
+    path = str(tmp_path / 'golden.bin')
+    writeTable(path, getEntries(5), bytes(32))
+    assert openTable(path) == (None, 0)
+    assert readTable(path) == dict()
+    assert readTable(path, bytes(32)) == getEntries(5)
+
+# Outputs which are missing from the table are journaled and merged by the
+# next build, except for journal entries of a different version.
+def test_journal(tmp_path, monkeypatch, request, worker_id):
+    logTest(request, worker_id)
+
+    directory = tmp_path / 'testLogs'
+    directory.mkdir()
+    monkeypatch.setattr(Golden, 'goldenPath', str(directory / 'golden.bin'))
+    monkeypatch.setattr(Golden, 'table', None)
+    monkeypatch.setattr(Golden, 'jobs', lambda: [])
+    monkeypatch.setattr(Golden, 'functions', {'getMaxIntegrals': lambda kernel: (Integer(len(kernel)), Integer(- 1))})
+
+    kernel = [[0, 0], [1 << 40, 1 << 15]]
+    assert Golden.getMaxIntegrals(kernel) == (2, - 1)
+    with open(Golden.getJournalPath(), 'r') as f:
+        lines = f.readlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])[0] == oracleVersion.hex()
+
+    staleKernel = [[0, 0], [1 << 41, 1 << 15]]
+    with open(str(directory / 'golden.0.jsonl'), 'w') as f:
+        f.write(json.dumps([bytes(32).hex(), 'getMaxIntegrals', staleKernel, encodeResult((Integer(7), Integer(7))).hex()]) + '\n')
+        f.write(json.dumps(['getMaxIntegrals', staleKernel, encodeResult((Integer(7), Integer(7))).hex()]) + '\n')
+
+    Golden.build(1)
+    assert os.listdir(str(directory)) == ['golden.bin']
+
+    content, slotCount = openTable(Golden.goldenPath)
+    assert slotCount == 3
+    assert decodeResult(lookup(content, slotCount, getKey('getMaxIntegrals', [kernel]))) == (2, - 1)
+    assert lookup(content, slotCount, getKey('getMaxIntegrals', [staleKernel])) is None
+
+# Journals which were renamed by an interrupted build are merged by the next
+# one, while partially written entries are dropped. Entries which are appended
+# after a journal is renamed go to a new journal and are kept for the next
+# build.
+def test_journalInterrupted(tmp_path, monkeypatch, request, worker_id):
+    logTest(request, worker_id)
+
+    directory = tmp_path / 'testLogs'
+    directory.mkdir()
+    monkeypatch.setattr(Golden, 'goldenPath', str(directory / 'golden.bin'))
+    monkeypatch.setattr(Golden, 'table', None)
+    monkeypatch.setattr(Golden, 'jobs', lambda: [])
+
+    kernel = [[0, 0], [1 << 40, 1 << 15]]
+    record = encodeResult((Integer(3), Integer(- 3)))
+    with open(str(directory / 'golden.0.merging'), 'w') as f:
+        f.write(json.dumps([oracleVersion.hex(), 'getMaxIntegrals', [kernel], record.hex()]) + '\n')
+        f.write(json.dumps([oracleVersion.hex(), 'getMaxIntegrals', [kernel], record.hex()])[0 : 20])
+
+    rename = os.rename
+    def renameAndAppend(source, target):
+        rename(source, target)
+        with open(source, 'a') as f:
+            f.write(json.dumps([oracleVersion.hex(), 'getMaxIntegrals', [[[0, 0], [1 << 41, 1 << 15]]], record.hex()]) + '\n')
+    with open(str(directory / 'golden.1.jsonl'), 'w') as f:
+        pass
+    monkeypatch.setattr(os, 'rename', renameAndAppend)
+
+    Golden.build(1)
+    assert sorted(os.listdir(str(directory))) == ['golden.1.jsonl', 'golden.bin']
+
+    content, slotCount = openTable(Golden.goldenPath)
+    assert decodeResult(lookup(content, slotCount, getKey('getMaxIntegrals', [kernel]))) == (3, - 3)
+    assert lookup(content, slotCount, getKey('getMaxIntegrals', [[[0, 0], [1 << 41, 1 << 15]]])) is None
@@ -0,0 +1,118 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import itertools
+import pytest
+
+# The strength of the generated covering arrays, i.e., every combination of
+# values for any 'mode' parameters appears in at least one test case. 'full'
+# generates the entire cartesian product. This is overwritten by the '--grid'
+# option in 'conftest.py'.
+mode = os.environ.get('NOFEE_GRID', '2')
+
+# Returns a list of rows where each row is a list of value indices, one per
+# parameter. Every 't' columns of the output contain every combination of
+# their values. The construction follows the in-parameter-order strategy:
+#
+# - the parameters are sorted in descending order of their sizes,
+# - the first 't' parameters are populated with their cartesian product,
+# - every subsequent parameter is added to the existing rows so that each row
+#   covers as many new combinations as possible (horizontal growth), and then
+#   new rows are appended for the remaining combinations (vertical growth).
+#
+# Ties are broken in favor of the smallest index. Hence, the output only
+# depends on the sizes and 't'.
+def coveringArray(sizes, t):
+    k = len(sizes)
+    t = min(t, k)
+    order = sorted(range(k), key=lambda p: (- sizes[p], p))
+    sortedSizes = [sizes[p] for p in order]
+
+    rows = [list(row) + [None] * (k - t) for row in itertools.product(*[range(size) for size in sortedSizes[0:t]])]
+
+    for i in range(t, k):
+        subsets = list(itertools.combinations(range(i), t - 1))
+
+        uncovered = set()
+        for subset in subsets:
+            for values in itertools.product(*[range(sortedSizes[p]) for p in subset]):
+                for v in range(sortedSizes[i]):
+                    uncovered.add((subset, values, v))
+
+        # Horizontal growth
+        for row in rows:
+            best = 0
+            bestCount = -1
+            for v in range(sortedSizes[i]):
+                count = 0
+                for subset in subsets:
+                    values = tuple(row[p] for p in subset)
+                    if None not in values and (subset, values, v) in uncovered:
+                        count += 1
+                if count > bestCount:
+                    best = v
+                    bestCount = count
+            row[i] = best
+            for subset in subsets:
+                values = tuple(row[p] for p in subset)
+                uncovered.discard((subset, values, best))
+
+        # Vertical growth. Rows with no unassigned entry cover all of their
+        # combinations already and cannot accommodate the remaining ones. The
+        # remaining rows are indexed by the value of the largest parameter.
+        partialRows = dict()
+        for row in rows:
+            if None in row[0:i]:
+                partialRows.setdefault(row[0], []).append(row)
+        for subset, values, v in sorted(uncovered):
+            if subset[0] == 0:
+                candidates = partialRows.get(values[0], []) + partialRows.get(None, [])
+            else:
+                candidates = itertools.chain(*partialRows.values())
+            for row in candidates:
+                if all(row[p] in [None, value] for p, value in zip(subset + (i, ), values + (v, ))):
+                    break
+            else:
+                row = [None] * k
+                rows.append(row)
+                partialRows.setdefault(None, []).append(row)
+            if row[0] is None and subset[0] == 0:
+                bucket = partialRows[None]
+                del bucket[next(j for j in range(len(bucket)) if bucket[j] is row)]
+                partialRows.setdefault(values[0], []).append(row)
+            for p, value in zip(subset + (i, ), values + (v, )):
+                row[p] = value
+
+    output = []
+    for row in rows:
+        unsorted = [0] * k
+        for p in range(k):
+            unsorted[order[p]] = 0 if row[p] is None else row[p]
+        output.append(unsorted)
+    return output
+
+# A replacement for stacks of '@pytest.mark.parametrize'. The keyword
+# arguments are the names of parameters and their lists of values. The ID of
+# each test case is composed of the indices of its values which is identical
+# in every mode.
+#
+# Parameters with a single value do not contribute to combinations and are
+# excluded from the covering array.
+def grid(**parameters):
+    names = list(parameters.keys())
+    values = [list(parameters[name]) for name in names]
+
+    if mode == 'full':
+        rows = [list(row) for row in itertools.product(*[range(len(value)) for value in values])]
+    else:
+        varying = [p for p in range(len(names)) if len(values[p]) > 1]
+        rows = []
+        for partial in coveringArray([len(values[p]) for p in varying], int(mode)):
+            row = [0] * len(names)
+            for p, index in zip(varying, partial):
+                row[p] = index
+            rows.append(row)
+
+    return pytest.mark.parametrize(
+        names,
+        [pytest.param(*[values[p][row[p]] for p in range(len(names))], id='-'.join(str(index) for index in row)) for row in rows]
+    )
@@ -0,0 +1,55 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import random
+import itertools
+import pytest
+import Grid
+from Nofee import logTest
+from Grid import coveringArray, grid
+
+random.seed(0)
+sizeVectors = [[random.randint(1, 5) for _ in range(random.randint(1, 8))] for _ in range(20)]
+
+# Every 't' columns of the covering array should contain every combination of
+# their values and every entry should be a valid index.
+@pytest.mark.parametrize('sizes', sizeVectors)
+@pytest.mark.parametrize('t', [2, 3])
+def test_coveringArray(sizes, t, request, worker_id):
+    logTest(request, worker_id)
+
+    rows = coveringArray(sizes, t)
+    assert all(len(row) == len(sizes) for row in rows)
+    assert all(0 <= row[p] < sizes[p] for row in rows for p in range(len(sizes)))
+
+    for subset in itertools.combinations(range(len(sizes)), min(t, len(sizes))):
+        covered = set(tuple(row[p] for p in subset) for row in rows)
+        assert covered == set(itertools.product(*[range(sizes[p]) for p in subset]))
+
+    # The output only depends on the sizes and 't' and it is never larger than
+    # the cartesian product.
+    assert coveringArray(sizes, t) == rows
+    product = 1
+    for size in sizes:
+        product *= size
+    assert len(rows) <= product
+
+def getCases(monkeypatch, mode, parameters):
+    monkeypatch.setattr(Grid, 'mode', mode)
+    names, cases = grid(**parameters).args
+    return names, dict((case.id, case.values) for case in cases)
+
+# A case carries the same ID with the same values in every mode. Hence, a
+# case which fails in one mode can be rerun in any other mode.
+@pytest.mark.parametrize('sizes', sizeVectors)
+def test_gridIds(monkeypatch, sizes, request, worker_id):
+    logTest(request, worker_id)
+
+    parameters = dict(('p' + str(p), [(p, v) for v in range(size)]) for p, size in enumerate(sizes))
+    names, full = getCases(monkeypatch, 'full', parameters)
+    assert names == list(parameters.keys())
+    assert len(full) == len(list(itertools.product(*parameters.values())))
+
+    for mode in ['2', '3']:
+        _, cases = getCases(monkeypatch, mode, parameters)
+        assert len(cases) <= len(full)
+        for id, values in cases.items():
+            assert full[id] == values
@@ -0,0 +1,379 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from Nofee import encodeCurve, encodeKernel
+from IntervalModel import IntervalModel, decodeCurve, decodeKernel, storePrice, copyPrice, height, log, sqrt, slt
+
+oneX23 = 2**23
+oneX216 = 2**216
+oneX47 = 2**47
+X111 = 2**111
+X255 = 2**255
+maxGrowth = 2**127
+accruedMax = 2**231 - 1
+
+# Every function below operates on numpy object arrays whose entries are
+# python integers. Each entry is referred to as a lane and corresponds to a
+# candidate pair of 'poolGrowthPortion' and 'protocolGrowthPortion'. Functions
+# return the outputs along with a boolean mask of the lanes that revert.
+
+def lanes(values, n):
+    output = numpy.empty(n, dtype=object)
+    output[:] = values if hasattr(values, '__len__') else [values] * n
+    return output
+
+# Mirrors 'updateGrowth' in 'Growth.sol'.
+def updateGrowth(growth, numerator, denominator, poolGrowthPortion, protocolGrowthPortion):
+    valueX158 = (growth << 47) - protocolGrowthPortion * growth
+    valueX205 = (valueX158 << 47) - poolGrowthPortion * valueX158
+    product = valueX205 * numerator
+    overflow = ((product >> 256) >= denominator).astype(bool)
+    updatedGrowth = growth + ((product // max(denominator, 1)) >> 94)
+    overflow |= (updatedGrowth > maxGrowth).astype(bool)
+    return updatedGrowth, overflow
+
+# Mirrors 'calculateGrowthPortion' in 'GrowthPortion.sol'.
+def calculateGrowthPortion(increment, currentAccrued, currentPoolRatio, poolGrowthPortion, protocolGrowthPortion):
+    coefficientX94 = (oneX47 - protocolGrowthPortion) * poolGrowthPortion
+    poolPortionIncrement = (increment * coefficientX94) >> 94
+    updatedAccrued = currentAccrued + ((increment * (coefficientX94 + (protocolGrowthPortion << 47))) >> 94)
+    overflow = (updatedAccrued > accruedMax).astype(bool)
+    positive = (updatedAccrued > 0).astype(bool)
+    updatedPoolRatio = numpy.where(
+        positive,
+        (currentPoolRatio * currentAccrued + (poolPortionIncrement << 23)) // numpy.maximum(updatedAccrued, 1),
+        0
+    )
+    return updatedAccrued, updatedPoolRatio, overflow
+
+# Mirrors 'safeInRangeAmount' in 'Amount.sol' for non-negative liquidity.
+def safeInRangeAmount(offset, integral, liquidity, outgoingMax, roundUp):
+    numerator = offset * integral * liquidity
+    if roundUp:
+        amount = - ((- numerator) // (outgoingMax * X111))
+    else:
+        amount = numerator // (outgoingMax * X111)
+    return amount, (amount >= X255).astype(bool)
+
+# Mirrors the '&' operator of 'X127'.
+def safeAdd(value0, value1):
+    result = value0 + value1
+    return result, ((result >= X255) | (result < - X255)).astype(bool)
+
+# Replays the growth and accrued growth portion bookkeeping of 'Swap.sol' for
+# many growth portion settings at once.
+#
+# Swaps are described by their trajectory in the integral space, i.e., by the
+# values that 'swapWithin' and 'cross' derive from the curve and the kernel.
+# These values do not depend on growth portions. Every amount which depends on
+# 'growth' (and hence on growth portions) is recomputed per lane with the same
+# rounding as the contract. A swap which reverts in a lane leaves that lane
+# untouched and is recorded in 'reverts'.
+#
+# 'steps' of a swap are tuples of either of the following forms:
+#
+#  ('within', sharesTotal, zeroForOne, currentToTarget, incomingCurrentToTarget,
+#             accrual0, accrual1, growthNumerator, growthDenominator, residual)
+#
+#  where 'accrual0 == integral0Incremented - integral0Amended' and
+#  'accrual1 == integral1Incremented - integral1Amended' once 'swapWithin' has
+#  adjusted the incremented integrals, and 'residual' is either 'None' or
+#  '(zeroOrOne, integral)', i.e., the residual value which 'swapWithin' gives
+#  to the swapper either when the target reaches '_next_' or due to the
+#  mismatch at the overshoot. The residual is added to the outgoing amount if
+#  'zeroOrOne == zeroForOne' and is subtracted from the incoming amount
+#  otherwise. 'withinStep' derives these values from the curve and the kernel.
+#  Or,
+#
+#  ('cross', sharesTotal, zeroForOne, outgoingIntegral, incomingIntegral)
+#
+#  where 'outgoingIntegral' is the current 'integral1' (resp. 'integral0')
+#  and 'incomingIntegral' is '_next_.sqrt(false) % incomingMax' (resp.
+#  '_next_.sqrt(true) % incomingMax') if 'zeroForOne' (resp. otherwise).
+#
+# As in 'Swap.sol', a step whose 'sharesTotal' is less than 'crossThreshold'
+# halts the swap.
+class GrowthAccrualSimulator:
+    def __init__(
+        self,
+        poolGrowthPortions,
+        protocolGrowthPortions,
+        growth,
+        sqrtOffset,
+        sqrtInverseOffset,
+        outgoingMax,
+        incomingMax,
+        accrued0=0,
+        accrued1=0,
+        poolRatio0=0,
+        poolRatio1=0
+    ):
+        assert numpy is not None, 'numpy is required for the accrual simulator.'
+        n = len(poolGrowthPortions)
+        assert len(protocolGrowthPortions) == n
+        self.n = n
+        self.poolGrowthPortion = lanes(poolGrowthPortions, n)
+        self.protocolGrowthPortion = lanes(protocolGrowthPortions, n)
+        self.isGrowthPortion = ((self.poolGrowthPortion > 0) | (self.protocolGrowthPortion > 0)).astype(bool)
+        self.sqrtOffset = sqrtOffset
+        self.sqrtInverseOffset = sqrtInverseOffset
+        self.outgoingMax = outgoingMax
+        self.incomingMax = incomingMax
+        self.growth = lanes(growth, n)
+        self.accrued0 = lanes(accrued0, n)
+        self.accrued1 = lanes(accrued1, n)
+        self.poolRatio0 = lanes(poolRatio0, n)
+        self.poolRatio1 = lanes(poolRatio1, n)
+        self.reverts = numpy.zeros(n, dtype=int)
+
+    def _state(self):
+        return [self.growth, self.accrued0, self.accrued1, self.poolRatio0, self.poolRatio1]
+
+    def _setState(self, state):
+        self.growth, self.accrued0, self.accrued1, self.poolRatio0, self.poolRatio1 = state
+
+    def _offset(self, zeroOrOne):
+        return self.sqrtOffset if zeroOrOne else self.sqrtInverseOffset
+
+    def _accrue(self, zeroOrOne, increment, failed):
+        if zeroOrOne:
+            accrued, ratio = self.accrued1, self.poolRatio1
+        else:
+            accrued, ratio = self.accrued0, self.poolRatio0
+        updatedAccrued, updatedRatio, overflow = calculateGrowthPortion(
+            increment,
+            accrued,
+            ratio,
+            self.poolGrowthPortion,
+            self.protocolGrowthPortion
+        )
+        accrued = numpy.where(self.isGrowthPortion, updatedAccrued, accrued)
+        ratio = numpy.where(self.isGrowthPortion, updatedRatio, ratio)
+        if zeroOrOne:
+            self.accrued1, self.poolRatio1 = accrued, ratio
+        else:
+            self.accrued0, self.poolRatio0 = accrued, ratio
+        return failed | (overflow & self.isGrowthPortion)
+
+    # Mirrors 'updateAmounts' in 'Swap.sol' except for 'amountSpecified'
+    # which is implied by the trajectory.
+    def _updateAmounts(self, zeroForOne, outgoingAmount, incomingAmount, failed):
+        amount0, amount1 = (incomingAmount, - outgoingAmount) if zeroForOne else (- outgoingAmount, incomingAmount)
+        self.amount0, overflow0 = safeAdd(self.amount0, amount0)
+        self.amount1, overflow1 = safeAdd(self.amount1, amount1)
+        return failed | overflow0 | overflow1
+
+    def _within(self, failed, sharesTotal, zeroForOne, currentToTarget, incomingCurrentToTarget, accrual0, accrual1, growthNumerator, growthDenominator, residual=None):
+        liquidity = self.growth * sharesTotal
+        outgoingAmount, overflow = safeInRangeAmount(
+            self._offset(zeroForOne), currentToTarget, liquidity, self.outgoingMax, False
+        )
+        failed = failed | overflow
+        incomingAmount, overflow = safeInRangeAmount(
+            self._offset(not zeroForOne), incomingCurrentToTarget, liquidity, self.outgoingMax, True
+        )
+        failed = failed | overflow
+
+        if residual is not None:
+            zeroOrOne, integral = residual
+            value, overflow = safeInRangeAmount(
+                self._offset(zeroOrOne), integral, liquidity, self.outgoingMax, False
+            )
+            failed = failed | overflow
+            if zeroOrOne == zeroForOne:
+                outgoingAmount, overflow = safeAdd(outgoingAmount, value)
+                failed = failed | overflow
+            else:
+                incomingAmount = numpy.maximum(incomingAmount - value, 0)
+
+        increment0, overflow0 = safeInRangeAmount(
+            self.sqrtInverseOffset, accrual0, liquidity, self.outgoingMax, False
+        )
+        increment1, overflow1 = safeInRangeAmount(
+            self.sqrtOffset, accrual1, liquidity, self.outgoingMax, False
+        )
+        failed = failed | ((overflow0 | overflow1) & self.isGrowthPortion)
+        failed = self._accrue(False, increment0, failed)
+        failed = self._accrue(True, increment1, failed)
+
+        self.growth, overflow = updateGrowth(
+            self.growth,
+            growthNumerator - growthDenominator,
+            growthDenominator,
+            self.poolGrowthPortion,
+            self.protocolGrowthPortion
+        )
+        failed = failed | overflow
+
+        return self._updateAmounts(zeroForOne, outgoingAmount, incomingAmount, failed)
+
+    def _cross(self, failed, sharesTotal, zeroForOne, outgoingIntegral, incomingIntegral):
+        liquidity = self.growth * sharesTotal
+        outgoingAmount, overflow = safeInRangeAmount(
+            self._offset(zeroForOne), outgoingIntegral, liquidity, self.outgoingMax, False
+        )
+        failed = failed | overflow
+        incomingAmount, overflow = safeInRangeAmount(
+            self._offset(not zeroForOne), incomingIntegral, liquidity, self.outgoingMax, True
+        )
+        failed = failed | overflow
+
+        self.growth, overflow = updateGrowth(
+            self.growth,
+            self.incomingMax - self.outgoingMax,
+            self.outgoingMax,
+            self.poolGrowthPortion,
+            self.protocolGrowthPortion
+        )
+        failed = failed | overflow
+
+        if sharesTotal == 0:
+            return failed
+
+        increment = (incomingAmount * (self.incomingMax - self.outgoingMax)) // self.incomingMax
+        failed = self._accrue(not zeroForOne, increment, failed)
+
+        return self._updateAmounts(zeroForOne, outgoingAmount, incomingAmount, failed)
+
+    # Applies the steps of one swap to every lane and returns 'amount0',
+    # 'amount1' in 'X127' representation along with the mask of reverted
+    # lanes.
+    def swap(self, steps, crossThreshold=0):
+        previous = self._state()
+        self.amount0 = lanes(0, self.n)
+        self.amount1 = lanes(0, self.n)
+        failed = numpy.zeros(self.n, dtype=bool)
+        for step in steps:
+            if step[1] < crossThreshold:
+                break
+            if step[0] == 'within':
+                failed = self._within(failed, *step[1:])
+            elif step[0] == 'cross':
+                failed = self._cross(failed, *step[1:])
+            else:
+                raise ValueError('Unknown step: ' + str(step[0]))
+
+        # 'writeAccruedParams' keeps the integer part of accrued values only.
+        self.accrued0 = numpy.where(self.isGrowthPortion, (self.accrued0 >> 127) << 127, self.accrued0)
+        self.accrued1 = numpy.where(self.isGrowthPortion, (self.accrued1 >> 127) << 127, self.accrued1)
+
+        # Reverted lanes are restored.
+        self._setState([
+            numpy.where(failed, old, new) for old, new in zip(previous, self._state())
+        ])
+        amount0 = numpy.where(failed, 0, self.amount0)
+        amount1 = numpy.where(failed, 0, self.amount1)
+        self.reverts += failed
+        return amount0, amount1, failed
+
+    # Mirrors 'collectPool' in 'NofeeswapDelegatee.sol' and returns integer
+    # amounts.
+    def collectPool(self):
+        amount0 = (self.accrued0 * self.poolRatio0) >> 23
+        amount1 = (self.accrued1 * self.poolRatio1) >> 23
+        self.accrued0 = self.accrued0 - amount0
+        self.accrued1 = self.accrued1 - amount1
+        self.poolRatio0 = lanes(0, self.n)
+        self.poolRatio1 = lanes(0, self.n)
+        return amount0 >> 127, amount1 >> 127
+
+    # Mirrors 'collectProtocol' in 'NofeeswapDelegatee.sol' and returns integer
+    # amounts.
+    def collectProtocol(self):
+        amount0 = (self.accrued0 * (oneX23 - self.poolRatio0)) >> 23
+        amount1 = (self.accrued1 * (oneX23 - self.poolRatio1)) >> 23
+        self.accrued0 = self.accrued0 - amount0
+        self.accrued1 = self.accrued1 - amount1
+        self.poolRatio0 = lanes(oneX23, self.n)
+        self.poolRatio1 = lanes(oneX23, self.n)
+        return amount0 >> 127, amount1 >> 127
+
+# Mirrors 'minFractions' in 'X216.sol'.
+def minFractions(numerator0, denominator0, numerator1, denominator1):
+    if numerator0 == 0 and denominator0 == 0:
+        return numerator1, denominator1, True
+    if numerator1 * denominator0 >= numerator0 * denominator1:
+        return numerator0, denominator0, False
+    return numerator1, denominator1, True
+
+# Derives the 'within' step of a call to 'swapWithin' whose target is not
+# limited by 'amountSpecified', given the integrals of the current interval
+# along with 'curve' and 'kernel' as in 'IntervalModel.py'. As in
+# 'initiateInterval', 'qLimit' is capped by the boundaries of the interval.
+def withinStep(sharesTotal, integral0, integral1, qLimit, curve, kernel, outgoingMax):
+    model = IntervalModel(
+        not slt(curve[-1], qLimit),
+        decodeKernel(encodeKernel(kernel)),
+        decodeCurve(encodeCurve(curve), len(curve))
+    )
+    zeroForOne = model.zeroForOne
+    model.initiateInterval(qLimit)
+    while log(model.target) != model.logPriceLimitOffsettedWithinInterval:
+        model.moveTarget()
+
+    # 'currentToTarget' is capped as in 'swapWithin'.
+    model.currentToTarget = min(model.currentToTarget, integral1 if zeroForOne else integral0)
+    currentToTarget = model.currentToTarget
+    incomingCurrentToTarget = model.incomingCurrentToTarget
+    if zeroForOne:
+        integral0Incremented = incomingCurrentToTarget + integral0
+        integral1Incremented = integral1 - currentToTarget
+    else:
+        integral0Incremented = integral0 - currentToTarget
+        integral1Incremented = incomingCurrentToTarget + integral1
+    integral0Amended = integral0Incremented
+    integral1Amended = integral1Incremented
+    growthNumerator = oneX216
+    growthDenominator = oneX216
+    residual = None
+
+    qNext = min(curve[0], curve[1]) if zeroForOne else max(curve[0], curve[1])
+    if log(model.target) == qNext:
+        if zeroForOne:
+            residual = (True, integral1Incremented)
+            integral0Amended = min(sqrt(storePrice(qNext), False) % outgoingMax, integral0Amended)
+            integral1Amended = 0
+            integral1Incremented = 0
+            growthNumerator, growthDenominator = integral0Incremented, integral0Amended
+        else:
+            residual = (False, integral0Incremented)
+            integral1Amended = min(sqrt(storePrice(qNext), True) % outgoingMax, integral1Amended)
+            integral0Amended = 0
+            integral0Incremented = 0
+            growthNumerator, growthDenominator = integral1Incremented, integral1Amended
+    elif height(model.total1) != 0 and log(model.target) != log(model.current):
+        model.overshoot = copyPrice(model.overshoot, model.target)
+        model.forward1 = copyPrice(model.forward1, model.target)
+        model.currentToOvershoot = model.currentToTarget
+        while model.moveOvershoot(integral0Amended, integral1Amended):
+            pass
+        integral0Amended, integral1Amended = model.searchOvershoot(integral0Amended, integral1Amended)
+        growthNumerator, growthDenominator, which = minFractions(
+            integral0Incremented,
+            integral0Amended,
+            integral1Incremented,
+            integral1Amended
+        )
+        if which:
+            integralIncremented = (integral0Amended * growthNumerator) // growthDenominator
+            residual = (False, integral0Incremented - integralIncremented)
+            integral0Incremented = integralIncremented
+        else:
+            integralIncremented = (integral1Amended * growthNumerator) // growthDenominator
+            residual = (True, max(integral1Incremented - integralIncremented, 0))
+            integral1Incremented = integralIncremented
+
+    return (
+        'within',
+        sharesTotal,
+        zeroForOne,
+        currentToTarget,
+        incomingCurrentToTarget,
+        integral0Incremented - integral0Amended,
+        integral1Incremented - integral1Amended,
+        growthNumerator,
+        growthDenominator,
+        residual
+    )
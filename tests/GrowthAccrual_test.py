@@ -0,0 +1,199 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+import brownie
+from brownie import accounts, GrowthWrapper, GrowthPortionWrapper, SwapWrapper
+from Nofee import logTest, _accrued0_, _accrued1_, _amount0_, _amount1_, _poolRatio0_, _poolRatio1_, _growth_, toInt, twosComplement, encodeCurve, encodeKernel
+from Golden import outgoing, getMaxIntegrals
+from IntervalModel import midpoint, spacing
+from GrowthAccrual import lanes, updateGrowth, calculateGrowthPortion, GrowthAccrualSimulator, withinStep
+
+oneX47 = 2 ** 47
+listX47 = [0, oneX47 // 5, oneX47 // 4, oneX47 // 3, oneX47 // 2, oneX47]
+
+poolGrowthPortions = [pool for pool in listX47 for protocol in listX47]
+protocolGrowthPortions = [protocol for pool in listX47 for protocol in listX47]
+n = len(poolGrowthPortions)
+
+list0X111 = [((1 << 127) - 1) // 5, ((1 << 127) - 1) // 3, ((1 << 127) - 1)]
+list1X216 = [((1 << 216) - 1) // 3, ((1 << 216) - 1)]
+
+accrued0 = 0x0000000000000000000000000000000000000000000000000000000000000000
+accrued1 = 0x0000000000000000000000000000000080000000000000000000000000000000
+accrued2 = 0x7807F807F807F807F807F807F807F80780000000000000000000000000000000
+accrued3 = 0x47FFFFFFFFFFFFFFFFFFFFFFFFFFFFFF80000000000000000000000000000000
+
+ratio0 = 0x000000
+ratio1 = 0x400000
+ratio2 = 0xFFFFFF
+
+oneX15 = 2 ** 15
+int256max = (1 << 255) - 1
+
+points = [(k * spacing) // 10 for k in range(7)]
+withinKernel = [[0, 0], [points[2], oneX15 // 3], [points[4], (2 * oneX15) // 3], [points[6], oneX15]]
+withinCurves = [
+    [midpoint + points[0], midpoint + points[6], midpoint + points[2], midpoint + points[4]],
+    [midpoint + points[6], midpoint + points[0], midpoint + points[4], midpoint + points[2]]
+]
+# The first two limits are within the interval and lead to an overshoot. The
+# other two are beyond the interval, in which case the target reaches '_next_'.
+withinLimits = [midpoint + points[1], midpoint + points[5], midpoint - spacing, midpoint + 2 * spacing]
+
+@pytest.fixture(autouse=True)
+def wrappers(fn_isolation):
+    return GrowthWrapper.deploy({'from': accounts[0]}), GrowthPortionWrapper.deploy({'from': accounts[0]})
+
+@pytest.mark.parametrize('growth', list0X111)
+@pytest.mark.parametrize('numerator', list1X216 + [0])
+@pytest.mark.parametrize('denominator', list1X216)
+def test_updateGrowth(wrappers, growth, numerator, denominator, request, worker_id):
+    logTest(request, worker_id)
+
+    growthWrapper, _ = wrappers
+    updatedGrowth, overflow = updateGrowth(
+        lanes(growth, n), numerator, denominator, lanes(poolGrowthPortions, n), lanes(protocolGrowthPortions, n)
+    )
+    for k in range(n):
+        if overflow[k]:
+            with brownie.reverts():
+                growthWrapper.updateGrowthWrapper(growth, protocolGrowthPortions[k], poolGrowthPortions[k], numerator, denominator)
+        else:
+            tx = growthWrapper.updateGrowthWrapper(growth, protocolGrowthPortions[k], poolGrowthPortions[k], numerator, denominator)
+            assert tx.return_value == updatedGrowth[k]
+
+@pytest.mark.parametrize('increment', [accrued0, accrued1, accrued2, accrued3])
+@pytest.mark.parametrize('currentAccrued', [accrued0, accrued1, accrued2, accrued3])
+@pytest.mark.parametrize('currentPoolRatio', [ratio0, ratio1, ratio2])
+def test_calculateGrowthPortion(wrappers, increment, currentAccrued, currentPoolRatio, request, worker_id):
+    logTest(request, worker_id)
+
+    _, growthPortionWrapper = wrappers
+    updatedAccrued, updatedPoolRatio, overflow = calculateGrowthPortion(
+        lanes(increment, n), lanes(currentAccrued, n), lanes(currentPoolRatio, n), lanes(poolGrowthPortions, n), lanes(protocolGrowthPortions, n)
+    )
+    for k in range(n):
+        if overflow[k]:
+            with brownie.reverts():
+                growthPortionWrapper._calculateGrowthPortion(protocolGrowthPortions[k], poolGrowthPortions[k], increment, currentAccrued, currentPoolRatio)
+        else:
+            tx = growthPortionWrapper._calculateGrowthPortion(protocolGrowthPortions[k], poolGrowthPortions[k], increment, currentAccrued, currentPoolRatio)
+            assert tx.return_value == (updatedAccrued[k], updatedPoolRatio[k])
+
+@pytest.mark.parametrize('zeroForOne', [False, True])
+@pytest.mark.parametrize('swaps', [1, 10])
+def test_simulator(wrappers, zeroForOne, swaps, request, worker_id):
+    logTest(request, worker_id)
+
+    growthWrapper, growthPortionWrapper = wrappers
+    sqrtOffset = 1 << 127
+    sqrtInverseOffset = 1 << 127
+    outgoingMax = ((1 << 210) - 1) // 3
+    incomingMax = outgoingMax + outgoingMax // 100
+    sharesTotal = 10 ** 18
+
+    simulator = GrowthAccrualSimulator(
+        poolGrowthPortions, protocolGrowthPortions, 1 << 111, sqrtOffset, sqrtInverseOffset, outgoingMax, incomingMax
+    )
+    steps = [('cross', sharesTotal, zeroForOne, 1 << 205, 1 << 207)]
+
+    # Lanes are independent. Hence, each lane should match a replay of the
+    # same swaps through the contract's growth and accrual functions.
+    growth = [1 << 111] * n
+    accrued = [0] * n
+    poolRatio = [0] * n
+    for _ in range(swaps):
+        _, _, failed = simulator.swap(steps)
+        assert not failed.any()
+        for k in range(n):
+            liquidity = growth[k] * sharesTotal
+            incomingAmount = - ((- (sqrtOffset if not zeroForOne else sqrtInverseOffset) * (1 << 207) * liquidity) // (outgoingMax << 111))
+            growth[k] = growthWrapper.updateGrowthWrapper(
+                growth[k],
+                protocolGrowthPortions[k],
+                poolGrowthPortions[k],
+                incomingMax - outgoingMax,
+                outgoingMax
+            ).return_value
+            if poolGrowthPortions[k] > 0 or protocolGrowthPortions[k] > 0:
+                tx = growthPortionWrapper._calculateGrowthPortion(
+                    protocolGrowthPortions[k],
+                    poolGrowthPortions[k],
+                    (incomingAmount * (incomingMax - outgoingMax)) // incomingMax,
+                    accrued[k],
+                    poolRatio[k]
+                )
+                accrued[k], poolRatio[k] = tx.return_value
+                accrued[k] = (accrued[k] >> 127) << 127
+
+    for k in range(n):
+        assert simulator.growth[k] == growth[k]
+        if zeroForOne:
+            assert simulator.accrued0[k] == accrued[k]
+            assert simulator.poolRatio0[k] == poolRatio[k]
+        else:
+            assert simulator.accrued1[k] == accrued[k]
+            assert simulator.poolRatio1[k] == poolRatio[k]
+
+def signedX127(value):
+    return value - (1 << 256) if value >= (1 << 255) else value
+
+@pytest.mark.parametrize('curve', withinCurves)
+@pytest.mark.parametrize('qLimit', withinLimits)
+@pytest.mark.parametrize('crossThreshold', [0, 10 ** 18 + 1])
+def test_simulatorWithin(wrappers, curve, qLimit, crossThreshold, request, worker_id):
+    logTest(request, worker_id)
+
+    swapWrapper = SwapWrapper.deploy({'from': accounts[0]})
+    growth = 1 << 111
+    sharesTotal = 10 ** 18
+    qLower = min(curve[0], curve[1])
+    qUpper = max(curve[0], curve[1])
+    qCurrent = curve[-1]
+    outgoingMax, incomingMax = getMaxIntegrals(withinKernel)
+    outgoingMax, incomingMax = int(outgoingMax), int(incomingMax)
+    integral0 = int(outgoing(curve, withinKernel, qCurrent, qUpper))
+    integral1 = int(outgoing(curve, withinKernel, qLower, qCurrent))
+
+    # 'poolId == 0' gives 'sqrtOffset == sqrtInverseOffset == 1 << 127'.
+    simulator = GrowthAccrualSimulator(
+        poolGrowthPortions, protocolGrowthPortions, growth, 1 << 127, 1 << 127, outgoingMax, incomingMax
+    )
+    step = withinStep(sharesTotal, integral0, integral1, qLimit, curve, withinKernel, outgoingMax)
+    amount0, amount1, failed = simulator.swap([step], crossThreshold)
+    assert not failed.any()
+
+    # Each lane should match 'swapWithin' with the same growth portions. An
+    # exact output which is never reached keeps the target at 'qLimit'.
+    for k in range(n):
+        tx = swapWrapper._swapWithin(
+            [
+                0,
+                growth,
+                integral0,
+                integral1,
+                sharesTotal,
+                outgoingMax,
+                poolGrowthPortions[k],
+                protocolGrowthPortions[k],
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                twosComplement(- (int256max // 3)),
+                qLimit,
+                crossThreshold,
+                len(curve)
+            ],
+            encodeKernel(withinKernel),
+            encodeCurve(curve)
+        )
+        data = tx.events['(unknown)'][0]['data']
+        assert simulator.growth[k] == toInt(data[_growth_ : _growth_ + 16].hex())
+        assert simulator.accrued0[k] == (toInt(data[_accrued0_ : _accrued0_ + 32].hex()) >> 127) << 127
+        assert simulator.accrued1[k] == (toInt(data[_accrued1_ : _accrued1_ + 32].hex()) >> 127) << 127
+        assert simulator.poolRatio0[k] == toInt(data[_poolRatio0_ : _poolRatio0_ + 3].hex())
+        assert simulator.poolRatio1[k] == toInt(data[_poolRatio1_ : _poolRatio1_ + 3].hex())
+        assert amount0[k] == signedX127(toInt(data[_amount0_ : _amount0_ + 32].hex()))
+        assert amount1[k] == signedX127(toInt(data[_amount1_ : _amount1_ + 32].hex()))
@@ -2,7 +2,7 @@
 import pytest
 import brownie
 from Nofee import logTest
-from brownie import accounts, GrowthPortionWrapper
+from brownie import GrowthPortionWrapper
 from sympy import Integer, floor
 from X23_test import oneX23
 from X47_test import oneX47
@@ -19,8 +19,8 @@ ratio2 = 0x800000
 ratio3 = 0xFFFFFF
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return GrowthPortionWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(GrowthPortionWrapper)
 
 @pytest.mark.parametrize('protocolGrowthPortion', [0, oneX47 // 5, oneX47 // 4, oneX47 // 3, oneX47 // 2, oneX47])
 @pytest.mark.parametrize('poolGrowthPortion', [0, oneX47 // 5, oneX47 // 4, oneX47 // 3, oneX47 // 2, oneX47])
@@ -2,7 +2,7 @@
 import pytest
 import brownie
 from Nofee import logTest
-from brownie import accounts, GrowthWrapper
+from brownie import GrowthWrapper
 from sympy import Integer, floor
 
 list0X111 = [((1 << 127) - 1) // 5, ((1 << 127) - 1) // 3, ((1 << 127) - 1)]
@@ -13,8 +13,8 @@ listX47 = [0, oneX47 // 5, oneX47 // 4, oneX47 // 3, oneX47 // 2, oneX47]
 list1X216 = [((1 << 216) - 1) // 3, ((1 << 216) - 1)]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return GrowthWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(GrowthWrapper)
 
 @pytest.mark.parametrize('value0', list0X111 + [0])
 @pytest.mark.parametrize('value1', listX47 + [0])
@@ -0,0 +1,294 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import time
+from Nofee import _hookSelector_, _msgSender_, _poolId_, _crossThreshold_, _amountSpecified_, _logPriceLimit_, _logPriceLimitOffsetted_, _zeroForOne_, _exactInput_, _integralLimit_, _integralLimitInterval_, _amount0_, _amount1_, _back_, _next_, _backGrowthMultiplier_, _nextGrowthMultiplier_, _direction_, _indexCurve_, _indexKernelTotal_, _indexKernelForward_, _logPriceLimitOffsettedWithinInterval_, _current_, _origin_, _begin_, _end_, _target_, _overshoot_, _total0_, _total1_, _forward0_, _forward1_, _incomingCurrentToTarget_, _currentToTarget_, _currentToOrigin_, _currentToOvershoot_, _targetToOvershoot_, _originToOvershoot_, _accrued0_, _accrued1_, _poolRatio0_, _poolRatio1_, _kernel_, _curve_, _hookData_, _kernelLength_, _curveLength_, _hookDataByteCount_, _dynamicParams_, _staticParamsStoragePointer_, _logPriceCurrent_, _sharesTotal_, _growth_, _integral0_, _integral1_, _deploymentCreationCode_, _tag0_, _tag1_, _sqrtOffset_, _sqrtInverseOffset_, _spacing_, _outgoingMax_, _outgoingMaxModularInverse_, _incomingMax_, _poolGrowthPortion_, _maxPoolGrowthPortion_, _protocolGrowthPortion_, _pendingKernelLength_, _qExpTable_, _logPriceMinOffsetted_, _logPriceMaxOffsetted_, _shares_, _logPriceMin_, _logPriceMax_, _positionAmount0_, _positionAmount1_
+
+# A Python counterpart of 'HookCalldata.sol'.
+#
+# Each hook method receives a memory snapshot as 'bytes calldata hookInput'
+# which starts from '_msgSender_' (see 'invokeHook' in 'Hooks.sol'). Hence,
+# the memory pointer '_x_' of 'Memory.sol' is found at 'hookInput[_x_ -
+# _msgSender_]'. 'HookInput' wraps a captured 'hookInput' (e.g., the output
+# of 'MockHook.midSwapData()') in a 'memoryview' and decodes each field on
+# access. Payloads which support the buffer protocol (e.g., 'bytes',
+# 'bytearray' and 'HexBytes') are wrapped without being copied, so changes to
+# a 'bytearray' are visible through the view. Other payloads (e.g., hex
+# strings) are converted to 'bytes' once.
+#
+# Each member of 'fields' is '[name, pointer, bits, signed]' where 'signed'
+# marks the 256 bit members whose types (e.g., 'X59' and 'X127') are read as
+# 'int256' in Solidity. Members of type 'bool' occupy 8 bits and are decoded
+# as 'value != 0', because memory holds '0xFF' rather than '0x01' for true.
+fields = [
+    ['msgSender', _msgSender_, 160, False],
+    ['poolId', _poolId_, 256, False],
+
+    ['crossThreshold', _crossThreshold_, 128, False],
+    ['amountSpecified', _amountSpecified_, 256, True],
+    ['logPriceLimit', _logPriceLimit_, 256, True],
+    ['logPriceLimitOffsetted', _logPriceLimitOffsetted_, 64, False],
+
+    ['zeroForOne', _zeroForOne_, 8, False],
+    ['exactInput', _exactInput_, 8, False],
+    ['integralLimit', _integralLimit_, 216, False],
+    ['integralLimitInterval', _integralLimitInterval_, 216, False],
+    ['amount0', _amount0_, 256, True],
+    ['amount1', _amount1_, 256, True],
+    ['backGrowthMultiplier', _backGrowthMultiplier_, 256, True],
+    ['nextGrowthMultiplier', _nextGrowthMultiplier_, 256, True],
+
+    ['direction', _direction_, 8, False],
+    ['indexCurve', _indexCurve_, 16, False],
+    ['indexKernelTotal', _indexKernelTotal_, 16, False],
+    ['indexKernelForward', _indexKernelForward_, 16, False],
+    ['logPriceLimitOffsettedWithinInterval', _logPriceLimitOffsettedWithinInterval_, 64, False],
+    ['incomingCurrentToTarget', _incomingCurrentToTarget_, 216, False],
+    ['currentToTarget', _currentToTarget_, 216, False],
+    ['currentToOrigin', _currentToOrigin_, 216, False],
+    ['currentToOvershoot', _currentToOvershoot_, 216, False],
+    ['targetToOvershoot', _targetToOvershoot_, 216, False],
+    ['originToOvershoot', _originToOvershoot_, 216, False],
+
+    ['accrued0', _accrued0_, 256, True],
+    ['accrued1', _accrued1_, 256, True],
+    ['poolRatio0', _poolRatio0_, 24, False],
+    ['poolRatio1', _poolRatio1_, 24, False],
+
+    ['kernel', _kernel_, 256, False],
+    ['curve', _curve_, 256, False],
+    ['hookData', _hookData_, 256, False],
+    ['kernelLength', _kernelLength_, 16, False],
+    ['curveLength', _curveLength_, 16, False],
+    ['hookDataByteCount', _hookDataByteCount_, 16, False],
+
+    ['staticParamsStoragePointerExtension', _dynamicParams_, 256, False],
+    ['staticParamsStoragePointer', _staticParamsStoragePointer_, 16, False],
+    ['logPriceCurrent', _logPriceCurrent_, 64, False],
+    ['sharesTotal', _sharesTotal_, 128, False],
+    ['growth', _growth_, 128, False],
+    ['integral0', _integral0_, 216, False],
+    ['integral1', _integral1_, 216, False],
+
+    ['deploymentCreationCode', _deploymentCreationCode_, 88, False],
+
+    ['tag0', _tag0_, 256, False],
+    ['tag1', _tag1_, 256, False],
+    ['sqrtOffset', _sqrtOffset_, 256, True],
+    ['sqrtInverseOffset', _sqrtInverseOffset_, 256, True],
+    ['outgoingMax', _outgoingMax_, 216, False],
+    ['outgoingMaxModularInverse', _outgoingMaxModularInverse_, 256, False],
+    ['incomingMax', _incomingMax_, 216, False],
+    ['poolGrowthPortion', _poolGrowthPortion_, 48, False],
+    ['maxPoolGrowthPortion', _maxPoolGrowthPortion_, 48, False],
+    ['protocolGrowthPortion', _protocolGrowthPortion_, 48, False],
+    ['pendingKernelLength', _pendingKernelLength_, 16, False],
+    ['qExpTable', _qExpTable_, 64, False],
+
+    ['logPriceMinOffsetted', _logPriceMinOffsetted_, 64, False],
+    ['logPriceMaxOffsetted', _logPriceMaxOffsetted_, 64, False],
+    ['shares', _shares_, 256, True],
+    ['logPriceMin', _logPriceMin_, 256, True],
+    ['logPriceMax', _logPriceMax_, 256, True],
+    ['positionAmount0', _positionAmount0_, 256, True],
+    ['positionAmount1', _positionAmount1_, 256, True],
+]
+
+# Members of type 'price' (see 'Price.sol'). Each one is decoded as
+# '(logPrice, sqrtPrice, sqrtInversePrice)' where 'logPrice' occupies 8 bytes
+# and each of the two square roots occupy 27 bytes. Members of 512 bits (e.g.,
+# 'total0') are prices with height which is placed in the 2 bytes prior to
+# the pointer. These are decoded as '(height, logPrice, sqrtPrice,
+# sqrtInversePrice)'.
+prices = [
+    ['back', _back_, False],
+    ['next', _next_, False],
+    ['current', _current_, False],
+    ['origin', _origin_, False],
+    ['begin', _begin_, False],
+    ['end', _end_, False],
+    ['target', _target_, False],
+    ['overshoot', _overshoot_, False],
+    ['total0', _total0_, True],
+    ['total1', _total1_, True],
+    ['forward0', _forward0_, True],
+    ['forward1', _forward1_, True],
+    ['spacing', _spacing_, False],
+]
+
+# Hook methods in the order of their flags, i.e., the method 'hooks[k]' is
+# invoked if 'poolId & (1 << (160 + k)) != 0'.
+hooks = [
+    'preInitialize',
+    'postInitialize',
+    'preMint',
+    'midMint',
+    'postMint',
+    'preBurn',
+    'midBurn',
+    'postBurn',
+    'preSwap',
+    'midSwap',
+    'postSwap',
+    'preDonate',
+    'midDonate',
+    'postDonate',
+    'preModifyKernel',
+    'midModifyKernel',
+    'postModifyKernel',
+]
+
+# The first and one past the last byte of a member within 'hookInput'.
+def getLocation(pointer, bits):
+    start = pointer - _msgSender_
+    return start, start + bits // 8
+
+# A byte-wise 'memoryview' of 'payload' which shares its buffer if possible.
+def getView(payload):
+    try:
+        view = memoryview(payload)
+    except TypeError:
+        return memoryview(bytes(payload))
+    return view if view.format == 'B' else view.cast('B')
+
+def decode(view, start, stop, signed):
+    value = int.from_bytes(view[start : stop], 'big')
+    if stop - start == 1:
+        return value != 0
+    if signed and value >> 255:
+        value -= 1 << 256
+    return value
+
+def fieldProperty(name, pointer, bits, signed):
+    start, stop = getLocation(pointer, bits)
+    def getter(self):
+        return decode(self.view, start, stop, signed)
+    getter.__name__ = name
+    return property(getter)
+
+def priceProperty(name, pointer, height):
+    start = pointer - _msgSender_
+    def getter(self):
+        view = self.view
+        price = (
+            int.from_bytes(view[start : start + 8], 'big'),
+            int.from_bytes(view[start + 8 : start + 35], 'big'),
+            int.from_bytes(view[start + 35 : start + 62], 'big')
+        )
+        if height:
+            return (int.from_bytes(view[start - 2 : start], 'big'), ) + price
+        return price
+    getter.__name__ = name
+    return property(getter)
+
+class HookInput:
+    def __init__(self, hookInput):
+        self.view = getView(hookInput)
+
+    # 'calldata' is the entire input of a hook method, i.e., the selector,
+    # the abi offset, the byte count and the memory snapshot.
+    @classmethod
+    def fromCalldata(cls, calldata):
+        return cls(getView(calldata)[_msgSender_ - _hookSelector_ :])
+
+    def __len__(self):
+        return len(self.view)
+
+    # Memory pointers (i.e., 'kernel', 'curve' and 'hookData') are translated
+    # to positions within 'hookInput'.
+    def position(self, pointer):
+        return pointer - _msgSender_
+
+    # The content of 'hookData'.
+    @property
+    def hookDataBytes(self):
+        start = self.position(self.hookData)
+        return bytes(self.view[start : start + self.hookDataByteCount])
+
+    # The members of the curve sequence.
+    @property
+    def curveMembers(self):
+        start = self.position(self.curve)
+        view = self.view
+        return [
+            int.from_bytes(view[start + 8 * k : start + 8 * k + 8], 'big')
+            for k in range(self.curveLength)
+        ]
+
+    # The breakpoints of the kernel as '[b[i], c[i]]' pairs, i.e., the same
+    # format as the input of 'encodeKernel'. The first breakpoint '[0, 0]' is
+    # not in memory and is prepended.
+    @property
+    def kernelBreakpoints(self):
+        start = self.position(self.kernel)
+        view = self.view
+        breakpoints = [[0, 0]]
+        for k in range(self.kernelLength - 1):
+            pointer = start + 64 * k
+            breakpoints.append([
+                int.from_bytes(view[pointer + 2 : pointer + 10], 'big'),
+                int.from_bytes(view[pointer : pointer + 2], 'big')
+            ])
+        return breakpoints
+
+for name, pointer, bits, signed in fields:
+    setattr(HookInput, name, fieldProperty(name, pointer, bits, signed))
+
+for name, pointer, height in prices:
+    setattr(HookInput, name, priceProperty(name, pointer, height))
+
+# Decodes the given fields of many captured payloads at once. The location
+# of each field is resolved once and the output maps each field name to the
+# list of its values, in the order of 'payloads'.
+def decodeBatch(payloads, names):
+    locations = dict((name, (pointer, bits, signed)) for name, pointer, bits, signed in fields)
+    columns = []
+    for name in names:
+        pointer, bits, signed = locations[name]
+        start, stop = getLocation(pointer, bits)
+        columns.append((name, start, stop, signed))
+
+    result = dict((name, []) for name in names)
+    for payload in payloads:
+        view = getView(payload)
+        for name, start, stop, signed in columns:
+            result[name].append(decode(view, start, stop, signed))
+    return result
+
+# Collects the payloads which are recorded by 'MockHook.sol' as '(method,
+# hookInput)' pairs. Only the latest payload of each method is recorded by
+# the mock and methods which are never invoked are skipped.
+def recordsFromMockHook(hook):
+    records = []
+    for method in hooks:
+        hookInput = bytes(getattr(hook, method + 'Data')())
+        if len(hookInput) > 0:
+            records.append((method, hookInput))
+    return records
+
+# Replays recorded hook payloads against hook logic written in Python.
+#
+# 'handlers' maps hook method names (e.g., 'midSwap') to callables which take
+# a 'HookInput' instance. Records with no handler are skipped. Each call is
+# timed so that the logic can be profiled without a node.
+class HookReplay:
+    def __init__(self, handlers):
+        self.handlers = dict(handlers)
+        self.timings = dict()
+
+    def replay(self, records):
+        results = []
+        for method, hookInput in records:
+            handler = self.handlers.get(method)
+            if handler is None:
+                continue
+            hookInput = HookInput(hookInput)
+            begin = time.perf_counter()
+            results.append((method, handler(hookInput)))
+            self.timings.setdefault(method, []).append(time.perf_counter() - begin)
+        return results
+
+    # Average time per call of each handler in microseconds.
+    def profile(self):
+        return dict(
+            (method, 1e6 * sum(timings) / len(timings))
+            for method, timings in self.timings.items()
+        )
@@ -0,0 +1,152 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import accounts, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockHook, DeployerHelper
+from Nofee import logTest, _msgSender_, _zeroForOne_, _exactInput_, _direction_, _endOfStaticParams_, isPreInitialize, isPostInitialize, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeCurve, getPoolId
+from HookInput import HookInput, HookReplay, decodeBatch, recordsFromMockHook
+
+logOffset = -5
+spacing = 2 ** 56
+kernel = [[0, 0], [spacing // 2, 2 ** 14], [spacing, 2 ** 15]]
+curve = [2 ** 62, 2 ** 62 + spacing, 2 ** 62 + (spacing // 2)]
+
+@pytest.fixture(autouse=True)
+def deployment(fn_isolation):
+    root = accounts[0]
+    owner = accounts[1]
+    deployer = DeployerHelper.deploy(root, {'from': root})
+    delegatee = deployer.addressOf(1)
+    nofeeswap = deployer.addressOf(2)
+    deployer.create3(
+        1,
+        NofeeswapDelegatee.bytecode + encode(
+            ['address'],
+            [nofeeswap]
+        ).hex(),
+        {'from': root}
+    )
+    deployer.create3(
+        2,
+        Nofeeswap.bytecode + encode(
+            ['address', 'address'],
+            [delegatee, root.address]
+        ).hex(),
+        {'from': root}
+    )
+    delegatee = NofeeswapDelegatee.at(delegatee)
+    nofeeswap = Nofeeswap.at(nofeeswap)
+    hook = MockHook.deploy({'from': root})
+
+    token0 = ERC20FixedSupply.deploy("ERC20_0", "ERC20_0", 2**120, owner, {'from': owner})
+    token1 = ERC20FixedSupply.deploy("ERC20_1", "ERC20_1", 2**120, owner, {'from': owner})
+    if toInt(token0.address) > toInt(token1.address):
+        token0, token1 = token1, token0
+
+    return root, owner, nofeeswap, delegatee, hook, token0, token1
+
+# Initializes pools whose pre and post initialize hooks are enabled and
+# returns the resulting poolIds.
+def initialize(deployment, salts, hookData):
+    root, owner, nofeeswap, delegatee, hook, token0, token1 = deployment
+
+    poolIds = []
+    for salt in salts:
+        unsaltedPoolId = (salt << 188) + (twosComplementInt8(logOffset) << 180) + isPreInitialize + isPostInitialize + toInt(hook.address)
+        nofeeswap.dispatch(
+          delegatee.initialize.encode_input(
+              unsaltedPoolId,
+              toInt(token0.address),
+              toInt(token1.address),
+              0,
+              encodeKernelCompact(kernel),
+              encodeCurve(curve),
+              hookData
+          ),
+          {'from': owner}
+        )
+        poolIds.append(getPoolId(owner.address, unsaltedPoolId))
+    return poolIds
+
+@pytest.mark.parametrize('hookData', [b"", b"HookData", b"\xF0" * 65])
+def test_hookInput(deployment, hookData, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, hook, token0, token1 = deployment
+
+    poolId, = initialize(deployment, [1], hookData)
+
+    for hookInput in [HookInput(hook.preInitializeData()), HookInput(hook.postInitializeData())]:
+        assert hookInput.msgSender == toInt(owner.address)
+        assert hookInput.poolId == poolId
+        assert hookInput.hookDataBytes == hookData
+        assert hookInput.hookDataByteCount == len(hookData)
+        assert hookInput.curveLength == len(curve)
+        assert hookInput.curveMembers == curve
+
+    hookInput = HookInput(hook.postInitializeData())
+    assert hookInput.tag0 == toInt(token0.address)
+    assert hookInput.tag1 == toInt(token1.address)
+    assert hookInput.logPriceCurrent == curve[-1]
+    assert hookInput.growth == 1 << 111
+    assert hookInput.sharesTotal == 0
+    assert hookInput.kernelLength == len(kernel)
+    assert hookInput.kernelBreakpoints == kernel
+    assert hookInput.spacing[0] == spacing
+    assert type(hookInput.zeroForOne) is bool
+    assert type(hookInput.exactInput) is bool
+    assert type(hookInput.direction) is bool
+
+# Memory holds '0xFF' for true. Any non-zero byte is decoded as true.
+@pytest.mark.parametrize('content', [0x00, 0x01, 0xFF])
+def test_hookInputBool(content, request, worker_id):
+    logTest(request, worker_id)
+
+    payload = bytearray(_endOfStaticParams_ - _msgSender_)
+    for pointer in [_zeroForOne_, _exactInput_, _direction_]:
+        payload[pointer - _msgSender_] = content
+
+    hookInput = HookInput(payload)
+    assert hookInput.zeroForOne is (content != 0)
+    assert hookInput.exactInput is (content != 0)
+    assert hookInput.direction is (content != 0)
+
+    columns = decodeBatch([payload, bytes(len(payload))], ['zeroForOne', 'exactInput', 'direction'])
+    for name in ['zeroForOne', 'exactInput', 'direction']:
+        assert columns[name] == [content != 0, False]
+
+# Buffer-protocol payloads are wrapped rather than copied. Hence, changes to a
+# 'bytearray' are visible through 'HookInput'.
+def test_hookInputView(request, worker_id):
+    logTest(request, worker_id)
+
+    payload = bytearray(_endOfStaticParams_ - _msgSender_)
+    hookInput = HookInput(payload)
+    assert hookInput.zeroForOne is False
+
+    payload[_zeroForOne_ - _msgSender_] = 0xFF
+    assert hookInput.zeroForOne is True
+    assert HookInput(bytes(payload)).zeroForOne is True
+
+def test_hookReplay(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, hook, token0, token1 = deployment
+
+    poolIds = []
+    payloads = []
+    for salt in range(1, 5):
+        poolIds += initialize(deployment, [salt], b"HookData")
+        payloads.append(hook.postInitializeData())
+
+    columns = decodeBatch(payloads, ['poolId', 'logPriceCurrent', 'curveLength'])
+    assert columns['poolId'] == poolIds
+    assert columns['logPriceCurrent'] == [curve[-1]] * len(poolIds)
+    assert columns['curveLength'] == [len(curve)] * len(poolIds)
+
+    records = recordsFromMockHook(hook)
+    assert [method for method, _ in records] == ['preInitialize', 'postInitialize']
+
+    replay = HookReplay({
+        'postInitialize': lambda hookInput: (hookInput.poolId, hookInput.hookDataBytes)
+    })
+    assert replay.replay(records) == [('postInitialize', (poolIds[-1], b"HookData"))]
+    assert list(replay.profile().keys()) == ['postInitialize']
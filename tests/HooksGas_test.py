@@ -0,0 +1,86 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import accounts, HooksWrapper, MockHook, MockHookCalldata
+from eth_abi import encode
+from Nofee import logTest, logGas, _hookInputByteCount_, _endOfStaticParams_, isPreInitialize, isPostInitialize, isPreMint, isMidMint, isPostMint, isPreBurn, isMidBurn, isPostBurn, isPreSwap, isMidSwap, isPostSwap, isPreDonate, isMidDonate, isPostDonate, isPreModifyKernel, isMidModifyKernel, isPostModifyKernel, toInt
+
+# 'hookData' is limited to 'type(uint16).max' bytes (see 'HookDataTooLong').
+# It follows the static parameters, the kernel and the curve in the snapshot.
+# Hence, the snapshot of a pool with the longest 'hookData' is at least
+# 'maxHookInputByteCount' bytes long.
+maxHookDataByteCount = 0xFFFF
+maxHookInputByteCount = maxHookDataByteCount + _endOfStaticParams_ - _hookInputByteCount_ - 32
+
+value = 0xF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00F
+
+byteCounts = [0, 0x40, 0x100, 0x400, 0x1000, 0x4000, maxHookDataByteCount, maxHookInputByteCount]
+
+# 'MockHook' writes the whole snapshot to fresh storage slots, which exceeds
+# the block gas limit for the larger snapshots.
+maxMockHookByteCount = 0x1000
+
+flags = {
+    'preInitialize': isPreInitialize,
+    'postInitialize': isPostInitialize,
+    'preMint': isPreMint,
+    'midMint': isMidMint,
+    'postMint': isPostMint,
+    'preBurn': isPreBurn,
+    'midBurn': isMidBurn,
+    'postBurn': isPostBurn,
+    'preSwap': isPreSwap,
+    'midSwap': isMidSwap,
+    'postSwap': isPostSwap,
+    'preDonate': isPreDonate,
+    'midDonate': isMidDonate,
+    'postDonate': isPostDonate,
+    'preModifyKernel': isPreModifyKernel,
+    'midModifyKernel': isMidModifyKernel,
+    'postModifyKernel': isPostModifyKernel
+}
+
+@pytest.fixture(autouse=True)
+def wrapper(fn_isolation):
+    return HooksWrapper.deploy({'from': accounts[0]})
+
+# A memory snapshot whose byte count is 'byteCount', preceded by the byte count.
+def getContent(byteCount):
+    return encode(['uint256'] * (byteCount + 1), [byteCount] + [value] * byteCount)[0 : byteCount + 32]
+
+# The gas spent by 'invokeHook' for each of the 17 hook flags and snapshot
+# sizes up to the 'hookData' limit. 'MockHook' copies the whole snapshot to
+# storage whereas 'MockHookCalldata' only reads 'poolId', 'amount0' and
+# 'amount1' from calldata. Since the snapshot is already in memory, the size of
+# the calldata given to the hook does not affect the cost of the call itself.
+# Hence, the latter should cost the same regardless of the snapshot size. The
+# measurements are recorded in 'testLogs/gas.jsonl'.
+#
+# Each hook is invoked once prior to measurement so that the storage slots
+# which are modified by the hook are already populated.
+@pytest.mark.parametrize('name', flags.keys())
+def test_invokeHookGas(wrapper, name, request, worker_id):
+    logTest(request, worker_id)
+
+    gas = dict()
+    for mock in [MockHook, MockHookCalldata]:
+        hook = mock.deploy({'from': accounts[0]})
+        selector = getattr(hook, name).signature
+        poolId = flags[name] + toInt(hook.address)
+        wrapper._invokeHookGas(poolId, selector, getContent(0))
+        sizes = [byteCount for byteCount in byteCounts if mock == MockHookCalldata or byteCount <= maxMockHookByteCount]
+        for byteCount in sizes:
+            tx = wrapper._invokeHookGas(poolId, selector, getContent(byteCount))
+            gas[(mock._name, byteCount)] = tx.return_value
+
+        if mock == MockHookCalldata:
+            assert hook.invocations() == len(sizes) + 1
+            assert tx.events['Invoked']['poolId'] == poolId
+
+    for byteCount in byteCounts[1:]:
+        assert gas[('MockHookCalldata', byteCount)] == gas[('MockHookCalldata', 0)]
+        if byteCount <= maxMockHookByteCount:
+            assert gas[('MockHook', byteCount)] > gas[('MockHook', 0)]
+
+    logGas(request, {
+        name + ', hook input byte count: ' + str(byteCount) + ', ' + mock: amount for (mock, byteCount), amount in gas.items()
+    })
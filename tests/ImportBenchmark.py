@@ -0,0 +1,80 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import sys
+import json
+import time
+import subprocess
+
+# Measures the latency of collecting a single test module, which is the
+# overhead of running that module alone, and appends the result to
+# 'collection.jsonl' so that regressions can be tracked across commits:
+#
+#   python tests/ImportBenchmark.py [test module ...]
+#
+# The latency is the median wall time of 'repetitions' fresh processes.
+benchmarkPath = os.path.join('testLogs', 'collection.jsonl')
+
+repetitions = 5
+
+# Returns the modules which are imported by 'import <module>' in a fresh
+# process together with their cumulative import times in microseconds.
+def importTimes(module, cwd):
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        cwd=cwd,
+        capture_output=True,
+        text=True
+    ).stderr
+    times = dict()
+    for line in output.split('\n'):
+        if line.startswith('import time:') and '|' in line:
+            own, cumulative, name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+def collectionLatency(path):
+    samples = []
+    for kk in range(repetitions):
+        start = time.time()
+        subprocess.run(
+            [sys.executable, '-m', 'pytest', '--collect-only', '-q', '-p', 'no:cacheprovider', path],
+            capture_output=True
+        )
+        samples.append(time.time() - start)
+    return sorted(samples)[repetitions // 2]
+
+def getCommit():
+    return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True).stdout.strip()
+
+def benchmark(paths):
+    tests = os.path.dirname(os.path.abspath(__file__))
+    records = []
+    for path in paths:
+        records.append({
+            'commit': getCommit(),
+            'time': time.time(),
+            'module': path,
+            'collection': collectionLatency(path),
+            'importNofee': importTimes('Nofee', tests).get('Nofee', 0) / 1e6
+        })
+
+    previous = dict()
+    if os.path.isfile(benchmarkPath):
+        with open(benchmarkPath, 'r') as f:
+            for line in f:
+                record = json.loads(line)
+                previous[record['module']] = record
+
+    if os.path.exists('testLogs') == False:
+        os.mkdir('testLogs')
+    with open(benchmarkPath, 'a') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+            line = record['module'] + ': collection ' + '{:.3f}'.format(record['collection']) + 's, import Nofee ' + '{:.3f}'.format(record['importNofee']) + 's'
+            if record['module'] in previous:
+                line += ' (previously ' + '{:.3f}'.format(previous[record['module']]['collection']) + 's at ' + previous[record['module']]['commit'] + ')'
+            print(line)
+
+if __name__ == '__main__':
+    benchmark(sys.argv[1:] if len(sys.argv) > 1 else [os.path.join('tests', 'X15_test.py')])
@@ -1,13 +1,13 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, IndexWrapper
+from brownie import IndexWrapper
 
 maxIndex = (1 << 16) - 1
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IndexWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IndexWrapper)
 
 @pytest.mark.parametrize('index0', [0, maxIndex // 7, maxIndex // 5, maxIndex // 3, maxIndex])
 @pytest.mark.parametrize('index1', [0, maxIndex // 7, maxIndex // 5, maxIndex // 3, maxIndex])
@@ -1,8 +1,11 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, Access, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockHook, DeployerHelper
+from brownie import accounts, web3, Access, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockHook, DeployerHelper
+from brownie.convert import to_address
 from sympy import Integer, floor, exp
-from Nofee import logTest, _hookData_, _msgSender_, _hookDataByteCount_, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeKernel, encodeCurve, dataGeneration, outgoing, getMaxIntegrals, getPoolId
+from Nofee import logTest, logGas, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeKernel, encodeCurve, dataGeneration, getPoolId, getKernelStorageAddress
+from Golden import outgoing, getMaxIntegrals
+from HookInput import HookInput
 
 initializations, swaps, kernelsValid, kernelsInvalid = dataGeneration(1000)
 
@@ -182,10 +185,48 @@ def test_initialize(deployment, n, request, worker_id):
 
     assert eventData == _eventData
 
-    hookDataPlacement = toInt(hook.preInitializeData()[_hookData_ - _msgSender_ : _hookData_ - _msgSender_ + 32].hex()) - _msgSender_
-    hookDataByteCount = toInt(hook.preInitializeData()[_hookDataByteCount_ - _msgSender_ : _hookDataByteCount_ - _msgSender_ + 2].hex())
-    assert hookData == hook.preInitializeData()[hookDataPlacement : hookDataPlacement + hookDataByteCount]
+    assert hookData == HookInput(hook.preInitializeData()).hookDataBytes
+    assert hookData == HookInput(hook.postInitializeData()).hookDataBytes
 
-    hookDataPlacement = toInt(hook.postInitializeData()[_hookData_ - _msgSender_ : _hookData_ - _msgSender_ + 32].hex()) - _msgSender_
-    hookDataByteCount = toInt(hook.postInitializeData()[_hookDataByteCount_ - _msgSender_ : _hookDataByteCount_ - _msgSender_ + 2].hex())
-    assert hookData == hook.postInitializeData()[hookDataPlacement : hookDataPlacement + hookDataByteCount]
\ No newline at end of file
+@pytest.mark.parametrize('kernelLength', [2, 16, 256])
+def test_initializeSharedKernel(deployment, kernelLength, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, other, nofeeswap, delegatee, access, hook, token0, token1 = deployment
+
+    spacing = 2 ** 48
+    kernel = [[(k * spacing) // (kernelLength - 1), (k * (2 ** 15)) // (kernelLength - 1)] for k in range(kernelLength)]
+    curve = [2 ** 62, 2 ** 62 + spacing, 2 ** 62 + (spacing // 2)]
+
+    # The kernel storage contract is deployed by the first initialization only.
+    # Subsequent pools with the same kernel refer to the same contract.
+    kernelStorageAddress = getKernelStorageAddress(nofeeswap.address, kernel)
+    assert len(web3.eth.get_code(to_address('0x' + format(kernelStorageAddress, '040x')))) == 0
+
+    gasUsed = []
+    for n in range(3):
+        unsaltedPoolId = (n << 188) + (twosComplementInt8(-5) << 180)
+        tx = nofeeswap.dispatch(
+          delegatee.initialize.encode_input(
+              unsaltedPoolId,
+              min(toInt(token0.address), toInt(token1.address)),
+              max(toInt(token0.address), toInt(token1.address)),
+              0,
+              encodeKernelCompact(kernel),
+              encodeCurve(curve),
+              b""
+          ),
+          {'from': owner}
+        )
+        gasUsed += [tx.gas_used]
+
+        poolId = getPoolId(owner.address, unsaltedPoolId)
+        assert list(access._readKernel(nofeeswap, poolId, 0)) == encodeKernel(kernel)
+
+    assert len(web3.eth.get_code(to_address('0x' + format(kernelStorageAddress, '040x')))) == 1 + 64 * (kernelLength - 1)
+    assert gasUsed[1] < gasUsed[0]
+    assert gasUsed[2] < gasUsed[0]
+    logGas(request, {
+        'kernel length: ' + str(kernelLength) + ', first': gasUsed[0],
+        'kernel length: ' + str(kernelLength) + ', shared': gasUsed[1]
+    })
@@ -1,12 +1,12 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, IntegralWrapper
+from brownie import IntegralWrapper
 from sympy import Integer, Symbol, floor, integrate, exp
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntegralWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntegralWrapper)
 
 @pytest.mark.parametrize('integralValue', [2 ** 128 - 1, 2 ** 210])
 @pytest.mark.parametrize('logPrice0', [1, 2 ** 63, 2 ** 64 - 1])
@@ -1,7 +1,8 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, IntervalWrapper
-from Nofee import logTest, getMaxIntegrals, dataGeneration, toInt, encodeKernel
+from brownie import IntervalWrapper
+from Nofee import logTest, dataGeneration, toInt, encodeKernel
+from Golden import getMaxIntegrals
 
 initializations, swaps, kernelsValid, kernelsInvalid = dataGeneration(1000)
 
@@ -39,8 +40,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntervalWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntervalWrapper)
 
 @pytest.mark.parametrize('n', range(len(initializations['kernel'])))
 def test_calculateMaxIntegrals(wrapper, n, request, worker_id):
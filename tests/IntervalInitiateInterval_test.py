@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, IntervalWrapper
+from brownie import IntervalWrapper
 from sympy import Integer, floor, exp
 from Nofee import logTest, _endOfStaticParams_, X60, X216, dataGeneration, toInt, encodeCurve
 
@@ -40,8 +40,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntervalWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntervalWrapper)
 
 @pytest.mark.parametrize('content', [value0, value1, value2, value3, value4])
 @pytest.mark.parametrize('curveLength', [2, maxCurveIndex // 2, maxCurveIndex])
@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, IntervalWrapper
+from brownie import IntervalWrapper
 from sympy import Integer, floor, exp
 from Nofee import logTest, thirtyTwoX59, X59, X216, dataGeneration
 
@@ -40,8 +40,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntervalWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntervalWrapper)
 
 @pytest.mark.parametrize('zeroForOne', [False, True])
 @pytest.mark.parametrize('currentToOrigin', [X216 // 5, X216 // 3])
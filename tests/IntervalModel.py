@@ -0,0 +1,1110 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import sys
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from Nofee import encodeCurve, encodeKernel
+
+# A model of the overshoot search of 'Interval.sol', i.e.,
+# 'getMismatch', 'moveOvershoot', 'newtonStep', 'newIntegrals' and
+# 'searchOvershoot', together with the part of 'initiateInterval' and
+# 'moveTarget' which leads to them in '_searchOvershoot' of
+# 'IntervalWrapper.sol'. The target searches, i.e., 'searchOutgoingTarget' and
+# 'searchIncomingTarget', are modeled as well and 'TargetSearch.py' sweeps
+# them.
+#
+# Every value is held in the representation of memory, i.e., prices are packed
+# as 'height << 496 | log << 432 | sqrt << 216 | sqrtInverse' and integrals as
+# 216-bit words, and every assembly block is translated one opcode at a time on
+# 256-bit words. Hence, the outputs are meant to be identical to those of the
+# wrapper, which is what 'IntervalNewtonStep_test.py',
+# 'IntervalNewIntegrals_test.py' and 'IntervalSearchOvershoot_test.py' assert:
+#
+#   assert wrapper._getNewtonStep(*args).return_value == getNewtonStep(*args)
+#
+# On top of that, 'searchOvershoot' records '(log, mismatch, mismatchPrime,
+# step)' for every Newton iteration, and 'sweep' evaluates many
+# configurations in parallel, i.e.,
+#
+#   traces = sweep([(integral0, integral1, qLimit, curve, kernel), ...])
+#
+# where 'curve' is a list of offsetted log prices and 'kernel' is a list of
+# '[logShift, height]' as everywhere else in the tests.
+
+X15 = 2 ** 15
+X59 = 2 ** 59
+X216 = 2 ** 216
+X255 = 2 ** 255
+X256 = 2 ** 256
+maxUint256 = X256 - 1
+
+oneX216 = X216
+epsilonX59 = 1
+epsilonX216 = 1
+twoX59 = 2 << 59
+
+EXP_INV_8_X240 = 0x00000015FC21041027ACBBFCD46780FEE71EAD23FBCB7F4A81E58767EF801A32
+
+# floor((2 ** 216) * exp(-16))
+sqrtInverseShiftZero = 0x0000000000000001E355BBAEE85CADA65F73F32E88FB3CC629B709109F57564D
+
+heightMask = (1 << 16) - 1
+logMask = (1 << 64) - 1
+sqrtMask = X216 - 1
+priceMask = (1 << 496) - 1
+
+class SearchingForOvershootFailed(Exception):
+    pass
+
+class SearchingForOutgoingTargetFailed(Exception):
+    pass
+
+class SearchingForIncomingTargetFailed(Exception):
+    pass
+
+# EVM opcodes on 256-bit words.
+def word(value):
+    return int(value) % X256
+
+def signed(value):
+    value = value % X256
+    return value - X256 if value >= X255 else value
+
+def mulmod(value0, value1, modulus):
+    return 0 if modulus == 0 else (value0 * value1) % modulus
+
+def addmod(value0, value1, modulus):
+    return 0 if modulus == 0 else (value0 + value1) % modulus
+
+def div(value0, value1):
+    return 0 if value1 == 0 else value0 // value1
+
+def mod(value0, value1):
+    return 0 if value1 == 0 else value0 % value1
+
+def slt(value0, value1):
+    return signed(value0) < signed(value1)
+
+def sdiv(value0, value1):
+    value0 = signed(value0)
+    value1 = signed(value1)
+    if value1 == 0:
+        return 0
+    quotient = abs(value0) // abs(value1)
+    return word(quotient if (value0 < 0) == (value1 < 0) else - quotient)
+
+def sar(shift, value):
+    return word(signed(value) >> shift)
+
+# 'FullMath.cheapMulDiv'
+def cheapMulDiv(value0, value1, denominator):
+    result = word(denominator - 1)
+    return addmod(
+        mulmod(value0, value1, result),
+        word(result - mulmod(value0, value1, denominator)),
+        result
+    )
+
+# 'FullMath.sqrt'
+def sqrtFloor(value):
+    r = (0xffffffffffffffffffffffffffffffffff < value) << 7
+    r |= (0xffffffffffffffffff < (value >> r)) << 6
+    r |= (0xffffffffff < (value >> r)) << 5
+    r |= (0xffffff < (value >> r)) << 4
+    root = word(181 << (r >> 1))
+    root = word(root * ((value >> r) + 65536)) >> 18
+    for _ in range(7):
+        root = (root + div(value, root)) >> 1
+    return root - (div(value, root) < root)
+
+# 'X216.mul', i.e., the '*' operator of 'X216'.
+def mulX216(value0, value1):
+    return mulmod(
+        addmod(
+            mulmod(
+                word(value0 - slt(value0, 0)),
+                word(value1 - slt(value1, 0)),
+                maxUint256
+            ),
+            word(maxUint256 - mulmod(value0, value1, X216)),
+            maxUint256
+        ),
+        1 << 40,
+        maxUint256
+    )
+
+# 'X216.cheapMul', i.e., the '&' operator of 'X216'.
+def cheapMulX216(value0, value1):
+    return addmod(
+        mulmod(value0, value1, X216 - 1),
+        word(X216 - 1 - mulmod(value0, value1, X216)),
+        X216 - 1
+    )
+
+# 'X216.mulDivByExpInv8', i.e., the '%' operator of 'X216'.
+def mulDivByExpInv8(value0, value1):
+    result = word(value0 * 0xF8F6376C44)
+    return word(
+        word(
+            word(result * value1) - mulmod(
+                result,
+                value1,
+                0x1561650620DABB6A84B684E2A7E5A47CAA0A0905210083F0E3B551AABF84E9
+            )
+        ) * 0x28256938C4923FF15AB260970AA81F81C15E6F5EF3AF38DC210569E77DB19359
+    )
+
+# 'X216.mulDivByExpInv16', i.e., the '^' operator of 'X216'.
+def mulDivByExpInv16(value0, value1):
+    value0 = word(value0 * 0x27D117D7B)
+    value1 = word(value1 * 0x2EC3A856)
+    return word(
+        word(
+            word(value0 * value1) - mulmod(
+                value0,
+                value1,
+                0xDBB82F7041B890FE67970A62A3568CC34DF9DCB17CC3A2A6A027850E7E3724F9
+            )
+        ) * 0x7F6AF8233BADA11DD406B4458454ED9904D7AF796BE7AA4885B23E25B6985D49
+    )
+
+def multiplyByExpEpsilon(value):
+    return word(
+        mulmod(
+            value,
+            0xFFFFFFFFFFFFFFF8000000000000002AAAAAAAAAAAAAAA001,
+            0xFFFFFFFFFFFFFFF0000000000000007FFFFFFFFFFFFFFD555555555555555FFF
+        ) * 0xAA3ED2381A8B1241D16168FD77EF989ED2B13BE12B716AA23F35ED0E39556001
+    )
+
+def divideByExpEpsilon(value):
+    return word(
+        mulmod(
+            value,
+            0xFFFFFFFFFFFFFFF0000000000000007FFFFFFFFFFFFFFD555555555555555FFE,
+            maxUint256
+        ) - word(
+            value * 0xFFFFFFFFFFFFFFF0000000000000007FFFFFFFFFFFFFFD555555555555555FFE
+        )
+    )
+
+# 'X59.times', i.e., the product of an 'X59' and an 'X15' in 'X74'.
+def times(value0, value1):
+    return word(value0 * value1)
+
+# 'X74.toX216'
+def toX216(value):
+    return word(value << 142)
+
+# 'X59.mulDivByExpInv16'
+def mulDivByExpInv16X59(value, multiplier0, multiplier1):
+    return word(
+        word(
+            word(word(value * multiplier0) * multiplier1) - mulmod(
+                mulmod(
+                    value,
+                    multiplier0,
+                    0xF1AADDD7742E56D32FB9F997447D9E6314DB84884FABAB26BF059AF9BC20B61
+                ),
+                multiplier1,
+                0xF1AADDD7742E56D32FB9F997447D9E6314DB84884FABAB26BF059AF9BC20B61
+            )
+        ) * 0xD49C04AF80AF1EA5F98F85886B450A4B264FC14874F9F64143836145A37DD8A1
+    )
+
+# 'X59.expInverse'
+def expInverse(value):
+    x = word(value)
+    x2 = word(x * x)
+    x4 = word(x2 * x2)
+    x6 = mulmod(
+        word(mulmod(x2, x4, maxUint256) - mulmod(x2, x4, 1 << 128)),
+        1 << 128,
+        maxUint256
+    )
+    x8 = word(mulmod(x4, x4, maxUint256) - word(x4 * x4))
+    a = word(
+        div(word(x2 * (7 << 104)), 15) +
+        div(x4, 39 << 46) +
+        div(x6, 6435 << 67) +
+        div(x8, 2027025 << 90) +
+        (1 << 254)
+    )
+    b = word(
+        div(word(x2 << 106), 15) +
+        div(x4, 585 << 44) +
+        div(x6, 225225 << 65) +
+        (1 << 255)
+    )
+    b = mulmod(
+        word(mulmod(x, b, maxUint256) - mulmod(x, b, 1 << 76)),
+        1 << 180,
+        maxUint256
+    )
+    a = word(cheapMulDiv(word(a - b), 1 << 254, word(a + b)) << 2)
+    for _ in range(14):
+        a = word(mulmod(a, a, maxUint256) - word(a * a))
+    return a
+
+# 'X59.exp' which returns '(sqrt, sqrtInverse)' of a price.
+def exp(value):
+    a = expInverse(value)
+    return a >> 40, cheapMulDiv(
+        0xF1AADDD7742E56D32FB9F997447D9E6314DB84884FABAB26BF059AF9BC20B609,
+        1 << 193,
+        a
+    )
+
+# 'Price.sol'
+def packPrice(logPrice, sqrtPrice, sqrtInversePrice, heightPrice=0):
+    return (
+        ((heightPrice & heightMask) << 496) |
+        ((logPrice & logMask) << 432) |
+        ((sqrtPrice & sqrtMask) << 216) |
+        (sqrtInversePrice & sqrtMask)
+    )
+
+def storePrice(logPrice):
+    sqrtPrice, sqrtInversePrice = exp(logPrice)
+    return packPrice(logPrice, sqrtPrice, sqrtInversePrice)
+
+def height(price):
+    return price >> 496
+
+def log(price):
+    return (price >> 432) & logMask
+
+def sqrt(price, inverse):
+    return price & sqrtMask if inverse else (price >> 216) & sqrtMask
+
+# Copies the 62 bytes of 'source' while keeping the height of 'destination'.
+def copyPrice(destination, source):
+    return (destination & ~priceMask) | (source & priceMask)
+
+# 'Integral.shift'
+def shift(integralInput, price0, price1, left):
+    right = not left
+    integralInput = word(0x4BC3287B * integralInput)
+    p0 = word(0xCEF6AE8685 * sqrt(price0, right))
+    p1 = word(0xCB21E499 * sqrt(price1, right))
+    shiftedIntegral = word(
+        word(
+            word(p0 * p1) - mulmod(
+                p0,
+                p1,
+                0x5BC2A24E50A66D39C35A9132C33F2FC50A1B99389D5455E78A7CF7EF8894E4CD
+            )
+        ) * 0x7082326D62B7EF4D06861F13C21DD192C8044B19A121205B7DC63C2642B5A805
+    )
+    return word(
+        mulmod(shiftedIntegral, integralInput, maxUint256) -
+        word(shiftedIntegral * integralInput)
+    )
+
+# 'Integral.evaluate' where 'coordinate0' and 'coordinate1' are the two
+# consecutive breakpoints which are read by 'Price.segment'.
+def evaluate(coordinate0, coordinate1, target):
+    b0, b1, c0, c1 = log(coordinate0), log(coordinate1), height(coordinate0), height(coordinate1)
+    if c1 == 0:
+        return 0
+    if c1 == c0:
+        return word(c0 * EXP_INV_8_X240) >> 40
+    if b1 == log(target):
+        return word(c1 * EXP_INV_8_X240) >> 40
+    if slt(b1, b0):
+        db, numerator = word(b0 - b1), word(word(b0 - log(target)) * word(c1 - c0))
+    else:
+        db, numerator = word(b1 - b0), word(word(log(target) - b0) * word(c1 - c0))
+    lsbits = mulmod(EXP_INV_8_X240, numerator, 1 << 192)
+    msbits = addmod(
+        mulmod(EXP_INV_8_X240, numerator, (1 << 192) - 1),
+        word((1 << 192) - 1 - lsbits),
+        (1 << 192) - 1
+    )
+    quotient = word(
+        word(div(msbits, db) << 192) +
+        div(word(word(mod(msbits, db) << 192) + lsbits), db)
+    )
+    return word(word(c0 * EXP_INV_8_X240) + quotient) >> 40
+
+def _integrate(sqrtFrom, sqrtTo, fromTimesDc, toTimesDc, db, c, sign):
+    lsbits0 = mulmod(fromTimesDc, sqrtFrom, 1 << 192)
+    lsbits1 = mulmod(toTimesDc, sqrtTo, 1 << 192)
+    if sign:
+        lsbits = addmod(lsbits0, word((1 << 192) - lsbits1), 1 << 192)
+        msbits = word(
+            word(lsbits1 + mulmod(fromTimesDc, sqrtFrom, (1 << 192) - 1)) -
+            word(lsbits0 + mulmod(toTimesDc, sqrtTo, (1 << 192) - 1)) -
+            (lsbits0 < lsbits1)
+        )
+    else:
+        lsbits = addmod(lsbits1, word((1 << 192) - lsbits0), 1 << 192)
+        msbits = word(
+            word(lsbits0 + mulmod(toTimesDc, sqrtTo, (1 << 192) - 1)) -
+            word(lsbits1 + mulmod(fromTimesDc, sqrtFrom, (1 << 192) - 1)) -
+            (lsbits1 < lsbits0)
+        )
+    quotient = word(
+        word(div(msbits, db) << 192) +
+        div(word(word(mod(msbits, db) << 192) + lsbits), db)
+    )
+    if sign:
+        return word(word(c * word(sqrtFrom - sqrtTo)) + quotient) >> 15
+    return word(word(c * word(sqrtTo - sqrtFrom)) - quotient) >> 15
+
+# 'Integral.outgoing'
+def outgoing(coordinate0, coordinate1, fromPrice, toPrice):
+    logFrom = log(fromPrice)
+    logTo = log(toPrice)
+    if logFrom == logTo:
+        return 0
+    c0 = height(coordinate0)
+    dc = height(coordinate1)
+    if dc == 0:
+        return 0
+    dc = word(dc - c0)
+    left = slt(logTo, logFrom)
+    sqrtFrom = sqrt(fromPrice, left)
+    sqrtTo = sqrt(toPrice, left)
+    if dc == 0:
+        return word(c0 * word(sqrtFrom - sqrtTo)) >> 15
+    db = log(coordinate0)
+    if left:
+        fromTimesDc = word(word(db - logFrom + twoX59) * dc)
+        toTimesDc = word(word(db - logTo + twoX59) * dc)
+        db = word(db - log(coordinate1))
+    else:
+        fromTimesDc = word(word(logFrom - db + twoX59) * dc)
+        toTimesDc = word(word(logTo - db + twoX59) * dc)
+        db = word(log(coordinate1) - db)
+    return _integrate(sqrtFrom, sqrtTo, fromTimesDc, toTimesDc, db, c0, True)
+
+# 'Integral.incoming'
+def incoming(coordinate0, coordinate1, fromPrice, toPrice):
+    logFrom = log(fromPrice)
+    logTo = log(toPrice)
+    if logFrom == logTo:
+        return 0
+    c1 = height(coordinate1)
+    if c1 == 0:
+        return 0
+    db = log(coordinate1)
+    left = slt(logTo, logFrom)
+    sqrtFrom = sqrt(fromPrice, not left)
+    sqrtTo = sqrt(toPrice, not left)
+    dc = height(coordinate0)
+    if c1 == dc:
+        return word(c1 * word(sqrtTo - sqrtFrom)) >> 15
+    dc = word(c1 - dc)
+    if left:
+        fromTimesDc = word(word(logFrom - db + twoX59) * dc)
+        toTimesDc = word(word(logTo - db + twoX59) * dc)
+        db = word(log(coordinate0) - db)
+    else:
+        fromTimesDc = word(word(db - logFrom + twoX59) * dc)
+        toTimesDc = word(word(db - logTo + twoX59) * dc)
+        db = word(db - log(coordinate0))
+    return _integrate(sqrtFrom, sqrtTo, fromTimesDc, toTimesDc, db, c1, False)
+
+def minX59(value0, value1):
+    return value0 if slt(value0, value1) else value1
+
+def maxX59(value0, value1):
+    return value1 if slt(value0, value1) else value0
+
+minX216 = minX59
+maxX216 = maxX59
+
+# Splits the output of 'encodeCurve' into members.
+def decodeCurve(curveArray, curveLength):
+    return [
+        (int(curveArray[index // 4]) >> (192 - 64 * (index % 4))) & logMask
+        for index in range(curveLength)
+    ]
+
+# Splits the output of 'encodeKernel' into packed breakpoints.
+def decodeKernel(kernelArray):
+    return [
+        (int(kernelArray[index]) << 256) | int(kernelArray[index + 1])
+        for index in range(0, len(kernelArray), 2)
+    ]
+
+# The memory of 'Interval.sol'. Prices and integrals are named after the
+# corresponding pointers of 'Memory.sol'.
+class IntervalModel:
+    def __init__(self, zeroForOne, kernel=None, curve=None):
+        self.zeroForOne = zeroForOne
+        self.direction = False
+        self.exactInput = False
+        self.integralLimit = oneX216 - epsilonX216
+        self.logPriceLimitOffsettedWithinInterval = 0
+        self.kernel = kernel if kernel is not None else []
+        self.curve = curve if curve is not None else []
+
+        self.indexCurve = 0
+        self.indexKernelTotal = 0
+        self.indexKernelForward = 0
+
+        self.current = 0
+        self.origin = 0
+        self.begin = 0
+        self.end = 0
+        self.target = 0
+        self.overshoot = 0
+        self.total0 = 0
+        self.total1 = 0
+        self.forward0 = 0
+        self.forward1 = 0
+
+        self.currentToTarget = 0
+        self.currentToOvershoot = 0
+        self.targetToOvershoot = 0
+        self.originToOvershoot = 0
+        self.currentToOrigin = 0
+        self.incomingCurrentToTarget = 0
+
+        # One '(log, mismatch, mismatchPrime, step)' per call to 'newtonStep'
+        # where 'log' is that of '_overshoot_' prior to the step.
+        self.iterations = []
+
+        # One '(x, step)' per Halley iteration of 'searchOutgoingTarget' or
+        # 'searchIncomingTarget' where 'x' is the distance from '_begin_'
+        # prior to the step, followed by the number of epsilon moves which
+        # come after the Halley iterations. 'refinement' holds the input of
+        # 'refineTargetGuess' of 'IntervalWrapper.sol' if it is called.
+        self.halley = []
+        self.epsilonMoves = 0
+        self.refinement = None
+
+    # 'Kernel.member'
+    def member(self, index):
+        if index > 0:
+            point = self.kernel[index - 1]
+            return height(point), log(point), sqrt(point, False), sqrt(point, True)
+        return 0, 0, oneX216, sqrtInverseShiftZero
+
+    # 'Kernel.impose'
+    def impose(self, basePrice, index, left):
+        heightShift, logShift, sqrtShift, sqrtInverseShift = self.member(index)
+        if left:
+            return packPrice(
+                word(log(basePrice) - logShift),
+                mulDivByExpInv16(sqrt(basePrice, False), sqrtInverseShift),
+                mulX216(sqrt(basePrice, True), sqrtShift),
+                heightShift
+            )
+        return packPrice(
+            word(log(basePrice) + logShift),
+            mulX216(sqrt(basePrice, False), sqrtShift),
+            mulDivByExpInv16(sqrt(basePrice, True), sqrtInverseShift),
+            heightShift
+        )
+
+    def initiateInterval(self, logPriceLimitOffsetted):
+        qLower = minX59(self.curve[0], self.curve[1])
+        qUpper = maxX59(self.curve[0], self.curve[1])
+        self.logPriceLimitOffsettedWithinInterval = minX59(maxX59(qLower, logPriceLimitOffsetted), qUpper)
+        self.indexCurve = len(self.curve) - 1
+        current = self.curve[self.indexCurve]
+        self.direction = slt(current, self.curve[self.indexCurve - 1])
+        self.current = storePrice(current)
+        self.origin = copyPrice(self.origin, self.current)
+        self.begin = copyPrice(self.begin, self.current)
+        self.end = copyPrice(self.end, self.current)
+        self.target = copyPrice(self.target, self.current)
+        self.total0 = copyPrice(self.total0, self.current)
+        self.total1 = copyPrice(self.total1, self.current)
+
+    def moveBreakpointTotal(self):
+        self.total0 = self.total1
+        self.indexKernelTotal += 1
+        self.total1 = self.impose(self.origin, self.indexKernelTotal, self.direction)
+
+    def moveBreakpointForward(self):
+        self.forward0 = self.forward1
+        self.indexKernelForward += 1
+        self.forward1 = self.impose(self.target, self.indexKernelForward, self.zeroForOne)
+
+    def movePhase(self):
+        self.begin = copyPrice(self.begin, self.origin)
+        self.origin = copyPrice(self.origin, self.end)
+        self.indexCurve -= 1
+        self.end = copyPrice(self.end, storePrice(self.curve[self.indexCurve]))
+        self.direction = not self.direction
+        self.total0 = self.impose(self.origin, self.indexKernelTotal - 1, self.direction)
+        self.total1 = self.impose(self.origin, self.indexKernelTotal, self.direction)
+        return self.direction
+
+    def moveOvershootByEpsilon(self, left):
+        if left:
+            self.overshoot = copyPrice(self.overshoot, packPrice(
+                word(log(self.overshoot) - epsilonX59),
+                multiplyByExpEpsilon(sqrt(self.overshoot, False)),
+                divideByExpEpsilon(sqrt(self.overshoot, True))
+            ))
+        else:
+            self.overshoot = copyPrice(self.overshoot, packPrice(
+                word(log(self.overshoot) + epsilonX59),
+                divideByExpEpsilon(sqrt(self.overshoot, False)),
+                multiplyByExpEpsilon(sqrt(self.overshoot, True))
+            ))
+
+    # 'moveTarget' where the integral limit is never reached, i.e., where
+    # 'searchOutgoingTarget' returns early.
+    def moveTarget(self):
+        if log(self.target) == log(self.total1):
+            self.moveBreakpointTotal()
+        direction = self.direction
+        if log(self.target) == log(self.end):
+            self.originToOvershoot = shift(self.originToOvershoot, self.target, self.origin, direction) % X216
+            direction = self.movePhase()
+        if direction != slt(log(self.begin), log(self.total0)):
+            self.begin = copyPrice(self.begin, self.total0)
+        self.target = copyPrice(
+            self.target,
+            self.total1 if direction == (not slt(log(self.total1), log(self.end))) else self.end
+        )
+        if direction == self.zeroForOne:
+            limit = self.logPriceLimitOffsettedWithinInterval
+            if direction != slt(limit, log(self.target)):
+                self.target = copyPrice(self.target, storePrice(limit))
+            outgoingLimit = word(self.integralLimit - self.currentToTarget)
+            amount = outgoing(self.total0, self.total1, self.begin, self.target)
+            assert not self.exactInput and not slt(outgoingLimit, amount)
+            self.currentToTarget = (self.currentToTarget + amount) % X216
+            self.incomingCurrentToTarget = (
+                self.incomingCurrentToTarget + incoming(self.total0, self.total1, self.begin, self.target)
+            ) % X216
+        else:
+            amount = outgoing(self.total0, self.total1, self.begin, self.target)
+            self.currentToOrigin = (self.currentToOrigin + amount) % X216
+        self.originToOvershoot = (self.originToOvershoot + amount) % X216
+
+    def getMismatch(self, integral0Incremented, integral1Incremented):
+        zeroForOne = self.zeroForOne
+        integral1AmendedMinusIntegral1Incremented = word(
+            shift(self.originToOvershoot, self.overshoot, self.origin, zeroForOne) -
+            shift(self.targetToOvershoot, self.overshoot, self.target, zeroForOne) -
+            self.currentToOrigin -
+            self.incomingCurrentToTarget
+        )
+        integral0AmendedMinusIntegral0Incremented = word(
+            self.currentToTarget + self.targetToOvershoot - self.currentToOvershoot
+        )
+        if zeroForOne:
+            return word(
+                mulX216(integral1AmendedMinusIntegral1Incremented, integral1Incremented) -
+                mulX216(integral0AmendedMinusIntegral0Incremented, integral0Incremented)
+            )
+        return word(
+            mulX216(integral1AmendedMinusIntegral1Incremented, integral0Incremented) -
+            mulX216(integral0AmendedMinusIntegral0Incremented, integral1Incremented)
+        )
+
+    def moveOvershoot(self, integral0Incremented, integral1Incremented):
+        if log(self.overshoot) == log(self.forward1):
+            self.moveBreakpointForward()
+        if log(self.overshoot) == log(self.total1):
+            self.moveBreakpointTotal()
+        direction = self.direction
+        if log(self.overshoot) == log(self.end):
+            self.originToOvershoot = shift(self.originToOvershoot, self.overshoot, self.origin, direction) % X216
+            direction = self.movePhase()
+        if direction != slt(log(self.begin), log(self.total0)):
+            self.begin = copyPrice(self.begin, self.total0)
+        self.overshoot = copyPrice(
+            self.overshoot,
+            self.total1 if direction == slt(log(self.end), log(self.total1)) else self.end
+        )
+        if direction == self.zeroForOne:
+            if direction != slt(log(self.begin), log(self.forward0)):
+                self.begin = copyPrice(self.begin, self.forward0)
+            if direction == slt(log(self.overshoot), log(self.forward1)):
+                self.overshoot = copyPrice(self.overshoot, self.forward1)
+        outgoingTotal = outgoing(self.total0, self.total1, self.begin, self.overshoot)
+        if direction == self.zeroForOne:
+            outgoingForward = outgoing(self.forward0, self.forward1, self.begin, self.overshoot)
+            self.currentToOvershoot = (self.currentToOvershoot + outgoingTotal) % X216
+            self.targetToOvershoot = (self.targetToOvershoot + outgoingForward) % X216
+            self.originToOvershoot = (self.originToOvershoot + outgoingTotal) % X216
+            if slt(0, self.getMismatch(integral0Incremented, integral1Incremented)):
+                self.end = copyPrice(self.end, self.overshoot)
+                self.currentToOvershoot = (self.currentToOvershoot - outgoingTotal) % X216
+                self.targetToOvershoot = (self.targetToOvershoot - outgoingForward) % X216
+                self.originToOvershoot = (self.originToOvershoot - outgoingTotal) % X216
+                self.overshoot = copyPrice(self.overshoot, self.begin)
+                return False
+        else:
+            self.currentToOrigin = (self.currentToOrigin + outgoingTotal) % X216
+            self.originToOvershoot = (self.originToOvershoot + outgoingTotal) % X216
+        return True
+
+    def _amend(self, integral0Incremented, integral1Incremented):
+        zeroForOne = self.zeroForOne
+        outgoingTotal = outgoing(self.total0, self.total1, self.begin, self.overshoot)
+        outgoingForward = outgoing(self.forward0, self.forward1, self.begin, self.overshoot)
+        integral0Amended = word(
+            integral0Incremented +
+            self.currentToTarget -
+            word(self.currentToOvershoot + outgoingTotal) +
+            word(self.targetToOvershoot + outgoingForward)
+        )
+        integral0Amended = maxX216(integral0Amended, 0)
+        originToTarget = word(
+            shift(word(self.originToOvershoot + outgoingTotal), self.overshoot, self.origin, zeroForOne) -
+            shift(word(self.targetToOvershoot + outgoingForward), self.overshoot, self.target, zeroForOne)
+        )
+        integral1Amended = word(
+            integral1Incremented +
+            originToTarget -
+            self.currentToOrigin -
+            self.incomingCurrentToTarget
+        )
+        integral1Amended = maxX216(integral1Amended, 0)
+        return originToTarget, integral0Amended, integral1Amended
+
+    def newtonStep(self, integral0Incremented, integral1Incremented):
+        zeroForOne = self.zeroForOne
+        if zeroForOne:
+            integral0Incremented, integral1Incremented = integral1Incremented, integral0Incremented
+        originToTarget, integral0Amended, integral1Amended = self._amend(
+            integral0Incremented,
+            integral1Incremented
+        )
+        overshootMinusOrigin = evaluate(self.total0, self.total1, self.overshoot)
+        overshootMinusTarget = evaluate(self.forward0, self.forward1, self.overshoot)
+        integral1AmendedPrime = word(
+            mulDivByExpInv8(sqrt(self.origin, not zeroForOne), overshootMinusOrigin) -
+            mulDivByExpInv8(sqrt(self.target, not zeroForOne), overshootMinusTarget)
+        )
+        integral1AmendedPrime = word(originToTarget + integral1AmendedPrime + integral1AmendedPrime)
+        integral0AmendedPrime = mulDivByExpInv8(
+            sqrt(self.overshoot, zeroForOne),
+            word(overshootMinusOrigin - overshootMinusTarget)
+        )
+        integral0AmendedPrime = word(integral0AmendedPrime + integral0AmendedPrime)
+        if zeroForOne:
+            mismatch = word(
+                cheapMulX216(integral0Incremented, integral1Amended) -
+                cheapMulX216(integral1Incremented, integral0Amended)
+            )
+            integral0Amended, integral1Amended = integral1Amended, integral0Amended
+        else:
+            mismatch = word(
+                cheapMulX216(integral1Incremented, integral0Amended) -
+                cheapMulX216(integral0Incremented, integral1Amended)
+            )
+        mismatchPrime = word(
+            mulX216(integral0Incremented, integral1AmendedPrime) +
+            mulX216(integral1Incremented, integral0AmendedPrime)
+        )
+        sign = slt(0, mismatch) != slt(0, mismatchPrime)
+        step = sdiv(word((1 << 38) * mismatch), sar(22, mismatchPrime))
+        self.iterations.append((log(self.overshoot), signed(mismatch), signed(mismatchPrime), signed(step)))
+        if step == 0 and mismatch != 0 and sar(22, mismatchPrime) == 0:
+            raise SearchingForOvershootFailed(log(self.overshoot))
+        return sign, step, integral0Amended, integral1Amended
+
+    def newIntegrals(self, integral0Incremented, integral1Incremented):
+        if self.zeroForOne:
+            integral0Incremented, integral1Incremented = integral1Incremented, integral0Incremented
+        _, integral0Amended, integral1Amended = self._amend(integral0Incremented, integral1Incremented)
+        if self.zeroForOne:
+            integral0Amended, integral1Amended = integral1Amended, integral0Amended
+        return integral0Amended, integral1Amended
+
+    # The contract does not bound the number of Newton iterations. 'maxSteps'
+    # stops runaway configurations of a sweep, in which case
+    # 'SearchingForOvershootFailed' is raised.
+    def searchOvershoot(self, integral0Incremented, integral1Incremented, maxSteps=None):
+        zeroForOne = self.zeroForOne
+        while True:
+            sign, step, integral0Amended, integral1Amended = self.newtonStep(
+                integral0Incremented,
+                integral1Incremented
+            )
+            if step == 0:
+                break
+            if maxSteps is not None and len(self.iterations) >= maxSteps:
+                raise SearchingForOvershootFailed(log(self.overshoot))
+            if zeroForOne:
+                logPrice = minX59(maxX59(log(self.end), word(log(self.overshoot) + step)), log(self.begin))
+            else:
+                logPrice = minX59(maxX59(log(self.begin), word(log(self.overshoot) + step)), log(self.end))
+            self.overshoot = copyPrice(self.overshoot, storePrice(logPrice))
+        growthInverse = maxX216(
+            cheapMulX216(integral0Incremented, integral1Amended),
+            cheapMulX216(integral1Incremented, integral0Amended)
+        )
+        forward = (log(self.overshoot) != log(self.end)) and (sign == zeroForOne)
+        backward = (log(self.overshoot) != log(self.begin)) and (sign != zeroForOne)
+        if forward or backward:
+            _integral0Amended = integral0Amended
+            _integral1Amended = integral1Amended
+            self.end = copyPrice(self.end, self.overshoot)
+            self.moveOvershootByEpsilon(forward == zeroForOne)
+            integral0Amended, integral1Amended = self.newIntegrals(integral0Incremented, integral1Incremented)
+            _growthInverse = maxX216(
+                cheapMulX216(integral0Incremented, integral1Amended),
+                cheapMulX216(integral1Incremented, integral0Amended)
+            )
+            if not slt(_growthInverse, growthInverse):
+                self.overshoot = copyPrice(self.overshoot, self.end)
+                integral0Amended = _integral0Amended
+                integral1Amended = _integral1Amended
+        integral0Amended = minX216(integral0Incremented, integral0Amended)
+        integral1Amended = minX216(integral1Incremented, integral1Amended)
+        return integral0Amended, integral1Amended
+
+    # 'searchOutgoingTarget', or 'searchOutgoingTargetRefined' of
+    # 'IntervalWrapper.sol' if 'refine' is set, i.e., the linear guess is
+    # refined by 'refineTargetGuess' before the Halley iterations.
+    def searchOutgoingTarget(self, refine=False, maxSteps=None):
+        outgoingLimit = word(self.integralLimit - self.currentToTarget)
+        amount = outgoing(self.total0, self.total1, self.begin, self.target)
+        if not slt(outgoingLimit, amount):
+            return False, amount
+        left = self.zeroForOne
+        if left:
+            db = word(log(self.total0) - log(self.total1))
+        else:
+            db = word(log(self.total1) - log(self.total0))
+        dc = word(height(self.total1) - height(self.total0))
+        q2 = times(twoX59, dc)
+        q1 = word(q2 + times(db, height(self.total0)))
+        if left:
+            q1 = word(q1 + times(word(log(self.total0) - log(self.begin)), dc))
+        else:
+            q1 = word(q1 + times(word(log(self.begin) - log(self.total0)), dc))
+        q0 = word(toX216(q1) - mulDivByExpInv16X59(db, sqrt(self.begin, not left), outgoingLimit))
+        q0 = word(q0 + q0)
+        if left:
+            xLimit = word(log(self.begin) - log(self.target))
+        else:
+            xLimit = word(log(self.target) - log(self.begin))
+        x = maxX59(epsilonX59, cheapMulDiv(xLimit, outgoingLimit, amount))
+        if refine:
+            self.refinement = (
+                x,
+                xLimit,
+                word(q1 - q2),
+                word(times(xLimit, dc) + q1 - q2),
+                sqrt(self.begin, left),
+                sqrt(self.target, left)
+            )
+            x = refineTargetGuess(*self.refinement)
+        while True:
+            g = word(times(x, dc) + q1)
+            h = word(toX216(g) - cheapMulDiv(q0, 1 << 255, expInverse(x)))
+            g = word(g - q2)
+            h_over_g_X142 = sdiv(h, g)
+            denominator = word((1 << 83) - word(sar(60, h_over_g_X142) - sdiv(word(h_over_g_X142 * dc), g)))
+            step = sdiv(word(h_over_g_X142 + h_over_g_X142), denominator)
+            self.halley.append((signed(x), signed(step)))
+            if step == 0:
+                if denominator == 0:
+                    raise SearchingForOutgoingTargetFailed(signed(x))
+                break
+            if maxSteps is not None and len(self.halley) >= maxSteps:
+                raise SearchingForOutgoingTargetFailed(signed(x))
+            x = minX59(maxX59(epsilonX59, word(x + step)), xLimit)
+        x = word(log(self.begin) - x) if left else word(log(self.begin) + x)
+        self.overshoot = copyPrice(self.overshoot, storePrice(x))
+        amount = outgoing(self.total0, self.total1, self.begin, self.overshoot)
+        while slt(amount, outgoingLimit):
+            self.moveOvershootByEpsilon(left)
+            self.epsilonMoves += 1
+            amount = outgoing(self.total0, self.total1, self.begin, self.overshoot)
+        self.target = copyPrice(self.target, self.overshoot)
+        return True, amount
+
+    # 'searchIncomingTarget', or 'searchIncomingTargetRefined' of
+    # 'IntervalWrapper.sol' if 'refine' is set.
+    def searchIncomingTarget(self, refine=False, maxSteps=None):
+        incomingLimit = word(self.integralLimit - self.incomingCurrentToTarget)
+        amount = incoming(self.total0, self.total1, self.begin, self.target)
+        if not slt(incomingLimit, amount):
+            return False, amount
+        left = self.zeroForOne
+        if left:
+            db = word(log(self.total0) - log(self.total1))
+        else:
+            db = word(log(self.total1) - log(self.total0))
+        dc = word(height(self.total1) - height(self.total0))
+        q2 = times(twoX59, dc)
+        q1 = word(q2 - times(db, height(self.total1)))
+        if left:
+            q1 = word(q1 + times(word(log(self.begin) - log(self.total1)), dc))
+        else:
+            q1 = word(q1 + times(word(log(self.total1) - log(self.begin)), dc))
+        q0 = word(toX216(q1) - mulDivByExpInv16X59(db, sqrt(self.begin, left), incomingLimit))
+        if left:
+            xLimit = word(log(self.begin) - log(self.target))
+        else:
+            xLimit = word(log(self.target) - log(self.begin))
+        x = xLimit
+        if not slt(amount, xLimit):
+            x = maxX59(epsilonX59, cheapMulDiv(xLimit, incomingLimit, amount))
+            if refine:
+                self.refinement = (
+                    x,
+                    xLimit,
+                    word(q2 - q1),
+                    word(times(xLimit, dc) + q2 - q1),
+                    sqrt(self.begin, not left),
+                    sqrt(self.target, not left)
+                )
+                x = refineTargetGuess(*self.refinement)
+        while True:
+            g = word(times(x, dc) - q1)
+            h = word(toX216(g) + mulX216(q0, expInverse(x) >> 40))
+            g = word(g + q2)
+            h_over_g_X142 = sdiv(h, g)
+            denominator = word((1 << 83) - word(sar(60, h_over_g_X142) + sdiv(word(h_over_g_X142 * dc), g)))
+            step = sdiv(word(h_over_g_X142 + h_over_g_X142), denominator)
+            self.halley.append((signed(x), signed(step)))
+            if step == 0:
+                if denominator == 0:
+                    raise SearchingForIncomingTargetFailed(signed(x))
+                break
+            if maxSteps is not None and len(self.halley) >= maxSteps:
+                raise SearchingForIncomingTargetFailed(signed(x))
+            x = minX59(maxX59(epsilonX59, word(x - step)), xLimit)
+        x = minX59(word(x + epsilonX59), xLimit)
+        x = word(log(self.begin) - x) if left else word(log(self.begin) + x)
+        self.overshoot = copyPrice(self.overshoot, storePrice(x))
+        amount = incoming(self.total0, self.total1, self.begin, self.overshoot)
+        while slt(incomingLimit, amount):
+            self.moveOvershootByEpsilon(not left)
+            self.epsilonMoves += 1
+            amount = incoming(self.total0, self.total1, self.begin, self.overshoot)
+        self.target = copyPrice(self.target, self.overshoot)
+        return True, amount
+
+# 'refineTargetGuess' of 'IntervalWrapper.sol'
+def refineTargetGuess(x, xLimit, gBegin, gTarget, sqrtBegin, sqrtTarget):
+    w1 = cheapMulDiv(gTarget, sqrtTarget, sqrtBegin)
+    total = word(gBegin + w1)
+    radicand = word(
+        word(gBegin * gBegin) +
+        word(sdiv(word(word(w1 - gBegin) * x), xLimit) * total)
+    )
+    denominator = word(gBegin + sqrtFloor(radicand))
+    guess = x
+    if denominator != 0:
+        guess = div(word(x * total), denominator)
+    return minX59(maxX59(epsilonX59, guess), xLimit)
+
+# Loads the memory in the same way as '_getNewtonStep' and '_newIntegrals' of
+# 'IntervalWrapper.sol'.
+def _loadNewtonStep(zeroForOne, beginLog, originLog, targetLog, overshootLog, integrals, input):
+    model = IntervalModel(zeroForOne)
+    model.begin = storePrice(word(beginLog))
+    model.origin = storePrice(word(originLog))
+    model.target = storePrice(word(targetLog))
+    model.overshoot = storePrice(word(overshootLog))
+    model.total0 = ((input[0] << 256) | input[1]) % (1 << 512)
+    model.total1 = ((input[2] << 256) | input[3]) % (1 << 512)
+    model.forward0 = ((input[4] << 256) | input[5]) % (1 << 512)
+    model.forward1 = ((input[6] << 256) | input[7]) % (1 << 512)
+    model.currentToTarget = integrals[2] % X216
+    model.currentToOvershoot = integrals[3] % X216
+    model.targetToOvershoot = integrals[4] % X216
+    model.originToOvershoot = integrals[5] % X216
+    model.currentToOrigin = integrals[6] % X216
+    model.incomingCurrentToTarget = integrals[7] % X216
+    return model
+
+# Returns the same as '_getNewtonStep' of 'IntervalWrapper.sol'.
+def getNewtonStep(zeroForOne, beginLog, originLog, targetLog, overshootLog, integrals, input):
+    model = _loadNewtonStep(zeroForOne, beginLog, originLog, targetLog, overshootLog, integrals, input)
+    sign, step, integral0Amended, integral1Amended = model.newtonStep(word(integrals[0]), word(integrals[1]))
+    return sign, signed(step), signed(integral0Amended), signed(integral1Amended)
+
+# Returns the same as '_newIntegrals' of 'IntervalWrapper.sol'.
+def getNewIntegrals(zeroForOne, beginLog, originLog, targetLog, overshootLog, integrals, input):
+    model = _loadNewtonStep(zeroForOne, beginLog, originLog, targetLog, overshootLog, integrals, input)
+    integral0Amended, integral1Amended = model.newIntegrals(word(integrals[0]), word(integrals[1]))
+    return signed(integral0Amended), signed(integral1Amended)
+
+# Loads the memory in the same way as '_searchOutgoingTarget' and
+# '_searchIncomingTarget' of 'IntervalWrapper.sol', where 'currentToTarget' is
+# either '_currentToTarget_' or '_incomingCurrentToTarget_'.
+def loadTargetSearch(integralLimit, currentToTarget, zeroForOne, input):
+    model = IntervalModel(zeroForOne)
+    model.integralLimit = integralLimit % X216
+    model.currentToTarget = currentToTarget % X216
+    model.incomingCurrentToTarget = currentToTarget % X216
+    model.begin = ((input[0] << 256) | input[1]) % (1 << 512)
+    model.target = ((input[2] << 256) | input[3]) % (1 << 512)
+    model.total0 = ((input[4] << 256) | input[5]) % (1 << 512)
+    model.total1 = ((input[6] << 256) | input[7]) % (1 << 512)
+    return model
+
+def _unloadTargetSearch(model, exactAmount, amount):
+    return exactAmount, signed(amount), [
+        model.overshoot >> 256,
+        model.overshoot % (1 << 256),
+        model.target >> 256,
+        model.target % (1 << 256)
+    ]
+
+# Returns the same as '_searchOutgoingTarget' of 'IntervalWrapper.sol', or
+# '_searchOutgoingTargetRefined' if 'refine' is set.
+def searchOutgoingTarget(integralLimit, currentToTarget, zeroForOne, input, refine=False):
+    model = loadTargetSearch(integralLimit, currentToTarget, zeroForOne, input)
+    exactAmount, amount = model.searchOutgoingTarget(refine)
+    return _unloadTargetSearch(model, exactAmount, amount)
+
+# Returns the same as '_searchIncomingTarget' of 'IntervalWrapper.sol', or
+# '_searchIncomingTargetRefined' if 'refine' is set.
+def searchIncomingTarget(integralLimit, incomingCurrentToTarget, zeroForOne, input, refine=False):
+    model = loadTargetSearch(integralLimit, incomingCurrentToTarget, zeroForOne, input)
+    exactAmount, amount = model.searchIncomingTarget(refine)
+    return _unloadTargetSearch(model, exactAmount, amount)
+
+# Replays '_searchOvershoot' of 'IntervalWrapper.sol' up to the call to
+# 'searchOvershoot' and returns the model together with the incremented
+# integrals.
+def prepareSearchOvershoot(integral0, integral1, qLimit, curveLength, kernelArray, curveArray):
+    curve = decodeCurve(curveArray, curveLength)
+    model = IntervalModel(not slt(curve[-1], qLimit), decodeKernel(kernelArray), curve)
+    model.initiateInterval(qLimit)
+    while log(model.target) != qLimit:
+        model.moveTarget()
+
+    model.overshoot = copyPrice(model.overshoot, model.target)
+    model.forward1 = copyPrice(model.forward1, model.target)
+    model.currentToOvershoot = model.currentToTarget
+
+    if model.zeroForOne:
+        integral0Incremented = word(model.incomingCurrentToTarget + integral0)
+        integral1Incremented = word(integral1 - model.currentToTarget)
+    else:
+        integral0Incremented = word(integral0 - model.currentToTarget)
+        integral1Incremented = word(model.incomingCurrentToTarget + integral1)
+
+    while model.moveOvershoot(integral0Incremented, integral1Incremented):
+        pass
+
+    return model, integral0Incremented, integral1Incremented
+
+# Returns the same as '_searchOvershoot' of 'IntervalWrapper.sol'.
+def searchOvershoot(integral0, integral1, qLimit, curveLength, kernelArray, curveArray):
+    model, integral0Incremented, integral1Incremented = prepareSearchOvershoot(
+        integral0,
+        integral1,
+        qLimit,
+        curveLength,
+        kernelArray,
+        curveArray
+    )
+    integral0Amended, integral1Amended = model.searchOvershoot(integral0Incremented, integral1Incremented)
+    return log(model.overshoot), signed(integral0Amended), signed(integral1Amended)
+
+# Evaluates a single configuration of 'sweep'. The output is a dictionary so
+# that it can be pickled back from worker processes and dumped as JSON.
+#
+# The contract starts the Newton iterations from '_begin_'. A candidate initial
+# guess may be tried instead via 'guess', i.e., a module level function which
+# receives the model prior to 'searchOvershoot' and returns a log price. The
+# guess is clamped to '[begin, end]' just like every Newton step.
+def trace(configuration, maxSteps=256, guess=None):
+    integral0, integral1, qLimit, curve, kernel = configuration
+    model, integral0Incremented, integral1Incremented = prepareSearchOvershoot(
+        integral0,
+        integral1,
+        qLimit,
+        len(curve),
+        encodeKernel(kernel),
+        encodeCurve(curve)
+    )
+    if guess is not None:
+        lower = minX59(log(model.begin), log(model.end))
+        upper = maxX59(log(model.begin), log(model.end))
+        model.overshoot = copyPrice(model.overshoot, storePrice(minX59(maxX59(lower, word(guess(model))), upper)))
+    output = {'configuration': configuration, 'failed': False}
+    try:
+        integral0Amended, integral1Amended = model.searchOvershoot(
+            integral0Incremented,
+            integral1Incremented,
+            maxSteps
+        )
+        output['overshoot'] = log(model.overshoot)
+        output['integral0Amended'] = signed(integral0Amended)
+        output['integral1Amended'] = signed(integral1Amended)
+    except SearchingForOvershootFailed:
+        output['failed'] = True
+    output['iterations'] = model.iterations
+    return output
+
+# Traces every configuration in parallel as in 'Golden.build'. Each
+# configuration is '(integral0, integral1, qLimit, curve, kernel)' with the
+# same inputs as 'IntervalSearchOvershoot_test.py'.
+def sweep(configurations, workers=None, maxSteps=256, guess=None):
+    configurations = list(configurations)
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers <= 1 or len(configurations) <= 1:
+        return [trace(configuration, maxSteps, guess) for configuration in configurations]
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(
+            trace,
+            configurations,
+            [maxSteps] * len(configurations),
+            [guess] * len(configurations),
+            chunksize=max(1, len(configurations) // (4 * workers))
+        ))
+
+# Summarizes the output of 'sweep' as a histogram of the number of Newton
+# iterations per configuration, together with the failed configurations.
+def histogram(traces):
+    counts = dict()
+    failures = []
+    for output in traces:
+        if output['failed']:
+            failures.append(output['configuration'])
+        else:
+            steps = len(output['iterations'])
+            counts[steps] = counts.get(steps, 0) + 1
+    return dict(sorted(counts.items())), failures
+
+midpoint = 0x8000000000000000
+spacing = 0x0800000000000000
+
+# The configurations of 'IntervalSearchOvershoot_test.py', i.e., a curve with
+# four members in either orientation, a kernel whose five inner breakpoints
+# are each skipped, kept or doubled into a jump, and five limits.
+def grid(orientations=(False, True), patterns=('skip', 'break', 'jump'), placements=(1, 2, 3, 4, 5)):
+    from Golden import outgoing
+    points = [(k * spacing) // 10 for k in range(7)]
+    configurations = []
+    for orientation in orientations:
+        if orientation:
+            curve = [midpoint + points[6], midpoint + points[0], midpoint + points[4], midpoint + points[2]]
+        else:
+            curve = [midpoint + points[0], midpoint + points[6], midpoint + points[2], midpoint + points[4]]
+        qLower = min(curve[0], curve[1])
+        qUpper = max(curve[0], curve[1])
+        qCurrent = curve[-1]
+        for choice in itertools.product(patterns, repeat=5):
+            kernel = [[0, 0]]
+            for k, pattern in enumerate(choice):
+                if pattern != 'skip':
+                    kernel += [[points[k + 1], ((2 * k + 1) * X15) // 11]]
+                if pattern == 'jump':
+                    kernel += [[points[k + 1], ((2 * k + 2) * X15) // 11]]
+            kernel += [[points[6], X15]]
+            integral0 = int(outgoing(curve, kernel, qCurrent, qUpper))
+            integral1 = int(outgoing(curve, kernel, qLower, qCurrent))
+            for placement in placements:
+                qLimit = midpoint + points[placement]
+                if qLimit != qCurrent:
+                    configurations.append((integral0, integral1, qLimit, curve, kernel))
+    return configurations
+
+if __name__ == '__main__':
+    traces = sweep(grid(), int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count())
+    counts, failures = histogram(traces)
+    for steps, count in counts.items():
+        print(str(steps) + ' Newton steps: ' + str(count) + ' configurations')
+    print(str(len(failures)) + ' failures')
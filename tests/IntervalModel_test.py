@@ -0,0 +1,53 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from Nofee import logTest, encodeCurve, encodeKernel
+from IntervalModel import grid, sweep, trace, histogram, searchOvershoot, midpoint, spacing
+
+# The sweep covers jumps and skips of the kernel. Breakpoints without a jump
+# are covered by 'IntervalSearchOvershoot_test.py' against the wrapper.
+@pytest.mark.parametrize('orientation', [False, True])
+def test_sweep(orientation, request, worker_id):
+    logTest(request, worker_id)
+
+    configurations = grid(orientations=[orientation], patterns=['skip', 'jump'])
+    traces = sweep(configurations, 2)
+    counts, failures = histogram(traces)
+    assert failures == []
+    assert sum(counts.values()) == len(configurations)
+
+    for configuration, output in zip(configurations, traces):
+        integral0, integral1, qLimit, curve, kernel = configuration
+
+        # The trace ends where 'searchOvershoot' returns.
+        assert (
+            output['overshoot'],
+            output['integral0Amended'],
+            output['integral1Amended']
+        ) == searchOvershoot(
+            integral0,
+            integral1,
+            qLimit,
+            len(curve),
+            encodeKernel(kernel),
+            encodeCurve(curve)
+        )
+
+        # Every Newton iteration but the last one moves the overshoot.
+        iterations = output['iterations']
+        assert iterations[-1][3] == 0
+        assert all(step != 0 for _, _, _, step in iterations[:-1])
+
+# An initial guess changes the iterations but not the outcome.
+def midpointGuess(model):
+    return midpoint + (3 * spacing) // 10
+
+def test_guess(request, worker_id):
+    logTest(request, worker_id)
+
+    for configuration in grid(patterns=['break'], placements=[2, 4]):
+        output = trace(configuration)
+        guessed = trace(configuration, guess=midpointGuess)
+        assert guessed['failed'] == False
+        assert guessed['overshoot'] == output['overshoot']
+        assert guessed['integral0Amended'] == output['integral0Amended']
+        assert guessed['integral1Amended'] == output['integral1Amended']
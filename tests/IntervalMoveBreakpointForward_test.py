@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, IntervalWrapper
+from brownie import IntervalWrapper
 from sympy import Integer, floor, exp
 from Nofee import logTest, thirtyTwoX59, dataGeneration
 
@@ -40,8 +40,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntervalWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntervalWrapper)
 
 @pytest.mark.parametrize('forward1Height', [height0, height2, height4])
 @pytest.mark.parametrize('forward1Log', [logPrice1, logPrice2, logPrice4])
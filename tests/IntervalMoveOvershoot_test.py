@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, IntervalWrapper
+from brownie import IntervalWrapper
 from sympy import Integer, floor, exp, Symbol, integrate
 from Nofee import logTest, X15, X59, X216, dataGeneration
 from X15_test import oneX15
@@ -41,13 +41,13 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntervalWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntervalWrapper)
 
-@pytest.mark.parametrize('direction', [False])
-@pytest.mark.parametrize('zeroForOne', [False])
+@pytest.mark.parametrize('direction', [False, True])
+@pytest.mark.parametrize('zeroForOne', [False, True])
 @pytest.mark.parametrize('originToOvershoot', [X216 // 5])
-@pytest.mark.parametrize('_forward1', ['afterBegin'])
+@pytest.mark.parametrize('_forward1', ['afterBegin', 'afterEnd', 'beforeEnd', 'begin', 'end'])
 @pytest.mark.parametrize('_forward2', ['begin', 'afterBegin', 'beforeEnd', 'end', 'afterEnd'])
 @pytest.mark.parametrize('_total0', ['begin', 'afterBegin', 'beforeEnd', 'end', 'afterEnd'])
 @pytest.mark.parametrize('_total1', ['begin', 'afterBegin', 'beforeEnd', 'end', 'afterEnd'])
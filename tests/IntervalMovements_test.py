@@ -1,8 +1,10 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, IntervalWrapper
+from brownie import IntervalWrapper
 from sympy import Integer, floor, exp, Symbol
-from Nofee import logTest, _interval_, _incomingCurrentToTarget_, _currentToTarget_, _currentToOrigin_, _currentToOvershoot_, _targetToOvershoot_, _originToOvershoot_, _current_, _direction_, _origin_, _begin_, _end_, _target_, _overshoot_, _total0_, _total1_, _forward0_, _forward1_, _indexCurve_, _indexKernelTotal_, _indexKernelForward_, _logPriceLimitOffsettedWithinInterval_, X15, X59, X216, amend, outgoing, incoming, dataGeneration, toInt, encodeCurve, encodeKernel
+from Nofee import logTest, _interval_, _incomingCurrentToTarget_, _currentToTarget_, _currentToOrigin_, _currentToOvershoot_, _targetToOvershoot_, _originToOvershoot_, _current_, _direction_, _origin_, _begin_, _end_, _target_, _overshoot_, _total0_, _total1_, _forward0_, _forward1_, _indexCurve_, _indexKernelTotal_, _indexKernelForward_, _logPriceLimitOffsettedWithinInterval_, X15, X59, X216, amend, dataGeneration, toInt, encodeCurve, encodeKernel
+from Golden import outgoing, incoming
+from TraceCache import getTrace
 from X15_test import oneX15
 
 initializations, swaps, kernelsValid, kernelsInvalid = dataGeneration(1000)
@@ -41,11 +43,11 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntervalWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntervalWrapper)
 
-@pytest.mark.parametrize('limitPlacement', [0])
-@pytest.mark.parametrize('p5', ['break'])
+@pytest.mark.parametrize('limitPlacement', [0, 1, 2, 3, 4, 5, 6])
+@pytest.mark.parametrize('p5', ['break', 'jump', 'skip'])
 @pytest.mark.parametrize('p4', ['skip', 'break', 'jump'])
 @pytest.mark.parametrize('p3', ['skip', 'break', 'jump'])
 @pytest.mark.parametrize('p2', ['skip', 'break', 'jump'])
@@ -122,13 +124,15 @@ def test_movements(wrapper, orientation, p1, p2, p3, p4, p5, limitPlacement, req
 
         size = len(tx.events['(unknown)'])
 
+        trace = getTrace(tx)
+
         snapshots = []
-        for jj in range(len(tx.trace)):
-            if tx.trace[jj]['op'] == 'LOG4':
+        for jj in range(len(trace)):
+            if trace[jj]['op'] == 'LOG4':
                 ii = 0
                 data = ''
-                while ii < len(tx.trace[jj]['memory']):
-                    data += tx.trace[jj]['memory'][ii]
+                while ii < len(trace[jj]['memory']):
+                    data += trace[jj]['memory'][ii]
                     ii += 1
                 data = int(data, 16).to_bytes(len(data) // 2, 'big')
                 snapshots += [data[_interval_ : (_originToOvershoot_ + 27)]]
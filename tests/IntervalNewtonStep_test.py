@@ -1,9 +1,10 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, IntervalWrapper
+from brownie import IntervalWrapper
 from sympy import Integer, floor, exp, Symbol, integrate
 from Nofee import logTest, thirtyTwoX59, X15, X59, X216, dataGeneration
 from X15_test import oneX15
+from IntervalModel import getNewtonStep
 
 initializations, swaps, kernelsValid, kernelsInvalid = dataGeneration(1000)
 
@@ -41,8 +42,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntervalWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntervalWrapper)
 
 @pytest.mark.parametrize('zeroForOne', [False, True])
 @pytest.mark.parametrize('originLog', [(1 * thirtyTwoX59) // 9])
@@ -117,32 +118,47 @@ def test_getNewtonStep(
     forward1Content0 = (forward1Height << 240) + (forward1Log << 176) + (sqrtForward1 >> 40)
     forward1Content1 = ((sqrtForward1 % (1 << 40)) << 216) + sqrtInverseForward1
 
+    integrals = [
+        integral0Incremented,
+        integral1Incremented,
+        currentToTarget,
+        currentToOvershoot,
+        targetToOvershoot,
+        originToOvershoot,
+        currentToOrigin,
+        incomingCurrentToTarget,
+    ]
+
+    contents = [
+        total0Content0,
+        total0Content1,
+        total1Content0,
+        total1Content1,
+        forward0Content0,
+        forward0Content1,
+        forward1Content0,
+        forward1Content1,
+    ]
+
     tx = wrapper._getNewtonStep(
         zeroForOne,
         beginLog,
         originLog,
         targetLog,
         overshootLog,
-        [
-            integral0Incremented,
-            integral1Incremented,
-            currentToTarget,
-            currentToOvershoot,
-            targetToOvershoot,
-            originToOvershoot,
-            currentToOrigin,
-            incomingCurrentToTarget,
-        ],
-        [
-            total0Content0,
-            total0Content1,
-            total1Content0,
-            total1Content1,
-            forward0Content0,
-            forward0Content1,
-            forward1Content0,
-            forward1Content1,
-        ]
+        integrals,
+        contents
+    )
+
+    # The Python model is expected to reproduce the outputs of the wrapper.
+    assert tuple(tx.return_value) == getNewtonStep(
+        zeroForOne,
+        beginLog,
+        originLog,
+        targetLog,
+        overshootLog,
+        integrals,
+        contents
     )
 
     sign, step, integral0Amended, integral1Amended = tx.return_value
@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, IntervalWrapper
+from brownie import IntervalWrapper
 from sympy import Integer, floor, exp, Symbol, integrate
 from Nofee import logTest, thirtyTwoX59, X15, X59, X216, dataGeneration
 from X15_test import oneX15
@@ -41,8 +41,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntervalWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntervalWrapper)
 
 @pytest.mark.parametrize('zeroForOne', [False, True])
 @pytest.mark.parametrize('horizontalStart', [1, thirtyTwoX59 // 2, thirtyTwoX59 - 1])
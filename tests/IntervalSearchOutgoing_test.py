@@ -2,6 +2,7 @@
 import pytest
 from brownie import accounts, IntervalWrapper
 from sympy import Integer, floor, exp, Symbol, integrate
+from Grid import grid
 from Nofee import logTest, thirtyTwoX59, X15, X59, X216, dataGeneration
 from X15_test import oneX15
 
@@ -44,14 +45,16 @@ points = [
 def wrapper(fn_isolation):
     return IntervalWrapper.deploy({'from': accounts[0]})
 
-@pytest.mark.parametrize('zeroForOne', [False, True])
-@pytest.mark.parametrize('horizontalStart', [1, thirtyTwoX59 // 2, thirtyTwoX59 - 1])
-@pytest.mark.parametrize('verticalStart', [0, oneX15 // 2, oneX15])
-@pytest.mark.parametrize('horizontalGap', [1, 3, 1 << 40, 1 << 63])
-@pytest.mark.parametrize('verticalGap', [0, 1, oneX15 // 3, oneX15])
-@pytest.mark.parametrize('_begin', ['begin', 'mid'])
-@pytest.mark.parametrize('_end', ['mid', 'end'])
-@pytest.mark.parametrize('_solution', ['begin + 1', 'mid', 'end - 1'])
+@grid(
+    zeroForOne=[False, True],
+    horizontalStart=[1, thirtyTwoX59 // 2, thirtyTwoX59 - 1],
+    verticalStart=[0, oneX15 // 2, oneX15],
+    horizontalGap=[1, 3, 1 << 40, 1 << 63],
+    verticalGap=[0, 1, oneX15 // 3, oneX15],
+    _begin=['begin', 'mid'],
+    _end=['mid', 'end'],
+    _solution=['begin + 1', 'mid', 'end - 1']
+)
 def test_searchOutgoingTarget(wrapper, zeroForOne, horizontalStart, horizontalGap, verticalStart, verticalGap, _begin, _end, _solution, request, worker_id):
     logTest(request, worker_id)
     
@@ -1,9 +1,11 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, IntervalWrapper
+from brownie import IntervalWrapper
 from sympy import Integer
-from Nofee import logTest, amend, outgoing, incoming, dataGeneration, encodeCurve, encodeKernel
+from Nofee import logTest, amend, dataGeneration, encodeCurve, encodeKernel
+from Golden import outgoing, incoming
 from X15_test import oneX15
+from IntervalModel import searchOvershoot
 
 initializations, swaps, kernelsValid, kernelsInvalid = dataGeneration(1000)
 
@@ -41,11 +43,11 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return IntervalWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(IntervalWrapper)
 
-@pytest.mark.parametrize('limitPlacement', [1])
-@pytest.mark.parametrize('p5', ['break'])
+@pytest.mark.parametrize('limitPlacement', [1, 2, 3, 4, 5])
+@pytest.mark.parametrize('p5', ['break', 'jump', 'skip'])
 @pytest.mark.parametrize('p4', ['skip', 'break', 'jump'])
 @pytest.mark.parametrize('p3', ['skip', 'break', 'jump'])
 @pytest.mark.parametrize('p2', ['skip', 'break', 'jump'])
@@ -120,6 +122,16 @@ def test_searchOvershoot(wrapper, orientation, p1, p2, p3, p4, p5, limitPlacemen
 
         overshoot, integral0Amended, integral1Amended = tx.return_value
 
+        # The Python model is expected to reproduce the outputs of the wrapper.
+        assert tuple(tx.return_value) == searchOvershoot(
+            integral0,
+            integral1,
+            target,
+            len(curve),
+            encodeKernel(kernel),
+            encodeCurve(curve)
+        )
+
         curveAmended = amend(amend(curve, overshoot), target)
         _integral0Amended = outgoing(curveAmended, kernel, target, qUpper)
         _integral1Amended = outgoing(curveAmended, kernel, qLower, target)
@@ -0,0 +1,108 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import accounts, IntervalWrapper
+from Nofee import logTest, logGas
+from IntervalModel import signed, searchOutgoingTarget, searchIncomingTarget
+from TargetSearch import fuzz, narrow, sweep
+
+sampleCount = 50
+
+@pytest.fixture(autouse=True)
+def wrapper(fn_isolation):
+    return IntervalWrapper.deploy({'from': accounts[0]})
+
+def distribution(gas):
+    gas = sorted(gas)
+    return {
+        'min': gas[0],
+        'median': gas[len(gas) // 2],
+        'mean': sum(gas) // len(gas),
+        'max': gas[-1]
+    }
+
+# The target searches of 'Interval.sol' start from the linear guess while
+# '_searchOutgoingTargetRefined' and '_searchIncomingTargetRefined' of
+# 'IntervalWrapper.sol' start from the output of 'refineTargetGuess'. Both
+# match the model and find the same target for the echidna input space as
+# well as the narrow segments of 'TargetSearch.py'.
+#
+# 'before' and 'after' are the gas used by the wrapper functions of the
+# deployed search and the refined one, respectively. Both wrapper functions
+# load and unload memory in the same way. Hence, the difference is due to the
+# search alone, which includes the cost of 'refineTargetGuess' as well as the
+# call overhead of 'prepare*Search' and '*HalleyStep' for whatever the
+# optimizer does not inline. The distributions are recorded in
+# 'testLogs/gas.jsonl'.
+@pytest.mark.parametrize('generator', [fuzz, narrow])
+@pytest.mark.parametrize('isIncoming', [False, True])
+def test_searchTargetGas(wrapper, generator, isIncoming, request, worker_id):
+    logTest(request, worker_id)
+
+    configurations = generator(sampleCount, isIncoming)
+    linear = sweep(configurations, 1)
+    refined = sweep(configurations, 1, True)
+
+    searchTarget = wrapper._searchIncomingTarget if isIncoming else wrapper._searchOutgoingTarget
+    searchTargetRefined = wrapper._searchIncomingTargetRefined if isIncoming else wrapper._searchOutgoingTargetRefined
+    traceTarget = wrapper._traceIncomingTarget if isIncoming else wrapper._traceOutgoingTarget
+    model = searchIncomingTarget if isIncoming else searchOutgoingTarget
+
+    before = []
+    after = []
+    stepGas = []
+    refinementGas = []
+    iterations = []
+    for configuration, output0, output1 in zip(configurations, linear, refined):
+        _, integralLimit, currentToTarget, zeroForOne, input = configuration
+
+        tx = searchTarget(integralLimit, currentToTarget, zeroForOne, input)
+        exactAmount, amount, output = tx.return_value
+        assert (exactAmount, amount, list(output)) == model(integralLimit, currentToTarget, zeroForOne, input)
+        before.append(tx.gas_used)
+
+        refinedTx = searchTargetRefined(integralLimit, currentToTarget, zeroForOne, input)
+        refinedExactAmount, refinedAmount, refinedOutput = refinedTx.return_value
+        assert (refinedExactAmount, refinedAmount, list(refinedOutput)) == model(integralLimit, currentToTarget, zeroForOne, input, True)
+        after.append(refinedTx.gas_used)
+
+        # The targets coincide. The amounts may differ in the last few bits
+        # as explained in 'TargetSearch_test.py'.
+        assert refinedExactAmount == exactAmount
+        assert refinedOutput[2:] == output[2:]
+        assert abs(refinedAmount - amount) <= abs(amount) >> 128
+
+        tx = traceTarget(integralLimit, currentToTarget, zeroForOne, input)
+        count, gasUsed = tx.return_value
+        assert count == len(output1['halley'])
+        assert [
+            (event['x'], event['step']) for event in tx.events['HalleyIteration']
+        ] == output1['halley']
+        assert tx.events['TargetSearch']['iterations'] == count
+        assert tx.events['TargetSearch']['gasUsed'] == gasUsed
+        stepGas += [event['gasUsed'] for event in tx.events['HalleyIteration']]
+        iterations.append((len(output0['halley']), count))
+
+        if output1['refinement'] is not None:
+            guess, refinement = wrapper._refineTargetGuess(
+                *[signed(value) for value in output1['refinement']]
+            ).return_value
+            assert guess == output1['halley'][0][0]
+            refinementGas.append(refinement)
+
+    measurements = {
+        'Halley iterations (model, linear guess), mean': sum(k for k, _ in iterations) / len(iterations),
+        'Halley iterations (model, refined guess), mean': sum(k for _, k in iterations) / len(iterations)
+    }
+    samples = {
+        'gas per Halley iteration': stepGas,
+        'gas of refineTargetGuess': refinementGas,
+        'before': before,
+        'after': after,
+        'after - before': [b - a for a, b in zip(before, after)]
+    }
+    for label, gas in samples.items():
+        if len(gas) > 0:
+            for statistic, value in distribution(gas).items():
+                measurements[label + ', ' + statistic] = value
+
+    logGas(request, measurements)
@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 import brownie
-from brownie import accounts, KernelCompactWrapper
+from brownie import KernelCompactWrapper
 from eth_abi.packed import encode_packed
 from Nofee import logTest, _kernelLength_, minLogStep, toInt, dataGeneration, encodeKernel, encodeKernelCompact
 from X15_test import oneX15
@@ -23,8 +23,8 @@ logPrice3 = 0x8FFFFFFFFFFFFFFF
 logPrice4 = 0xFFFFFFFFFFFFFFFF
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return KernelCompactWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(KernelCompactWrapper)
 
 @pytest.mark.parametrize('content', [value0, value1, value2, value3, value4])
 @pytest.mark.parametrize('kernelCompactLength', [2, maxKernelIndex // 2, maxKernelIndex])
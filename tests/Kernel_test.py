@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, KernelWrapper
+from brownie import KernelWrapper
 from sympy import Integer, floor, exp
 from eth_abi.packed import encode_packed
 from Nofee import logTest, thirtyTwoX59
@@ -26,8 +26,8 @@ height3 = 0x3FFF
 height4 = 0x8000
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return KernelWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(KernelWrapper)
 
 @pytest.mark.parametrize('content', [value0, value1, value2, value3, value4])
 @pytest.mark.parametrize('kernelLength', [2, maxKernelIndex // 2, maxKernelIndex])
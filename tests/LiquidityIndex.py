@@ -0,0 +1,201 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+from bisect import bisect_left, bisect_right, insort
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+X64 = 2**64
+X256 = 2**256
+
+# Decodes the 'data' field of a 'ModifyPosition' event which is a tightly
+# packed snapshot of memory from '_modifyPositionInput_' to
+# '_endOfModifyPosition_' (see 'INofeeswap.sol'):
+#
+#    0            8            16         48            80            112
+#    |            |            |          |             |             |
+#    +------------+------------+----------+-------------+-------------+
+#    | qMin (X59) | qMax (X59) |  shares  | logPriceMin | logPriceMax |
+#    +------------+------------+----------+-------------+-------------+
+#
+#    112               144               176
+#    |                 |                 |
+#    +-----------------+-----------------+
+#    | positionAmount0 | positionAmount1 |
+#    +-----------------+-----------------+
+#
+def decodeModifyPositionData(data):
+    if type(data) is not bytes:
+        data = b''.join([bytes(word) for word in data])
+
+    def signed(value):
+        return value - X256 if value >= (X256 >> 1) else value
+
+    qMin = int.from_bytes(data[0:8], 'big')
+    qMax = int.from_bytes(data[8:16], 'big')
+    shares = signed(int.from_bytes(data[16:48], 'big'))
+    logPriceMin = signed(int.from_bytes(data[48:80], 'big'))
+    logPriceMax = signed(int.from_bytes(data[80:112], 'big'))
+    amount0 = signed(int.from_bytes(data[112:144], 'big'))
+    amount1 = signed(int.from_bytes(data[144:176], 'big'))
+    return qMin, qMax, shares, logPriceMin, logPriceMax, amount0, amount1
+
+# An off-chain mirror of 'sharesDelta[qBoundary]' for a single pool.
+#
+# Boundaries are spaced by 'qSpacing' and aligned with 'qUpper' (see
+# 'NofeeswapDelegatee.modifyPosition'). Each boundary is mapped to a one-based
+# position 'n' and two sparse Fenwick trees are maintained over 'n':
+#
+#  - 'sharesDelta[n]' whose prefix sums give the number of shares active in the
+#    interval '[qBoundary, qBoundary + qSpacing]',
+#  - 'n * sharesDelta[n]' which, combined with the former, gives the sum of
+#    active shares across a range of intervals.
+#
+# Hence, point and range queries cost 'O(log(2 ** 64 / qSpacing))' regardless of
+# the number of positions. A sorted list of populated boundaries is kept as
+# well, for whole range scans.
+class LiquidityIndex:
+    def __init__(self, qSpacing, qAnchor):
+        assert qSpacing > 0
+        self.qSpacing = qSpacing
+        self.remainder = qAnchor % qSpacing
+        self.size = ((X64 - 1 - self.remainder) // qSpacing) + 1
+        self.delta = dict()
+        self.treeDelta = dict()
+        self.treeWeighted = dict()
+        self.sortedBoundaries = []
+
+    def position(self, qBoundary):
+        assert 0 <= qBoundary < X64
+        if (qBoundary - self.remainder) % self.qSpacing != 0:
+            raise ValueError('LogPriceIsNotSpaced: ' + str(qBoundary))
+        return ((qBoundary - self.remainder) // self.qSpacing) + 1
+
+    def boundary(self, n):
+        return self.remainder + (n - 1) * self.qSpacing
+
+    def _update(self, n, value):
+        weighted = n * value
+        while n <= self.size:
+            self.treeDelta[n] = self.treeDelta.get(n, 0) + value
+            self.treeWeighted[n] = self.treeWeighted.get(n, 0) + weighted
+            n += n & (-n)
+
+    def _prefix(self, n):
+        sumDelta = 0
+        sumWeighted = 0
+        n = min(n, self.size)
+        while n > 0:
+            sumDelta += self.treeDelta.get(n, 0)
+            sumWeighted += self.treeWeighted.get(n, 0)
+            n -= n & (-n)
+        return sumDelta, sumWeighted
+
+    def _addDelta(self, qBoundary, value):
+        if value == 0:
+            return
+        n = self.position(qBoundary)
+        previous = self.delta.get(qBoundary, 0)
+        current = previous + value
+        if current == 0:
+            del self.delta[qBoundary]
+            del self.sortedBoundaries[bisect_left(self.sortedBoundaries, qBoundary)]
+        else:
+            if previous == 0:
+                insort(self.sortedBoundaries, qBoundary)
+            self.delta[qBoundary] = current
+        self._update(n, value)
+
+    # Mirrors 'modifySharesDelta' in 'Storage.sol'.
+    def modifyPosition(self, qMin, qMax, shares):
+        if qMin >= qMax:
+            raise ValueError('LogPricesOutOfOrder: ' + str(qMin) + ', ' + str(qMax))
+        self.position(qMin)
+        self.position(qMax)
+        self._addDelta(qMin, shares)
+        self._addDelta(qMax, - shares)
+
+    # 'event' is either a brownie event (e.g., 'tx.events['ModifyPosition']')
+    # or the raw 'data' field of a 'ModifyPosition' log.
+    def ingestEvent(self, event):
+        data = event['data'] if hasattr(event, 'keys') else event
+        qMin, qMax, shares, _, _, _, _ = decodeModifyPositionData(data)
+        self.modifyPosition(qMin, qMax, shares)
+
+    def ingestEvents(self, events):
+        for event in events:
+            self.ingestEvent(event)
+
+    # Overwrites the index with 'sharesDelta' values read from storage.
+    # 'reader' maps a boundary to its 'sharesDelta', e.g.,
+    # 'lambda q: access._readSharesDelta(nofeeswap, poolId, q)'.
+    def ingestStorage(self, reader, boundaries):
+        for qBoundary in boundaries:
+            self._addDelta(qBoundary, reader(qBoundary) - self.delta.get(qBoundary, 0))
+
+    def sharesDelta(self, qBoundary):
+        return self.delta.get(qBoundary, 0)
+
+    # The number of shares in the interval '[qLower, qLower + qSpacing]' where
+    # 'qLower' is the largest spaced boundary not greater than 'logPrice'.
+    def activeShares(self, logPrice):
+        if logPrice < self.remainder:
+            return 0
+        n = ((logPrice - self.remainder) // self.qSpacing) + 1
+        return self._prefix(n)[0]
+
+    # Liquidity in the same sense as 'growth.times(sharesTotal)' where 'growth'
+    # is in 'X111' representation.
+    def activeLiquidity(self, logPrice, growth):
+        return growth * self.activeShares(logPrice)
+
+    # The sum of active shares over every interval within '[qMin, qMax]'.
+    # Over the entire range, this is equal to 'sharesGross'.
+    def sharesInRange(self, qMin, qMax):
+        return self._cumulative(self.position(qMax) - 1) - self._cumulative(self.position(qMin) - 1)
+
+    def sharesGross(self):
+        return self._cumulative(self.size)
+
+    def _cumulative(self, n):
+        sumDelta, sumWeighted = self._prefix(n)
+        return (n + 1) * sumDelta - sumWeighted
+
+    def boundaries(self):
+        return list(self.sortedBoundaries)
+
+    # Yields '(qLower, qUpper, shares)' for every maximal range of intervals
+    # within '[qMin, qMax]' with a constant number of active shares. If the
+    # index is empty, the populated range is empty and nothing is yielded
+    # unless both 'qMin' and 'qMax' are given.
+    def scan(self, qMin=None, qMax=None):
+        if len(self.sortedBoundaries) == 0 and (qMin is None or qMax is None):
+            return
+        qMin = self.sortedBoundaries[0] if qMin is None else qMin
+        qMax = self.sortedBoundaries[-1] if qMax is None else qMax
+        if qMin >= qMax:
+            return
+        shares = self.activeShares(qMin)
+        begin = qMin
+        start = bisect_right(self.sortedBoundaries, qMin)
+        end = bisect_left(self.sortedBoundaries, qMax)
+        for qBoundary in self.sortedBoundaries[start:end]:
+            yield begin, qBoundary, shares
+            shares += self.delta[qBoundary]
+            begin = qBoundary
+        yield begin, qMax, shares
+
+    def activeSharesBatch(self, logPrices):
+        return [self.activeShares(logPrice) for logPrice in logPrices]
+
+    # Exports the populated boundaries and the number of shares active right
+    # after each of them. Shares may exceed 64 bits. Hence, an object array is
+    # used to preserve full precision.
+    def toNumpy(self):
+        assert numpy is not None, 'numpy is required for array exports.'
+        boundaries = numpy.array(self.sortedBoundaries, dtype=numpy.uint64)
+        shares = numpy.cumsum(
+            numpy.array([self.delta[q] for q in self.sortedBoundaries], dtype=object)
+        )
+        return boundaries, shares
@@ -0,0 +1,121 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import accounts, StorageWrapper, EventsWrapper
+from eth_abi import encode
+from Nofee import logTest, twosComplement, _hookSelector_, _modifyPositionInput_, _endOfModifyPosition_
+from LiquidityIndex import LiquidityIndex, decodeModifyPositionData
+
+poolId = 0xF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00F
+
+qSpacing0 = 0x0000000000000001
+qSpacing1 = 0x00000000000F00FF
+qSpacing2 = 0x0800000000000000
+
+positions = [
+    (3, 7, 1000),
+    (1, 12, 0xF00FF00FF00FF00F),
+    (5, 6, - 500),
+    (3, 7, - 1000),
+    (2, 9, 0x8FFFFFFFFFFFFFFF),
+    (7, 12, 1),
+]
+
+@pytest.fixture(autouse=True)
+def wrapper(fn_isolation):
+    return StorageWrapper.deploy({'from': accounts[0]})
+
+@pytest.mark.parametrize('qSpacing', [qSpacing0, qSpacing1, qSpacing2])
+@pytest.mark.parametrize('qAnchor', [0x0000000000000001, 0x3FFFFFFFFFFFFFFF])
+def test_modifySharesDelta(wrapper, qSpacing, qAnchor, request, worker_id):
+    logTest(request, worker_id)
+
+    index = LiquidityIndex(qSpacing, qAnchor)
+    remainder = qAnchor % qSpacing
+    remainder = remainder if remainder > 0 else qSpacing
+
+    # The index should track 'sharesDelta' and 'sharesGross' exactly as
+    # 'modifySharesDelta' does.
+    for nMin, nMax, shares in positions:
+        qMin = remainder + nMin * qSpacing
+        qMax = remainder + nMax * qSpacing
+        tx = wrapper._modifySharesDelta(
+            poolId,
+            twosComplement(index.sharesGross()),
+            shares,
+            index.sharesDelta(qMin),
+            index.sharesDelta(qMax),
+            qMin,
+            qMax,
+            qSpacing
+        )
+        sharesGrossNew, sharesDeltaMinNew, sharesDeltaMaxNew = tx.return_value
+        index.modifyPosition(qMin, qMax, shares)
+        assert sharesGrossNew == twosComplement(index.sharesGross())
+        assert sharesDeltaMinNew == index.sharesDelta(qMin)
+        assert sharesDeltaMaxNew == index.sharesDelta(qMax)
+
+    # Active shares should match a direct sum over positions.
+    for n in range(0, 14):
+        q = remainder + n * qSpacing
+        active = sum([
+            shares for nMin, nMax, shares in positions if nMin <= n < nMax
+        ])
+        assert index.activeShares(q) == active
+        if qSpacing > 1:
+            assert index.activeShares(q + qSpacing - 1) == active
+
+    # Scans should partition the populated range.
+    segments = list(index.scan())
+    for (_, qUpper, _), (qLower, _, _) in zip(segments[:-1], segments[1:]):
+        assert qUpper == qLower
+    assert sum([
+        shares * (qUpper - qLower) // qSpacing for qLower, qUpper, shares in segments
+    ]) == index.sharesGross()
+
+# An empty index has no populated range to scan.
+def test_scanEmpty(request, worker_id):
+    logTest(request, worker_id)
+
+    index = LiquidityIndex(qSpacing1, 0x0000000000000001)
+    assert list(index.scan()) == []
+    assert list(index.scan(qMax=qSpacing1)) == []
+    assert list(index.scan(qSpacing1, 3 * qSpacing1)) == [(qSpacing1, 3 * qSpacing1, 0)]
+
+    # Once every position is burnt, the index is empty again.
+    index.modifyPosition(qSpacing1 + 1, 3 * qSpacing1 + 1, 7)
+    index.modifyPosition(qSpacing1 + 1, 3 * qSpacing1 + 1, - 7)
+    assert list(index.scan()) == []
+
+@pytest.mark.parametrize('qMin', [0x0000000000000001, 0x8FFFFFFFFFFFFFFF])
+@pytest.mark.parametrize('n', [1, 5])
+@pytest.mark.parametrize('shares', [1, - 1, 0xF00FF00FF00FF00FF00FF00FF00FF00F])
+def test_ingestEvent(qMin, n, shares, request, worker_id):
+    logTest(request, worker_id)
+
+    eventsWrapper = EventsWrapper.deploy({'from': accounts[0]})
+    qSpacing = 0x0000000000010000
+    qMax = qMin + n * qSpacing
+    logPriceMin = qMin - (1 << 63)
+    logPriceMax = qMax - (1 << 63)
+    amount0 = 0xF00F
+    amount1 = - 0xF00F
+
+    content = qMin.to_bytes(8, 'big') + qMax.to_bytes(8, 'big') + encode(
+        ['int256', 'int256', 'int256', 'int256', 'int256'],
+        [shares, logPriceMin, logPriceMax, amount0, amount1]
+    )
+    contentBytes = bytes(_modifyPositionInput_ - _hookSelector_) + content
+    assert len(contentBytes) == _endOfModifyPosition_ - _hookSelector_
+
+    tx = eventsWrapper._emitModifyPositionEvent(contentBytes)
+    event = tx.events['ModifyPosition']
+
+    assert decodeModifyPositionData(event['data']) == (qMin, qMax, shares, logPriceMin, logPriceMax, amount0, amount1)
+
+    index = LiquidityIndex(qSpacing, qMin)
+    index.ingestEvent(event)
+    assert index.sharesDelta(qMin) == shares
+    assert index.sharesDelta(qMax) == - shares
+    assert index.activeShares(qMin) == shares
+    assert index.activeShares(qMax) == 0
+    assert index.sharesGross() == n * shares
@@ -80,6 +80,7 @@ variables = [
     ['maxPoolGrowthPortion', 48, 'X47', 'getter', 'setter'],
     ['protocolGrowthPortion', 48, 'X47', 'getter', 'setter'],
     ['pendingKernelLength', 16, 'Index', 'getter', 'setter'],
+    ['qExpTable', 64, 'X59', 'getter', 'setter'],
     ['endOfStaticParams', 0],
 ]
 
@@ -342,5 +343,6 @@ for k in variables:
 # 2042 XXXXXX                                                                  maxPoolGrowthPortion                              48
 # 2048 XXXXXX                                                                  protocolGrowthPortion                             48
 # 2054 XX                                                                      pendingKernelLength                               16
+# 2056 XXXXXXXX                                                                qExpTable                                         64
 
-# 2056 endOfStaticParams
\ No newline at end of file
+# 2064 endOfStaticParams
\ No newline at end of file
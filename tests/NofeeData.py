@@ -0,0 +1,352 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+from functools import lru_cache
+from Nofee import X15, X64, addOffset, getBoundaries
+
+# The output of 'dataGeneration' is cached so that the test modules which are
+# collected by the same process share one copy. Hence, it should not be
+# modified by the callers.
+@lru_cache(maxsize=None)
+def dataGeneration(n):
+    logPriceTickX59 = 57643193118714
+
+    feeSpacingSmallX59 = 288302457773874 # 0.05% fee
+    feeSpacingMediumX59 = 1731981530143823 # 0.3% fee
+    feeSpacingLargeX59 = 5793624167011548 # 1.0% fee
+
+    logPriceSpacingSmallX59 = 10 * logPriceTickX59
+    logPriceSpacingMediumX59 = 60 * logPriceTickX59
+    logPriceSpacingLargeX59 = 200 * logPriceTickX59
+
+    horizontalSteps = [0, 2**32, X64 - 2**32 - 1]
+    verticalSteps = [0, 1, X15 // 2, X15 - 1, X15]
+    prices = addOffset([
+        0,
+        -1, +1,
+        # -feeSpacingSmallX59, +feeSpacingSmallX59,
+        -logPriceSpacingSmallX59, +logPriceSpacingSmallX59,
+        -logPriceSpacingLargeX59, +logPriceSpacingLargeX59
+        # -feeSpacingSmallX59,
+        # +logPriceSpacingLargeX59
+    ])
+
+    # A list of valid kernels of various sizes and shapes to be used for testing
+    kernelsValid = [
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [1*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [1*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [1*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [1*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [1*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 5*X15 // 8], 
+            [6*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 0*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 0*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 0*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 0*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 8*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 0*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [6*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 0*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [6*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 0*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [6*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [7*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [8*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 0*X15 // 8], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 0*X15 // 8], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [6*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 5*X15 // 8], 
+            [6*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [1*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 5*X15 // 8], 
+            [6*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [1*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 5*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 6*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 6*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 8*X15 // 8]
+        ],
+        [
+            [0, 0], 
+            [1*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [2*logPriceSpacingSmallX59, 1*X15 // 8], 
+            [3*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [4*logPriceSpacingSmallX59, 2*X15 // 8], 
+            [5*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [6*logPriceSpacingSmallX59, 3*X15 // 8], 
+            [7*logPriceSpacingSmallX59, 4*X15 // 8], 
+            [9*logPriceSpacingSmallX59, 8*X15 // 8]
+        ]
+    ]
+
+    for horizontalStep1X59 in horizontalSteps:
+        for verticalStep1X15 in verticalSteps:
+            valid1 = (horizontalStep1X59 != 0)
+            if valid1 and horizontalStep1X59 >= 2 ** 40:
+                kernel1 = [[0, 0], [horizontalStep1X59, verticalStep1X15]]
+                if verticalStep1X15 == X15:
+                    if kernel1 not in kernelsValid:
+                        kernelsValid += [kernel1]
+                for horizontalStep2X59 in horizontalSteps:
+                    for verticalStep2X15 in verticalSteps:
+                        valid2 = ((horizontalStep2X59 != 0) or (verticalStep2X15 != 0)) and \
+                            (verticalStep1X15 + verticalStep2X15 <= X15) and \
+                            ((verticalStep1X15 != 0) or (verticalStep2X15 != 0)) and \
+                            ((horizontalStep1X59 != 0) or (horizontalStep2X59 != 0)) and \
+                            (2 ** 40 <= horizontalStep1X59 + horizontalStep2X59 < X64 - 1)
+                        if valid2:
+                            kernel2 = [
+                                [0, 0], 
+                                [horizontalStep1X59, verticalStep1X15], 
+                                [horizontalStep1X59 + horizontalStep2X59, verticalStep1X15 + verticalStep2X15]
+                            ]
+                            if (verticalStep1X15 + verticalStep2X15 == X15) and (horizontalStep2X59 != 0):
+                                if kernel2 not in kernelsValid:
+                                    kernelsValid += [kernel2]
+                            for horizontalStep3X59 in horizontalSteps:
+                                for verticalStep3X15 in verticalSteps:
+                                    valid3 = ((horizontalStep3X59 != 0) or (verticalStep3X15 != 0)) and \
+                                        ((verticalStep2X15 != 0) or (verticalStep3X15 != 0)) and \
+                                        ((horizontalStep2X59 != 0) or (horizontalStep3X59 != 0)) and \
+                                        (2 ** 40 <= horizontalStep1X59 + horizontalStep2X59 + horizontalStep3X59 < X64 - 1)
+                                    if valid3:
+                                        kernel3 = [
+                                            [0, 0], 
+                                            [horizontalStep1X59, verticalStep1X15], 
+                                            [horizontalStep1X59 + horizontalStep2X59, verticalStep1X15 + verticalStep2X15], 
+                                            [horizontalStep1X59 + horizontalStep2X59 + horizontalStep3X59, verticalStep1X15 + verticalStep2X15 + verticalStep3X15]
+                                        ]
+                                        if (verticalStep1X15 + verticalStep2X15 + verticalStep3X15 == X15) and (horizontalStep3X59 != 0) and (horizontalStep1X59 + horizontalStep2X59 + horizontalStep3X59 >= 2 ** 40):
+                                            if kernel3 not in kernelsValid:
+                                                kernelsValid += [kernel3]
+
+    # A list of kernels that are not valid
+    kernelsInvalid = [[[0, 0]]]
+    for horizontalStep1X59 in horizontalSteps:
+        for verticalStep1X15 in verticalSteps:
+            kernel1 = [[0, 0], [horizontalStep1X59, verticalStep1X15]]
+            kernelsInvalid += [kernel1]
+            for horizontalStep2X59 in horizontalSteps:
+                for verticalStep2X15 in verticalSteps:
+                    kernel2 = [
+                        [0, 0], 
+                        [horizontalStep1X59, verticalStep1X15], 
+                        [horizontalStep1X59 + horizontalStep2X59, verticalStep1X15 + verticalStep2X15]
+                    ]
+                    kernelsInvalid += [kernel2]
+                    for horizontalStep3X59 in horizontalSteps:
+                        for verticalStep3X15 in verticalSteps:
+                            kernel3 = [
+                                [0, 0], 
+                                [horizontalStep1X59, verticalStep1X15], 
+                                [horizontalStep1X59 + horizontalStep2X59, verticalStep1X15 + verticalStep2X15], 
+                                [horizontalStep1X59 + horizontalStep2X59 + horizontalStep3X59, verticalStep1X15 + verticalStep2X15 + verticalStep3X15]
+                            ]
+                            kernelsInvalid += [kernel3]
+    kernelsInvalid = [kernel for kernel in kernelsInvalid if (
+        (kernel not in kernelsValid) and (kernel[-1][1] <= X15) and (kernel[-1][1] != kernel[-2][1] if len(kernel) > 1 else True)
+    )]
+
+    # A list of curves
+    curves = [[] for t in kernelsValid]
+    for i in range(len(kernelsValid)):
+        for price0X59 in prices:
+            for price1X59 in [price0X59 + kernelsValid[i][-1][0], price0X59 - kernelsValid[i][-1][0]]:
+                if price1X59 > 0 and price1X59 < X64:
+                    curve1 = [price0X59, price1X59]
+                    curves[i] += [curve1]
+                    for price2X59 in prices:
+                        if min(price0X59, price1X59) < price2X59 < max(price0X59, price1X59):
+                            curve2 = [price0X59, price1X59, price2X59]
+                            curves[i] += [curve2]
+                            for price3X59 in prices:
+                                if min(price1X59, price2X59) < price3X59 < max(price1X59, price2X59):
+                                    curve3 = [price0X59, price1X59, price2X59, price3X59]
+                                    curves[i] += [curve3]
+                                    for price4X59 in prices:
+                                        if min(price2X59, price3X59) < price4X59 < max(price2X59, price3X59):
+                                            curve4 = [price0X59, price1X59, price2X59, price3X59, price4X59]
+                                            curves[i] += [curve4]
+                                            for price5X59 in prices:
+                                                if min(price3X59, price4X59) < price5X59 < max(price3X59, price4X59):
+                                                    curve5 = [price0X59, price1X59, price2X59, price3X59, price4X59, price5X59]
+                                                    curves[i] += [curve5]
+                                                    for price6X59 in prices:
+                                                        if min(price4X59, price5X59) < price6X59 < max(price4X59, price5X59):
+                                                            curve6 = [price0X59, price1X59, price2X59, price3X59, price4X59, price5X59, price6X59]
+                                                            curves[i] += [curve6]
+                                                            for price7X59 in prices:
+                                                                if min(price5X59, price6X59) < price7X59 < max(price5X59, price6X59):
+                                                                    curve7 = [price0X59, price1X59, price2X59, price3X59, price4X59, price5X59, price6X59, price7X59]
+                                                                    curves[i] += [curve7]
+                                                                    for price8X59 in prices:
+                                                                        if min(price6X59, price7X59) < price8X59 < max(price6X59, price7X59):
+                                                                            curve8 = [price0X59, price1X59, price2X59, price3X59, price4X59, price5X59, price6X59, price7X59, price8X59]
+                                                                            curves[i] += [curve8]
+
+    initializations = dict()
+    initializations['kernel'] = []
+    initializations['curve'] = []
+    for k in range(min(n, len(kernelsValid))):
+        # if k % 20 == 0:
+        #     print('Data generation', k, 'out of', min(n, len(kernelsValid)))
+        kernel = kernelsValid[k]
+        for curve in curves[k]:
+            initializations['kernel'] = initializations['kernel'] + [kernel]
+            initializations['curve'] = initializations['curve'] + [curve]
+
+    swaps = dict()
+    swaps['kernel'] = []
+    swaps['curve'] = []
+    swaps['target'] = []
+    for k in range(min(n, len(kernelsValid))):
+        # if k % 20 == 0:
+        #     print('Data generation', k, 'out of', min(n, len(kernelsValid)))
+        kernel = kernelsValid[k]
+        for curve in curves[k]:
+            for targetX59 in prices:
+                qLowerX59, qUpperX59 = getBoundaries(curve)
+                if (targetX59 != curve[-1]) and (qLowerX59 < targetX59) and (targetX59 < qUpperX59):
+                    swaps['kernel'] = swaps['kernel'] + [kernel]
+                    swaps['curve'] = swaps['curve'] + [curve]
+                    swaps['target'] = swaps['target'] + [targetX59]
+
+    initializations['kernel'] = initializations['kernel'][0:100]
+    initializations['curve'] = initializations['curve'][0:100]
+    swaps['kernel'] = swaps['kernel'][0:100]
+    swaps['curve'] = swaps['curve'][0:100]
+    swaps['target'] = swaps['target'][0:100]
+
+    return initializations, swaps, kernelsValid, kernelsInvalid
@@ -0,0 +1,38 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import sys
+import subprocess
+import pytest
+from Nofee import logTest
+from ImportBenchmark import importTimes
+
+heavyModules = ['sympy', 'eth_abi', 'sha3', 'NofeeOracle', 'NofeeData']
+
+# Importing 'Nofee' should not load any of the heavy modules.
+def test_importNofee(request, worker_id):
+    logTest(request, worker_id)
+
+    times = importTimes('Nofee', os.path.dirname(os.path.abspath(__file__)))
+    assert 'Nofee' in times
+    for module in heavyModules:
+        assert module not in times
+    print()
+    print('import Nofee: ' + str(times['Nofee']) + 'us')
+
+# The heavy modules are loaded on first access.
+@pytest.mark.parametrize('name, module', [
+    ['encode', 'eth_abi'],
+    ['dataGeneration', 'NofeeData'],
+    ['outgoing', 'NofeeOracle'],
+    ['encodeKernel', 'NofeeOracle']
+])
+def test_lazyNames(name, module, request, worker_id):
+    logTest(request, worker_id)
+
+    modules = subprocess.run(
+        [sys.executable, '-c', 'import sys, Nofee; Nofee.' + name + '; print(" ".join(sys.modules))'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True
+    ).stdout.split()
+    assert module in modules
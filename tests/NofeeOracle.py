@@ -0,0 +1,179 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+from sympy import Integer, Symbol, Piecewise, And, floor, piecewise_fold, exp, N
+from Nofee import X15, X59, X60, X63, X216, X256, getStorageAddress, getKernelHash
+
+# The symbolic reference model which is loaded by 'Nofee.py' on first access.
+
+# The address of the kernel storage contract which is shared among all pools
+# of 'nofeeswap' whose kernel is equal to 'kernel'.
+def getKernelStorageAddress(nofeeswap, kernel):
+    kernelBytes = b''.join([int(value).to_bytes(32, 'big') for value in encodeKernel(kernel)])
+    return getStorageAddress(nofeeswap, getKernelHash(kernelBytes))
+
+def toRational(input):
+    if type(input) is list:
+        return [(value - X63) / Integer(X59) for value in input]
+    else:
+        return (input - X63) / Integer(X59)
+
+def encodeKernel(kernel):
+    k = 0
+    for point in kernel[1:]:
+        k <<= 16
+        k += point[1]
+        k <<= 64
+        k += point[0]
+        k <<= 216
+        k += floor(X216 * exp(- Integer(point[0]) / X60))
+        k <<= 216
+        k += floor(X216 * exp(- 16 + Integer(point[0]) / X60))
+
+    l = 2 * (len(kernel) - 1)
+
+    result = [0] * l
+    while l != 0:
+        l -= 1
+        result[l] = k % X256
+        k //= X256
+
+    return result
+
+def getFunctionFromKernel(kernel):
+    h = Symbol('h', real = True)
+    args = []
+    for k in range(len(kernel) - 1):
+        c0 = Integer(kernel[k][1]) / X15
+        c1 = Integer(kernel[k+1][1]) / X15
+        b0 = Integer(kernel[k][0]) / X59
+        b1 = Integer(kernel[k+1][0]) / X59
+        if b1 != b0:
+            args = args + [(
+                c0 + ((c1 - c0) * (h - b0) / (b1 - b0)),
+                And(b0 < h, h < b1)
+            )]
+    args = args + [(0, h < 0), (0, (Integer(kernel[-1][0]) / X59) < h), (0, True)]
+    return Piecewise(*args), h
+
+def getFunctionFromCurve(curve, kernel):
+    zKernel, h = getFunctionFromKernel(kernel)
+    args = []
+    for k in range(len(curve), 1, -1):
+        point0 = (curve[min(k, len(curve) - 1)] - X63) / Integer(X59)
+        point1 = (curve[k - 1] - X63) / Integer(X59)
+        point2 = (curve[k - 2] - X63) / Integer(X59)
+        if point2 > point0:
+            args = args + [(zKernel.subs(h, h - point1), And(point0 < h, h < point2))]
+        else:
+            args = args + [(zKernel.subs(h, point1 - h), And(point2 < h, h < point0))]
+    point1 = min((curve[0] - X63) / Integer(X59), (curve[1] - X63) / Integer(X59))
+    point2 = max((curve[0] - X63) / Integer(X59), (curve[1] - X63) / Integer(X59))
+    args = args + [(0, h < point1), (0, point2 < h), (0, True)]
+    return Piecewise(*args), h
+
+def outgoing(curve, kernel, qMinX59, qMaxX59):
+    if qMinX59 == qMaxX59:
+        return Integer(0)
+    
+    integral = 0
+    h = Symbol('h', real = True)
+
+    if curve[-1] <= qMinX59:
+        for kk in range(len(curve), 1, -1):
+            point0 = curve[min(kk, len(curve) - 1)]
+            point1 = curve[kk - 1]
+            point2 = curve[kk - 2]
+            if point0 < point2:
+                begin = max(qMinX59, point0)
+                end = min(qMaxX59, point2)
+                if begin < end:
+                    for ii in range(len(kernel) - 1):
+                        c0 = Integer(kernel[ii][1]) / X15
+                        c1 = Integer(kernel[ii + 1][1]) / X15
+                        b0 = point1 + kernel[ii][0]
+                        b1 = point1 + kernel[ii + 1][0]
+                        limit0 = max(b0, begin)
+                        limit1 = min(b1, end)
+                        if limit0 < limit1:
+                            f = ((c0 + ((c1 - c0) * (h - toRational(b0)) / (toRational(b1) - toRational(b0)))) * exp(- h / 2)).integrate(h)
+                            integral += N(X216 * exp(-8) * (f.subs(h, toRational(limit1)) - f.subs(h, toRational(limit0))) / 2, 200)
+        return floor(integral)
+    
+    if qMaxX59 <= curve[-1]:
+        for kk in range(len(curve), 1, -1):
+            point0 = curve[min(kk, len(curve) - 1)]
+            point1 = curve[kk - 1]
+            point2 = curve[kk - 2]
+            if point2 < point0:
+                begin = min(qMaxX59, point0)
+                end = max(qMinX59, point2)
+                if end < begin:
+                    for ii in range(len(kernel) - 1):
+                        c0 = Integer(kernel[ii][1]) / X15
+                        c1 = Integer(kernel[ii + 1][1]) / X15
+                        b0 = point1 - kernel[ii][0]
+                        b1 = point1 - kernel[ii + 1][0]
+                        limit0 = max(b1, end)
+                        limit1 = min(b0, begin)
+                        if limit0 < limit1:
+                            f = ((c0 + ((c1 - c0) * (h - toRational(b0)) / (toRational(b1) - toRational(b0)))) * exp(+ h / 2)).integrate(h)
+                            integral += N(X216 * exp(-8) * (f.subs(h, toRational(limit1)) - f.subs(h, toRational(limit0))) / 2, 200)
+        return floor(integral)
+
+def incoming(curve, kernel, qMinX59, qMaxX59):
+    if qMinX59 == qMaxX59:
+        return Integer(0)
+    
+    integral = 0
+    h = Symbol('h', real = True)
+
+    if curve[-1] <= qMinX59:
+        for kk in range(len(curve), 1, -1):
+            point0 = curve[min(kk, len(curve) - 1)]
+            point1 = curve[kk - 1]
+            point2 = curve[kk - 2]
+            if point0 < point2:
+                begin = max(qMinX59, point0)
+                end = min(qMaxX59, point2)
+                if begin < end:
+                    for ii in range(len(kernel) - 1):
+                        c0 = Integer(kernel[ii][1]) / X15
+                        c1 = Integer(kernel[ii + 1][1]) / X15
+                        b0 = point1 + kernel[ii][0]
+                        b1 = point1 + kernel[ii + 1][0]
+                        limit0 = max(b0, begin)
+                        limit1 = min(b1, end)
+                        if limit0 < limit1:
+                            f = ((c0 + ((c1 - c0) * (h - toRational(b0)) / (toRational(b1) - toRational(b0)))) * exp(+ h / 2)).integrate(h)
+                            integral += N(X216 * exp(-8) * (f.subs(h, toRational(limit1)) - f.subs(h, toRational(limit0))) / 2, 200)
+        return floor(integral)
+    
+    if qMaxX59 <= curve[-1]:
+        for kk in range(len(curve), 1, -1):
+            point0 = curve[min(kk, len(curve) - 1)]
+            point1 = curve[kk - 1]
+            point2 = curve[kk - 2]
+            if point2 < point0:
+                begin = min(qMaxX59, point0)
+                end = max(qMinX59, point2)
+                if end < begin:
+                    for ii in range(len(kernel) - 1):
+                        c0 = Integer(kernel[ii][1]) / X15
+                        c1 = Integer(kernel[ii + 1][1]) / X15
+                        b0 = point1 - kernel[ii][0]
+                        b1 = point1 - kernel[ii + 1][0]
+                        limit0 = max(b1, end)
+                        limit1 = min(b0, begin)
+                        if limit0 < limit1:
+                            f = ((c0 + ((c1 - c0) * (h - toRational(b0)) / (toRational(b1) - toRational(b0)))) * exp(- h / 2)).integrate(h)
+                            integral += N(X216 * exp(-8) * (f.subs(h, toRational(limit1)) - f.subs(h, toRational(limit0))) / 2, 200)
+        return floor(integral)
+
+def getMaxIntegrals(kernel):
+    lower = 1
+    upper = kernel[-1][0] + 1
+    zKernel, hKernel = getFunctionFromKernel(kernel)
+    zOutgoing = piecewise_fold(zKernel.subs(hKernel, hKernel - (Integer(lower - (2 ** 63)) / (2 ** 59))) * exp(- hKernel / 2), evaluate = True)._eval_integral(hKernel)
+    outgoingMax = floor(N((2 ** 216) * exp(-8) * exp(+ Integer(lower - (2 ** 63)) / (2 ** 60)) * (zOutgoing.subs(hKernel, Integer(upper - 2 ** 63) / (2 ** 59)) - zOutgoing.subs(hKernel, Integer(lower - 2 ** 63) / (2 ** 59))) / 2, 100))
+    zIncoming = piecewise_fold(zKernel.subs(hKernel, hKernel - (Integer(lower - (2 ** 63)) / (2 ** 59))) * exp(+ hKernel / 2), evaluate = True)._eval_integral(hKernel)
+    incomingMax = floor(N((2 ** 216) * exp(-8) * exp(- Integer(upper - (2 ** 63)) / (2 ** 60)) * (zIncoming.subs(hKernel, Integer(upper - 2 ** 63) / (2 ** 59)) - zIncoming.subs(hKernel, Integer(lower - 2 ** 63) / (2 ** 59))) / 2, 100))
+    return outgoingMax, incomingMax
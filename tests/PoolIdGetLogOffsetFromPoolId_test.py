@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, PoolIdWrapper
+from brownie import PoolIdWrapper
 from Nofee import logTest, address0, toInt, twosComplementInt8
 
 address1 = '0x0000000000000000000000000000000000000001'
@@ -14,11 +14,11 @@ value3 = 0x8FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
 value4 = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return PoolIdWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(PoolIdWrapper)
 
 @pytest.mark.parametrize('offset', range(-89, 90, 5))
-@pytest.mark.parametrize('hook', [address0])
+@pytest.mark.parametrize('hook', [address0, address1, address2, address3])
 @pytest.mark.parametrize('value', [value0, value1, value2, value3])
 def test_getLogOffsetFromPoolId(wrapper, offset, hook, value, request, worker_id):
     logTest(request, worker_id)
@@ -18,7 +18,7 @@ def wrapper(fn_isolation):
     return PoolIdWrapper.deploy({'from': accounts[0]})
 
 @pytest.mark.parametrize('offset', range(-89, 90, 5))
-@pytest.mark.parametrize('hook', [address0])
+@pytest.mark.parametrize('hook', [address0, address1, address2, address3])
 @pytest.mark.parametrize('value', [value0, value1, value2, value3])
 def test_verifyPoolId(wrapper, offset, hook, value, request, worker_id):
     logTest(request, worker_id)
@@ -0,0 +1,309 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import pytest
+import brownie
+from brownie import accounts, Access, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockOperator, MockSwapper, DeployerHelper
+from brownie.test import strategy
+from brownie.exceptions import VirtualMachineError
+from hypothesis.database import DirectoryBasedExampleDatabase
+from eth_abi import decode
+from Nofee import logTest, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeCurve, getPoolId, isMutableKernel, isMutablePoolGrowthPortion, isDonateAllowed
+from PositionValuation import PoolSnapshot, PositionValuation, positionTag, fromOffsetted, toOffsetted
+from UnlockSession import UnlockSession
+from PoolModel import LifecycleModel, collectPoolAmounts, collectProtocolAmounts, oneX23
+from CustomErrors import isError
+
+logOffset = -5
+spacing = 2 ** 56
+curve = [2 ** 62, 2 ** 62 + spacing, 2 ** 62 + (spacing // 2)]
+kernels = [
+  [[0, 0], [spacing, 2 ** 15]],
+  [[0, 0], [spacing // 2, 2 ** 14], [spacing, 2 ** 15]],
+  [[0, 0], [spacing // 4, 2 ** 13], [spacing, 2 ** 15]]
+]
+oneX47 = 2 ** 47
+growthPortions = [0, oneX47 // 5, oneX47 // 2, oneX47]
+
+# Pools have no hook. Hence, none of the least significant '17' flags are set.
+flags = isMutableKernel + isMutablePoolGrowthPortion + isDonateAllowed
+
+maxPools = 4
+
+# Every shard is an independent run of the state machine with its own
+# examples. Shards are distributed among the workers of 'pytest-xdist' and
+# failing examples are saved to a shared database. Hence, a failure found by
+# any shard is replayed first by every subsequent run until it is fixed.
+shards = int(os.environ.get('NOFEE_HYPOTHESIS_SHARDS', '4'))
+
+databasePath = os.path.join('testLogs', 'hypothesis')
+
+def protocol(maxPoolGrowthPortion, protocolGrowthPortion, owner):
+    return (maxPoolGrowthPortion << 208) + (protocolGrowthPortion << 160) + toInt(owner.address)
+
+@pytest.fixture(autouse=True)
+def deployment(fn_isolation):
+    root = accounts[0]
+    owner = accounts[1]
+    deployer = DeployerHelper.deploy(root, {'from': root})
+    delegatee = deployer.addressOf(1)
+    nofeeswap = deployer.addressOf(2)
+    deployer.create3(
+        1,
+        NofeeswapDelegatee.bytecode + encode(
+            ['address'],
+            [nofeeswap]
+        ).hex(),
+        {'from': root}
+    )
+    deployer.create3(
+        2,
+        Nofeeswap.bytecode + encode(
+            ['address', 'address'],
+            [delegatee, root.address]
+        ).hex(),
+        {'from': root}
+    )
+    delegatee = NofeeswapDelegatee.at(delegatee)
+    nofeeswap = Nofeeswap.at(nofeeswap)
+    access = Access.deploy({'from': root})
+    operator = MockOperator.deploy(nofeeswap, {'from': root})
+    swapper = MockSwapper.deploy(nofeeswap, {'from': root})
+
+    token0 = ERC20FixedSupply.deploy("ERC20_0", "ERC20_0", 2**120, owner, {'from': owner})
+    token1 = ERC20FixedSupply.deploy("ERC20_1", "ERC20_1", 2**120, owner, {'from': owner})
+    if toInt(token0.address) > toInt(token1.address):
+        token0, token1 = token1, token0
+
+    for spender in [operator, swapper]:
+        token0.approve(spender, 2**120, {'from': owner})
+        token1.approve(spender, 2**120, {'from': owner})
+
+    nofeeswap.dispatch(delegatee.modifyProtocol.encode_input(
+        protocol(oneX47 // 2, oneX47 // 5, root)
+    ), {'from': root})
+
+    return root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1
+
+# Pool actions are drawn at random and are executed against the deployment.
+# 'LifecycleModel' is the oracle for every token movement:
+#
+# - mints, burns and donations settle exactly the amounts of
+#   'PositionValuation' or else 'unlock' reverts with a nonzero transient
+#   balance,
+# - collections credit exactly the amounts of 'PoolModel', and
+# - swaps are not modelled. Each swap is checked to exchange one tag for the
+#   other and to move the current price towards the limit and its amounts are
+#   recorded. A swap may only revert if its amounts overflow.
+#
+# The invariants compare token, position and singleton balances with the
+# model and check that nofeeswap can pay every position, singleton balance
+# and accrued growth portion at once.
+class PoolLifecycle:
+    st_index = strategy('uint256')
+    st_kernel = strategy('uint256', max_value=len(kernels) - 1)
+    st_portion = strategy('uint256', max_value=len(growthPortions) - 1)
+    st_maxPortion = strategy('uint256', max_value=len(growthPortions) - 1)
+    st_offset = strategy('int256', min_value=-2, max_value=1)
+    st_width = strategy('uint256', min_value=1, max_value=3)
+    st_shares = strategy('int256', min_value=- 2 ** 60, max_value=2 ** 60)
+    st_donation = strategy('uint256', min_value=1, max_value=2 ** 50)
+    st_amount = strategy('int256', min_value=- 2 ** 96, max_value=2 ** 96)
+    st_limit = strategy('uint256', max_value=48)
+
+    def __init__(cls, deployment):
+        cls.root, cls.owner, cls.nofeeswap, cls.delegatee, cls.access, cls.operator, cls.swapper, cls.token0, cls.token1 = deployment
+        cls.tag0 = toInt(cls.token0.address)
+        cls.tag1 = toInt(cls.token1.address)
+
+    def setup(self):
+        self.model = LifecycleModel()
+        self.salt = 0
+        self.initialize(0, 0)
+        self.mint(self.model.poolIds()[0], 0, 1, 2 ** 60)
+
+    def getPoolId(self, index):
+        poolIds = self.model.poolIds()
+        return poolIds[index % len(poolIds)]
+
+    def initialize(self, kernelIndex, portionIndex):
+        unsaltedPoolId = (self.salt << 188) + (twosComplementInt8(logOffset) << 180) + flags
+        poolId = getPoolId(self.owner.address, unsaltedPoolId)
+        self.salt += 1
+        self.nofeeswap.dispatch(
+          self.delegatee.initialize.encode_input(
+              unsaltedPoolId,
+              self.tag0,
+              self.tag1,
+              growthPortions[portionIndex],
+              encodeKernelCompact(kernels[kernelIndex]),
+              encodeCurve(curve),
+              b""
+          ),
+          {'from': self.owner}
+        )
+        self.model.initialize(poolId, kernelIndex)
+
+    def modifyPosition(self, poolId, logPriceMin, logPriceMax, shares):
+        pool = PoolSnapshot.fromAccess(self.access, self.nofeeswap, poolId)
+        try:
+            amount0, amount1 = PositionValuation(pool).modifyPositionAmounts(
+                toOffsetted(poolId, logPriceMin),
+                toOffsetted(poolId, logPriceMax),
+                shares
+            )
+        except (ValueError, OverflowError):
+            return
+
+        session = UnlockSession(self.nofeeswap.address, self.operator.address)
+        tag0 = session.registerERC20(self.token0.address)
+        tag1 = session.registerERC20(self.token1.address)
+        session.modifyPosition(poolId, logPriceMin, logPriceMax, shares, b"", tag0, tag1, amount0, amount1)
+        session.settle(self.owner.address, self.owner.address, self.owner.address)
+        self.nofeeswap.unlock(self.operator, session.encode(), {'from': self.owner, 'value': session.value()})
+
+        tag = positionTag(poolId, logPriceMin, logPriceMax)
+        self.model.modifyPosition(poolId, tag, logPriceMin, logPriceMax, shares, amount0, amount1)
+
+    # Mints over 'width' intervals starting 'offset' intervals away from the
+    # current one.
+    def mint(self, poolId, offset, width, shares):
+        pool = PoolSnapshot.fromAccess(self.access, self.nofeeswap, poolId)
+        qMin = pool.qLower + offset * pool.qSpacing
+        qMax = qMin + width * pool.qSpacing
+        self.modifyPosition(poolId, fromOffsetted(poolId, qMin), fromOffsetted(poolId, qMax), shares)
+
+    def rule_initialize(self, st_kernel, st_portion):
+        if len(self.model.pools) < maxPools:
+            self.initialize(st_kernel, st_portion)
+
+    # Negative shares burn part of an existing position, if any.
+    def rule_modifyPosition(self, st_index, st_offset, st_width, st_shares):
+        poolId = self.getPoolId(st_index)
+        positions = self.model.pools[poolId].positions
+        if st_shares < 0 and len(positions) > 0:
+            tag = sorted(positions.keys())[st_index % len(positions)]
+            logPriceMin, logPriceMax = self.model.pools[poolId].ranges[tag]
+            self.modifyPosition(poolId, logPriceMin, logPriceMax, - min(- st_shares, positions[tag]))
+        else:
+            self.mint(poolId, st_offset, st_width, max(abs(st_shares), 1))
+
+    def rule_donate(self, st_index, st_donation):
+        poolId = self.getPoolId(st_index)
+        pool = PoolSnapshot.fromAccess(self.access, self.nofeeswap, poolId)
+        _, _, _, sharesTotal, _, _, _ = self.access._readDynamicParams(self.nofeeswap, poolId)
+        try:
+            amount0, amount1 = PositionValuation(pool).donateAmounts(st_donation)
+        except OverflowError:
+            return
+
+        session = UnlockSession(self.nofeeswap.address, self.operator.address)
+        tag0 = session.registerERC20(self.token0.address)
+        tag1 = session.registerERC20(self.token1.address)
+        session.donate(poolId, st_donation, b"", tag0, tag1, amount0, amount1)
+        session.settle(self.owner.address, self.owner.address, self.owner.address)
+        if sharesTotal == 0:
+            with brownie.reverts('CannotDonateToEmptyInterval: '):
+                self.nofeeswap.unlock(self.operator, session.encode(), {'from': self.owner, 'value': session.value()})
+            return
+        self.nofeeswap.unlock(self.operator, session.encode(), {'from': self.owner, 'value': session.value()})
+        self.model.donate(amount0, amount1)
+
+    # The limit is drawn within two intervals below and four intervals above
+    # the current interval with a resolution of an eighth of an interval.
+    def rule_swap(self, st_index, st_amount, st_limit):
+        poolId = self.getPoolId(st_index)
+        pool = PoolSnapshot.fromAccess(self.access, self.nofeeswap, poolId)
+        qLimit = pool.qLower + (st_limit - 16) * (pool.qSpacing // 8)
+        try:
+            tx = self.nofeeswap.unlock(
+                self.swapper,
+                encode(
+                    ['uint256', 'int256', 'int256', 'uint256', 'address', 'address'],
+                    [poolId, st_amount, fromOffsetted(poolId, qLimit), 2, self.token0.address, self.token1.address]
+                ),
+                {'from': self.owner}
+            )
+        except VirtualMachineError as error:
+            assert isError(
+                error,
+                'SafeInRangeAmountOverflow',
+                'SafeOutOfRangeAmountOverflow',
+                'AccruedGrowthPortionOverflow',
+                'GrowthOverflow'
+            )
+            return
+        _, amount0, amount1 = decode(['uint256', 'int256', 'int256'], bytes(tx.return_value))
+
+        assert amount0 * amount1 <= 0
+        _, _, logPriceCurrent, _, _, _, _ = self.access._readDynamicParams(self.nofeeswap, poolId)
+        assert min(pool.logPriceCurrent, qLimit) <= logPriceCurrent <= max(pool.logPriceCurrent, qLimit)
+        self.model.swap(amount0, amount1)
+
+    def rule_modifyKernel(self, st_index, st_kernel):
+        poolId = self.getPoolId(st_index)
+        self.nofeeswap.dispatch(
+            self.delegatee.modifyKernel.encode_input(poolId, encodeKernelCompact(kernels[st_kernel]), b""),
+            {'from': self.owner}
+        )
+        self.model.modifyKernel(poolId, st_kernel)
+
+    def rule_updateGrowthPortions(self, st_index, st_maxPortion, st_portion):
+        poolId = self.getPoolId(st_index)
+        self.nofeeswap.dispatch(self.delegatee.modifyProtocol.encode_input(
+            protocol(growthPortions[st_maxPortion], growthPortions[st_portion], self.root)
+        ), {'from': self.root})
+        self.nofeeswap.dispatch(self.delegatee.updateGrowthPortions.encode_input(poolId), {'from': self.owner})
+
+    def collect(self, poolId, method, amounts, recipient, ratio):
+        accruedParams = self.access._readAccruedParams(self.nofeeswap, poolId)
+        amount0, amount1, remaining0, remaining1 = amounts(*accruedParams)
+        balance0 = self.nofeeswap.balanceOf(recipient, self.tag0)
+        balance1 = self.nofeeswap.balanceOf(recipient, self.tag1)
+
+        tx = self.nofeeswap.dispatch(method.encode_input(poolId), {'from': self.owner})
+        assert tx.return_value == (amount0, amount1)
+        assert self.nofeeswap.balanceOf(recipient, self.tag0) == balance0 + amount0
+        assert self.nofeeswap.balanceOf(recipient, self.tag1) == balance1 + amount1
+        assert tuple(self.access._readAccruedParams(self.nofeeswap, poolId)) == (ratio, ratio, remaining0, remaining1)
+        self.model.collect(recipient.address, self.tag0, self.tag1, amount0, amount1)
+
+    def rule_collectPool(self, st_index):
+        self.collect(self.getPoolId(st_index), self.delegatee.collectPool, collectPoolAmounts, self.owner, 0)
+
+    def rule_collectProtocol(self, st_index):
+        self.collect(self.getPoolId(st_index), self.delegatee.collectProtocol, collectProtocolAmounts, self.root, oneX23)
+
+    def invariant_reserves(self):
+        assert self.token0.balanceOf(self.nofeeswap) == self.model.reserves[0]
+        assert self.token1.balanceOf(self.nofeeswap) == self.model.reserves[1]
+
+    def invariant_balances(self):
+        for pool in self.model.pools.values():
+            for tag, shares in pool.positions.items():
+                assert self.nofeeswap.balanceOf(self.owner, tag) == shares
+        for (owner, tag), amount in self.model.balances.items():
+            assert self.nofeeswap.balanceOf(owner, tag) == amount
+
+    def invariant_solvency(self):
+        owed0 = sum(amount for (_, tag), amount in self.model.balances.items() if tag == self.tag0)
+        owed1 = sum(amount for (_, tag), amount in self.model.balances.items() if tag == self.tag1)
+        for poolId, pool in self.model.pools.items():
+            valuation = PositionValuation(PoolSnapshot.fromAccess(self.access, self.nofeeswap, poolId))
+            for amount0, amount1 in valuation.valuateTags(pool.positions, pool.ranges).values():
+                owed0 += amount0
+                owed1 += amount1
+            _, _, accrued0, accrued1 = self.access._readAccruedParams(self.nofeeswap, poolId)
+            owed0 += accrued0
+            owed1 += accrued1
+        assert owed0 <= self.model.reserves[0]
+        assert owed1 <= self.model.reserves[1]
+
+@pytest.mark.parametrize('shard', range(shards))
+def test_poolLifecycle(deployment, state_machine, shard, request, worker_id):
+    logTest(request, worker_id)
+
+    state_machine(
+        PoolLifecycle,
+        deployment,
+        settings={'database': DirectoryBasedExampleDatabase(databasePath)}
+    )
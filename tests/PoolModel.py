@@ -0,0 +1,84 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+
+oneX23 = 2 ** 23
+
+# Mirrors the split of accrued growth portions in 'collectPool' and
+# 'collectProtocol' of 'NofeeswapDelegatee.sol'. 'accrued' is the integer
+# which is read via 'Access._readAccruedParams' and 'ratio' is the share of the
+# collector as an 'X23'. Returns the collected amount and the remaining
+# accrued integer.
+def collectAccrued(accrued, ratio):
+    product = (accrued << 127) * ratio >> 23
+    return product >> 127, ((accrued << 127) - product) >> 127
+
+def collectPoolAmounts(poolRatio0, poolRatio1, accrued0, accrued1):
+    amount0, remaining0 = collectAccrued(accrued0, poolRatio0)
+    amount1, remaining1 = collectAccrued(accrued1, poolRatio1)
+    return amount0, amount1, remaining0, remaining1
+
+def collectProtocolAmounts(poolRatio0, poolRatio1, accrued0, accrued1):
+    amount0, remaining0 = collectAccrued(accrued0, oneX23 - poolRatio0)
+    amount1, remaining1 = collectAccrued(accrued1, oneX23 - poolRatio1)
+    return amount0, amount1, remaining0, remaining1
+
+# The state of a single pool which is not readable from storage, i.e., the
+# ranges of its positions, or which is tracked in order to cross check
+# storage, i.e., position balances and kernels.
+class PoolModel:
+    def __init__(self, poolId, kernel):
+        self.poolId = poolId
+        self.kernel = kernel
+        self.pendingKernel = None
+        self.positions = dict()
+        self.ranges = dict()
+
+    def modifyPosition(self, tag, logPriceMin, logPriceMax, shares):
+        balance = self.positions.get(tag, 0) + shares
+        assert balance >= 0
+        if balance == 0:
+            del self.positions[tag]
+        else:
+            self.positions[tag] = balance
+        self.ranges[tag] = (logPriceMin, logPriceMax)
+
+# A model of everything that a sequence of pool actions does to the balances
+# of nofeeswap. 'reserves' are the token balances of nofeeswap and 'balances'
+# maps '(owner, tag)' to singleton balances, excluding position tags which are
+# tracked per pool.
+class LifecycleModel:
+    def __init__(self):
+        self.pools = dict()
+        self.reserves = [0, 0]
+        self.balances = dict()
+
+    def initialize(self, poolId, kernel):
+        self.pools[poolId] = PoolModel(poolId, kernel)
+
+    def poolIds(self):
+        return list(self.pools.keys())
+
+    # Positive amounts are paid to nofeeswap and negative amounts are taken.
+    def transfer(self, amount0, amount1):
+        self.reserves[0] += amount0
+        self.reserves[1] += amount1
+        assert self.reserves[0] >= 0
+        assert self.reserves[1] >= 0
+
+    def modifyPosition(self, poolId, tag, logPriceMin, logPriceMax, shares, amount0, amount1):
+        self.pools[poolId].modifyPosition(tag, logPriceMin, logPriceMax, shares)
+        self.transfer(amount0, amount1)
+
+    def donate(self, amount0, amount1):
+        self.transfer(amount0, amount1)
+
+    def swap(self, amount0, amount1):
+        self.transfer(amount0, amount1)
+
+    def modifyKernel(self, poolId, kernel):
+        self.pools[poolId].pendingKernel = kernel
+
+    # Collected amounts are credited to singleton balances and do not move any
+    # tokens.
+    def collect(self, owner, tag0, tag1, amount0, amount1):
+        self.balances[(owner, tag0)] = self.balances.get((owner, tag0), 0) + amount0
+        self.balances[(owner, tag1)] = self.balances.get((owner, tag1), 0) + amount1
@@ -0,0 +1,143 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import asyncio
+from eth_utils import to_checksum_address
+from Nofee import _staticParams_, _endOfStaticParams_, getStaticParamsStorageAddress
+from IntervalModel import height, log
+from ExpTable import getExpTable
+from SwapSimulator import PoolState, getDynamicParamsSlot, getCurveSlot, getGrowthMultiplierSlot, decodeDynamicParams, toHex, toBytes
+from AsyncRpc import AsyncJsonRpc
+
+# Reads snapshots of many pools concurrently through 'AsyncRpc.py', i.e.,
+#
+#   async with AsyncJsonRpc(endpoint) as rpc:
+#       snapshots = await PoolReader(rpc, nofeeswap).snapshots(poolIds)
+#
+# All snapshots are pinned to a single block. Each one is read in three
+# rounds of concurrent calls which are packed into JSON-RPC batches along with
+# the calls of every other pool:
+#
+#   1. the four dynamic parameters slots and the first 'curveWords' slots of
+#      the curve,
+#
+#   2. the remaining slots of the curve, if any, followed by the bytecode of
+#      the static parameters and the growth multipliers of 'curve[0 : 2]',
+#      i.e., the boundaries of the current interval,
+#
+#   3. the bytecode of the kernel.
+#
+# Pools with identical kernels share a kernel storage contract (see
+# 'Storage.sol'). Hence, the corresponding 'eth_getCode' calls are coalesced
+# by the client.
+
+# The offset of 'kernelStorageAddress' within the bytecode of a storage
+# contract of static parameters, i.e., after the '00' padding byte and the
+# static parameters.
+kernelReferenceOffset = 1 + (_endOfStaticParams_ - _staticParams_)
+
+# Each kernel breakpoint occupies '64' bytes of the kernel storage contract as
+# it does in memory, i.e., 2 bytes of 'height', 8 bytes of 'log' and 27 bytes
+# of each of 'sqrt' and 'sqrtInverse'.
+breakpointByteCount = 64
+
+def toAddress(value):
+    return to_checksum_address('0x' + format(value, '040x'))
+
+# Returns '(kernelStorageAddress, kernelLength)' given the bytecode of a
+# storage contract of static parameters.
+def decodeKernelReference(code):
+    reference = bytes(code)[kernelReferenceOffset : kernelReferenceOffset + 22]
+    return toAddress(int.from_bytes(reference[0 : 20], 'big')), int.from_bytes(reference[20 : 22], 'big')
+
+# Returns the list of '[logShift, height]' given the bytecode of a kernel
+# storage contract. The first breakpoint '[0, 0]' is implicit.
+def decodeKernel(code, kernelLength):
+    content = bytes(code)[1 : 1 + breakpointByteCount * (kernelLength - 1)]
+    kernel = [[0, 0]]
+    for k in range(0, len(content), breakpointByteCount):
+        breakpoint = int.from_bytes(content[k : k + breakpointByteCount], 'big')
+        kernel.append([log(breakpoint), height(breakpoint)])
+    return kernel
+
+# Appends the members of a curve slot to 'curve' and returns whether the curve
+# is complete, i.e., whether 'logPriceCurrent' or an empty member is reached.
+def appendCurveWord(curve, word, logPriceCurrent):
+    members = [(word >> shift) % (1 << 64) for shift in [192, 128, 64, 0]]
+    if logPriceCurrent in members:
+        curve += members[0 : members.index(logPriceCurrent) + 1]
+        return True
+    if 0 in members:
+        curve += [member for member in members if member != 0]
+        return True
+    curve += members
+    return False
+
+# The state of a pool as read by 'PoolReader', which may be given to
+# 'SwapSimulator.simulate' as is. In addition to 'PoolState', it records the
+# block, the kernel storage contract, the decoded kernel and the exp table.
+class PoolData(PoolState):
+    def __init__(self, poolId, block, dynamicParams, curve, growthMultipliers, staticParams, kernelStorageAddress, kernel):
+        super().__init__(poolId, dynamicParams, curve, growthMultipliers, staticParams)
+        self.block = block
+        self.kernelStorageAddress = kernelStorageAddress
+        self.kernel = kernel
+        self.expTable = getExpTable(staticParams)
+
+class PoolReader:
+    def __init__(self, rpc, nofeeswap, curveWords=1):
+        self.rpc = AsyncJsonRpc(rpc) if isinstance(rpc, str) else rpc
+        self.nofeeswap = to_checksum_address(nofeeswap)
+        self.curveWords = curveWords
+
+    async def _storage(self, slot, block):
+        return int(await self.rpc.call('eth_getStorageAt', [self.nofeeswap, toHex(slot)], block), 16)
+
+    async def _code(self, address, block):
+        return toBytes(await self.rpc.call('eth_getCode', [address], block))
+
+    async def snapshot(self, poolId, block):
+        slot = getDynamicParamsSlot(poolId)
+        curveSlot = getCurveSlot(poolId)
+        words = await asyncio.gather(
+            *[self._storage(slot + k, block) for k in range(-1, 3)],
+            *[self._storage(curveSlot + k, block) for k in range(self.curveWords)]
+        )
+        pointer, logPriceCurrent, sharesTotal, growth, integral0, integral1 = decodeDynamicParams(words[1 : 4])
+        extension = words[0] if pointer == 0xFFFF else pointer
+
+        curve = []
+        complete = False
+        for word in words[4:]:
+            complete = appendCurveWord(curve, word, logPriceCurrent)
+            if complete:
+                break
+        curveSlot += self.curveWords
+        while not complete:
+            complete = appendCurveWord(curve, await self._storage(curveSlot, block), logPriceCurrent)
+            curveSlot += 1
+
+        boundaries = curve[0 : 2]
+        staticParams, *growthMultipliers = await asyncio.gather(
+            self._code(toAddress(getStaticParamsStorageAddress(self.nofeeswap, poolId, extension)), block),
+            *[self._storage(getGrowthMultiplierSlot(poolId, q), block) for q in boundaries]
+        )
+
+        kernelStorageAddress, kernelLength = decodeKernelReference(staticParams)
+        kernel = decodeKernel(await self._code(kernelStorageAddress, block), kernelLength)
+
+        return PoolData(
+            poolId,
+            block,
+            (extension, logPriceCurrent, sharesTotal, growth, integral0, integral1),
+            curve,
+            dict(zip(boundaries, growthMultipliers)),
+            staticParams,
+            kernelStorageAddress,
+            kernel
+        )
+
+    # Returns the snapshots of 'poolIds' in the same order. If 'block' is not
+    # given, the latest block is used.
+    async def snapshots(self, poolIds, block=None):
+        if block is None:
+            block = await self.rpc.blockNumber()
+        return await asyncio.gather(*[self.snapshot(poolId, block) for poolId in poolIds])
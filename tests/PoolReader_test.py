@@ -0,0 +1,327 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import time
+import random
+import asyncio
+import pytest
+from eth_utils import to_checksum_address
+from Nofee import logTest, _staticParams_, _endOfStaticParams_, getStorageAddress, getKernelHash, getStaticParamsStorageAddress
+from IntervalModel import exp, packPrice
+from ExpTable import encodeExpTable
+from SwapSimulator import SwapSimulator, PoolState, JsonRpc
+from AsyncRpc import AsyncJsonRpc, RpcError
+from PoolReader import PoolReader, toAddress
+from RpcStandIn import RpcStandIn
+
+nofeeswap = to_checksum_address('0x' + 'ab' * 20)
+spacing = 2 ** 56
+kernels = [
+    [[0, 0], [spacing, 2 ** 15]],
+    [[0, 0], [spacing // 2, 2 ** 13], [spacing, 2 ** 15]],
+    [[0, 0], [spacing // 4, 2 ** 12], [spacing // 2, 2 ** 14], [spacing, 2 ** 15]],
+    [[0, 0], [spacing // 2, 0], [spacing // 2, 2 ** 15], [spacing, 2 ** 15]]
+]
+
+def encodeKernelCode(kernel):
+    kernelBytes = b''.join([
+        packPrice(logShift, *exp(logShift), height).to_bytes(64, 'big') for logShift, height in kernel[1:]
+    ])
+    return toAddress(getStorageAddress(nofeeswap, getKernelHash(kernelBytes))), b'\x00' + kernelBytes
+
+# Random pools whose kernels are drawn from 'kernels'. The curves span one to
+# three slots and some static parameters storage pointers overflow
+# 'type(uint16).max'. Every fifth pool hosts an exp table.
+def generatePools(count, seed=0):
+    generator = random.Random(seed)
+    pools = []
+    for k in range(count):
+        poolId = generator.getrandbits(256)
+        kernel = kernels[k % len(kernels)]
+        kernelStorageAddress, kernelCode = encodeKernelCode(kernel)
+        qLower = generator.randrange(2 ** 62, 2 ** 63, spacing)
+        curve = [qLower, qLower + spacing]
+        for _ in range(generator.randrange(0, 10)):
+            curve.append(generator.randrange(qLower + 1, qLower + spacing))
+        extension = generator.choice([generator.randrange(0, 0xFFFF), generator.randrange(0xFFFF, 2 ** 40)])
+        staticParams = b'\x00' + generator.randbytes(_endOfStaticParams_ - _staticParams_)
+        staticParams += bytes.fromhex(kernelStorageAddress[2:]) + len(kernel).to_bytes(2, 'big')
+        if k % 5 == 0:
+            staticParams += encodeExpTable(qLower, qLower + 4 * spacing, spacing)
+        state = PoolState(
+            poolId,
+            (
+                extension,
+                curve[-1],
+                generator.getrandbits(127),
+                generator.getrandbits(127) + 1,
+                generator.getrandbits(216),
+                generator.getrandbits(216)
+            ),
+            curve,
+            {q: generator.getrandbits(200) for q in curve[0 : 2]},
+            staticParams
+        )
+        pools.append((state, kernel, kernelStorageAddress, kernelCode))
+    return pools
+
+def populate(standIn, pools):
+    for state, kernel, kernelStorageAddress, kernelCode in pools:
+        standIn.setPool(nofeeswap, state, kernelStorageAddress, kernelCode)
+
+def checkSnapshot(snapshot, pool):
+    state, kernel, kernelStorageAddress, kernelCode = pool
+    assert snapshot.poolId == state.poolId
+    assert snapshot.dynamicParams == state.dynamicParams
+    assert snapshot.curve == state.curve
+    assert snapshot.growthMultipliers == state.growthMultipliers
+    assert snapshot.staticParams == state.staticParams
+    assert snapshot.kernelStorageAddress == kernelStorageAddress
+    assert snapshot.kernel == kernel
+    assert snapshot.expTable == state.staticParams[1 + (_endOfStaticParams_ - _staticParams_) + 22:]
+
+# A synchronous adapter which reads one slot at a time through 'JsonRpc',
+# i.e., the way pools are read through brownie's Web3 provider.
+class SequentialRpc:
+    def __init__(self, endpoint):
+        self.rpc = JsonRpc(endpoint)
+
+    async def call(self, method, params, block=None):
+        if block is not None:
+            params = list(params) + [hex(block)]
+        response = self.rpc.request(method, params)
+        if 'error' in response:
+            raise RpcError(response['error'])
+        return response['result']
+
+    async def blockNumber(self):
+        return int(await self.call('eth_blockNumber', []), 16)
+
+@pytest.fixture
+def standIn():
+    standIn = RpcStandIn()
+    populate(standIn, generatePools(64))
+    standIn.run()
+    yield standIn
+    standIn.shutdown()
+
+def test_snapshots(standIn, request, worker_id):
+    logTest(request, worker_id)
+
+    pools = generatePools(64)
+
+    async def read():
+        async with AsyncJsonRpc(standIn.endpoint) as rpc:
+            return await PoolReader(rpc, nofeeswap).snapshots([state.poolId for state, _, _, _ in pools])
+
+    snapshots = asyncio.run(read())
+    for snapshot, pool in zip(snapshots, pools):
+        assert snapshot.block == standIn.blockNumber
+        checkSnapshot(snapshot, pool)
+
+# The bytecode of static parameters is placed at the address which is derived
+# from the storage pointer of 'dynamicParams'. Hence, it may not be given
+# without the latter.
+def test_poolState(request, worker_id):
+    logTest(request, worker_id)
+
+    simulator = SwapSimulator('http://127.0.0.1:8545', nofeeswap, '0x00')
+    for state, _, _, _ in generatePools(8):
+        storageAddress = getStaticParamsStorageAddress(nofeeswap, state.poolId, state.dynamicParams[0])
+        overrides = simulator.overrides([state])
+        assert overrides[toAddress(storageAddress)] == {'code': '0x' + state.staticParams.hex()}
+        assert overrides[nofeeswap] == {'stateDiff': state.stateDiff()}
+
+        with pytest.raises(ValueError):
+            PoolState(state.poolId, staticParams=state.staticParams)
+
+        assert len(simulator.overrides([PoolState(state.poolId)])) == 1
+
+# No batch exceeds either limit and every call is answered.
+@pytest.mark.parametrize('maxBatchSize', [1, 7, 200])
+@pytest.mark.parametrize('maxBatchBytes', [300, 2000, 1 << 20])
+def test_batching(standIn, maxBatchSize, maxBatchBytes, request, worker_id):
+    logTest(request, worker_id)
+
+    pools = generatePools(64)
+
+    async def read():
+        async with AsyncJsonRpc(standIn.endpoint, maxBatchSize=maxBatchSize, maxBatchBytes=maxBatchBytes) as rpc:
+            snapshots = await PoolReader(rpc, nofeeswap).snapshots([state.poolId for state, _, _, _ in pools])
+            return snapshots, rpc.stats
+
+    snapshots, stats = asyncio.run(read())
+    for snapshot, pool in zip(snapshots, pools):
+        checkSnapshot(snapshot, pool)
+
+    assert max(standIn.batchSizes) <= maxBatchSize
+    # A single call which exceeds 'maxBatchBytes' is sent on its own.
+    assert all(size <= maxBatchBytes or count == 1 for size, count in zip(standIn.payloadSizes, standIn.batchSizes))
+    assert stats['batches'] == standIn.requests
+    assert stats['sent'] == standIn.calls
+    if maxBatchSize == 200 and maxBatchBytes == 1 << 20:
+        assert standIn.requests < len(pools)
+
+# Identical calls which are in flight at the same time are sent once.
+def test_coalescing(standIn, request, worker_id):
+    logTest(request, worker_id)
+
+    pools = generatePools(64)
+    state, _, _, _ = pools[0]
+
+    async def read():
+        async with AsyncJsonRpc(standIn.endpoint) as rpc:
+            block = await rpc.blockNumber()
+            reader = PoolReader(rpc, nofeeswap)
+            first = await asyncio.gather(*[reader.snapshot(state.poolId, block) for _ in range(50)])
+            stats = dict(rpc.stats)
+            standIn.reset()
+            second = await reader.snapshots([state.poolId for state, _, _, _ in pools], block)
+            return first, second, stats
+
+    first, second, stats = asyncio.run(read())
+    for snapshot in first:
+        checkSnapshot(snapshot, pools[0])
+    # Four slots of dynamic parameters, the slots of the curve, the bytecode
+    # of static parameters, two growth multipliers and the kernel.
+    callCount = 4 + (len(state.curve) + 3) // 4 + 1 + 2 + 1
+    assert stats['coalesced'] == 49 * callCount
+
+    # The first pool is served from cache and the kernel storage contracts
+    # are read once per distinct kernel.
+    for snapshot, pool in zip(second, pools):
+        checkSnapshot(snapshot, pool)
+    assert standIn.methods['eth_getCode'] == len(pools) - 1 + len(kernels) - 1
+
+# Responses are cached per block and only for the most recent 'cacheBlocks'.
+def test_cache(standIn, request, worker_id):
+    logTest(request, worker_id)
+
+    pools = generatePools(64)
+    poolIds = [state.poolId for state, _, _, _ in pools]
+
+    async def read():
+        async with AsyncJsonRpc(standIn.endpoint, cacheBlocks=2) as rpc:
+            reader = PoolReader(rpc, nofeeswap)
+            block = await rpc.blockNumber()
+            standIn.reset()
+            await reader.snapshots(poolIds, block)
+            calls = standIn.calls
+            assert calls > len(pools)
+
+            # The same block is served from cache.
+            snapshots = await reader.snapshots(poolIds, block)
+            assert standIn.calls == calls
+            for snapshot, pool in zip(snapshots, pools):
+                checkSnapshot(snapshot, pool)
+
+            # A new block is read from the node.
+            standIn.mine()
+            snapshots = await reader.snapshots(poolIds)
+            assert snapshots[0].block == block + 1
+            assert standIn.calls == 2 * calls + 1
+
+            standIn.mine()
+            await reader.snapshots(poolIds, block + 2)
+            assert list(rpc.cache.keys()) == [block + 1, block + 2]
+
+            # The first block has been evicted.
+            await reader.snapshots(poolIds, block)
+            assert standIn.calls == 4 * calls + 1
+
+    asyncio.run(read())
+
+# No more than 'poolSize' connections are opened and they are kept alive
+# across batches.
+@pytest.mark.parametrize('poolSize', [1, 3])
+def test_connectionPool(standIn, poolSize, request, worker_id):
+    logTest(request, worker_id)
+
+    standIn.latency = 0.002
+    pools = generatePools(64)
+
+    async def read():
+        async with AsyncJsonRpc(standIn.endpoint, poolSize=poolSize, maxBatchSize=10) as rpc:
+            snapshots = await PoolReader(rpc, nofeeswap).snapshots([state.poolId for state, _, _, _ in pools])
+            return snapshots, rpc.stats
+
+    snapshots, stats = asyncio.run(read())
+    for snapshot, pool in zip(snapshots, pools):
+        checkSnapshot(snapshot, pool)
+    assert stats['connections'] == standIn.connections
+    assert standIn.connections <= poolSize
+    assert standIn.maxOpenConnections <= poolSize
+    assert standIn.requests > 10 * standIn.connections
+
+# An error is raised for the failing calls of a batch only.
+def test_errors(standIn, request, worker_id):
+    logTest(request, worker_id)
+
+    async def read():
+        async with AsyncJsonRpc(standIn.endpoint) as rpc:
+            block = await rpc.blockNumber()
+            return await asyncio.gather(
+                rpc.call('eth_getCode', [nofeeswap], block),
+                rpc.call('eth_unsupported', []),
+                rpc.call('eth_getCode', [nofeeswap], block + 1),
+                return_exceptions=True
+            ), rpc.cache
+
+    (code, unsupported, ahead), cache = asyncio.run(read())
+    assert code == '0x'
+    assert isinstance(unsupported, RpcError)
+    assert unsupported.error['code'] == -32601
+    assert isinstance(ahead, RpcError)
+    assert str(ahead) == 'header not found'
+    assert standIn.batchSizes[-1] == 3
+    assert all(len(content) == 1 for content in cache.values())
+
+# Reads snapshots of 1000 pools from a node which is 'latency' seconds away.
+# The sequential baseline reads one slot at a time and is extrapolated from
+# its first 100 pools.
+@pytest.mark.parametrize('latency', [0, 0.001, 0.005])
+def test_throughput(latency, request, worker_id):
+    logTest(request, worker_id)
+
+    count = 1000
+    sampleCount = 100
+    pools = generatePools(count, 1)
+    poolIds = [state.poolId for state, _, _, _ in pools]
+
+    standIn = RpcStandIn(latency)
+    populate(standIn, pools)
+    endpoint = standIn.run()
+
+    async def concurrent():
+        async with AsyncJsonRpc(endpoint) as rpc:
+            start = time.time()
+            snapshots = await PoolReader(rpc, nofeeswap).snapshots(poolIds)
+            return snapshots, time.time() - start, rpc.stats
+
+    async def sequential():
+        reader = PoolReader(SequentialRpc(endpoint), nofeeswap)
+        block = await reader.rpc.blockNumber()
+        start = time.time()
+        snapshots = [await reader.snapshot(poolId, block) for poolId in poolIds[0 : sampleCount]]
+        return snapshots, (time.time() - start) * count / sampleCount
+
+    try:
+        snapshots, duration, stats = asyncio.run(concurrent())
+        batches = standIn.requests
+        calls = standIn.calls
+        standIn.reset()
+        baseline, sequentialDuration = asyncio.run(sequential())
+        sequentialCalls = standIn.calls * count // sampleCount
+    finally:
+        standIn.shutdown()
+
+    for snapshot, pool in zip(snapshots + baseline, pools + pools[0 : sampleCount]):
+        checkSnapshot(snapshot, pool)
+    assert duration < sequentialDuration
+
+    print()
+    print(
+        str(count) + ' pools, latency ' + str(int(latency * 1000)) + 'ms: ' +
+        'batched ' + '{:.2f}'.format(duration) + 's (' + str(calls) + ' calls in ' + str(batches) + ' batches, ' +
+        str(stats['coalesced'] + stats['cached']) + ' coalesced or cached, ' + '{:.0f}'.format(count / duration) + ' pools/s), ' +
+        'sequential (extrapolated) ' + '{:.2f}'.format(sequentialDuration) + 's (' + str(sequentialCalls) + ' calls, ' +
+        '{:.0f}'.format(count / sequentialDuration) + ' pools/s)'
+    )
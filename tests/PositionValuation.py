@@ -0,0 +1,412 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from Nofee import keccak
+from LiquidityIndex import decodeModifyPositionData
+
+X59 = 2**59
+X111 = 2**111
+X255 = 2**255
+X256 = 2**256
+
+# Position tags follow 'Tag.sol', i.e., 'keccak(poolId, logPriceMin, logPriceMax)'
+# where 'logPriceMin' and 'logPriceMax' are not offsetted.
+def positionTag(poolId, logPriceMin, logPriceMax):
+    return keccak(['uint256', 'int256', 'int256'], [poolId, logPriceMin, logPriceMax])
+
+# 'qMin := logPriceMin - (logOffset - 16) * (2 ** 59)' as in 'Calldata.sol'.
+def getShift(poolId):
+    logOffset = (poolId >> 180) % 256
+    logOffset = logOffset - 256 if logOffset >= 128 else logOffset
+    return (logOffset - 16) * X59
+
+def toOffsetted(poolId, logPrice):
+    return logPrice - getShift(poolId)
+
+def fromOffsetted(poolId, q):
+    return q + getShift(poolId)
+
+# The snapshot of a pool which is needed in order to value its positions. The
+# members are read via 'Access.sol'. 'reader' maps a spaced boundary to the
+# corresponding 'growthMultiplier' on storage.
+class PoolSnapshot:
+    def __init__(
+        self,
+        poolId,
+        qLower,
+        qUpper,
+        logPriceCurrent,
+        growth,
+        integral0,
+        integral1,
+        sqrtOffset,
+        sqrtInverseOffset,
+        outgoingMax,
+        reader
+    ):
+        self.poolId = poolId
+        self.qLower = qLower
+        self.qUpper = qUpper
+        self.qSpacing = qUpper - qLower
+        self.logPriceCurrent = logPriceCurrent
+        self.growth = growth
+        self.integral0 = integral0
+        self.integral1 = integral1
+        self.sqrtOffset = sqrtOffset
+        self.sqrtInverseOffset = sqrtInverseOffset
+        self.outgoingMax = outgoingMax
+        self.reader = reader
+
+    @classmethod
+    def fromAccess(cls, access, nofeeswap, poolId):
+        _, pointer, logPriceCurrent, _, growth, integral0, integral1 = access._readDynamicParams(nofeeswap, poolId)
+        curve = list(access._readCurve(nofeeswap, poolId, logPriceCurrent).return_value)
+        qLower = min(curve[0] >> 192, (curve[0] >> 128) % (1 << 64))
+        qUpper = max(curve[0] >> 192, (curve[0] >> 128) % (1 << 64))
+        _, _, sqrtOffset, sqrtInverseOffset, _, _ = access._readStaticParams0(nofeeswap, poolId, pointer)
+        outgoingMax, _, _, _, _, _, _ = access._readStaticParams1(nofeeswap, poolId, pointer)
+        return cls(
+            poolId,
+            qLower,
+            qUpper,
+            logPriceCurrent,
+            growth,
+            integral0,
+            integral1,
+            sqrtOffset,
+            sqrtInverseOffset,
+            outgoingMax,
+            lambda q: access._readGrowthMultiplier(nofeeswap, poolId, q)
+        )
+
+# Mirrors 'safeOutOfRangeAmount' in 'Amount.sol'.
+def safeOutOfRangeAmount(offset, multiplier, shares):
+    product = (offset << 48) * multiplier * abs(shares)
+    q0 = product % X256
+    q1 = (product >> 256) % X256
+    if product >> 512 != 0:
+        raise OverflowError('SafeOutOfRangeAmountOverflow: ' + str(offset) + ', ' + str(multiplier) + ', ' + str(shares))
+    if shares < 0:
+        if q1 >= X255:
+            raise OverflowError('SafeOutOfRangeAmountOverflow: ' + str(offset) + ', ' + str(multiplier) + ', ' + str(shares))
+        return - q1
+    if q0 > 0:
+        if q1 >= X255 - 1:
+            raise OverflowError('SafeOutOfRangeAmountOverflow: ' + str(offset) + ', ' + str(multiplier) + ', ' + str(shares))
+        return q1 + 1
+    if q1 >= X255:
+        raise OverflowError('SafeOutOfRangeAmountOverflow: ' + str(offset) + ', ' + str(multiplier) + ', ' + str(shares))
+    return q1
+
+# Mirrors 'safeInRangeAmount' in 'Amount.sol'.
+def safeInRangeAmount(offset, integral, liquidity, outgoingMax, roundUp):
+    numerator = offset * integral * abs(liquidity)
+    denominator = outgoingMax * X111
+    if roundUp == (liquidity >= 0):
+        result = - ((- numerator) // denominator)
+    else:
+        result = numerator // denominator
+    if result >= X255:
+        raise OverflowError('SafeInRangeAmountOverflow: ' + str(offset) + ', ' + str(integral) + ', ' + str(liquidity))
+    return - result if liquidity < 0 else result
+
+# Mirrors the '&' operator of 'X127'.
+def safeAdd(value0, value1):
+    result = value0 + value1
+    if not (- X255 <= result < X255):
+        raise OverflowError('SafeAddFailed: ' + str(value0) + ', ' + str(value1))
+    return result
+
+def toIntegerRoundUp(value):
+    return - ((- value) >> 127)
+
+# The following functions mirror the above on numpy object arrays whose
+# entries are python integers, one lane per position, as in
+# 'GrowthAccrual.py'. Each returns the outputs along with a boolean mask of
+# the lanes that overflow.
+
+def safeOutOfRangeAmounts(offset, multiplier, shares):
+    product = (offset << 48) * multiplier * numpy.abs(shares)
+    q0 = product % X256
+    q1 = (product >> 256) % X256
+    negative = (shares < 0).astype(bool)
+    roundUp = (~negative) & (q0 > 0).astype(bool)
+    overflow = (product >> 512 != 0).astype(bool)
+    overflow |= roundUp & (q1 >= X255 - 1).astype(bool)
+    overflow |= (~roundUp) & (q1 >= X255).astype(bool)
+    return numpy.where(negative, - q1, numpy.where(roundUp, q1 + 1, q1)), overflow
+
+def safeInRangeAmounts(offset, integral, liquidity, outgoingMax, roundUp):
+    numerator = offset * integral * numpy.abs(liquidity)
+    denominator = outgoingMax * X111
+    negative = (liquidity < 0).astype(bool)
+    up = - ((- numerator) // denominator)
+    down = numerator // denominator
+    result = numpy.where(negative, down, up) if roundUp else numpy.where(negative, up, down)
+    return numpy.where(negative, - result, result), (result >= X255).astype(bool)
+
+def safeAdds(value0, value1):
+    result = value0 + value1
+    return result, ((result >= X255) | (result < - X255)).astype(bool)
+
+# Values liquidity positions of a single pool in batches.
+#
+# Growth multipliers are cached per boundary. Hence, valuing 'n' positions
+# over 'm' distinct boundaries costs 'm' storage reads rather than '2 * n'.
+class PositionValuation:
+    def __init__(self, pool):
+        self.pool = pool
+        self.multipliers = dict()
+
+    def prefetch(self, boundaries):
+        for q in boundaries:
+            if q not in self.multipliers:
+                self.multipliers[q] = self.pool.reader(q)
+
+    def growthMultiplier(self, q):
+        if q not in self.multipliers:
+            self.multipliers[q] = self.pool.reader(q)
+        return self.multipliers[q]
+
+    def _boundaries(self, qMin, qMax):
+        pool = self.pool
+        if pool.qUpper <= qMin or qMax <= pool.qLower:
+            return [qMin, qMax]
+        return [qMin, qMax, pool.qLower, pool.qUpper]
+
+    def _validate(self, qMin, qMax):
+        pool = self.pool
+        if (qMin - pool.qUpper) % pool.qSpacing != 0:
+            raise ValueError('LogPriceMinIsNotSpaced: ' + str(qMin))
+        if (qMax - pool.qUpper) % pool.qSpacing != 0:
+            raise ValueError('LogPriceMaxIsNotSpaced: ' + str(qMax))
+        if qMin >= qMax:
+            raise ValueError('LogPricesOutOfOrder: ' + str(qMin) + ', ' + str(qMax))
+
+    # Returns the amounts of 'tag0' and 'tag1' which 'modifyPosition' would
+    # return for the offsetted range '[qMin, qMax]' and the given 'shares'.
+    # The two outputs are identical to 'amount0' and 'amount1' in
+    # 'NofeeswapDelegatee.modifyPosition'.
+    def modifyPositionAmounts(self, qMin, qMax, shares):
+        pool = self.pool
+        self._validate(qMin, qMax)
+        amount0 = 0
+        amount1 = 0
+        if pool.qUpper <= qMin:
+            amount0 = toIntegerRoundUp(safeOutOfRangeAmount(
+                pool.sqrtInverseOffset,
+                self.growthMultiplier(qMin) - self.growthMultiplier(qMax),
+                shares
+            ))
+        elif qMax <= pool.qLower:
+            amount1 = toIntegerRoundUp(safeOutOfRangeAmount(
+                pool.sqrtOffset,
+                self.growthMultiplier(qMax) - self.growthMultiplier(qMin),
+                shares
+            ))
+        else:
+            liquidity = pool.growth * shares
+
+            amount0Inside = 0
+            if pool.logPriceCurrent != pool.qUpper:
+                amount0Inside = safeInRangeAmount(
+                    pool.sqrtInverseOffset,
+                    pool.integral0,
+                    liquidity,
+                    pool.outgoingMax,
+                    True
+                )
+            amount0Outside = safeOutOfRangeAmount(
+                pool.sqrtInverseOffset,
+                self.growthMultiplier(pool.qUpper) - self.growthMultiplier(qMax),
+                shares
+            )
+            amount0 = toIntegerRoundUp(safeAdd(amount0Inside, amount0Outside))
+
+            amount1Inside = 0
+            if pool.logPriceCurrent != pool.qLower:
+                amount1Inside = safeInRangeAmount(
+                    pool.sqrtOffset,
+                    pool.integral1,
+                    liquidity,
+                    pool.outgoingMax,
+                    True
+                )
+            amount1Outside = safeOutOfRangeAmount(
+                pool.sqrtOffset,
+                self.growthMultiplier(pool.qLower) - self.growthMultiplier(qMin),
+                shares
+            )
+            amount1 = toIntegerRoundUp(safeAdd(amount1Inside, amount1Outside))
+        return amount0, amount1
+
+    # Returns the amounts of 'tag0' and 'tag1' which 'donate' would return for
+    # the given 'shares', i.e., the in-range part of a mint over the current
+    # interval.
+    def donateAmounts(self, shares):
+        pool = self.pool
+        liquidity = pool.growth * shares
+        amount0 = 0
+        if pool.logPriceCurrent != pool.qUpper:
+            amount0 = toIntegerRoundUp(safeInRangeAmount(
+                pool.sqrtInverseOffset,
+                pool.integral0,
+                liquidity,
+                pool.outgoingMax,
+                True
+            ))
+        amount1 = 0
+        if pool.logPriceCurrent != pool.qLower:
+            amount1 = toIntegerRoundUp(safeInRangeAmount(
+                pool.sqrtOffset,
+                pool.integral1,
+                liquidity,
+                pool.outgoingMax,
+                True
+            ))
+        return amount0, amount1
+
+    # Values a batch of positions. 'logPricesMin', 'logPricesMax' and
+    # 'balances' are equal length sequences (lists or numpy arrays) where
+    # 'logPricesMin' and 'logPricesMax' are not offsetted. The output is the
+    # amounts of 'tag0' and 'tag1' to be received if each balance is burned.
+    #
+    # The amounts of all positions are evaluated at once on numpy object
+    # arrays with the same rounding as 'modifyPositionAmounts'. If any
+    # position is invalid or overflows, the first one is given to
+    # 'modifyPositionAmounts' which raises the corresponding error.
+    def valuate(self, logPricesMin, logPricesMax, balances):
+        assert numpy is not None, 'numpy is required for batch valuation.'
+        pool = self.pool
+        shift = getShift(pool.poolId)
+        n = len(balances)
+        qMins = numpy.empty(n, dtype=object)
+        qMaxs = numpy.empty(n, dtype=object)
+        shares = numpy.empty(n, dtype=object)
+        qMins[:] = [int(logPrice) - shift for logPrice in logPricesMin]
+        qMaxs[:] = [int(logPrice) - shift for logPrice in logPricesMax]
+        shares[:] = [- int(balance) for balance in balances]
+        if n == 0:
+            return [], []
+
+        def fail(failed):
+            k = int(numpy.flatnonzero(failed)[0])
+            self.modifyPositionAmounts(qMins[k], qMaxs[k], shares[k])
+            raise AssertionError('batch valuation diverged at position ' + str(k))
+
+        invalid = ((qMins - pool.qUpper) % pool.qSpacing != 0).astype(bool)
+        invalid |= ((qMaxs - pool.qUpper) % pool.qSpacing != 0).astype(bool)
+        invalid |= (qMins >= qMaxs).astype(bool)
+        if invalid.any():
+            fail(invalid)
+
+        above = (pool.qUpper <= qMins).astype(bool)
+        below = (qMaxs <= pool.qLower).astype(bool)
+        inside = ~(above | below)
+
+        boundaries = set(qMins.tolist()) | set(qMaxs.tolist())
+        if inside.any():
+            boundaries.update([pool.qLower, pool.qUpper])
+        self.prefetch(sorted(boundaries))
+        multipliersMin = numpy.empty(n, dtype=object)
+        multipliersMax = numpy.empty(n, dtype=object)
+        multipliersMin[:] = [self.multipliers[q] for q in qMins]
+        multipliersMax[:] = [self.multipliers[q] for q in qMaxs]
+
+        # Lanes of the other two cases are zeroed so that they do not
+        # overflow.
+        def where(mask, values):
+            return numpy.where(mask, values, 0).astype(object)
+
+        # 'qUpper <= qMin'
+        outside0, overflow = safeOutOfRangeAmounts(
+            pool.sqrtInverseOffset,
+            where(above, multipliersMin - multipliersMax),
+            where(above, shares)
+        )
+        failed = overflow & above
+
+        # 'qMax <= qLower'
+        outside1, overflow = safeOutOfRangeAmounts(
+            pool.sqrtOffset,
+            where(below, multipliersMax - multipliersMin),
+            where(below, shares)
+        )
+        failed |= overflow & below
+
+        amounts0 = where(above, outside0)
+        amounts1 = where(below, outside1)
+
+        # 'qMin < qUpper' and 'qLower < qMax'
+        if inside.any():
+            liquidity = where(inside, pool.growth * shares)
+
+            amount0Inside = where(inside, 0)
+            if pool.logPriceCurrent != pool.qUpper:
+                amount0Inside, overflow = safeInRangeAmounts(
+                    pool.sqrtInverseOffset,
+                    pool.integral0,
+                    liquidity,
+                    pool.outgoingMax,
+                    True
+                )
+                failed |= overflow & inside
+            amount0Outside, overflow = safeOutOfRangeAmounts(
+                pool.sqrtInverseOffset,
+                where(inside, self.multipliers[pool.qUpper] - multipliersMax),
+                where(inside, shares)
+            )
+            failed |= overflow & inside
+            amount0, overflow = safeAdds(amount0Inside, amount0Outside)
+            failed |= overflow & inside
+
+            amount1Inside = where(inside, 0)
+            if pool.logPriceCurrent != pool.qLower:
+                amount1Inside, overflow = safeInRangeAmounts(
+                    pool.sqrtOffset,
+                    pool.integral1,
+                    liquidity,
+                    pool.outgoingMax,
+                    True
+                )
+                failed |= overflow & inside
+            amount1Outside, overflow = safeOutOfRangeAmounts(
+                pool.sqrtOffset,
+                where(inside, self.multipliers[pool.qLower] - multipliersMin),
+                where(inside, shares)
+            )
+            failed |= overflow & inside
+            amount1, overflow = safeAdds(amount1Inside, amount1Outside)
+            failed |= overflow & inside
+
+            amounts0 = numpy.where(inside, amount0, amounts0)
+            amounts1 = numpy.where(inside, amount1, amounts1)
+
+        if failed.any():
+            fail(failed)
+
+        amounts0 = - toIntegerRoundUp(amounts0)
+        amounts1 = - toIntegerRoundUp(amounts1)
+        return amounts0.tolist(), amounts1.tolist()
+
+    # 'positions' maps position tags to balances. 'ranges' maps position tags
+    # to '(logPriceMin, logPriceMax)' (see 'rangesFromEvents').
+    def valuateTags(self, positions, ranges):
+        tags = list(positions.keys())
+        amounts0, amounts1 = self.valuate(
+            [ranges[tag][0] for tag in tags],
+            [ranges[tag][1] for tag in tags],
+            [positions[tag] for tag in tags]
+        )
+        return {tag: (amount0, amount1) for tag, amount0, amount1 in zip(tags, amounts0, amounts1)}
+
+# Position tags are hashes. Hence, the ranges are recovered from
+# 'ModifyPosition' events.
+def rangesFromEvents(events):
+    ranges = dict()
+    for event in events:
+        _, _, _, logPriceMin, logPriceMax, _, _ = decodeModifyPositionData(event['data'])
+        ranges[positionTag(event['poolId'], logPriceMin, logPriceMax)] = (logPriceMin, logPriceMax)
+    return ranges
@@ -0,0 +1,123 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import AmountWrapper
+from Nofee import logTest, twosComplementInt8
+from PositionValuation import PoolSnapshot, PositionValuation, toOffsetted, fromOffsetted, toIntegerRoundUp
+
+qSpacing = 0x0000100000000000
+qLower = 0x8000000000000000
+qUpper = qLower + qSpacing
+
+growth = (1 << 111) + 0xF00FF00FF00FF00FF00FF00F
+integral0 = 0xF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00F
+integral1 = 0x0FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF0
+outgoingMax = 0x1FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF
+
+logOffset = -5
+poolId = (twosComplementInt8(logOffset) << 180) + 0xF00FF00FF00FF00FF00FF00FF00FF00FF00FF00F
+
+balances = [1, 0xF00FF00FF00FF00F, 0x7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF]
+
+# Ranges are expressed in terms of the number of spacings from 'qLower'.
+ranges = [(-4, -2), (-3, 0), (-1, 1), (-2, 3), (0, 1), (1, 2), (2, 5)]
+
+def defaultGrowthMultiplier(q):
+    # Growth multipliers decrease from left to right when 'q >= qUpper' and
+    # increase when 'q <= qLower'. Any monotone values are sufficient here.
+    return (1 << 220) - (q << 152) if q >= qUpper else (q << 152) + 0xF00FF00F
+
+def getOutgoingMaxModularInverse(outgoingMax):
+    value = outgoingMax
+    while value % 2 != 1:
+        value >>= 1
+    return pow(value, -1, 2**256)
+
+@pytest.fixture(autouse=True)
+def wrapper(deploy):
+    return deploy(AmountWrapper)
+
+@pytest.mark.parametrize('logPriceCurrent', [qLower, qLower + (qSpacing // 3), qUpper])
+@pytest.mark.parametrize('sqrtOffset', [(1 << 127) >> 3, (1 << 127) + 0xF00FF00F, (1 << 127) << 3])
+def test_valuate(wrapper, logPriceCurrent, sqrtOffset, request, worker_id):
+    logTest(request, worker_id)
+
+    sqrtInverseOffset = (2 ** 254) // sqrtOffset
+    outgoingMaxModularInverse = getOutgoingMaxModularInverse(outgoingMax)
+
+    reads = []
+    def reader(q):
+        reads.append(q)
+        return defaultGrowthMultiplier(q)
+
+    pool = PoolSnapshot(
+        poolId,
+        qLower,
+        qUpper,
+        logPriceCurrent,
+        growth,
+        integral0,
+        integral1,
+        sqrtOffset,
+        sqrtInverseOffset,
+        outgoingMax,
+        reader
+    )
+    valuation = PositionValuation(pool)
+
+    logPricesMin = []
+    logPricesMax = []
+    positionBalances = []
+    for nMin, nMax in ranges:
+        for balance in balances:
+            logPricesMin.append(fromOffsetted(poolId, qLower + nMin * qSpacing))
+            logPricesMax.append(fromOffsetted(poolId, qLower + nMax * qSpacing))
+            positionBalances.append(balance)
+
+    amounts0, amounts1 = valuation.valuate(logPricesMin, logPricesMax, positionBalances)
+
+    # Each distinct boundary should be read exactly once.
+    assert len(reads) == len(set(reads))
+    assert set(reads) == set(
+        [qLower + n * qSpacing for nMin, nMax in ranges for n in [nMin, nMax]] + [qLower, qUpper]
+    )
+
+    # The results should match the contract, one position at a time.
+    for logPriceMin, logPriceMax, balance, amount0, amount1 in zip(logPricesMin, logPricesMax, positionBalances, amounts0, amounts1):
+        qMin = toOffsetted(poolId, logPriceMin)
+        qMax = toOffsetted(poolId, logPriceMax)
+        shares = - balance
+        if qUpper <= qMin:
+            amount0Expected = toIntegerRoundUp(wrapper.safeOutOfRangeAmountWrapper(
+                sqrtOffset, sqrtInverseOffset, defaultGrowthMultiplier(qMin) - defaultGrowthMultiplier(qMax), shares, False
+            ).return_value)
+            amount1Expected = 0
+        elif qMax <= qLower:
+            amount0Expected = 0
+            amount1Expected = toIntegerRoundUp(wrapper.safeOutOfRangeAmountWrapper(
+                sqrtOffset, sqrtInverseOffset, defaultGrowthMultiplier(qMax) - defaultGrowthMultiplier(qMin), shares, True
+            ).return_value)
+        else:
+            amount0Inside = 0
+            if logPriceCurrent != qUpper:
+                amount0Inside = wrapper.safeInRangeAmountWrapper(
+                    sqrtOffset, sqrtInverseOffset, integral0, growth, shares, outgoingMax, outgoingMaxModularInverse, False, True
+                ).return_value
+            amount0Outside = wrapper.safeOutOfRangeAmountWrapper(
+                sqrtOffset, sqrtInverseOffset, defaultGrowthMultiplier(qUpper) - defaultGrowthMultiplier(qMax), shares, False
+            ).return_value
+            amount0Expected = toIntegerRoundUp(amount0Inside + amount0Outside)
+
+            amount1Inside = 0
+            if logPriceCurrent != qLower:
+                amount1Inside = wrapper.safeInRangeAmountWrapper(
+                    sqrtOffset, sqrtInverseOffset, integral1, growth, shares, outgoingMax, outgoingMaxModularInverse, True, True
+                ).return_value
+            amount1Outside = wrapper.safeOutOfRangeAmountWrapper(
+                sqrtOffset, sqrtInverseOffset, defaultGrowthMultiplier(qLower) - defaultGrowthMultiplier(qMin), shares, True
+            ).return_value
+            amount1Expected = toIntegerRoundUp(amount1Inside + amount1Outside)
+
+        assert amount0 == - amount0Expected
+        assert amount1 == - amount1Expected
+        assert amount0 >= 0
+        assert amount1 >= 0
@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, PriceWrapper
+from brownie import PriceWrapper
 from sympy import Integer, floor, exp
 from Nofee import logTest
 from X15_test import oneX15
@@ -15,8 +15,8 @@ sampleX59 = 0xF00FF00FF00FF00F
 sampleX216 = 0xFF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return PriceWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(PriceWrapper)
 
 @pytest.mark.parametrize('logPrice', [epsilonX59, sampleX59, thirtyTwoX59 - epsilonX59])
 def test_storePrice0(wrapper, logPrice, request, worker_id):
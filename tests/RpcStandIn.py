@@ -0,0 +1,175 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import json
+import asyncio
+import threading
+from Nofee import getStaticParamsStorageAddress
+from SwapSimulator import toHex
+from AsyncRpc import readResponse
+
+# A stand-in for a local hardhat node which serves the read-only subset of
+# JSON-RPC that 'PoolReader.py' relies on, i.e., 'eth_blockNumber',
+# 'eth_getStorageAt' and 'eth_getCode', from in-memory storage and bytecode:
+#
+#   standIn = RpcStandIn(latency=0.001)
+#   standIn.setPool(nofeeswap, state, kernelStorageAddress, kernelCode)
+#   endpoint = standIn.run()
+#   ...
+#   standIn.shutdown()
+#
+# 'run' serves from a background thread with its own event loop, as a
+# separate node would, so that both 'AsyncRpc.py' and synchronous clients
+# such as 'JsonRpc' of 'SwapSimulator.py' may be pointed at 'endpoint'.
+#
+# Like hardhat, it answers JSON-RPC batches, keeps HTTP/1.1 connections alive
+# and processes the requests of each connection in order. 'latency' seconds
+# are spent on every HTTP request in order to emulate a round trip to a
+# remote node. The requests, calls per method, batch sizes, payload sizes
+# and connections which are observed by the server are recorded for tests.
+#
+# Storage is not versioned, i.e., every block which is not ahead of
+# 'blockNumber' sees the same state.
+
+class RpcStandIn:
+    def __init__(self, latency=0):
+        self.latency = latency
+        self.blockNumber = 1
+        self.storage = dict()
+        self.code = dict()
+        self.server = None
+        self.endpoint = None
+        self.loop = None
+        self.thread = None
+        self.writers = set()
+        self.reset()
+
+    def reset(self):
+        self.requests = 0
+        self.calls = 0
+        self.methods = dict()
+        self.batchSizes = []
+        self.payloadSizes = []
+        self.connections = 0
+        self.openConnections = 0
+        self.maxOpenConnections = 0
+
+    async def start(self, host='127.0.0.1', port=0):
+        self.server = await asyncio.start_server(self._serve, host, port)
+        self.endpoint = 'http://' + host + ':' + str(self.server.sockets[0].getsockname()[1])
+        return self.endpoint
+
+    async def stop(self):
+        self.server.close()
+        for writer in list(self.writers):
+            writer.close()
+        await self.server.wait_closed()
+
+    def run(self):
+        started = threading.Event()
+        self.loop = asyncio.new_event_loop()
+
+        def serve():
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_until_complete(self.start())
+            started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=serve, daemon=True)
+        self.thread.start()
+        started.wait()
+        return self.endpoint
+
+    def shutdown(self):
+        asyncio.run_coroutine_threadsafe(self.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def mine(self):
+        self.blockNumber += 1
+
+    def setStorage(self, address, slot, value):
+        self.storage[(address.lower(), slot)] = value
+
+    def setCode(self, address, code):
+        self.code[address.lower()] = bytes(code)
+
+    # Places a 'PoolState' on 'nofeeswap' along with the storage contract of
+    # its static parameters and its kernel storage contract.
+    def setPool(self, nofeeswap, state, kernelStorageAddress, kernelCode):
+        for slot, value in state.stateDiff().items():
+            self.setStorage(nofeeswap, int(slot, 16), int(value, 16))
+        storageAddress = getStaticParamsStorageAddress(nofeeswap, state.poolId, state.storagePointer())
+        self.setCode('0x' + format(storageAddress, '040x'), state.staticParams)
+        self.setCode(kernelStorageAddress, kernelCode)
+
+    def _block(self, tag):
+        if tag in ['latest', 'pending', 'safe', 'finalized']:
+            return self.blockNumber
+        if tag == 'earliest':
+            return 0
+        block = int(tag, 16)
+        if block > self.blockNumber:
+            raise ValueError('header not found')
+        return block
+
+    def _call(self, call):
+        self.calls += 1
+        method = call.get('method')
+        self.methods[method] = self.methods.get(method, 0) + 1
+        params = call.get('params', [])
+        try:
+            if method == 'eth_blockNumber':
+                result = hex(self.blockNumber)
+            elif method == 'eth_chainId':
+                result = hex(31337)
+            elif method == 'eth_getStorageAt':
+                self._block(params[2] if len(params) > 2 else 'latest')
+                result = toHex(self.storage.get((params[0].lower(), int(params[1], 16)), 0))
+            elif method == 'eth_getCode':
+                self._block(params[1] if len(params) > 1 else 'latest')
+                result = '0x' + self.code.get(params[0].lower(), b'').hex()
+            else:
+                return {'jsonrpc': '2.0', 'id': call.get('id'), 'error': {'code': -32601, 'message': 'Method ' + str(method) + ' is not supported'}}
+        except (ValueError, IndexError, TypeError, AttributeError) as error:
+            return {'jsonrpc': '2.0', 'id': call.get('id'), 'error': {'code': -32602, 'message': str(error)}}
+        return {'jsonrpc': '2.0', 'id': call.get('id'), 'result': result}
+
+    async def _serve(self, reader, writer):
+        self.writers.add(writer)
+        self.connections += 1
+        self.openConnections += 1
+        self.maxOpenConnections = max(self.maxOpenConnections, self.openConnections)
+        try:
+            while True:
+                try:
+                    _, headers, body = await readResponse(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                self.requests += 1
+                self.payloadSizes.append(len(body))
+                if self.latency > 0:
+                    await asyncio.sleep(self.latency)
+                payload = json.loads(body)
+                if isinstance(payload, list):
+                    self.batchSizes.append(len(payload))
+                    response = [self._call(call) for call in payload]
+                else:
+                    self.batchSizes.append(1)
+                    response = self._call(payload)
+                content = json.dumps(response).encode('utf-8')
+                close = headers.get('connection', '').lower() == 'close'
+                writer.write(
+                    (
+                        'HTTP/1.1 200 OK\r\n' +
+                        'Content-Type: application/json\r\n' +
+                        'Content-Length: ' + str(len(content)) + '\r\n' +
+                        'Connection: ' + ('close' if close else 'keep-alive') + '\r\n\r\n'
+                    ).encode('ascii') + content
+                )
+                await writer.drain()
+                if close:
+                    break
+        finally:
+            self.openConnections -= 1
+            self.writers.discard(writer)
+            writer.close()
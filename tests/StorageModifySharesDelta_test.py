@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 import brownie
-from brownie import accounts, StorageWrapper
+from brownie import StorageWrapper
 from Nofee import logTest, twosComplement
 
 accruedMax = (1 << 231) - 1
@@ -69,8 +69,8 @@ curve3 = 0x8BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB8
 curve4 = 0xAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return StorageWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(StorageWrapper)
 
 @pytest.mark.parametrize('poolId', [value2])
 @pytest.mark.parametrize('sharesGross', [balance0, balance2, balance4])
@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, StorageWrapper
+from brownie import accounts, chain, StorageWrapper
 from Nofee import logTest
 
 accruedMax = (1 << 231) - 1
@@ -84,4 +84,51 @@ def test_writeCurve(wrapper, poolId, qCurrent, curve, offset, length, request, w
     curveLength = 4 * length + 4 - offset
     tx = wrapper._writeCurve(poolId, curveLength, curveArray)
     curveArrayResult = tx.return_value
-    assert curveArrayResult == curveArray
\ No newline at end of file
+    assert curveArrayResult == curveArray
+def encodeMembers(members):
+    words = []
+    for k in range(0, len(members), 4):
+        word = 0
+        for j, member in enumerate(members[k:k + 4]):
+            word += member << (64 * (3 - j))
+        words.append(word)
+    return words
+
+def getMembers(length, seed):
+    return [((seed + k) * 0xF00FF00FF00F + 0x0FF00FF00FF00FF0) % (2 ** 64) for k in range(length)]
+
+@pytest.mark.parametrize('poolId', [value1, value4])
+@pytest.mark.parametrize('previousLength', [2, 3, 4, 5, 9, 16])
+@pytest.mark.parametrize('curveLength', [2, 4, 5, 8, 13])
+@pytest.mark.parametrize('curveIndex', [0, 1, 3, 4, 7, 12])
+def test_writeCurveFrom(wrapper, poolId, previousLength, curveLength, curveIndex, request, worker_id):
+    logTest(request, worker_id)
+
+    if curveIndex >= min(previousLength, curveLength):
+        return
+
+    # The two curves agree on every member prior to 'curveIndex'.
+    previousMembers = getMembers(previousLength, 0)
+    members = previousMembers[0:curveIndex] + getMembers(curveLength - curveIndex, 1000)
+
+    # Storage should be byte-identical to the outcome of rewriting the entire
+    # curve sequence.
+    expected = wrapper._writeCurveFrom(poolId, curveLength, 0, encodeMembers(members), encodeMembers(previousMembers)).return_value
+    result = wrapper._writeCurveFrom(poolId, curveLength, curveIndex, encodeMembers(members), encodeMembers(previousMembers)).return_value
+    assert result == expected
+
+@pytest.mark.parametrize('curveLength', [2, 3, 5, 16, 64, 255, 1024, 4095])
+def test_writeCurveFromGas(wrapper, curveLength, request, worker_id):
+    logTest(request, worker_id)
+
+    # Typically, only the last one or two members are modified by a swap.
+    members = getMembers(curveLength, 0)
+    previousMembers = members[0:curveLength - 2] + getMembers(2, 1000)
+
+    # Both transactions start from the same state so that the difference in
+    # gas is due to 'writeCurve' only.
+    txFull = wrapper._writeCurveFrom(value2, curveLength, 0, encodeMembers(members), encodeMembers(previousMembers))
+    chain.undo()
+    txPartial = wrapper._writeCurveFrom(value2, curveLength, curveLength - 2, encodeMembers(members), encodeMembers(previousMembers))
+    assert txPartial.return_value == txFull.return_value
+    assert txPartial.gas_used <= txFull.gas_used
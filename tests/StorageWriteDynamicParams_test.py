@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, StorageWrapper
+from brownie import StorageWrapper
 from Nofee import logTest
 
 accruedMax = (1 << 231) - 1
@@ -68,8 +68,8 @@ curve3 = 0x8BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB88BB8
 curve4 = 0xAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return StorageWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(StorageWrapper)
 
 @pytest.mark.parametrize('poolId', [value0, value4])
 @pytest.mark.parametrize('staticParamsStoragePointerExtension', [value0, value4])
@@ -1,10 +1,11 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 import brownie
-from brownie import accounts, StorageWrapper
+from brownie import accounts, web3, StorageWrapper
+from brownie.convert import to_address
 from sympy import Integer, floor, exp
 from eth_abi import encode
-from Nofee import logTest, _staticParams_, _endOfStaticParams_, address0, toInt, keccak256, keccakPacked, twosComplement
+from Nofee import logTest, logGas, _staticParams_, _endOfStaticParams_, address0, toInt, keccak256, keccakPacked, twosComplement, getStorageAddress, getStaticParamsStorageAddress, getKernelHash
 from Tag_test import tag0, tag1, tag2, tag3
 
 accruedMax = (1 << 231) - 1
@@ -593,9 +594,58 @@ def test_writeStaticParams(wrapper, poolId, kernelLength, content, request, work
         ]
     ) % (1 << 160)
 
+    staticBytes = contentBytes[0 : _endOfStaticParams_ - _staticParams_]
+    kernelBytes = contentBytes[_endOfStaticParams_ - _staticParams_ : ]
+    kernelStorageAddress = getStorageAddress(wrapper.address, getKernelHash(kernelBytes))
+
     tx = wrapper._writeStaticParams(poolId, kernelLength, storagePointer, storageAddress, contentBytes)
     contentResult = tx.return_value
-    assert contentResult.hex() == '00' + contentBytes.hex()
+    assert contentResult.hex() == '00' + staticBytes.hex() + kernelStorageAddress.to_bytes(20, 'big').hex() + kernelLength.to_bytes(2, 'big').hex()
+    assert web3.eth.get_code(to_address('0x' + format(kernelStorageAddress, '040x'))).hex().removeprefix('0x') == '00' + kernelBytes.hex()
+
+@pytest.mark.parametrize('kernelLength', [2, 16, 256])
+@pytest.mark.parametrize('content', [value2, value3])
+def test_writeStaticParamsSharedKernel(wrapper, kernelLength, content, request, worker_id):
+    logTest(request, worker_id)
+    
+    # Check if pools with identical kernels share one kernel storage contract
+    # which is deployed only once.
+
+    contentLength = 64 * (kernelLength - 1) + _endOfStaticParams_ - _staticParams_
+    contentBytes = encode(['uint256'] * contentLength, [content] * contentLength)[0 : contentLength]
+    kernelBytes = contentBytes[_endOfStaticParams_ - _staticParams_ : ]
+    kernelStorageAddress = getStorageAddress(wrapper.address, getKernelHash(kernelBytes))
+
+    gasUsed = []
+    for poolId in [value1, value2, value4]:
+        storageAddress = getStaticParamsStorageAddress(wrapper.address, poolId, 0)
+        tx = wrapper._writeStaticParams(poolId, kernelLength, 0, storageAddress, contentBytes)
+        contentResult = tx.return_value
+        assert contentResult[- 22 : - 2].hex() == kernelStorageAddress.to_bytes(20, 'big').hex()
+        gasUsed += [tx.gas_used]
+
+    assert web3.eth.get_code(to_address('0x' + format(kernelStorageAddress, '040x'))).hex().removeprefix('0x') == '00' + kernelBytes.hex()
+    assert gasUsed[1] < gasUsed[0]
+    assert gasUsed[2] < gasUsed[0]
+
+    # The same pools with one storage contract per pool hosting both static
+    # parameters and kernel, for comparison.
+    perPoolGasUsed = []
+    for poolId in [value1, value2, value4]:
+        tx = wrapper._writeStaticParamsAndKernel(poolId, kernelLength, 1, contentBytes)
+        perPoolGasUsed += [tx.gas_used]
+        storageAddress = getStaticParamsStorageAddress(wrapper.address, poolId, 1)
+        assert web3.eth.get_code(to_address('0x' + format(storageAddress, '040x'))).hex().removeprefix('0x') == '00' + contentBytes.hex()
+
+    if kernelLength > 2:
+        assert gasUsed[1] < perPoolGasUsed[1]
+
+    logGas(request, {
+        'kernel length: ' + str(kernelLength) + ', first: shared': gasUsed[0],
+        'kernel length: ' + str(kernelLength) + ', first: per-pool': perPoolGasUsed[0],
+        'kernel length: ' + str(kernelLength) + ', subsequent: shared': gasUsed[1],
+        'kernel length: ' + str(kernelLength) + ', subsequent: per-pool': perPoolGasUsed[1]
+    })
 
 @pytest.mark.parametrize('poolId', [value0, value1, value2, value3, value4])
 @pytest.mark.parametrize('storagePointer', [value0, value1, value2, value3, value4])
@@ -654,6 +704,15 @@ def test_getStaticParamsStorageAddress1(wrapper, nofeeswap, poolId, storagePoint
     storageAddress = tx.return_value
     assert toInt(storageAddress) == _storageAddress
 
+@pytest.mark.parametrize('kernelHash', [value0, value1, value2, value3, value4])
+def test_getKernelStorageAddress(wrapper, kernelHash, request, worker_id):
+    logTest(request, worker_id)
+    
+    # Check if the kernel storage address is calculated correctly.
+    tx = wrapper._getKernelStorageAddress(kernelHash)
+    kernelStorageAddress = tx.return_value
+    assert toInt(kernelStorageAddress) == getStorageAddress(wrapper.address, kernelHash)
+
 @pytest.mark.parametrize('contentLength', [1, 10, 25, 50, 100, 200, 500])
 @pytest.mark.parametrize('content', [value2, value3, value4])
 def test_readStaticParams(wrapper, contentLength, content, request, worker_id):
@@ -676,20 +735,27 @@ def test_readStaticParamsAndKernel(wrapper, contentLength, content, request, wor
     
     # Check if the static parameters and kernel are read correctly.
     contentBytes = encode(['uint256'] * contentLength, [content] * contentLength)[0 : contentLength]
-    tx = wrapper._readStaticParamsAndKernel(contentBytes)
+    staticBytes = contentBytes[0 : _endOfStaticParams_ - _staticParams_]
+    kernelBytes = contentBytes[_endOfStaticParams_ - _staticParams_ : ]
+    tx = wrapper._readStaticParamsAndKernel(staticBytes, kernelBytes)
     contentResult = tx.return_value
     assert contentResult.hex() == contentBytes[0 : ((_endOfStaticParams_ - _staticParams_) + 64 * ((contentLength - (_endOfStaticParams_ - _staticParams_)) // 64))].hex()
 
-@pytest.mark.parametrize('contentLength', [500, 600, 700, 800, 900])
+@pytest.mark.parametrize('kernelStorageAddress', [address1, address2, address3])
+@pytest.mark.parametrize('kernelLength', [2, 91, 1020])
 @pytest.mark.parametrize('content', [value2, value3, value4])
-def test_readKernelLength(wrapper, contentLength, content, request, worker_id):
+def test_readKernelStorage(wrapper, kernelStorageAddress, kernelLength, content, request, worker_id):
     logTest(request, worker_id)
     
-    # Check if the kernel length is read correctly.
+    # Check if the kernel storage address and the kernel length are read
+    # correctly.
+    contentLength = _endOfStaticParams_ - _staticParams_
     contentBytes = encode(['uint256'] * contentLength, [content] * contentLength)[0 : contentLength]
-    tx = wrapper._readKernelLength(contentBytes)
-    length = tx.return_value
-    assert length == 1 + ((contentLength - (_endOfStaticParams_ - _staticParams_)) // 64)
+    contentBytes += toInt(kernelStorageAddress).to_bytes(20, 'big') + kernelLength.to_bytes(2, 'big')
+    tx = wrapper._readKernelStorage(contentBytes)
+    _kernelStorageAddress, length = tx.return_value
+    assert toInt(_kernelStorageAddress) == toInt(kernelStorageAddress)
+    assert length == kernelLength
 
 @pytest.mark.parametrize('contentLength', [500, 600, 700, 800, 900])
 @pytest.mark.parametrize('content', [value2, value3, value4])
@@ -698,7 +764,7 @@ def test_readKernel(wrapper, contentLength, content, request, worker_id):
     
     # Check if the kernel are read correctly.
     contentBytes = encode(['uint256'] * contentLength, [content] * contentLength)[0 : contentLength]
-    tx = wrapper._readKernel(contentBytes)
+    tx = wrapper._readKernel(contentBytes[(_endOfStaticParams_ - _staticParams_) : ])
     contentResult = tx.return_value
     assert contentResult.hex() == contentBytes[(_endOfStaticParams_ - _staticParams_) : ((_endOfStaticParams_ - _staticParams_) + 64 * ((contentLength - (_endOfStaticParams_ - _staticParams_)) // 64))].hex()
 
@@ -709,6 +775,6 @@ def test_readKernel(wrapper, contentLength, content, request, worker_id):
     
     # Check if the kernel are read correctly.
     contentBytes = encode(['uint256'] * contentLength, [content] * contentLength)[0 : contentLength]
-    tx = wrapper._readKernel(contentBytes)
+    tx = wrapper._readKernel(contentBytes[(_endOfStaticParams_ - _staticParams_) : ])
     contentResult = tx.return_value
     assert contentResult.hex() == contentBytes[(_endOfStaticParams_ - _staticParams_) : ((_endOfStaticParams_ - _staticParams_) + 64 * ((contentLength - (_endOfStaticParams_ - _staticParams_)) // 64))].hex()
\ No newline at end of file
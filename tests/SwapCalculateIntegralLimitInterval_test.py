@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, SwapWrapper
+from brownie import SwapWrapper
 from sympy import Integer, floor, exp
 from Nofee import logTest, X216, dataGeneration
 
@@ -42,8 +42,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return SwapWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(SwapWrapper)
 
 @pytest.mark.parametrize('exactInput', [False, True])
 @pytest.mark.parametrize('zeroForOne', [False, True])
@@ -1,10 +1,11 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, SwapWrapper
+from brownie import SwapWrapper
 from sympy import Integer, floor, ceiling, exp
 from Nofee import logTest, X216, _accrued0_, _accrued1_, _integral0_, _integral1_, _amount0_, _amount1_, _poolRatio0_, _poolRatio1_, _growth_, dataGeneration, toInt, twosComplementInt8, twosComplement
 from X23_test import oneX23
 from X47_test import oneX47
+from CustomErrors import isError
 
 initializations, swaps, kernelsValid, kernelsInvalid = dataGeneration(1000)
 
@@ -44,8 +45,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return SwapWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(SwapWrapper)
 
 @pytest.mark.parametrize('logOffset', [-89, 0, 89])
 @pytest.mark.parametrize('growth', [((1 << 127) - 1) // 5, (1 << 127) - (1 << 110)])
@@ -114,9 +115,7 @@ def test_cross(wrapper, logOffset, growth, sharesTotal, outgoingMax, incomingMax
                 ]
             )
         except Exception as error:
-            assert ('SafeInRangeAmountOverflow' in error.revert_msg) or \
-                ('AccruedGrowthPortionOverflow' in error.revert_msg) or \
-                ('GrowthOverflow' in error.revert_msg)
+            assert isError(error, 'SafeInRangeAmountOverflow', 'AccruedGrowthPortionOverflow', 'GrowthOverflow')
         else:
             data = tx.events['(unknown)'][0]['data']
             integral0Amended = toInt(data[_integral0_ : _integral0_ + 27].hex())
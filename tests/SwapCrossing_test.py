@@ -0,0 +1,142 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import accounts, Access, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockOperator, MockSwapper, DeployerHelper
+from eth_abi import decode
+from Nofee import logTest, logGas, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeCurve, getPoolId
+from PositionValuation import PoolSnapshot, PositionValuation, fromOffsetted
+from UnlockSession import UnlockSession
+
+logOffset = -5
+spacing = 2 ** 56
+kernel = [[0, 0], [spacing, 2 ** 15]]
+curve = [2 ** 62, 2 ** 62 + spacing, 2 ** 62 + (spacing // 2)]
+
+@pytest.fixture(autouse=True)
+def deployment(fn_isolation):
+    root = accounts[0]
+    owner = accounts[1]
+    deployer = DeployerHelper.deploy(root, {'from': root})
+    delegatee = deployer.addressOf(1)
+    nofeeswap = deployer.addressOf(2)
+    deployer.create3(
+        1,
+        NofeeswapDelegatee.bytecode + encode(
+            ['address'],
+            [nofeeswap]
+        ).hex(),
+        {'from': root}
+    )
+    deployer.create3(
+        2,
+        Nofeeswap.bytecode + encode(
+            ['address', 'address'],
+            [delegatee, root.address]
+        ).hex(),
+        {'from': root}
+    )
+    delegatee = NofeeswapDelegatee.at(delegatee)
+    nofeeswap = Nofeeswap.at(nofeeswap)
+    access = Access.deploy({'from': root})
+    operator = MockOperator.deploy(nofeeswap, {'from': root})
+    swapper = MockSwapper.deploy(nofeeswap, {'from': root})
+
+    token0 = ERC20FixedSupply.deploy("ERC20_0", "ERC20_0", 2**120, owner, {'from': owner})
+    token1 = ERC20FixedSupply.deploy("ERC20_1", "ERC20_1", 2**120, owner, {'from': owner})
+    if toInt(token0.address) > toInt(token1.address):
+        token0, token1 = token1, token0
+
+    for spender in [operator, swapper]:
+        token0.approve(spender, 2**120, {'from': owner})
+        token1.approve(spender, 2**120, {'from': owner})
+
+    return root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1
+
+# Initializes a pool and mints 'shares' over the current interval only. Hence,
+# every interval above the current one is empty.
+def initialize(deployment, salt, shares):
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    unsaltedPoolId = (salt << 188) + (twosComplementInt8(logOffset) << 180) + (0 << 160)
+    poolId = getPoolId(owner.address, unsaltedPoolId)
+
+    nofeeswap.dispatch(
+      delegatee.initialize.encode_input(
+          unsaltedPoolId,
+          toInt(token0.address),
+          toInt(token1.address),
+          0,
+          encodeKernelCompact(kernel),
+          encodeCurve(curve),
+          b""
+      ),
+      {'from': owner}
+    )
+
+    pool = PoolSnapshot.fromAccess(access, nofeeswap, poolId)
+    amount0, amount1 = PositionValuation(pool).modifyPositionAmounts(pool.qLower, pool.qUpper, shares)
+    session = UnlockSession(nofeeswap.address, operator.address)
+    tag0 = session.registerERC20(token0.address)
+    tag1 = session.registerERC20(token1.address)
+    session.modifyPosition(
+        poolId,
+        fromOffsetted(poolId, pool.qLower),
+        fromOffsetted(poolId, pool.qUpper),
+        shares,
+        b"",
+        tag0,
+        tag1,
+        amount0,
+        amount1
+    )
+    session.settle(owner.address, owner.address, owner.address)
+    nofeeswap.unlock(operator, session.encode(), {'from': owner})
+
+    return poolId
+
+# Returns the gas spent by 'swap' along with the resulting amounts.
+def swap(deployment, poolId, amountSpecified, logPriceLimit, zeroForOne):
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    tx = nofeeswap.unlock(
+        swapper,
+        encode(
+            ['uint256', 'int256', 'int256', 'uint256', 'address', 'address'],
+            [poolId, amountSpecified, logPriceLimit, zeroForOne, token0.address, token1.address]
+        ),
+        {'from': owner}
+    )
+    return decode(['uint256', 'int256', 'int256'], bytes(tx.return_value))
+
+# Each swap exhausts the current interval and then crosses 'k' empty intervals
+# whose boundaries have never been populated. The default growth multiplier
+# of each crossed boundary is overwritten within the same swap. Hence, it
+# should only be written on storage for the boundary at which the swap halts.
+# The gas spent for every 'k' is recorded in 'testLogs/gas.jsonl'.
+def test_swapCrossing(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    gas = dict()
+    for salt, k in enumerate([0, 1, 2, 4, 8, 16, 32]):
+        poolId = initialize(deployment, salt, 2 ** 60)
+
+        limit = fromOffsetted(poolId, curve[1] + k * spacing)
+
+        gasUsed, amount0, amount1 = swap(deployment, poolId, 2 ** 100, limit, 2)
+        assert amount0 * amount1 < 0
+        gas[k] = gasUsed
+
+        _, _, logPriceCurrent, _, _, _, _ = access._readDynamicParams(nofeeswap, poolId)
+        assert logPriceCurrent == curve[1] + k * spacing
+
+        for j in range(k + 1):
+            assert access._readGrowthMultiplier(nofeeswap, poolId, curve[1] + j * spacing) > 0
+        assert access._readGrowthMultiplier(nofeeswap, poolId, curve[1] + (k + 1) * spacing) == 0
+
+    for k in [2, 4, 8, 16, 32]:
+        assert gas[k] > gas[k // 2]
+
+    logGas(request, {
+        'intervals crossed: ' + str(k): gas[k] for k in [0, 1, 2, 4, 8, 16, 32]
+    })
@@ -0,0 +1,177 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import accounts, web3, Access, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockOperator, MockSwapper, DeployerHelper
+from eth_abi import decode
+from Nofee import logTest, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeCurve, getPoolId, amend
+from PositionValuation import PoolSnapshot, PositionValuation, fromOffsetted
+from UnlockSession import UnlockSession
+from SwapSimulator import getCurveSlot
+from PoolReader import appendCurveWord
+
+logOffset = -5
+spacing = 2 ** 56
+kernel = [[0, 0], [spacing, 2 ** 15]]
+curve = [2 ** 62, 2 ** 62 + spacing, 2 ** 62 + (spacing // 2)]
+
+# The position spans four intervals on either side of the initial one.
+qMin = curve[0] - 4 * spacing
+qMax = curve[1] + 4 * spacing
+
+# The limits of consecutive swaps in terms of the number of spacings from
+# 'curve[0]'. The first eight zigzag within the initial interval so that every
+# swap appends a member to the curve sequence, which then spans three slots.
+# The next swap crosses to another interval, which replaces the curve with a
+# shorter one, and the price then moves back and forth across intervals.
+limits = [
+    0.875, 0.625, 0.8125, 0.6875, 0.78125, 0.71875, 0.765625, 0.734375,
+    2.5, -1.5, 0.25, 0.875, 0.375, -2.5, 3.5
+]
+
+@pytest.fixture(autouse=True)
+def deployment(fn_isolation):
+    root = accounts[0]
+    owner = accounts[1]
+    deployer = DeployerHelper.deploy(root, {'from': root})
+    delegatee = deployer.addressOf(1)
+    nofeeswap = deployer.addressOf(2)
+    deployer.create3(
+        1,
+        NofeeswapDelegatee.bytecode + encode(
+            ['address'],
+            [nofeeswap]
+        ).hex(),
+        {'from': root}
+    )
+    deployer.create3(
+        2,
+        Nofeeswap.bytecode + encode(
+            ['address', 'address'],
+            [delegatee, root.address]
+        ).hex(),
+        {'from': root}
+    )
+    delegatee = NofeeswapDelegatee.at(delegatee)
+    nofeeswap = Nofeeswap.at(nofeeswap)
+    access = Access.deploy({'from': root})
+    operator = MockOperator.deploy(nofeeswap, {'from': root})
+    swapper = MockSwapper.deploy(nofeeswap, {'from': root})
+
+    token0 = ERC20FixedSupply.deploy("ERC20_0", "ERC20_0", 2**120, owner, {'from': owner})
+    token1 = ERC20FixedSupply.deploy("ERC20_1", "ERC20_1", 2**120, owner, {'from': owner})
+    if toInt(token0.address) > toInt(token1.address):
+        token0, token1 = token1, token0
+
+    for spender in [operator, swapper]:
+        token0.approve(spender, 2**120, {'from': owner})
+        token1.approve(spender, 2**120, {'from': owner})
+
+    return root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1
+
+# Initializes a pool and mints 'shares' over '[qMin, qMax]'.
+def initialize(deployment, shares):
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    unsaltedPoolId = (twosComplementInt8(logOffset) << 180) + (0 << 160)
+    poolId = getPoolId(owner.address, unsaltedPoolId)
+
+    nofeeswap.dispatch(
+      delegatee.initialize.encode_input(
+          unsaltedPoolId,
+          toInt(token0.address),
+          toInt(token1.address),
+          0,
+          encodeKernelCompact(kernel),
+          encodeCurve(curve),
+          b""
+      ),
+      {'from': owner}
+    )
+
+    pool = PoolSnapshot.fromAccess(access, nofeeswap, poolId)
+    amount0, amount1 = PositionValuation(pool).modifyPositionAmounts(qMin, qMax, shares)
+    session = UnlockSession(nofeeswap.address, operator.address)
+    tag0 = session.registerERC20(token0.address)
+    tag1 = session.registerERC20(token1.address)
+    session.modifyPosition(
+        poolId,
+        fromOffsetted(poolId, qMin),
+        fromOffsetted(poolId, qMax),
+        shares,
+        b"",
+        tag0,
+        tag1,
+        amount0,
+        amount1
+    )
+    session.settle(owner.address, owner.address, owner.address)
+    nofeeswap.unlock(operator, session.encode(), {'from': owner})
+
+    return poolId
+
+def swap(deployment, poolId, amountSpecified, logPriceLimit, zeroForOne):
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    tx = nofeeswap.unlock(
+        swapper,
+        encode(
+            ['uint256', 'int256', 'int256', 'uint256', 'address', 'address'],
+            [poolId, amountSpecified, logPriceLimit, zeroForOne, token0.address, token1.address]
+        ),
+        {'from': owner}
+    )
+    return decode(['uint256', 'int256', 'int256'], bytes(tx.return_value))
+
+def readSlots(nofeeswap, poolId, count):
+    slot = getCurveSlot(poolId)
+    return [
+        int.from_bytes(bytes(web3.eth.get_storage_at(nofeeswap.address, slot + k)), 'big') for k in range(count)
+    ]
+
+# Swaps back and forth across several members of the curve sequence. After
+# every swap,
+#
+# - the curve sequence which is read from storage terminates at
+#   'logPriceCurrent' and, throughout the initial zigzag, it is amended as in
+#   'Nofee.amend', and
+#
+# - every slot beyond the one hosting the last member is left untouched, i.e.,
+#   stale members of a longer curve remain as they were before the swap.
+def test_swapCurveTail(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    poolId = initialize(deployment, 2 ** 60)
+
+    members = list(curve)
+    slotCount = 1
+    lengths = []
+    for index, limit in enumerate(limits):
+        before = readSlots(nofeeswap, poolId, slotCount)
+
+        target = curve[0] + int(limit * spacing)
+        _, amount0, amount1 = swap(deployment, poolId, 2 ** 100, fromOffsetted(poolId, target), 2)
+        assert amount0 * amount1 < 0
+
+        _, _, logPriceCurrent, _, _, _, _ = access._readDynamicParams(nofeeswap, poolId)
+        assert logPriceCurrent == target
+
+        expected = amend(members, target) if index < 8 else None
+        members = []
+        for word in access._readCurve(nofeeswap, poolId, logPriceCurrent).return_value:
+            if appendCurveWord(members, word, logPriceCurrent):
+                break
+        assert members[-1] == logPriceCurrent
+        if expected is not None:
+            assert members == expected
+        lengths.append(len(members))
+
+        finalSlot = (len(members) - 1) // 4
+        after = readSlots(nofeeswap, poolId, slotCount)
+        for k in range(finalSlot + 1, slotCount):
+            assert after[k] == before[k]
+        slotCount = max(slotCount, finalSlot + 1)
+
+    # The curve spans three slots before it shrinks.
+    assert lengths[7] == len(curve) + 8
+    assert min(lengths[8:]) < 5
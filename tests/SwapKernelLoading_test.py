@@ -0,0 +1,138 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import accounts, Access, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockOperator, MockSwapper, DeployerHelper
+from eth_abi import decode
+from Nofee import logTest, logGas, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeCurve, getPoolId
+from PositionValuation import PoolSnapshot, PositionValuation, fromOffsetted
+from UnlockSession import UnlockSession
+
+logOffset = -5
+spacing = 2 ** 56
+curve = [2 ** 62, 2 ** 62 + spacing, 2 ** 62 + (spacing // 2)]
+
+# A kernel with 'n' pieces whose breakpoints are evenly spaced.
+def getKernel(n):
+    return [[(k * spacing) // n, (k * (2 ** 15)) // n] for k in range(n + 1)]
+
+@pytest.fixture(autouse=True)
+def deployment(fn_isolation):
+    root = accounts[0]
+    owner = accounts[1]
+    deployer = DeployerHelper.deploy(root, {'from': root})
+    delegatee = deployer.addressOf(1)
+    nofeeswap = deployer.addressOf(2)
+    deployer.create3(
+        1,
+        NofeeswapDelegatee.bytecode + encode(
+            ['address'],
+            [nofeeswap]
+        ).hex(),
+        {'from': root}
+    )
+    deployer.create3(
+        2,
+        Nofeeswap.bytecode + encode(
+            ['address', 'address'],
+            [delegatee, root.address]
+        ).hex(),
+        {'from': root}
+    )
+    delegatee = NofeeswapDelegatee.at(delegatee)
+    nofeeswap = Nofeeswap.at(nofeeswap)
+    access = Access.deploy({'from': root})
+    operator = MockOperator.deploy(nofeeswap, {'from': root})
+    swapper = MockSwapper.deploy(nofeeswap, {'from': root})
+
+    token0 = ERC20FixedSupply.deploy("ERC20_0", "ERC20_0", 2**120, owner, {'from': owner})
+    token1 = ERC20FixedSupply.deploy("ERC20_1", "ERC20_1", 2**120, owner, {'from': owner})
+    if toInt(token0.address) > toInt(token1.address):
+        token0, token1 = token1, token0
+
+    for spender in [operator, swapper]:
+        token0.approve(spender, 2**120, {'from': owner})
+        token1.approve(spender, 2**120, {'from': owner})
+
+    return root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1
+
+# Initializes a pool with the given kernel and mints 'shares' over the
+# current interval.
+def initialize(deployment, kernel, salt, shares):
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    unsaltedPoolId = (salt << 188) + (twosComplementInt8(logOffset) << 180) + (0 << 160)
+    poolId = getPoolId(owner.address, unsaltedPoolId)
+
+    nofeeswap.dispatch(
+      delegatee.initialize.encode_input(
+          unsaltedPoolId,
+          toInt(token0.address),
+          toInt(token1.address),
+          0,
+          encodeKernelCompact(kernel),
+          encodeCurve(curve),
+          b""
+      ),
+      {'from': owner}
+    )
+
+    pool = PoolSnapshot.fromAccess(access, nofeeswap, poolId)
+    amount0, amount1 = PositionValuation(pool).modifyPositionAmounts(pool.qLower, pool.qUpper, shares)
+    session = UnlockSession(nofeeswap.address, operator.address)
+    tag0 = session.registerERC20(token0.address)
+    tag1 = session.registerERC20(token1.address)
+    session.modifyPosition(
+        poolId,
+        fromOffsetted(poolId, pool.qLower),
+        fromOffsetted(poolId, pool.qUpper),
+        shares,
+        b"",
+        tag0,
+        tag1,
+        amount0,
+        amount1
+    )
+    session.settle(owner.address, owner.address, owner.address)
+    nofeeswap.unlock(operator, session.encode(), {'from': owner})
+
+    return poolId
+
+# Returns the gas spent by 'swap' along with the resulting amounts.
+def swap(deployment, poolId, amountSpecified, logPriceLimit, zeroForOne):
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    tx = nofeeswap.unlock(
+        swapper,
+        encode(
+            ['uint256', 'int256', 'int256', 'uint256', 'address', 'address'],
+            [poolId, amountSpecified, logPriceLimit, zeroForOne, token0.address, token1.address]
+        ),
+        {'from': owner}
+    )
+    return decode(['uint256', 'int256', 'int256'], bytes(tx.return_value))
+
+# Kernel breakpoints are loaded only if 'swapWithin' is invoked. Hence, the
+# size of the kernel should affect the gas cost of a swap which returns early
+# less than that of a swap which moves the price within the current interval.
+def test_swapKernelLoading(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    gas = dict()
+    for salt, n in enumerate([1, 10, 100, 1000]):
+        poolId = initialize(deployment, getKernel(n), salt, 2 ** 60)
+
+        limit = fromOffsetted(poolId, curve[2] + (spacing // 4))
+
+        gasUsed, amount0, amount1 = swap(deployment, poolId, 0, limit, 2)
+        assert (amount0, amount1) == (0, 0)
+        gas[('early', n)] = gasUsed
+
+        gasUsed, amount0, amount1 = swap(deployment, poolId, 2 ** 100, limit, 2)
+        assert amount0 * amount1 < 0
+        gas[('within', n)] = gasUsed
+
+    for n in [10, 100, 1000]:
+        assert gas[('early', n)] - gas[('early', 1)] < gas[('within', n)] - gas[('within', 1)]
+
+    logGas(request, {
+        'kernel pieces: ' + str(n) + ', ' + mode: gas[(mode, n)] for mode in ['early', 'within'] for n in [1, 10, 100, 1000]
+    })
@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 import brownie
-from brownie import accounts, SwapWrapper
+from brownie import SwapWrapper
 from sympy import Integer, floor, exp
 from Nofee import logTest, X216, _logPriceLimitOffsetted_, _zeroForOne_, _exactInput_, _back_, _next_, _integralLimit_, _integralLimitInterval_, thirtyTwoX59, dataGeneration, toInt, twosComplementInt8
 
@@ -43,10 +43,10 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return SwapWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(SwapWrapper)
 
-@pytest.mark.parametrize('zeroForOne_', [0])
+@pytest.mark.parametrize('zeroForOne_', [0, 1, 2])
 @pytest.mark.parametrize('logOffset', [-89, 0, 89])
 @pytest.mark.parametrize('q0', [logPrice2, logPrice3, logPrice4])
 @pytest.mark.parametrize('q1', [logPrice2, logPrice3, logPrice4])
@@ -0,0 +1,284 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import json
+import urllib.request
+from eth_abi import decode
+from eth_utils import to_checksum_address
+from Nofee import keccakPacked, keccak256, encodeCurve, getStaticParamsStorageAddress
+from UnlockSession import encodeCall, swapSignature
+from CustomErrors import decodeError
+
+# Simulates 'Nofeeswap.swap' against hypothetical pool states via a single
+# 'eth_call' whose state override set replaces the storage slots of the pool
+# on 'nofeeswap' and the bytecode of its static parameters, i.e.,
+#
+#   simulator = SwapSimulator(endpoint, nofeeswap, SwapSimulator._build['deployedBytecode'])
+#   state = PoolState(poolId, dynamicParams=..., curve=..., growthMultipliers=...)
+#   amount0, amount1, gasUsed = simulator.simulate(state, amountSpecified, logPriceLimit, zeroForOne)
+#
+# The bytecode of 'SwapSimulator.sol' is placed at 'simulatorAddress' by the
+# same override set. It unlocks 'nofeeswap', performs the swap and reverts
+# with the outcome, so that nothing needs to be settled. 'simulateBatch'
+# evaluates many hypothetical states in one JSON-RPC batch.
+#
+# The slots are derived as in 'Storage.sol':
+#
+#   dynamic params:     keccak(poolId, dynamicParamsSlot) + [-1, 0, 1, 2]
+#   curve:              keccak(poolId, curveSlot) + [0, 1, ...]
+#   growth multipliers: keccak(poolId, qBoundary, growthMultiplierSlot)
+#
+# where slot '-1' is only populated if the static parameters storage pointer
+# has overflowed 'type(uint16).max'.
+
+# uint128(uint256(keccak256("dynamicParams"))) - 1
+dynamicParamsSlot = 0x6890D047AD8C870137858A70716B2C6B
+
+# uint128(uint256(keccak256("curve"))) - 1
+curveSlot = 0x3B2D91718DFB37F9969A1B0670A83E70
+
+# uint64(uint256(keccak256("growthMultiplier"))) - 1
+growthMultiplierSlot = 0x1447E579411C2C93
+
+simulateSignature = 'simulate(address,bytes)'
+
+# An arbitrary address which hosts the bytecode of 'SwapSimulator.sol'.
+simulatorAddress = to_checksum_address('0x' + format(keccak256('SwapSimulator') % (1 << 160), '040x'))
+
+def getDynamicParamsSlot(poolId):
+    return keccakPacked(['uint256', 'uint128'], [poolId, dynamicParamsSlot])
+
+def getCurveSlot(poolId):
+    return keccakPacked(['uint256', 'uint128'], [poolId, curveSlot])
+
+def getGrowthMultiplierSlot(poolId, qBoundary):
+    return keccakPacked(['uint256', 'uint64', 'uint64'], [poolId, qBoundary, growthMultiplierSlot])
+
+# The three storage slots of dynamic parameters, i.e., 2 bytes of
+# 'staticParamsStoragePointer', 8 bytes of 'logPriceCurrent', 16 bytes of
+# 'sharesTotal', 16 bytes of 'growth' and 27 bytes of each integral as in
+# 'Memory.sol'.
+def encodeDynamicParams(staticParamsStoragePointer, logPriceCurrent, sharesTotal, growth, integral0, integral1):
+    content = staticParamsStoragePointer
+    content = (content << 64) + logPriceCurrent
+    content = (content << 128) + sharesTotal
+    content = (content << 128) + growth
+    content = (content << 216) + integral0
+    content = (content << 216) + integral1
+    return [content >> 512, (content >> 256) % (1 << 256), content % (1 << 256)]
+
+# The inverse of 'encodeDynamicParams'.
+def decodeDynamicParams(words):
+    content = (words[0] << 512) + (words[1] << 256) + words[2]
+    return (
+        content >> 752,
+        (content >> 688) % (1 << 64),
+        (content >> 560) % (1 << 128),
+        (content >> 432) % (1 << 128),
+        (content >> 216) % (1 << 216),
+        content % (1 << 216)
+    )
+
+def toHex(value):
+    return '0x' + format(value, '064x')
+
+def toBytes(value):
+    return bytes.fromhex(value[2:]) if value.startswith('0x') else bytes.fromhex(value)
+
+# A hypothetical state of a single pool. Every member which is 'None' is left
+# as it is on chain.
+#
+# 'dynamicParams' is '(staticParamsStoragePointerExtension, logPriceCurrent,
+# sharesTotal, growth, integral0, integral1)', 'curve' is the list of
+# offsetted log prices whose last member is 'logPriceCurrent',
+# 'growthMultipliers' maps offsetted boundaries to their growth multipliers
+# and 'staticParams' is the bytecode of the storage contract of static
+# parameters, i.e., '00 | static parameters | kernelStorageAddress |
+# kernelLength | exp table'. The latter is placed at the address which is
+# derived from 'staticParamsStoragePointerExtension'. Hence, 'staticParams'
+# may not be given without 'dynamicParams'.
+class PoolState:
+    def __init__(self, poolId, dynamicParams=None, curve=None, growthMultipliers=None, staticParams=None):
+        if staticParams is not None and dynamicParams is None:
+            raise ValueError('staticParams requires dynamicParams')
+        self.poolId = poolId
+        self.dynamicParams = dynamicParams
+        self.curve = curve
+        self.growthMultipliers = growthMultipliers if growthMultipliers is not None else dict()
+        self.staticParams = staticParams
+
+    def storagePointer(self):
+        return self.dynamicParams[0]
+
+    # The slots of 'nofeeswap' to be overridden.
+    def stateDiff(self):
+        slots = dict()
+        if self.dynamicParams is not None:
+            extension, logPriceCurrent, sharesTotal, growth, integral0, integral1 = self.dynamicParams
+            pointer = min(extension, 0xFFFF)
+            slot = getDynamicParamsSlot(self.poolId)
+            for k, word in enumerate(encodeDynamicParams(pointer, logPriceCurrent, sharesTotal, growth, integral0, integral1)):
+                slots[toHex(slot + k)] = toHex(word)
+            if pointer == 0xFFFF:
+                slots[toHex(slot - 1)] = toHex(extension)
+        if self.curve is not None:
+            slot = getCurveSlot(self.poolId)
+            for k, word in enumerate(encodeCurve(self.curve)):
+                slots[toHex(slot + k)] = toHex(word)
+        for qBoundary, growthMultiplier in self.growthMultipliers.items():
+            slots[toHex(getGrowthMultiplierSlot(self.poolId, qBoundary))] = toHex(growthMultiplier)
+        return slots
+
+# A minimal synchronous JSON-RPC client over HTTP.
+class JsonRpc:
+    def __init__(self, endpoint, timeout=60):
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.id = 0
+
+    def _post(self, payload):
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(payload).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+    def request(self, method, params):
+        self.id += 1
+        return self._post({'jsonrpc': '2.0', 'id': self.id, 'method': method, 'params': params})
+
+    # Sends every '(method, params)' in a single batch and returns the
+    # responses in the same order.
+    def batch(self, calls):
+        if len(calls) == 0:
+            return []
+        payload = []
+        for method, params in calls:
+            self.id += 1
+            payload.append({'jsonrpc': '2.0', 'id': self.id, 'method': method, 'params': params})
+        responses = {response['id']: response for response in self._post(payload)}
+        return [responses[call['id']] for call in payload]
+
+# The revert data of a failed 'eth_call', which nodes either place directly
+# in 'data' or nest in 'data.data'.
+def getRevertData(error):
+    data = error.get('data')
+    if isinstance(data, dict):
+        data = data.get('data')
+    if isinstance(data, str) and data.startswith('0x'):
+        return toBytes(data)
+    return None
+
+class SimulationReverted(Exception):
+    def __init__(self, error, data):
+        super().__init__(str(error) if error is not None else '0x' + (data or b'').hex())
+        self.error = error
+        self.data = data
+
+class SwapSimulator:
+    def __init__(self, endpoint, nofeeswap, simulatorCode, block='latest'):
+        self.rpc = JsonRpc(endpoint) if isinstance(endpoint, str) else endpoint
+        self.nofeeswap = to_checksum_address(nofeeswap)
+        self.simulatorCode = simulatorCode if simulatorCode.startswith('0x') else '0x' + simulatorCode
+        self.block = block
+
+    # The override set of 'eth_call' for the given pool states.
+    def overrides(self, states):
+        overrides = {simulatorAddress: {'code': self.simulatorCode}}
+        stateDiff = dict()
+        for state in states:
+            stateDiff.update(state.stateDiff())
+            if state.staticParams is not None:
+                storageAddress = getStaticParamsStorageAddress(self.nofeeswap, state.poolId, state.storagePointer())
+                address = to_checksum_address('0x' + format(storageAddress, '040x'))
+                overrides[address] = {'code': '0x' + bytes(state.staticParams).hex()}
+        if len(stateDiff) > 0:
+            overrides[self.nofeeswap] = {'stateDiff': stateDiff}
+        return overrides
+
+    def _params(self, state, amountSpecified, logPriceLimit, zeroForOne, hookData):
+        swapCalldata = encodeCall(
+            swapSignature,
+            ['uint256', 'int256', 'int256', 'uint256', 'bytes'],
+            [state.poolId, amountSpecified, logPriceLimit, zeroForOne, hookData]
+        )
+        data = encodeCall(simulateSignature, ['address', 'bytes'], [self.nofeeswap, swapCalldata])
+        return [
+            {'to': simulatorAddress, 'data': '0x' + data.hex()},
+            self.block,
+            self.overrides([state])
+        ]
+
+    # Returns '(amount0, amount1, gasUsed)' or a 'SimulationReverted' whose
+    # 'error' is the custom error of 'Errors.sol', if any.
+    @staticmethod
+    def _parse(response):
+        if 'error' in response:
+            data = getRevertData(response['error'])
+            error = decodeError(data) if data is not None else None
+            return SimulationReverted(error, data)
+        return decode(['int256', 'int256', 'uint256'], toBytes(response['result']))
+
+    def simulate(self, state, amountSpecified, logPriceLimit, zeroForOne, hookData=b''):
+        outcome = self._parse(self.rpc.request(
+            'eth_call',
+            self._params(state, amountSpecified, logPriceLimit, zeroForOne, hookData)
+        ))
+        if isinstance(outcome, SimulationReverted):
+            raise outcome
+        return outcome
+
+    # Evaluates every '(state, amountSpecified, logPriceLimit, zeroForOne)' in
+    # JSON-RPC batches of at most 'batchSize' calls. A reverted simulation
+    # yields a 'SimulationReverted' in place of its outcome.
+    def simulateBatch(self, swaps, batchSize=500, hookData=b''):
+        swaps = list(swaps)
+        outcomes = []
+        for start in range(0, len(swaps), batchSize):
+            responses = self.rpc.batch([
+                ('eth_call', self._params(state, amountSpecified, logPriceLimit, zeroForOne, hookData))
+                for state, amountSpecified, logPriceLimit, zeroForOne in swaps[start : start + batchSize]
+            ])
+            outcomes += [self._parse(response) for response in responses]
+        return outcomes
+
+    # Reads the current state of a pool, i.e., dynamic parameters, the curve
+    # and the bytecode of static parameters, together with the growth
+    # multipliers of the given boundaries. The result may be amended and
+    # given to 'simulate'.
+    def readState(self, poolId, boundaries=()):
+        slot = getDynamicParamsSlot(poolId)
+        boundaries = list(boundaries)
+        responses = self.rpc.batch(
+            [('eth_getStorageAt', [self.nofeeswap, toHex(slot + k), self.block]) for k in range(-1, 3)] +
+            [('eth_getStorageAt', [self.nofeeswap, toHex(getGrowthMultiplierSlot(poolId, q)), self.block]) for q in boundaries]
+        )
+        words = [int(response['result'], 16) for response in responses]
+        pointer, logPriceCurrent, sharesTotal, growth, integral0, integral1 = decodeDynamicParams(words[1 : 4])
+        extension = words[0] if pointer == 0xFFFF else pointer
+        state = PoolState(
+            poolId,
+            (extension, logPriceCurrent, sharesTotal, growth, integral0, integral1),
+            growthMultipliers={q: word for q, word in zip(boundaries, words[4:])}
+        )
+
+        # The curve is read four members at a time until 'logPriceCurrent'.
+        curve = []
+        slot = getCurveSlot(poolId)
+        while True:
+            word = int(self.rpc.request('eth_getStorageAt', [self.nofeeswap, toHex(slot), self.block])['result'], 16)
+            members = [(word >> shift) % (1 << 64) for shift in [192, 128, 64, 0]]
+            if logPriceCurrent in members:
+                curve += members[0 : members.index(logPriceCurrent) + 1]
+                break
+            if 0 in members or word == 0:
+                curve += [member for member in members if member != 0]
+                break
+            curve += members
+            slot += 1
+        state.curve = curve
+
+        storageAddress = getStaticParamsStorageAddress(self.nofeeswap, poolId, extension)
+        code = self.rpc.request('eth_getCode', [to_checksum_address('0x' + format(storageAddress, '040x')), self.block])['result']
+        state.staticParams = toBytes(code)
+        return state
@@ -0,0 +1,242 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import time
+import asyncio
+import pytest
+from brownie import accounts, web3, Access, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockOperator, MockSwapper, DeployerHelper
+from brownie import SwapSimulator as SwapSimulatorContract
+from eth_abi import decode
+from Nofee import logTest, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeCurve, getPoolId
+from PositionValuation import PoolSnapshot, PositionValuation, fromOffsetted
+from UnlockSession import UnlockSession
+from SwapSimulator import SwapSimulator, PoolState, SimulationReverted
+from AsyncRpc import AsyncJsonRpc
+from PoolReader import PoolReader
+
+logOffset = -5
+spacing = 2 ** 56
+curve = [2 ** 62, 2 ** 62 + spacing, 2 ** 62 + (spacing // 2)]
+kernels = [
+    [[0, 0], [spacing, 2 ** 15]],
+    [[0, 0], [spacing // 2, 2 ** 13], [spacing, 2 ** 15]]
+]
+
+@pytest.fixture(autouse=True)
+def deployment(fn_isolation):
+    root = accounts[0]
+    owner = accounts[1]
+    deployer = DeployerHelper.deploy(root, {'from': root})
+    delegatee = deployer.addressOf(1)
+    nofeeswap = deployer.addressOf(2)
+    deployer.create3(
+        1,
+        NofeeswapDelegatee.bytecode + encode(
+            ['address'],
+            [nofeeswap]
+        ).hex(),
+        {'from': root}
+    )
+    deployer.create3(
+        2,
+        Nofeeswap.bytecode + encode(
+            ['address', 'address'],
+            [delegatee, root.address]
+        ).hex(),
+        {'from': root}
+    )
+    delegatee = NofeeswapDelegatee.at(delegatee)
+    nofeeswap = Nofeeswap.at(nofeeswap)
+    access = Access.deploy({'from': root})
+    operator = MockOperator.deploy(nofeeswap, {'from': root})
+    swapper = MockSwapper.deploy(nofeeswap, {'from': root})
+
+    token0 = ERC20FixedSupply.deploy("ERC20_0", "ERC20_0", 2**120, owner, {'from': owner})
+    token1 = ERC20FixedSupply.deploy("ERC20_1", "ERC20_1", 2**120, owner, {'from': owner})
+    if toInt(token0.address) > toInt(token1.address):
+        token0, token1 = token1, token0
+
+    for spender in [operator, swapper]:
+        token0.approve(spender, 2**120, {'from': owner})
+        token1.approve(spender, 2**120, {'from': owner})
+
+    return root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1
+
+# Initializes a pool and mints 'shares' over the current interval only.
+def initialize(deployment, salt, kernel, shares):
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    unsaltedPoolId = (salt << 188) + (twosComplementInt8(logOffset) << 180) + (0 << 160)
+    poolId = getPoolId(owner.address, unsaltedPoolId)
+
+    nofeeswap.dispatch(
+      delegatee.initialize.encode_input(
+          unsaltedPoolId,
+          toInt(token0.address),
+          toInt(token1.address),
+          0,
+          encodeKernelCompact(kernel),
+          encodeCurve(curve),
+          b""
+      ),
+      {'from': owner}
+    )
+
+    pool = PoolSnapshot.fromAccess(access, nofeeswap, poolId)
+    amount0, amount1 = PositionValuation(pool).modifyPositionAmounts(curve[0], curve[1], shares)
+    session = UnlockSession(nofeeswap.address, operator.address)
+    tag0 = session.registerERC20(token0.address)
+    tag1 = session.registerERC20(token1.address)
+    session.modifyPosition(
+        poolId,
+        fromOffsetted(poolId, curve[0]),
+        fromOffsetted(poolId, curve[1]),
+        shares,
+        b"",
+        tag0,
+        tag1,
+        amount0,
+        amount1
+    )
+    session.settle(owner.address, owner.address, owner.address)
+    nofeeswap.unlock(operator, session.encode(), {'from': owner})
+
+    return poolId
+
+# Returns the amounts of an actual swap.
+def swap(deployment, poolId, amountSpecified, logPriceLimit, zeroForOne):
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    tx = nofeeswap.unlock(
+        swapper,
+        encode(
+            ['uint256', 'int256', 'int256', 'uint256', 'address', 'address'],
+            [poolId, amountSpecified, logPriceLimit, zeroForOne, token0.address, token1.address]
+        ),
+        {'from': owner}
+    )
+    _, amount0, amount1 = decode(['uint256', 'int256', 'int256'], bytes(tx.return_value))
+    return amount0, amount1
+
+def getSimulator(nofeeswap):
+    return SwapSimulator(
+        web3.provider.endpoint_uri,
+        nofeeswap.address,
+        SwapSimulatorContract._build['deployedBytecode']
+    )
+
+def test_simulate(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    poolId = initialize(deployment, 0, kernels[0], 2 ** 60)
+    simulator = getSimulator(nofeeswap)
+    limit = fromOffsetted(poolId, curve[1] - spacing // 8)
+
+    # The state which is read from chain is overridden by itself.
+    state = simulator.readState(poolId, curve[0 : 2])
+    assert state.curve == curve
+    extension, _, logPriceCurrent, sharesTotal, growth, integral0, integral1 = access._readDynamicParams(nofeeswap, poolId)
+    assert state.dynamicParams == (extension, logPriceCurrent, sharesTotal, growth, integral0, integral1)
+    assert state.growthMultipliers == {q: access._readGrowthMultiplier(nofeeswap, poolId, q) for q in curve[0 : 2]}
+
+    for amountSpecified in [2 ** 40, - 2 ** 40, 2 ** 100]:
+        amount0, amount1, gasUsed = simulator.simulate(state, amountSpecified, limit, 2)
+        assert (amount0, amount1, gasUsed) == simulator.simulate(PoolState(poolId), amountSpecified, limit, 2)
+        assert gasUsed > 0
+
+    # Nothing is written on chain by a simulation.
+    assert simulator.readState(poolId, curve[0 : 2]).dynamicParams == state.dynamicParams
+    assert (amount0, amount1) == swap(deployment, poolId, 2 ** 100, limit, 2)
+
+# The state of one pool, including its static parameters and hence its
+# kernel, is imposed on another pool. The simulated swap on the latter matches
+# an actual swap on the former.
+def test_whatIf(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    poolId0 = initialize(deployment, 0, kernels[0], 2 ** 60)
+    poolId1 = initialize(deployment, 1, kernels[1], 2 ** 62)
+    simulator = getSimulator(nofeeswap)
+
+    source = simulator.readState(poolId1, curve[0 : 2])
+    assert source.staticParams != simulator.readState(poolId0).staticParams
+    state = PoolState(poolId0, source.dynamicParams, source.curve, source.growthMultipliers, source.staticParams)
+
+    amountSpecified = 2 ** 50
+    limit = fromOffsetted(poolId0, curve[1] - spacing // 8)
+    amount0, amount1, _ = simulator.simulate(state, amountSpecified, limit, 2)
+    assert (amount0, amount1) != simulator.simulate(PoolState(poolId0), amountSpecified, limit, 2)[0 : 2]
+    assert (amount0, amount1) == swap(deployment, poolId1, amountSpecified, limit, 2)
+
+# Hundreds of hypothetical states are evaluated in a single JSON-RPC batch.
+# Reverts are reported per simulation and classified by 'CustomErrors.py'.
+def test_simulateBatch(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    poolId = initialize(deployment, 0, kernels[0], 2 ** 60)
+    simulator = getSimulator(nofeeswap)
+    state = simulator.readState(poolId, curve[0 : 2])
+    extension, logPriceCurrent, sharesTotal, growth, integral0, integral1 = state.dynamicParams
+    limit = fromOffsetted(poolId, curve[1] - spacing // 8)
+
+    swaps = []
+    for k in range(300):
+        hypothetical = PoolState(
+            poolId,
+            (extension, logPriceCurrent, sharesTotal, growth + k * (growth >> 8), integral0, integral1),
+            state.curve,
+            state.growthMultipliers,
+            state.staticParams
+        )
+        swaps.append((hypothetical, 2 ** (30 + k % 30), limit, 2))
+
+    # A pool whose 'growth' is zero does not exist.
+    swaps.append((PoolState(poolId, (extension, logPriceCurrent, sharesTotal, 0, integral0, integral1)), 2 ** 40, limit, 2))
+
+    start = time.time()
+    outcomes = simulator.simulateBatch(swaps)
+    batchDuration = time.time() - start
+
+    assert len(outcomes) == len(swaps)
+    assert isinstance(outcomes[-1], SimulationReverted)
+    assert outcomes[-1].error.name == 'PoolDoesNotExist'
+    assert outcomes[-1].error['poolId'] == poolId
+
+    start = time.time()
+    for k in range(0, 300, 30):
+        assert outcomes[k] == simulator.simulate(*swaps[k])
+    sequentialDuration = (time.time() - start) * 30
+
+    print()
+    print('300 simulations, batched: ' + '{:.2f}'.format(batchDuration) + 's, sequential (extrapolated): ' + '{:.2f}'.format(sequentialDuration) + 's')
+
+# The snapshots of 'PoolReader.py' match 'readState' and can be simulated as
+# they are.
+def test_poolReader(deployment, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, nofeeswap, delegatee, access, operator, swapper, token0, token1 = deployment
+
+    poolIds = [initialize(deployment, k, kernels[k], 2 ** 60) for k in range(2)]
+    simulator = getSimulator(nofeeswap)
+
+    async def read():
+        async with AsyncJsonRpc(web3.provider.endpoint_uri) as rpc:
+            return await PoolReader(rpc, nofeeswap.address).snapshots(poolIds)
+
+    snapshots = asyncio.run(read())
+    for poolId, kernel, snapshot in zip(poolIds, kernels, snapshots):
+        limit = fromOffsetted(poolId, curve[1] - spacing // 8)
+        state = simulator.readState(poolId, curve[0 : 2])
+        assert snapshot.block == web3.eth.block_number
+        assert snapshot.dynamicParams == state.dynamicParams
+        assert snapshot.curve == state.curve
+        assert snapshot.growthMultipliers == state.growthMultipliers
+        assert snapshot.staticParams == state.staticParams
+        assert snapshot.kernel == kernel
+        assert snapshot.expTable == b''
+        assert simulator.simulate(snapshot, 2 ** 40, limit, 2) == simulator.simulate(state, 2 ** 40, limit, 2)
@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, SwapWrapper
+from brownie import SwapWrapper
 from sympy import Integer, floor, exp
 from Nofee import logTest, X216, _curveLength_, _integral0_, _integral1_, _backGrowthMultiplier_, _nextGrowthMultiplier_, _sharesTotal_, _growth_, _back_, _next_, dataGeneration, toInt, twosComplementInt8
 from X111_test import oneX111
@@ -44,8 +44,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return SwapWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(SwapWrapper)
 
 @pytest.mark.parametrize('logOffset', [-89, 0, 89])
 @pytest.mark.parametrize('outgoingMax', [X216 // (1 << 80)])
@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 import brownie
-from brownie import accounts, SwapWrapper
+from brownie import SwapWrapper
 from Nofee import logTest, dataGeneration
 
 initializations, swaps, kernelsValid, kernelsInvalid = dataGeneration(1000)
@@ -42,8 +42,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return SwapWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(SwapWrapper)
 
 @pytest.mark.parametrize('zeroForOne', [False, True])
 @pytest.mark.parametrize('amount0', [int256max // 9, int256max, - (int256max // 9), - int256max])
@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, SwapWrapper
+from brownie import SwapWrapper
 from eth_abi import encode
 from Nofee import logTest, _poolGrowthPortion_, _maxPoolGrowthPortion_, _staticParams_, _endOfStaticParams_, dataGeneration, toInt
 
@@ -42,8 +42,8 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return SwapWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(SwapWrapper)
 
 @pytest.mark.parametrize('poolId', [value1, value2, value2, value3])
 @pytest.mark.parametrize('storagePointer', [1 << 255, 0, 111])
@@ -1,10 +1,13 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, SwapWrapper
+from brownie import SwapWrapper
 from sympy import Integer, floor, ceiling, exp
-from Nofee import logTest, _accrued0_, _accrued1_, _integral0_, _integral1_, _amount0_, _amount1_, _poolRatio0_, _poolRatio1_, _growth_, _interval_, _originToOvershoot_, dataGeneration, toInt, twosComplementInt8, twosComplement, encodeCurve, amend, outgoing, incoming, getMaxIntegrals, encodeKernel
+from Grid import grid
+from Nofee import logTest, _accrued0_, _accrued1_, _integral0_, _integral1_, _amount0_, _amount1_, _poolRatio0_, _poolRatio1_, _growth_, _interval_, _originToOvershoot_, dataGeneration, toInt, twosComplementInt8, twosComplement, encodeCurve, amend, encodeKernel
+from Golden import outgoing, incoming, getMaxIntegrals
 from X23_test import oneX23
 from X47_test import oneX47
+from CustomErrors import isError
 
 initializations, swaps, kernelsValid, kernelsInvalid = dataGeneration(1000)
 
@@ -44,24 +47,25 @@ points = [
 ]
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return SwapWrapper.deploy({'from': accounts[0]})
-
-kk = 0
-@pytest.mark.parametrize('n', range((kk * len(initializations['kernel'])) // 20, ((kk + 1) * len(initializations['kernel'])) // 20))
-@pytest.mark.parametrize('logOffset', [-89, 0, 89])
-@pytest.mark.parametrize('growth', [((1 << 127) - 1) // 5, (1 << 127) - (1 << 110)])
-@pytest.mark.parametrize('sharesTotal', [1000, ((1 << 127) - 1) // 9])
-@pytest.mark.parametrize('poolGrowthPortion', [oneX47 // 3])
-@pytest.mark.parametrize('protocolGrowthPortion', [oneX47 // 5])
-@pytest.mark.parametrize('accrued0', [((1 << 104) * (1 << 127)) // 3, ((1 << 104) * (1 << 127)) - ((1 << 17) * (1 << 127))])
-@pytest.mark.parametrize('accrued1', [((1 << 104) * (1 << 127)) // 5, ((1 << 104) * (1 << 127)) - ((1 << 10) * (1 << 127))])
-@pytest.mark.parametrize('poolRatio0', [(1 << 23) // 15])
-@pytest.mark.parametrize('poolRatio1', [(1 << 23) // 77])
-@pytest.mark.parametrize('amount0', [int256max // 9, - (int256max // 9)])
-@pytest.mark.parametrize('amount1', [int256max // 13, - (int256max // 7)])
-@pytest.mark.parametrize('amountSpecified', [int256max // 3])
-@pytest.mark.parametrize('crossThreshold', [0])
+def wrapper(deploy):
+    return deploy(SwapWrapper)
+
+@grid(
+    n=range(len(initializations['kernel'])),
+    logOffset=[-89, 0, 89],
+    growth=[((1 << 127) - 1) // 5, (1 << 127) - (1 << 110)],
+    sharesTotal=[1000, ((1 << 127) - 1) // 9],
+    poolGrowthPortion=[oneX47 // 3],
+    protocolGrowthPortion=[oneX47 // 5],
+    accrued0=[((1 << 104) * (1 << 127)) // 3, ((1 << 104) * (1 << 127)) - ((1 << 17) * (1 << 127))],
+    accrued1=[((1 << 104) * (1 << 127)) // 5, ((1 << 104) * (1 << 127)) - ((1 << 10) * (1 << 127))],
+    poolRatio0=[(1 << 23) // 15],
+    poolRatio1=[(1 << 23) // 77],
+    amount0=[int256max // 9, - (int256max // 9)],
+    amount1=[int256max // 13, - (int256max // 7)],
+    amountSpecified=[int256max // 3],
+    crossThreshold=[0]
+)
 def test_swapWithin(wrapper, n, logOffset, growth, sharesTotal, poolGrowthPortion, protocolGrowthPortion, accrued0, accrued1, poolRatio0, poolRatio1, amount0, amount1, amountSpecified, crossThreshold, request, worker_id):
     logTest(request, worker_id)
     
@@ -109,9 +113,7 @@ def test_swapWithin(wrapper, n, logOffset, growth, sharesTotal, poolGrowthPortio
             encodeCurve(curve)
         )
     except Exception as error:
-        assert ('SafeInRangeAmountOverflow' in error.revert_msg) or \
-            ('AccruedGrowthPortionOverflow' in error.revert_msg) or \
-            ('GrowthOverflow' in error.revert_msg)
+        assert isError(error, 'SafeInRangeAmountOverflow', 'AccruedGrowthPortionOverflow', 'GrowthOverflow')
     else:
         data = tx.events['(unknown)'][0]['data']
         overshoot = toInt(tx.events['(unknown)'][0]['topic1'])
@@ -1,6 +1,6 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
-from brownie import accounts, TagWrapper
+from brownie import TagWrapper
 from Nofee import logTest, address0, toInt, keccak, keccakPacked
 from X59_test import oneX59, maxX59
 
@@ -23,8 +23,8 @@ poolId1 = 0xF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00F
 poolId2 = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return TagWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(TagWrapper)
 
 @pytest.mark.parametrize('value0', [tag0, tag1, tag2, tag3])
 @pytest.mark.parametrize('value1', [tag0, tag1, tag2, tag3])
@@ -0,0 +1,228 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import sys
+import random
+from concurrent.futures import ProcessPoolExecutor
+from IntervalModel import (
+    X15,
+    exp,
+    log,
+    packPrice,
+    outgoing,
+    incoming,
+    loadTargetSearch,
+    SearchingForOutgoingTargetFailed,
+    SearchingForIncomingTargetFailed
+)
+
+# Sweeps the input space of 'searchOutgoingTarget' and 'searchIncomingTarget'
+# using the model of 'IntervalModel.py'. Each configuration is
+#
+#   '(isIncoming, integralLimit, currentToTarget, zeroForOne, input)'
+#
+# with the same inputs as '_searchOutgoingTarget' or '_searchIncomingTarget'
+# of 'IntervalWrapper.sol'. Two families of configurations are generated:
+#
+# - 'fuzz' applies the seed transforms of 'SearchOutgoingTest.sol' and
+#   'SearchIncomingTest.sol' to uniformly random seeds, i.e., the input space
+#   of the echidna campaigns, and
+#
+# - 'narrow' draws the segments that swaps actually encounter, i.e., kernel
+#   segments of '2 ** 44' to '2 ** 59' in width whose ends often coincide with
+#   'begin' and 'target'.
+#
+# Every configuration can be traced either from the linear guess of
+# 'Interval.sol' or from the refined guess of 'IntervalWrapper.sol', i.e., the
+# output of 'refineTargetGuess':
+#
+#   python tests/TargetSearch.py [count] [workers]
+#
+# prints the resulting histograms of the number of Halley iterations side by
+# side.
+
+def _price(logPrice, heightPrice=0):
+    sqrtPrice, sqrtInversePrice = exp(logPrice)
+    return packPrice(logPrice, sqrtPrice, sqrtInversePrice, heightPrice)
+
+def _configuration(isIncoming, zeroForOne, begin, target, total0, total1, integralSeed):
+    integral = (incoming if isIncoming else outgoing)(total0, total1, begin, target)
+    # The seed transform of 'integralLimit' reverts otherwise.
+    if integral <= 1:
+        return None
+    integralLimit = 1 + integralSeed % (integral - 1)
+    input = []
+    for price in [begin, target, total0, total1]:
+        input += [price >> 256, price % (1 << 256)]
+    return (isIncoming, integralLimit, 0, zeroForOne, input)
+
+# 'get_a_logPrice' of 'FuzzUtilities.sol'.
+def getALogPrice(seed):
+    return 1 + (seed % ((2 ** 64) - 1))
+
+# 'get_a_logPrice_in_between' of 'FuzzUtilities.sol'.
+def getALogPriceInBetween(seed, logPrice0, logPrice1):
+    lower = min(logPrice0, logPrice1)
+    upper = max(logPrice0, logPrice1)
+    return lower + (seed % (upper - lower + 1))
+
+# 'get_a_height' of 'FuzzUtilities.sol'.
+def getAHeight(seed):
+    return seed % (X15 + 1)
+
+# 'get_a_height_in_between' of 'FuzzUtilities.sol'.
+def getAHeightInBetween(seed, height0, height1):
+    lower = min(height0, height1)
+    upper = max(height0, height1)
+    return lower + (seed % (upper - lower + 1))
+
+# The seed transforms of 'searchOutgoingTarget_test' and
+# 'searchIncomingTarget_test'. Returns 'None' if the seeds are rejected.
+def fromSeeds(isIncoming, zeroForOneSeed, beginSeed, targetSeed, total0Seed, total1Seed, integralSeed):
+    total0 = getALogPrice(total0Seed % (1 << 64))
+    total1 = getALogPrice(total1Seed % (1 << 64))
+    total0Height = getAHeight((total0Seed >> 64) % (1 << 16))
+    total1Height = getAHeightInBetween((total1Seed >> 64) % (1 << 16), 1, X15)
+    total0Height, total1Height = min(total0Height, total1Height), max(total0Height, total1Height)
+    if zeroForOneSeed:
+        total0, total1 = max(total0, total1), min(total0, total1)
+    else:
+        total0, total1 = min(total0, total1), max(total0, total1)
+    begin = getALogPriceInBetween(beginSeed, total0, total1)
+    target = getALogPriceInBetween(targetSeed, total0, total1)
+    if zeroForOneSeed:
+        begin, target = max(begin, target), min(begin, target)
+    else:
+        begin, target = min(begin, target), max(begin, target)
+    return _configuration(
+        isIncoming,
+        zeroForOneSeed,
+        _price(begin),
+        _price(target),
+        _price(total0, total0Height),
+        _price(total1, total1Height),
+        integralSeed
+    )
+
+def fuzz(count, isIncoming, seed=0):
+    rng = random.Random(seed)
+    configurations = []
+    while len(configurations) < count:
+        configuration = fromSeeds(
+            isIncoming,
+            rng.getrandbits(1) == 1,
+            rng.getrandbits(64),
+            rng.getrandbits(64),
+            rng.getrandbits(80),
+            rng.getrandbits(80),
+            rng.getrandbits(216)
+        )
+        if configuration is not None:
+            configurations.append(configuration)
+    return configurations
+
+def narrow(count, isIncoming, seed=0):
+    rng = random.Random(seed)
+    configurations = []
+    while len(configurations) < count:
+        zeroForOne = rng.getrandbits(1) == 1
+        width = 1 + rng.getrandbits(rng.randint(44, 59))
+        total0 = (1 << 62) + rng.getrandbits(60)
+        total1 = total0 - width if zeroForOne else total0 + width
+        total0Height = 0 if rng.random() < 0.3 else rng.randint(0, X15)
+        total1Height = rng.randint(max(total0Height, 1), X15) if rng.random() < 0.8 else max(total0Height, 1)
+        lower = min(total0, total1)
+        upper = max(total0, total1)
+        begin = total0 if rng.random() < 0.5 else rng.randint(lower, upper)
+        target = total1 if rng.random() < 0.5 else rng.randint(lower, upper)
+        if zeroForOne:
+            begin, target = max(begin, target), min(begin, target)
+        else:
+            begin, target = min(begin, target), max(begin, target)
+        configuration = _configuration(
+            isIncoming,
+            zeroForOne,
+            _price(begin),
+            _price(target),
+            _price(total0, total0Height),
+            _price(total1, total1Height),
+            rng.getrandbits(216)
+        )
+        if configuration is not None:
+            configurations.append(configuration)
+    return configurations
+
+# Evaluates a single configuration. The output is a dictionary so that it can
+# be pickled back from worker processes. If 'refine' is set, the search starts
+# from the output of 'refineTargetGuess' instead of the linear guess.
+def trace(configuration, refine=False, maxSteps=64):
+    isIncoming, integralLimit, currentToTarget, zeroForOne, input = configuration
+    model = loadTargetSearch(integralLimit, currentToTarget, zeroForOne, input)
+    output = {'configuration': configuration, 'failed': False}
+    try:
+        if isIncoming:
+            output['exactAmount'], output['amount'] = model.searchIncomingTarget(refine, maxSteps)
+        else:
+            output['exactAmount'], output['amount'] = model.searchOutgoingTarget(refine, maxSteps)
+        output['target'] = log(model.target)
+    except (SearchingForOutgoingTargetFailed, SearchingForIncomingTargetFailed):
+        output['failed'] = True
+    output['halley'] = model.halley
+    output['epsilonMoves'] = model.epsilonMoves
+    output['refinement'] = model.refinement
+    return output
+
+# Traces every configuration in parallel as in 'IntervalModel.sweep'.
+def sweep(configurations, workers=None, refine=False, maxSteps=64):
+    configurations = list(configurations)
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers <= 1 or len(configurations) <= 1:
+        return [trace(configuration, refine, maxSteps) for configuration in configurations]
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(
+            trace,
+            configurations,
+            [refine] * len(configurations),
+            [maxSteps] * len(configurations),
+            chunksize=max(1, len(configurations) // (4 * workers))
+        ))
+
+# Summarizes the output of 'sweep' as a histogram of the number of Halley
+# iterations per configuration, including the final one whose step is zero,
+# together with the failed configurations.
+def histogram(traces):
+    counts = dict()
+    failures = []
+    for output in traces:
+        if output['failed']:
+            failures.append(output['configuration'])
+        else:
+            steps = len(output['halley'])
+            counts[steps] = counts.get(steps, 0) + 1
+    return dict(sorted(counts.items())), failures
+
+# The average number of Halley iterations and epsilon moves.
+def mean(traces):
+    count = max(1, len(traces))
+    return (
+        sum(len(output['halley']) for output in traces) / count,
+        sum(output['epsilonMoves'] for output in traces) / count
+    )
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    for generator in [fuzz, narrow]:
+        for isIncoming in [False, True]:
+            configurations = generator(count, isIncoming)
+            print(generator.__name__ + ', ' + ('searchIncomingTarget' if isIncoming else 'searchOutgoingTarget') + ':')
+            for refine in [False, True]:
+                traces = sweep(configurations, workers, refine)
+                counts, failures = histogram(traces)
+                iterations, epsilonMoves = mean(traces)
+                print(
+                    '  ' + ('refined guess: ' if refine else 'linear guess:  ') +
+                    str(counts) +
+                    ', mean iterations: ' + format(iterations, '.3f') +
+                    ', mean epsilon moves: ' + format(epsilonMoves, '.3f') +
+                    ', failures: ' + str(len(failures))
+                )
@@ -0,0 +1,67 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from Nofee import logTest
+from IntervalModel import incoming, outgoing, storePrice, copyPrice, loadTargetSearch
+from TargetSearch import fuzz, narrow, sweep, histogram, mean
+
+# The properties of 'SearchOutgoingTest.sol' and 'SearchIncomingTest.sol',
+# i.e., the target is the closest log price to 'begin' whose integral reaches
+# the limit.
+def checkProperties(output):
+    isIncoming, integralLimit, currentToTarget, zeroForOne, input = output['configuration']
+    model = loadTargetSearch(integralLimit, currentToTarget, zeroForOne, input)
+    begin = model.begin
+    target = output['target']
+    left = target - 1 if zeroForOne else target + 1
+    right = target + 1 if zeroForOne else target - 1
+
+    assert output['exactAmount']
+    if isIncoming:
+        assert output['amount'] <= integralLimit
+        if target != (model.total1 >> 432) % (1 << 64):
+            model.target = copyPrice(model.target, storePrice(left))
+            assert integralLimit < incoming(model.total0, model.total1, begin, model.target)
+    else:
+        assert integralLimit <= output['amount']
+        if target != (begin >> 432) % (1 << 64):
+            model.target = copyPrice(model.target, storePrice(right))
+            assert outgoing(model.total0, model.total1, begin, model.target) < integralLimit
+
+# Both the linear guess of 'Interval.sol' and the refined guess of
+# 'IntervalWrapper.sol' are swept.
+@pytest.mark.parametrize('generator', [fuzz, narrow])
+@pytest.mark.parametrize('isIncoming', [False, True])
+@pytest.mark.parametrize('refine', [False, True])
+def test_sweep(generator, isIncoming, refine, request, worker_id):
+    logTest(request, worker_id)
+
+    configurations = generator(200, isIncoming)
+    traces = sweep(configurations, 2, refine)
+    counts, failures = histogram(traces)
+    assert failures == []
+    assert sum(counts.values()) == len(configurations)
+
+    for output in traces:
+        checkProperties(output)
+
+        # Every Halley iteration but the last one moves 'x'.
+        halley = output['halley']
+        assert halley[-1][1] == 0
+        assert all(step != 0 for _, step in halley[:-1])
+
+# The refined initial guess changes the iterations but not the target. The
+# amounts may differ in the last few bits because 'moveOvershootByEpsilon'
+# derives the price of the target from its neighbour instead of 'exp'.
+@pytest.mark.parametrize('isIncoming', [False, True])
+def test_guess(isIncoming, request, worker_id):
+    logTest(request, worker_id)
+
+    configurations = narrow(200, isIncoming)
+    linear = sweep(configurations, 2)
+    refined = sweep(configurations, 2, True)
+    for output0, output1 in zip(refined, linear):
+        assert output0['failed'] == output1['failed'] == False
+        assert output0['target'] == output1['target']
+        assert abs(output0['amount'] - output1['amount']) <= output0['amount'] >> 128
+
+    assert mean(refined)[0] < mean(linear)[0]
@@ -0,0 +1,105 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import json
+import zlib
+from sha3 import keccak_256
+from brownie import web3
+
+# A content-addressed cache of transaction traces. Tracing a transaction with
+# its memory is the most expensive request that is served by the development
+# network while its outcome is fully determined by:
+#
+# - the runtime bytecode of the receiver,
+# - the calldata, and
+# - the state prior to the transaction, i.e., the state root of its parent
+#   block, which is reproducible thanks to the isolation fixtures of brownie.
+#
+# Hence, traces are stored under the keccak of the above and are read locally
+# by subsequent runs. By default, only the 'LOG' steps are kept along with the
+# memory at each of them. With 'full=True', every step is kept and the memory
+# of each step is stored as a delta with respect to the previous one.
+#
+# Entries are compressed files in 'traces' and the least recently used ones
+# are evicted once the total size exceeds 'NOFEE_TRACE_CACHE_MB' megabytes.
+tracesPath = os.path.join('testLogs', 'traces')
+
+sizeCap = int(os.environ.get('NOFEE_TRACE_CACHE_MB', '256')) * (2 ** 20)
+
+def getKey(tx, full):
+    parent = web3.eth.get_block(tx.block_number - 1)
+    content = bytes(web3.eth.get_code(tx.receiver))
+    content += bytes.fromhex(tx.input[2:])
+    content += bytes(parent['stateRoot'])
+    content += b'full' if full else b'logs'
+    return keccak_256(content).hexdigest()
+
+# Each step keeps 'op', 'pc' and 'depth' and, instead of 'memory', the length
+# of memory in words together with the words that differ from the previous
+# step.
+def encodeSteps(trace, full):
+    steps = []
+    previous = []
+    for step in trace:
+        if not full:
+            if step['op'].startswith('LOG'):
+                steps.append({'op': step['op'], 'depth': step['depth'], 'memory': step['memory']})
+            continue
+        memory = step['memory']
+        delta = [[kk, memory[kk]] for kk in range(len(memory)) if kk >= len(previous) or previous[kk] != memory[kk]]
+        steps.append({'op': step['op'], 'pc': step['pc'], 'depth': step['depth'], 'size': len(memory), 'delta': delta})
+        previous = memory
+    return steps
+
+def decodeSteps(steps, full):
+    if not full:
+        return steps
+    trace = []
+    memory = []
+    for step in steps:
+        memory = memory[0 : step['size']] + [None] * (step['size'] - len(memory))
+        for kk, word in step['delta']:
+            memory[kk] = word
+        trace.append({'op': step['op'], 'pc': step['pc'], 'depth': step['depth'], 'memory': list(memory)})
+    return trace
+
+def evict():
+    entries = []
+    for name in os.listdir(tracesPath):
+        try:
+            status = os.stat(os.path.join(tracesPath, name))
+            entries.append((status.st_mtime, status.st_size, name))
+        except FileNotFoundError:
+            pass
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= sizeCap:
+            break
+        try:
+            os.remove(os.path.join(tracesPath, name))
+        except FileNotFoundError:
+            pass
+        total -= size
+
+# Returns the steps of 'tx.trace' which are kept by the cache, as a list of
+# dictionaries with the same keys as brownie. Receipts of the in-process
+# backend (see 'Evm.py') carry their 'LOG' steps already and bypass the cache.
+def getTrace(tx, full=False):
+    if not hasattr(tx, 'txid'):
+        return tx.trace
+
+    path = os.path.join(tracesPath, getKey(tx, full) + '.z')
+    try:
+        with open(path, 'rb') as f:
+            steps = json.loads(zlib.decompress(f.read()))
+        os.utime(path)
+        return decodeSteps(steps, full)
+    except FileNotFoundError:
+        pass
+
+    steps = encodeSteps(tx.trace, full)
+    os.makedirs(tracesPath, exist_ok=True)
+    with open(path + '.' + str(os.getpid()), 'wb') as f:
+        f.write(zlib.compress(json.dumps(steps).encode()))
+    os.replace(path + '.' + str(os.getpid()), path)
+    evict()
+    return decodeSteps(steps, full)
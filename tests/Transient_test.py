@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 import brownie
-from brownie import accounts, TransientWrapper
+from brownie import TransientWrapper
 from Nofee import logTest, address0, keccak256, keccak, keccakPacked
 from Tag_test import tag0, tag1, tag2, tag3
 
@@ -33,8 +33,8 @@ index0 = 0x0000000000000000000000000000000000000000000000000000000000000000
 index1 = 0xF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00FF00F
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return TransientWrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(TransientWrapper)
 
 def test_unlockTargetSlot(wrapper, request, worker_id):
     logTest(request, worker_id)
@@ -0,0 +1,220 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+from eth_abi import encode
+from Nofee import keccak256, keccakPacked, toInt
+from PositionValuation import positionTag
+
+# The first four bytes of 'keccak256(signature)'.
+def selector(signature):
+    return (keccak256(signature) >> 224).to_bytes(4, 'big')
+
+def encodeCall(signature, types, values):
+    return selector(signature) + encode(types, values)
+
+def erc20Tag(token):
+    return toInt(token) if type(token) is str else token
+
+def multiTokenTag(token, tokenId):
+    return keccakPacked(['uint256', 'address'], [tokenId, token])
+
+swapSignature = 'swap(uint256,int256,int256,uint256,bytes)'
+modifyPositionSignature = 'modifyPosition(uint256,int256,int256,int256,bytes)'
+donateSignature = 'donate(uint256,uint256,bytes)'
+collectPoolSignature = 'collectPool(uint256)'
+collectProtocolSignature = 'collectProtocol(uint256)'
+dispatchSignature = 'dispatch(bytes)'
+modifyBalanceSignature = 'modifyBalance(address,uint256,int256)'
+syncSignature = 'sync(address)'
+syncMultiTokenSignature = 'sync(address,uint256)'
+settleSignature = 'settle()'
+takeSignature = 'take(address,address,uint256)'
+takeERC6909Signature = 'take(address,uint256,address,uint256)'
+takeERC1155Signature = 'take(address,uint256,address,uint256,bytes)'
+transferFromSignature = 'transferFrom(address,address,uint256)'
+transferFromERC6909Signature = 'transferFrom(address,address,uint256,uint256)'
+safeTransferFromERC1155Signature = 'safeTransferFrom(address,address,uint256,uint256,bytes)'
+
+zeroAddress = '0x' + '00' * 20
+
+# Composes the body of a single 'unlock' session.
+#
+# Each action appends a call to be executed by the unlock target (see
+# 'MockOperator.sol') and records its effect on the transient balances of the
+# unlock target, i.e., the values which 'updateTransientBalance' accumulates
+# per tag. A positive net balance is owed to the protocol and a negative net
+# balance is owed to the unlock target. Amounts are provided by the caller,
+# e.g., via 'PositionValuation.modifyPositionAmounts'.
+#
+# Since only the net balance of each tag is settled at the end of the session,
+# opposite actions on the same tag (e.g., minting and burning the same
+# position or swapping back and forth) cost no token transfers at all and
+# every tag with a nonzero net is settled by a single operation:
+#
+#  - a negative net is taken via 'take',
+#  - a positive net of an ERC-20 or a multi-token is paid via 'sync', a
+#    transfer from 'payer' to nofeeswap and 'settle',
+#  - a positive net of the native token is paid via 'settle' with 'value',
+#  - any other tag (e.g., a position tag) is netted against the singleton
+#    balance of 'owner' via 'modifyBalance'.
+class UnlockSession:
+    def __init__(self, nofeeswap, operator):
+        self.nofeeswap = nofeeswap
+        self.operator = operator
+        self.calls = []
+        self.balances = dict()
+        self.tokens = dict()
+
+    def _call(self, target, value, data):
+        self.calls.append((target, value, data))
+
+    def _dispatch(self, data):
+        self._call(self.nofeeswap, 0, encodeCall(dispatchSignature, ['bytes'], [data]))
+
+    def _update(self, tag, amount):
+        if amount == 0:
+            return
+        balance = self.balances.get(tag, 0) + amount
+        if balance == 0:
+            del self.balances[tag]
+        else:
+            self.balances[tag] = balance
+
+    # Tags which are settled via token transfers should be registered.
+    def registerNative(self):
+        self.tokens[0] = ('native',)
+        return 0
+
+    def registerERC20(self, token):
+        tag = erc20Tag(token)
+        self.tokens[tag] = ('erc20', token)
+        return tag
+
+    def registerERC6909(self, token, tokenId):
+        tag = multiTokenTag(token, tokenId)
+        self.tokens[tag] = ('erc6909', token, tokenId)
+        return tag
+
+    def registerERC1155(self, token, tokenId, transferData=b''):
+        tag = multiTokenTag(token, tokenId)
+        self.tokens[tag] = ('erc1155', token, tokenId, transferData)
+        return tag
+
+    def swap(self, poolId, amountSpecified, logPriceLimit, zeroForOne, hookData, tag0, tag1, amount0, amount1):
+        self._call(self.nofeeswap, 0, encodeCall(
+            swapSignature,
+            ['uint256', 'int256', 'int256', 'uint256', 'bytes'],
+            [poolId, amountSpecified, logPriceLimit, zeroForOne, hookData]
+        ))
+        self._update(tag0, amount0)
+        self._update(tag1, amount1)
+
+    def modifyPosition(self, poolId, logPriceMin, logPriceMax, shares, hookData, tag0, tag1, amount0, amount1):
+        self._dispatch(encodeCall(
+            modifyPositionSignature,
+            ['uint256', 'int256', 'int256', 'int256', 'bytes'],
+            [poolId, logPriceMin, logPriceMax, shares, hookData]
+        ))
+        self._update(positionTag(poolId, logPriceMin, logPriceMax), - shares)
+        self._update(tag0, amount0)
+        self._update(tag1, amount1)
+
+    def donate(self, poolId, shares, hookData, tag0, tag1, amount0, amount1):
+        self._dispatch(encodeCall(
+            donateSignature,
+            ['uint256', 'uint256', 'bytes'],
+            [poolId, shares, hookData]
+        ))
+        self._update(tag0, amount0)
+        self._update(tag1, amount1)
+
+    # Collected amounts are credited to singleton balances directly and leave
+    # transient balances untouched.
+    def collectPool(self, poolId):
+        self._dispatch(encodeCall(collectPoolSignature, ['uint256'], [poolId]))
+
+    def collectProtocol(self, poolId):
+        self._dispatch(encodeCall(collectProtocolSignature, ['uint256'], [poolId]))
+
+    # Moves 'amount' from the singleton balance of 'owner' to the transient
+    # balance of the unlock target, e.g., in order to spend collected amounts
+    # within the same session.
+    def withdraw(self, owner, tag, amount):
+        self._call(self.nofeeswap, 0, encodeCall(
+            modifyBalanceSignature,
+            ['address', 'uint256', 'int256'],
+            [owner, tag, - amount]
+        ))
+        self._update(tag, - amount)
+
+    # Appends the settlement of every nonzero net balance. 'payer' is the
+    # account from which positive nets are pulled, 'recipient' receives
+    # negative nets and 'owner' is the singleton balance owner for any
+    # unregistered tag. Returns the number of appended calls.
+    def settle(self, payer, recipient, owner):
+        count = len(self.calls)
+        for tag in sorted(self.balances.keys()):
+            amount = self.balances[tag]
+            token = self.tokens.get(tag)
+            if token is None:
+                self._call(self.nofeeswap, 0, encodeCall(
+                    modifyBalanceSignature,
+                    ['address', 'uint256', 'int256'],
+                    [owner, tag, - amount]
+                ))
+            elif amount < 0:
+                self._take(token, recipient, - amount)
+            else:
+                self._pay(token, payer, amount)
+        self.balances = dict()
+        return len(self.calls) - count
+
+    def _take(self, token, recipient, amount):
+        if token[0] == 'native':
+            signature, types, values = takeSignature, ['address', 'address', 'uint256'], [zeroAddress, recipient, amount]
+        elif token[0] == 'erc20':
+            signature, types, values = takeSignature, ['address', 'address', 'uint256'], [token[1], recipient, amount]
+        elif token[0] == 'erc6909':
+            signature, types, values = takeERC6909Signature, ['address', 'uint256', 'address', 'uint256'], [token[1], token[2], recipient, amount]
+        else:
+            signature, types, values = takeERC1155Signature, ['address', 'uint256', 'address', 'uint256', 'bytes'], [token[1], token[2], recipient, amount, token[3]]
+        self._call(self.nofeeswap, 0, encodeCall(signature, types, values))
+
+    def _pay(self, token, payer, amount):
+        if token[0] == 'native':
+            # 'settle' treats 'msg.value' as payment when the reserve token is
+            # 'address(0)'.
+            self._call(self.nofeeswap, 0, encodeCall(syncSignature, ['address'], [zeroAddress]))
+            self._call(self.nofeeswap, amount, encodeCall(settleSignature, [], []))
+            return
+        if token[0] == 'erc20':
+            self._call(self.nofeeswap, 0, encodeCall(syncSignature, ['address'], [token[1]]))
+            self._call(token[1], 0, encodeCall(
+                transferFromSignature,
+                ['address', 'address', 'uint256'],
+                [payer, self.nofeeswap, amount]
+            ))
+        elif token[0] == 'erc6909':
+            self._call(self.nofeeswap, 0, encodeCall(syncMultiTokenSignature, ['address', 'uint256'], [token[1], token[2]]))
+            self._call(token[1], 0, encodeCall(
+                transferFromERC6909Signature,
+                ['address', 'address', 'uint256', 'uint256'],
+                [payer, self.nofeeswap, token[2], amount]
+            ))
+        else:
+            self._call(self.nofeeswap, 0, encodeCall(syncMultiTokenSignature, ['address', 'uint256'], [token[1], token[2]]))
+            self._call(token[1], 0, encodeCall(
+                safeTransferFromERC1155Signature,
+                ['address', 'address', 'uint256', 'uint256', 'bytes'],
+                [payer, self.nofeeswap, token[2], amount, token[3]]
+            ))
+        self._call(self.nofeeswap, 0, encodeCall(settleSignature, [], []))
+
+    # The native value to be attached to 'unlock'.
+    def value(self):
+        return sum(call[1] for call in self.calls)
+
+    # The 'data' argument of 'unlock', as decoded by 'MockOperator.sol'.
+    def encode(self):
+        return encode(
+            ['address[]', 'uint256[]', 'bytes[]'],
+            [[call[0] for call in self.calls], [call[1] for call in self.calls], [call[2] for call in self.calls]]
+        )
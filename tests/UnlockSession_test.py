@@ -0,0 +1,122 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import accounts, Access, Nofeeswap, NofeeswapDelegatee, ERC20FixedSupply, MockOperator, DeployerHelper
+from Nofee import logTest, encode, toInt, twosComplementInt8, encodeKernelCompact, encodeCurve, getPoolId
+from PositionValuation import PoolSnapshot, PositionValuation, positionTag, fromOffsetted
+from UnlockSession import UnlockSession
+
+logOffset = -5
+kernel = [
+  [0, 0],
+  [2 ** 40, 2 ** 15]
+]
+curve = [2 ** 40 + 1, 2 ** 40 + 1 + 2 ** 40, 2 ** 40 + 1 + 2 ** 39]
+
+@pytest.fixture(autouse=True)
+def deployment(fn_isolation):
+    root = accounts[0]
+    owner = accounts[1]
+    other = accounts[2]
+    deployer = DeployerHelper.deploy(root, {'from': root})
+    delegatee = deployer.addressOf(1)
+    nofeeswap = deployer.addressOf(2)
+    deployer.create3(
+        1,
+        NofeeswapDelegatee.bytecode + encode(
+            ['address'],
+            [nofeeswap]
+        ).hex(),
+        {'from': root}
+    )
+    deployer.create3(
+        2,
+        Nofeeswap.bytecode + encode(
+            ['address', 'address'],
+            [delegatee, root.address]
+        ).hex(),
+        {'from': root}
+    )
+    delegatee = NofeeswapDelegatee.at(delegatee)
+    nofeeswap = Nofeeswap.at(nofeeswap)
+    access = Access.deploy({'from': root})
+    operator = MockOperator.deploy(nofeeswap, {'from': root})
+
+    token0 = ERC20FixedSupply.deploy("ERC20_0", "ERC20_0", 2**120, owner, {'from': owner})
+    token1 = ERC20FixedSupply.deploy("ERC20_1", "ERC20_1", 2**120, owner, {'from': owner})
+    if toInt(token0.address) > toInt(token1.address):
+        token0, token1 = token1, token0
+
+    nofeeswap.dispatch(delegatee.modifyProtocol.encode_input(
+        (123 << 208) + (456 << 160) + int(root.address, 16)
+    ), {'from': root})
+
+    unsaltedPoolId = (twosComplementInt8(logOffset) << 180) + (0 << 160)
+    poolId = getPoolId(owner.address, unsaltedPoolId)
+
+    nofeeswap.dispatch(
+      delegatee.initialize.encode_input(
+          unsaltedPoolId,
+          toInt(token0.address),
+          toInt(token1.address),
+          0,
+          encodeKernelCompact(kernel),
+          encodeCurve(curve),
+          b""
+      ),
+      {'from': owner}
+    )
+
+    token0.approve(operator, 2**120, {'from': owner})
+    token1.approve(operator, 2**120, {'from': owner})
+
+    return root, owner, other, nofeeswap, delegatee, access, operator, token0, token1, poolId
+
+def modifyPosition(session, access, nofeeswap, poolId, tag0, tag1, shares):
+    pool = PoolSnapshot.fromAccess(access, nofeeswap, poolId)
+    amount0, amount1 = PositionValuation(pool).modifyPositionAmounts(pool.qLower, pool.qUpper, shares)
+    logPriceMin = fromOffsetted(poolId, pool.qLower)
+    logPriceMax = fromOffsetted(poolId, pool.qUpper)
+    session.modifyPosition(poolId, logPriceMin, logPriceMax, shares, b"", tag0, tag1, amount0, amount1)
+    return amount0, amount1, positionTag(poolId, logPriceMin, logPriceMax)
+
+@pytest.mark.parametrize('shares', [1, 1000000, 2 ** 60])
+def test_unlockSession(deployment, shares, request, worker_id):
+    logTest(request, worker_id)
+
+    root, owner, other, nofeeswap, delegatee, access, operator, token0, token1, poolId = deployment
+
+    # A single mint settles each tag once.
+    session = UnlockSession(nofeeswap.address, operator.address)
+    tag0 = session.registerERC20(token0.address)
+    tag1 = session.registerERC20(token1.address)
+    amount0, amount1, tag = modifyPosition(session, access, nofeeswap, poolId, tag0, tag1, shares)
+    assert amount0 > 0
+    assert amount1 > 0
+    assert session.settle(owner.address, owner.address, owner.address) == 7
+
+    balance0 = token0.balanceOf(owner)
+    balance1 = token1.balanceOf(owner)
+    tx = nofeeswap.unlock(operator, session.encode(), {'from': owner, 'value': session.value()})
+    assert nofeeswap.balanceOf(owner, tag) == shares
+    assert token0.balanceOf(owner) == balance0 - amount0
+    assert token1.balanceOf(owner) == balance1 - amount1
+    assert token0.balanceOf(nofeeswap) == amount0
+    assert token1.balanceOf(nofeeswap) == amount1
+
+    # A mint followed by a partial burn within the same session is netted, i.e.,
+    # each tag is still settled once.
+    session = UnlockSession(nofeeswap.address, operator.address)
+    session.registerERC20(token0.address)
+    session.registerERC20(token1.address)
+    mint0, mint1, _ = modifyPosition(session, access, nofeeswap, poolId, tag0, tag1, 3 * shares)
+    burn0, burn1, _ = modifyPosition(session, access, nofeeswap, poolId, tag0, tag1, - 2 * shares)
+    assert session.balances == {tag0: mint0 + burn0, tag1: mint1 + burn1, tag: - shares}
+    assert session.settle(owner.address, owner.address, owner.address) == 7
+
+    balance0 = token0.balanceOf(owner)
+    balance1 = token1.balanceOf(owner)
+    tx = nofeeswap.unlock(operator, session.encode(), {'from': owner, 'value': session.value()})
+    assert nofeeswap.balanceOf(owner, tag) == 2 * shares
+    assert token0.balanceOf(owner) == balance0 - mint0 - burn0
+    assert token1.balanceOf(owner) == balance1 - mint1 - burn1
+
@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, X111Wrapper
+from brownie import X111Wrapper
 from sympy import Integer, floor, exp
 from X216_test import oneX216
 
@@ -12,8 +12,8 @@ minusOneX127 = 0 - (1 << 111)
 maxGrowth = (1 << 127)
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return X111Wrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(X111Wrapper)
 
 @pytest.mark.parametrize('value0', [minX111, minX111 // 3, 0, maxX111 // 3, maxX111])
 @pytest.mark.parametrize('value1', [minX111, minX111 // 3, 0, maxX111 // 3, maxX111])
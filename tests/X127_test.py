@@ -3,7 +3,7 @@
 import pytest
 import brownie
 from Nofee import logTest
-from brownie import accounts, X127Wrapper
+from brownie import X127Wrapper
 from X216_test import maxX216, oneX216
 
 maxX127 = (1 << 255) - 1
@@ -12,8 +12,8 @@ oneX127 = 1 << 127
 minusOneX127 = 0 - (1 << 127)
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return X127Wrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(X127Wrapper)
 
 @pytest.mark.parametrize('value0', [minX127, minX127 // 3, 0, maxX127 // 3, maxX127])
 @pytest.mark.parametrize('value1', [minX127, minX127 // 3, 0, maxX127 // 3, maxX127])
@@ -1,13 +1,13 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, X15Wrapper
+from brownie import X15Wrapper
 
 oneX15 = 2 ** 15
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return X15Wrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(X15Wrapper)
 
 @pytest.mark.parametrize('value0', [0, oneX15 // 5, oneX15 // 4, oneX15 // 3, oneX15 // 2, oneX15])
 @pytest.mark.parametrize('value1', [0, oneX15 // 5, oneX15 // 4, oneX15 // 3, oneX15 // 2, oneX15])
@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, X208Wrapper
+from brownie import X208Wrapper
 from sympy import Integer, floor, exp
 from X216_test import maxX216, oneX216
 
@@ -9,8 +9,8 @@ maxX208 = 2 ** 256 - 1
 oneX208 = 2 ** 208
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return X208Wrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(X208Wrapper)
 
 @pytest.mark.parametrize('value0', [0, oneX208 // 5, oneX208 // 3, oneX208, maxX208 // 5, maxX208 // 3, maxX208])
 @pytest.mark.parametrize('value1', [0, oneX208 // 5, oneX208 // 3, oneX208, maxX208 // 5, maxX208 // 3, maxX208])
@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, X216Wrapper
+from brownie import X216Wrapper
 from sympy import Integer, floor, exp
 
 maxX216 = (1 << 255) - 1
@@ -10,8 +10,8 @@ oneX216 = 1 << 216
 minusOneX216 = 0 - (1 << 216)
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return X216Wrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(X216Wrapper)
 
 @pytest.mark.parametrize('value0', [minX216, minX216 // 3, 0, maxX216 // 3, maxX216])
 @pytest.mark.parametrize('value1', [minX216, minX216 // 3, 0, maxX216 // 3, maxX216])
@@ -1,13 +1,13 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, X23Wrapper
+from brownie import X23Wrapper
 
 oneX23 = 2 ** 23
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return X23Wrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(X23Wrapper)
 
 @pytest.mark.parametrize('value0', [0, oneX23 // 5, oneX23 // 3, oneX23])
 @pytest.mark.parametrize('value1', [0, oneX23 // 5, oneX23 // 3, oneX23])
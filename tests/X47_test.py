@@ -1,13 +1,13 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, X47Wrapper
+from brownie import X47Wrapper
 
 oneX47 = 2 ** 47
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return X47Wrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(X47Wrapper)
 
 @pytest.mark.parametrize('value0', [0, oneX47 // 5, oneX47 // 4, oneX47 // 3, oneX47 // 2, oneX47])
 @pytest.mark.parametrize('value1', [0, oneX47 // 5, oneX47 // 4, oneX47 // 3, oneX47 // 2, oneX47])
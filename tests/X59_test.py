@@ -1,7 +1,7 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, X59Wrapper
+from brownie import X59Wrapper
 from sympy import Integer, floor, exp, ceiling
 from X216_test import maxX216, oneX216
 
@@ -14,8 +14,8 @@ minLogOffsetX59 = 0 - (90 << 59)
 maxLogOffsetX59 = (90 << 59)
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return X59Wrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(X59Wrapper)
 
 @pytest.mark.parametrize('value0', [minX59, minX59 // 3, 0, maxX59 // 3, maxX59])
 @pytest.mark.parametrize('value1', [minX59, minX59 // 3, 0, maxX59 // 3, maxX59])
@@ -1,15 +1,15 @@
 # Copyright 2025, NoFeeSwap LLC - All rights reserved.
 import pytest
 from Nofee import logTest
-from brownie import accounts, X74Wrapper
+from brownie import X74Wrapper
 
 maxX74 = (1 << 113) - 1
 minX74 = 0 - (1 << 113)
 oneX74 = 1 << 74
 
 @pytest.fixture(autouse=True)
-def wrapper(fn_isolation):
-    return X74Wrapper.deploy({'from': accounts[0]})
+def wrapper(deploy):
+    return deploy(X74Wrapper)
 
 @pytest.mark.parametrize('value0', [minX74, minX74 // 3, 0, maxX74 // 3, maxX74])
 @pytest.mark.parametrize('value1', [minX74, minX74 // 3, 0, maxX74 // 3, maxX74])
@@ -0,0 +1,230 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import os
+import re
+import json
+import heapq
+import pytest
+import Grid
+from brownie import accounts
+from brownie.network import history
+
+# The durations of individual test cases, in seconds, are recorded in this
+# file after every run and are used by subsequent runs in order to balance
+# the workload across xdist workers.
+durationsPath = os.path.join('testLogs', 'durations.json')
+
+# The suffix which is appended to 'nodeid' by xdist when '--dist loadgroup' is
+# active.
+groupSuffix = re.compile(r'@lpt[0-9]+$')
+
+# The revert reasons which are encountered by each test function are recorded
+# in this file, separately for every execution backend (see 'Evm.py') and
+# every grid mode (see 'Grid.py'). A covering array is expected to reach the
+# same revert reasons as the full grid on the same backend.
+revertsPath = os.path.join('testLogs', 'reverts.json')
+
+# The total duration of every test module is recorded in this file separately
+# for each execution backend (see 'Evm.py') in order to compare them.
+backendsPath = os.path.join('testLogs', 'backends.json')
+
+durations = dict()
+
+reverts = dict()
+
+# The in-process EVM of this process, once the 'inProcessEvm' fixture is set
+# up.
+inProcessEvms = []
+
+def nodeidOf(nodeid):
+    return groupSuffix.sub('', nodeid)
+
+def functionOf(nodeid):
+    return nodeidOf(nodeid).split('[')[0]
+
+def readJson(path):
+    if os.path.isfile(path):
+        with open(path, 'r') as f:
+            return json.load(f)
+    return dict()
+
+def writeJson(path, content):
+    if os.path.exists('testLogs') == False:
+        os.mkdir('testLogs')
+    with open(path, 'w') as f:
+        json.dump(content, f, indent=0, sort_keys=True)
+
+def readDurations():
+    return readJson(durationsPath)
+
+def writeDurations(recorded):
+    merged = readDurations()
+    merged.update(recorded)
+    writeJson(durationsPath, merged)
+
+def mergeReverts(target, source):
+    for function, record in source.items():
+        merged = target.setdefault(function, {'cases': 0, 'reasons': {}})
+        merged['cases'] += record['cases']
+        for reason, count in record['reasons'].items():
+            merged['reasons'][reason] = merged['reasons'].get(reason, 0) + count
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--grid',
+        default=Grid.mode,
+        choices=['2', '3', 'full'],
+        help='Strength of the covering arrays generated by Grid.py, or full for the entire cartesian product.'
+    )
+    parser.addoption(
+        '--evm',
+        default=os.environ.get('NOFEE_EVM', 'brownie'),
+        choices=['brownie', 'inprocess'],
+        help='Execution backend of the wrappers which are deployed via the deploy fixture.'
+    )
+
+@pytest.fixture(scope='session')
+def inProcessEvm():
+    from Evm import InProcessEvm
+    evm = InProcessEvm()
+    inProcessEvms.append(evm)
+    return evm
+
+# Deploys a wrapper from 'contracts/helpers' on an isolated chain, which is
+# either the development network of brownie or the in-process EVM of 'Evm.py'.
+@pytest.fixture
+def deploy(request):
+    if request.config.getoption('evm') == 'inprocess':
+        evm = request.getfixturevalue('inProcessEvm')
+        evm.reset()
+        return evm.deploy
+    request.getfixturevalue('fn_isolation')
+    return lambda container: container.deploy({'from': accounts[0]})
+
+# Longest processing time first: test cases are sorted in descending order of
+# their recorded durations and each one is assigned to the bin with the least
+# total duration so far. Test cases with no recorded duration are given the
+# average duration. Returns the index of the bin for every test case.
+def packLPT(nodeids, recorded, binCount):
+    known = [recorded[nodeid] for nodeid in nodeids if nodeid in recorded]
+    average = (sum(known) / len(known)) if len(known) > 0 else 1.0
+    order = sorted(nodeids, key=lambda nodeid: (- recorded.get(nodeid, average), nodeid))
+    bins = [(0.0, k) for k in range(binCount)]
+    assignment = dict()
+    for nodeid in order:
+        load, k = heapq.heappop(bins)
+        assignment[nodeid] = k
+        heapq.heappush(bins, (load + recorded.get(nodeid, average), k))
+    return assignment
+
+# Once durations are recorded, the controller switches the default 'load'
+# distribution to 'loadgroup' so that each worker receives one of the bins
+# that are constructed below.
+def pytest_configure(config):
+    Grid.mode = config.getoption('grid')
+    if hasattr(config, 'workerinput'):
+        return
+    if config.getoption('dist', 'no') in ['load', 'loadscope', 'loadfile']:
+        if os.path.isfile(durationsPath):
+            config.option.dist = 'loadgroup'
+
+# Brownie distributes whole modules across workers. Once durations are
+# recorded, the test cases are distributed according to their bins instead.
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption('dist', 'no') == 'loadgroup':
+        from xdist.scheduler import LoadGroupScheduling
+        return LoadGroupScheduling(config, log)
+
+# Workers parse the command line on their own. Hence, the choice of the
+# controller is passed to them via 'workerinput'.
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput['loadgroup'] = node.config.getoption('dist', 'no') == 'loadgroup'
+
+# Every worker collects the same test cases and reads the same durations.
+# Hence, all workers arrive at the same assignment of test cases to bins.
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    if not hasattr(config, 'workerinput'):
+        return
+    if config.workerinput.get('loadgroup', False) == False:
+        return
+    config.option.loadgroup = True
+    binCount = config.workerinput['workercount']
+    recorded = readDurations()
+    assignment = packLPT([item.nodeid for item in items], recorded, binCount)
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name='lpt' + str(assignment[item.nodeid])))
+
+# The controller receives the reports of all workers. The duration of a test
+# case is the sum of its setup, call and teardown phases.
+def pytest_runtest_logreport(report):
+    nodeid = nodeidOf(report.nodeid)
+    durations[nodeid] = durations.get(nodeid, 0.0) + report.duration
+
+# Reverted transactions which are issued by a test case are read prior to its
+# teardown from the transaction history of brownie and from the reverts which
+# are raised by the in-process EVM, since the latter never reach the history.
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    start = len(history)
+    inProcessStart = [len(evm.reverts) for evm in inProcessEvms]
+    yield
+    record = reverts.setdefault(functionOf(item.nodeid), {'cases': 0, 'reasons': {}})
+    record['cases'] += 1
+    reasons = [str(tx.revert_msg) for tx in history[start:] if tx.status == 0]
+    for evm, evmStart in zip(inProcessEvms, inProcessStart):
+        reasons += [str(error.revert_msg) for error in evm.reverts[evmStart:]]
+    for reason in reasons:
+        record['reasons'][reason] = record['reasons'].get(reason, 0) + 1
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    mergeReverts(reverts, getattr(node, 'workeroutput', {}).get('reverts', {}))
+
+def getModuleDurations():
+    modules = dict()
+    for nodeid, duration in durations.items():
+        module = nodeid.split('::')[0]
+        modules[module] = modules.get(module, 0.0) + duration
+    return modules
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, 'workerinput'):
+        session.config.workeroutput['reverts'] = reverts
+        return
+    if len(durations) > 0:
+        writeDurations(durations)
+        recorded = readJson(backendsPath)
+        recorded.setdefault(session.config.getoption('evm'), {}).update(getModuleDurations())
+        writeJson(backendsPath, recorded)
+    if len(reverts) > 0:
+        recorded = readJson(revertsPath)
+        recorded.setdefault(session.config.getoption('evm'), {}).setdefault(Grid.mode, {}).update(reverts)
+        writeJson(revertsPath, recorded)
+
+# Lists the revert reasons which are reached by the full grid on the same
+# backend but not by the covering arrays of the current run, followed by the
+# speedup of the in-process backend for every module which is recorded under
+# both backends.
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, 'workerinput'):
+        return
+    recorded = readJson(backendsPath)
+    for module in sorted(getModuleDurations().keys()):
+        if module in recorded.get('brownie', {}) and module in recorded.get('inprocess', {}):
+            brownieDuration = recorded['brownie'][module]
+            inprocessDuration = recorded['inprocess'][module]
+            terminalreporter.write_line(
+                module + ': brownie ' + '{:.2f}'.format(brownieDuration) + 's, inprocess ' + '{:.2f}'.format(inprocessDuration) + 's (' + '{:.1f}'.format(brownieDuration / max(inprocessDuration, 1e-9)) + 'x)'
+            )
+    if Grid.mode == 'full':
+        return
+    full = readJson(revertsPath).get(config.getoption('evm'), {}).get('full', {})
+    for function in sorted(reverts.keys()):
+        if function in full:
+            missing = sorted(set(full[function]['reasons'].keys()) - set(reverts[function]['reasons'].keys()))
+            if len(missing) > 0:
+                terminalreporter.write_line(
+                    function + ' (grid ' + Grid.mode + ', ' + str(reverts[function]['cases']) + ' of ' + str(full[function]['cases']) + ' cases) misses revert reasons: ' + ', '.join(missing)
+                )